@@ -0,0 +1,56 @@
+import argparse
+import time
+
+import numpy as np
+
+from pryces.infrastructure.backtest import DEFAULT_RULE_SETS, NotificationBacktester, PriceHistory
+from pryces.infrastructure.history import DailyBars
+
+
+def synthesize_bars(symbols: int, days: int, seed: int) -> DailyBars:
+    # Random-walk daily bars so the benchmark runs without downloading history.
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, size=(symbols, days)), axis=1))
+    open_ = close * (1 + rng.normal(0, 0.01, size=close.shape))
+    spread = np.abs(rng.normal(0, 0.015, size=close.shape))
+    start = np.datetime64("2015-01-01")
+    return DailyBars(
+        symbols=[f"SYM{i}" for i in range(symbols)],
+        days=np.arange(start, start + days),
+        open=open_,
+        high=np.maximum(open_, close) * (1 + spread),
+        low=np.minimum(open_, close) * (1 - spread),
+        close=close,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized notification backtest")
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    bars = synthesize_bars(args.symbols, args.years * 252, args.seed)
+
+    start = time.perf_counter()
+    history = PriceHistory.from_daily(bars)
+    prepared = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reports = NotificationBacktester().run(history, list(DEFAULT_RULE_SETS))
+    evaluated = time.perf_counter() - start
+
+    sessions = reports[0].sessions
+    print(f"symbols:       {args.symbols}")
+    print(f"years:         {args.years}")
+    print(f"sessions:      {sessions}")
+    print(f"indicators:    {prepared:.2f}s")
+    print(f"rule sets:     {len(reports)} in {evaluated:.2f}s")
+    print(f"throughput:    {sessions * len(reports) / evaluated:,.0f} sessions/s")
+    for report in reports:
+        print(f"  {report.rule_set.name}: {report.total} notifications")
+
+
+if __name__ == "__main__":
+    main()
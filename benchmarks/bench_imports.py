@@ -0,0 +1,48 @@
+import argparse
+import subprocess
+import sys
+
+_ENTRY_POINTS = ("pryces.presentation.console.cli", "pryces.presentation.scripts.telegram_bot")
+# Eager imports of the market data libraries took about 0.7 s; startup should stay well below.
+_BUDGET_SECONDS = 0.35
+
+
+def import_seconds(module: str) -> float:
+    # Cumulative import time of `module` in a fresh interpreter, from `python -X importtime`.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        parts = line.partition("import time:")[2].split("|")
+        if len(parts) == 3 and parts[2].strip() == module and parts[1].strip().isdigit():
+            return int(parts[1]) / 1_000_000
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def run(args: argparse.Namespace) -> int:
+    over = 0
+    for module in _ENTRY_POINTS:
+        # The best of several runs, so one slow start on a busy machine does not count.
+        seconds = min(import_seconds(module) for _ in range(args.runs))
+        verdict = "ok" if seconds < args.budget else "OVER BUDGET"
+        print(f"{module:<48}{seconds * 1000:7.1f}ms  {verdict}")
+        over += seconds >= args.budget
+    return 1 if over else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Startup import time of the CLI and the bot, against a budget"
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--budget", type=float, default=_BUDGET_SECONDS, help="Budget per entry point in seconds"
+    )
+    sys.exit(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import argparse
+import logging
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from pryces.infrastructure.logging import LogPipeline, PythonLoggerFactory
+
+_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_GROUP_ID = "-1001234567890"
+
+
+class SlowFileHandler(RotatingFileHandler):
+    # Models slow storage (a busy disk, a network mount) with a fixed delay per record.
+    def __init__(self, path: Path, latency: float) -> None:
+        super().__init__(path, maxBytes=5 * 1024 * 1024, backupCount=3)
+        self._latency = latency
+        self.setFormatter(logging.Formatter(_FORMAT))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._latency:
+            time.sleep(self._latency)
+        super().emit(record)
+
+
+def eager_cycle(logger, symbols: list[str], messages: list[str]) -> None:
+    # The log calls of one monitor cycle as written before: messages formatted by the caller.
+    for symbol in symbols:
+        logger.debug(f"Fetching stock data for {symbol}")
+    for message in messages:
+        logger.debug(f"Sending message to Telegram group {_GROUP_ID}")
+        logger.info(f"Notification sent:\n{message}")
+
+
+def lazy_cycle(logger, symbols: list[str], messages: list[str]) -> None:
+    for symbol in symbols:
+        logger.debug("Fetching stock data for %s", symbol)
+    for message in messages:
+        logger.debug("Sending message to Telegram group %s", _GROUP_ID)
+        logger.info("Notification sent:\n%s", message)
+
+
+def measure(mode: str, args: argparse.Namespace, directory: Path) -> float:
+    root = logging.getLogger()
+    root.handlers[:] = []
+    root.setLevel(logging.INFO)
+    level = logging.DEBUG if args.debug else logging.INFO
+    logging.getLogger("pryces").setLevel(level)
+    handler = SlowFileHandler(directory / f"{mode}.log", args.write_latency)
+    handler.setLevel(level)
+
+    pipeline = None
+    if mode == "direct":
+        root.addHandler(handler)
+        cycle = eager_cycle
+    else:
+        pipeline = LogPipeline([handler], level, args.queue_size, root)
+        cycle = lazy_cycle
+
+    logger = PythonLoggerFactory().get_logger("pryces.bench")
+    symbols = [f"SYM{i}" for i in range(args.symbols)]
+    messages = [
+        f"SYM{i} rose 5.25% to 123.45 USD, above its 50-day average of 110.10. " * 4
+        for i in range(args.notifications)
+    ]
+    hot = 0.0
+    for _ in range(args.cycles):
+        start = time.perf_counter()
+        cycle(logger, symbols, messages)
+        hot += time.perf_counter() - start
+        # The monitor sleeps for its interval between cycles, which lets the writer catch up.
+        while pipeline is not None and pipeline.pending:
+            time.sleep(0.0001)
+    if pipeline is not None:
+        pipeline.stop()
+    handler.close()
+    if pipeline is not None and pipeline.dropped:
+        print(f"{mode}: dropped {pipeline.dropped} record(s), raise --queue-size")
+    return hot
+
+
+def run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        results = {mode: measure(mode, args, Path(directory)) for mode in ("direct", "queued")}
+
+    records = args.cycles * args.notifications * (2 if args.debug else 1)
+    print(f"cycles:             {args.cycles}")
+    print(f"records written:    {records + (args.cycles * args.symbols if args.debug else 0)}")
+    for mode, hot in results.items():
+        print(f"{mode + ':':<20}{hot / args.cycles * 1e6:.1f}µs per cycle on the monitor thread")
+    direct, queued = results["direct"], results["queued"]
+    print(f"saving:             {(direct - queued) / args.cycles * 1e6:.1f}µs per cycle")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Cost of a monitor cycle's log calls on the monitor thread, writing to a "
+        "file directly versus through the queued pipeline"
+    )
+    parser.add_argument("--cycles", type=int, default=2000)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--notifications", type=int, default=5, help="Notifications per cycle")
+    parser.add_argument("--debug", action="store_true", help="Enable debug records")
+    parser.add_argument(
+        "--write-latency", type=float, default=0.0, help="Delay per written record in seconds"
+    )
+    parser.add_argument("--queue-size", type=int, default=10_000)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import Mock
+
+from pryces.application.interfaces import MessageSender
+from pryces.application.services import NotificationService, StockSynchronizer
+from pryces.application.use_cases.trigger_stocks_notifications import (
+    TriggerStocksNotifications,
+    TriggerStocksNotificationsRequest,
+)
+from pryces.domain.notifications import NotificationPriority
+from pryces.infrastructure.configs import ConfigManager
+from pryces.infrastructure.formatters import ConsolidatingNotificationFormatter
+from pryces.infrastructure.providers import ReplayStockProvider
+from pryces.infrastructure.recordings import InfoRecorder
+from pryces.infrastructure.repositories import InMemoryStockRepository
+
+
+class CountingMessageSender(MessageSender):
+    def __init__(self) -> None:
+        self.sent = 0
+
+    def send_message(
+        self,
+        message: str,
+        priority: NotificationPriority = NotificationPriority.NORMAL,
+        key: str | None = None,
+    ) -> bool:
+        self.sent += 1
+        return True
+
+
+def synthesize_session(
+    path: Path, symbols: int, cycles: int, interval: int, seed: int, stale: float = 0.0
+) -> None:
+    # Random-walk trading session so the benchmark runs without a recorded one; each cycle a
+    # symbol's quote stays unchanged with probability `stale`, as illiquid ones do.
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 5, 15, 30)
+    prices = {f"SYM{i}": rng.uniform(20, 500) for i in range(symbols)}
+    previous_close = dict(prices)
+    clock_time = start
+    recorder = InfoRecorder(path, clock=lambda: clock_time)
+    for cycle in range(cycles):
+        clock_time = start + timedelta(seconds=cycle * interval)
+        for symbol, price in prices.items():
+            if rng.random() >= stale:
+                price = max(price * (1 + rng.gauss(0, 0.002)), 0.01)
+            prices[symbol] = price
+            base = previous_close[symbol]
+            recorder.record(
+                symbol,
+                {
+                    "currentPrice": round(price, 2),
+                    "previousClose": round(base, 2),
+                    "open": round(base * 1.001, 2),
+                    "dayHigh": round(max(price, base) * 1.01, 2),
+                    "dayLow": round(min(price, base) * 0.99, 2),
+                    "fiftyDayAverage": round(base * 0.98, 2),
+                    "twoHundredDayAverage": round(base * 1.02, 2),
+                    "fiftyTwoWeekHigh": round(base * 1.03, 2),
+                    "fiftyTwoWeekLow": round(base * 0.7, 2),
+                    "marketCap": 10_000_000_000,
+                    "longName": f"{symbol} Inc.",
+                    "currency": "USD",
+                    "marketState": "REGULAR",
+                    "exchangeDataDelayedBy": 0,
+                    "quoteType": "EQUITY",
+                },
+            )
+        recorder.end_cycle()
+    recorder.close()
+
+
+def _build_session(
+    recording: Path, speed: float
+) -> tuple[ReplayStockProvider, TriggerStocksNotifications, CountingMessageSender]:
+    provider = ReplayStockProvider(recording, logger_factory=Mock(), speed=speed)
+    sender = CountingMessageSender()
+    trigger = TriggerStocksNotifications(
+        stock_synchronizer=StockSynchronizer(provider, InMemoryStockRepository()),
+        notification_service=NotificationService(
+            sender, ConsolidatingNotificationFormatter(), clock=provider.clock
+        ),
+    )
+    return provider, trigger, sender
+
+
+def _replay(
+    provider: ReplayStockProvider,
+    trigger: TriggerStocksNotifications,
+    targets: dict[str, list[Decimal]],
+) -> int:
+    request = TriggerStocksNotificationsRequest(symbols=provider.symbols, targets=targets)
+    cycles = 0
+    while not provider.exhausted:
+        trigger.handle(request)
+        cycles += 1
+    return cycles
+
+
+def run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        recording = args.recording
+        if recording is None:
+            recording = Path(tmp) / "session.jsonl.gz"
+            synthesize_session(
+                recording, args.symbols, args.cycles, args.interval, args.seed, args.stale
+            )
+
+        targets: dict[str, list[Decimal]] = {}
+        if args.config is not None:
+            config = ConfigManager(args.config).read_monitor_stocks_config()
+            targets = {s.symbol: s.prices for s in config.symbols}
+
+        provider, trigger, sender = _build_session(recording, args.speed)
+        start = time.perf_counter()
+        cycles = _replay(provider, trigger, targets)
+        elapsed = time.perf_counter() - start
+
+        # Second pass under tracemalloc, which slows execution too much to share the timing run.
+        provider, trigger, _ = _build_session(recording, args.speed)
+        tracemalloc.start()
+        _replay(provider, trigger, targets)
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+
+    print(f"cycles:             {cycles}")
+    print(f"messages:           {sender.sent}")
+    print(f"elapsed:            {elapsed:.3f}s")
+    print(f"cycles/sec:         {cycles / elapsed:.1f}")
+    print(f"peak traced memory: {peak / 1024:.1f} KiB")
+    print(f"live blocks:        {blocks}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Replay a recorded trading session through TriggerStocksNotifications"
+    )
+    parser.add_argument(
+        "recording",
+        type=Path,
+        nargs="?",
+        default=None,
+        help="Recording made with monitor_stocks --record (default: synthetic session)",
+    )
+    parser.add_argument("--config", type=Path, default=None, help="Config file with targets")
+    parser.add_argument("--speed", type=float, default=0.0, help="Replay speed, 0 = unthrottled")
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--cycles", type=int, default=390)
+    parser.add_argument("--interval", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--stale",
+        type=float,
+        default=0.0,
+        help="Probability that a symbol's synthetic quote is unchanged in a cycle",
+    )
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import argparse
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from unittest.mock import Mock
+
+from pryces.domain.stocks import Stock
+from pryces.infrastructure.providers import YahooFinanceMapper
+
+
+def synthesize_infos(symbols: int, cycles: int, seed: int, stale: float) -> list[dict[str, dict]]:
+    # yfinance-shaped infos per cycle: prices random-walk, the profile and averages stay put,
+    # and a symbol's quote is unchanged with probability `stale`.
+    rng = random.Random(seed)
+    prices = {f"SYM{i}": rng.uniform(20, 500) for i in range(symbols)}
+    previous_close = dict(prices)
+    sessions = []
+    for _ in range(cycles):
+        infos = {}
+        for symbol, price in prices.items():
+            if rng.random() >= stale:
+                price = max(price * (1 + rng.gauss(0, 0.002)), 0.01)
+            prices[symbol] = price
+            base = previous_close[symbol]
+            infos[symbol] = {
+                "currentPrice": round(price, 2),
+                "previousClose": round(base, 2),
+                "open": round(base * 1.001, 2),
+                "dayHigh": round(max(price, base) * 1.01, 2),
+                "dayLow": round(min(price, base) * 0.99, 2),
+                "fiftyDayAverage": round(base * 0.98, 2),
+                "twoHundredDayAverage": round(base * 1.02, 2),
+                "fiftyTwoWeekHigh": round(base * 1.03, 2),
+                "fiftyTwoWeekLow": round(base * 0.7, 2),
+                "marketCap": 10_000_000_000,
+                "longName": f"{symbol} Inc.",
+                "currency": "USD",
+                "marketState": "REGULAR",
+                "exchangeDataDelayedBy": 0,
+                "quoteType": "EQUITY",
+            }
+        sessions.append(infos)
+    return sessions
+
+
+def _full(mapper: YahooFinanceMapper) -> Callable[[list[dict[str, dict]]], None]:
+    def replay(cycles: list[dict[str, dict]]) -> None:
+        held: dict[str, Stock] = {}
+        for infos in cycles:
+            for symbol, info in infos.items():
+                stock = mapper.map(symbol, info)
+                existing = held.get(symbol)
+                if existing is None:
+                    held[symbol] = stock
+                else:
+                    existing.update(stock)
+
+    return replay
+
+
+def _delta(mapper: YahooFinanceMapper) -> Callable[[list[dict[str, dict]]], None]:
+    def replay(cycles: list[dict[str, dict]]) -> None:
+        held: dict[str, Stock] = {}
+        raw: dict[str, dict] = {}
+        for infos in cycles:
+            for symbol, info in infos.items():
+                quote, raw[symbol] = mapper.map_delta(symbol, info, raw.get(symbol))
+                existing = held.get(symbol)
+                if existing is None:
+                    held[symbol] = Stock.from_quote(quote)
+                else:
+                    existing.apply(quote)
+
+    return replay
+
+
+def _measure(replay: Callable[[list[dict[str, dict]]], None], cycles: list[dict[str, dict]]):
+    start = time.perf_counter()
+    replay(cycles)
+    elapsed = time.perf_counter() - start
+
+    # Second pass under tracemalloc, which slows execution too much to share the timing run.
+    tracemalloc.start()
+    replay(cycles)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run(args: argparse.Namespace) -> None:
+    cycles = synthesize_infos(args.symbols, args.cycles, args.seed, args.stale)
+    mapper = YahooFinanceMapper(0, Mock())
+    quotes = args.symbols * args.cycles
+
+    print(f"quotes:             {quotes}")
+    for label, replay in (("full", _full(mapper)), ("delta", _delta(mapper))):
+        elapsed, peak = _measure(replay, cycles)
+        print(f"{label + ' µs/quote:':<20}{elapsed / quotes * 1e6:.2f}")
+        print(f"{label + ' peak memory:':<20}{peak / 1024:.1f} KiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-symbol cost of mapping yfinance infos onto held stocks, "
+        "as full stocks versus changed-field deltas"
+    )
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--cycles", type=int, default=390)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--stale",
+        type=float,
+        default=0.0,
+        help="Probability that a symbol's synthetic quote is unchanged in a cycle",
+    )
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import time
+from unittest.mock import Mock
+
+from pryces.infrastructure.senders import (
+    FireAndForgetMessageSender,
+    FireAndForgetSettings,
+    RetryMessageSender,
+    RetrySettings,
+    TelegramMessageSender,
+    TelegramSettings,
+)
+from pryces.testing import FakeTelegramServer, FakeTelegramSettings
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+    return ordered[index]
+
+
+def run(args: argparse.Namespace) -> None:
+    server_settings = FakeTelegramSettings(
+        latency=args.latency,
+        rate_limit_every=args.rate_limit_every,
+        retry_after=0,
+        server_error_every=args.server_error_every,
+    )
+    with FakeTelegramServer(server_settings) as server:
+        telegram = TelegramMessageSender(
+            TelegramSettings(bot_token="bench", group_id="1", api_base_url=server.base_url),
+            logger_factory=Mock(),
+        )
+        retry = RetryMessageSender(
+            telegram,
+            RetrySettings(max_retries=3, base_delay=0.0, backoff_factor=1.0),
+            logger_factory=Mock(),
+        )
+        sender = FireAndForgetMessageSender(
+            retry,
+            logger_factory=Mock(),
+            settings=FireAndForgetSettings(workers=args.workers, max_queue_size=args.messages),
+        )
+
+        enqueued_at: dict[str, float] = {}
+        start = time.monotonic()
+        for i in range(args.messages):
+            text = f"message {i}"
+            enqueued_at[text] = time.monotonic()
+            sender.send_message(text, key=f"SYM{i % args.symbols}")
+        sender.shutdown()
+        elapsed = time.monotonic() - start
+
+        messages = server.messages
+        latencies = [m.received_at - enqueued_at[m.text] for m in messages]
+
+    print(f"messages sent:      {len(messages)}/{args.messages}")
+    print(f"server calls:       {server.send_calls}")
+    print(f"elapsed:            {elapsed:.2f}s")
+    print(f"throughput:         {len(messages) / elapsed:.1f} msg/s")
+    if latencies:
+        print(f"p50 latency:        {_percentile(latencies, 50) * 1000:.1f}ms")
+        print(f"p99 latency:        {_percentile(latencies, 99) * 1000:.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Push messages through the full sender chain against a local fake Bot API"
+    )
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="Server latency in seconds")
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    parser.add_argument("--server-error-every", type=int, default=0)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import argparse
+import time
+from unittest.mock import Mock
+
+from pryces.infrastructure.receivers import TelegramUpdatePoller
+from pryces.infrastructure.senders import TelegramSettings
+from pryces.testing import FakeTelegramServer, FakeTelegramSettings
+
+
+def run(args: argparse.Namespace) -> None:
+    with FakeTelegramServer(FakeTelegramSettings(latency=args.latency)) as server:
+        poller = TelegramUpdatePoller(
+            TelegramSettings(bot_token="bench", group_id="1", api_base_url=server.base_url),
+            logger_factory=Mock(),
+        )
+        received = 0
+        polls = 0
+        offset = 0
+        start = time.monotonic()
+        for _ in range(args.bursts):
+            for i in range(args.burst_size):
+                server.push_update(-100, f"/targets SYM{i}")
+            target = received + args.burst_size
+            while received < target:
+                updates = poller.get_updates(offset)
+                polls += 1
+                received += len(updates)
+                if updates:
+                    offset = updates[-1].update_id + 1
+        elapsed = time.monotonic() - start
+        poller.close()
+
+    print(f"updates received:   {received}")
+    print(f"polls:              {polls}")
+    print(f"elapsed:            {elapsed:.2f}s")
+    print(f"throughput:         {received / elapsed:.0f} updates/s")
+    print(f"per poll:           {elapsed / polls * 1000:.2f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Drain bursts of group updates through the poller against a local fake Bot API"
+    )
+    parser.add_argument("--bursts", type=int, default=50)
+    parser.add_argument("--burst-size", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.0, help="Server latency in seconds")
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import ParamSpec, TypeVar
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+# The monitor cycle being run, so that every log record of a cycle can be correlated.
+_cycle_id: ContextVar[str | None] = ContextVar("pryces_cycle_id", default=None)
+
+
+def new_cycle_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def current_cycle_id() -> str | None:
+    return _cycle_id.get()
+
+
+@contextmanager
+def cycle_scope(cycle_id: str | None) -> Iterator[None]:
+    token = _cycle_id.set(cycle_id)
+    try:
+        yield
+    finally:
+        _cycle_id.reset(token)
+
+
+def bind_cycle(function: Callable[_P, _R]) -> Callable[_P, _R]:
+    # Threads do not inherit the caller's context, so work handed to a pool carries the cycle
+    # over explicitly.
+    cycle_id = current_cycle_id()
+
+    def bound(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        with cycle_scope(cycle_id):
+            return function(*args, **kwargs)
+
+    return bound
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
+from pryces.domain.notifications import NotificationPriority
 from pryces.domain.stock_statistics import StockStatistics
-from pryces.domain.stocks import Stock
+from pryces.domain.stocks import QuoteDelta, Stock
 
 
 class StockProvider(ABC):
@@ -10,6 +12,14 @@ class StockProvider(ABC):
         pass
 
 
+class QuoteProvider(ABC):
+    # Implemented by stock providers that can send only what changed since the previous quote
+    # they returned for a symbol; symbols not in `known` get a full quote.
+    @abstractmethod
+    def get_quotes(self, symbols: list[str], known: set[str]) -> list[QuoteDelta]:
+        pass
+
+
 class StockStatisticsProvider(ABC):
     @abstractmethod
     def get_stock_statistics(self, symbols: list[str]) -> list[StockStatistics]:
@@ -25,29 +35,49 @@ class StockRepository(ABC):
     def get(self, symbol: str) -> Stock | None:
         pass
 
+    @abstractmethod
+    def delete_batch(self, symbols: list[str]) -> None:
+        pass
+
+
+class TickRecorder(ABC):
+    @abstractmethod
+    def record(self, stocks: list[Stock], at: datetime) -> None:
+        # Must be cheap: it runs inside the monitor cycle.
+        pass
+
 
 class MessageSender(ABC):
     @abstractmethod
-    def send_message(self, message: str) -> bool:
+    def send_message(
+        self,
+        message: str,
+        priority: NotificationPriority = NotificationPriority.NORMAL,
+        key: str | None = None,
+    ) -> bool:
         # Returns True when accepted for delivery — not necessarily delivered yet.
+        # Messages sharing a key are delivered one at a time, in order within a priority.
         pass
 
 
 class Logger(ABC):
+    # Arguments are %-formatted into the message only if the record is emitted, so hot paths
+    # pass them instead of formatting the message themselves. Keyword fields (symbol, duration,
+    # outcome...) are kept as separate values for structured logs.
     @abstractmethod
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args: object, **fields: object) -> None:
         pass
 
     @abstractmethod
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: object, **fields: object) -> None:
         pass
 
     @abstractmethod
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: object, **fields: object) -> None:
         pass
 
     @abstractmethod
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: object, **fields: object) -> None:
         pass
 
 
@@ -1,11 +1,20 @@
+import time
 from datetime import datetime
 from decimal import Decimal
 from typing import Callable
 
 from pryces.domain.notifications import NotificationFormatter
+from pryces.domain.rules import RuleBook
 from pryces.domain.stocks import Stock
 
-from .interfaces import MessageSender, StockProvider, StockRepository
+from .interfaces import (
+    LoggerFactory,
+    MessageSender,
+    QuoteProvider,
+    StockProvider,
+    StockRepository,
+    TickRecorder,
+)
 
 
 class NotificationService:
@@ -14,15 +23,33 @@ class NotificationService:
         message_sender: MessageSender,
         formatter: NotificationFormatter,
         clock: Callable[[], datetime] = datetime.now,
+        logger_factory: LoggerFactory | None = None,
     ) -> None:
         self._message_sender = message_sender
         self._formatter = formatter
         self._clock = clock
+        self._logger = logger_factory.get_logger(__name__) if logger_factory else None
 
-    def send_stock_notifications(self, stock: Stock) -> list[Decimal]:
-        result = stock.generate_notifications(now=self._clock(), formatter=self._formatter)
+    def send_stock_notifications(
+        self, stock: Stock, rules: RuleBook | None = None
+    ) -> list[Decimal]:
+        result = stock.generate_notifications(
+            now=self._clock(), formatter=self._formatter, rules=rules
+        )
         for message in result.messages:
-            self._message_sender.send_message(message)
+            accepted = self._message_sender.send_message(
+                message.text, message.priority, stock.symbol
+            )
+            if self._logger is not None:
+                self._logger.debug(
+                    "%s notification for %s %s",
+                    message.priority.name,
+                    stock.symbol,
+                    "queued" if accepted else "dropped",
+                    symbol=stock.symbol,
+                    priority=message.priority.name,
+                    outcome="queued" if accepted else "dropped",
+                )
         return result.fulfilled_targets
 
 
@@ -31,26 +58,89 @@ class StockSynchronizer:
         self,
         provider: StockProvider,
         stock_repository: StockRepository,
+        tick_recorder: TickRecorder | None = None,
+        clock: Callable[[], datetime] = datetime.now,
+        logger_factory: LoggerFactory | None = None,
     ) -> None:
         self._provider = provider
         self._stock_repository = stock_repository
+        self._tick_recorder = tick_recorder
+        self._clock = clock
+        self._logger = logger_factory.get_logger(__name__) if logger_factory else None
+        # Symbols whose targets changed but whose stock has not been fetched since.
+        self._pending_target_changes: set[str] = set()
 
-    def fetch_and_sync(self, symbols: list[str], targets: dict[str, list[Decimal]]) -> list[Stock]:
-        fresh_stocks = self._provider.get_stocks(symbols)
+    def fetch_and_sync(
+        self,
+        symbols: list[str],
+        targets: dict[str, list[Decimal]],
+        changed_symbols: set[str] | None = None,
+    ) -> list[Stock]:
+        # changed_symbols=None re-syncs the targets of every stock; otherwise only new stocks
+        # and the given symbols are re-synced, the rest keep their targets from earlier cycles.
+        if changed_symbols is not None:
+            self._pending_target_changes.update(changed_symbols)
         synced: list[Stock] = []
 
-        for fresh_stock in fresh_stocks:
-            existing = self._stock_repository.get(fresh_stock.symbol)
-            if existing is not None:
-                existing.update(fresh_stock)
-                stock = existing
-            else:
-                stock = fresh_stock
+        started = time.perf_counter()
+        fetched = self._fetch(symbols)
+        if self._logger is not None:
+            duration = time.perf_counter() - started
+            self._logger.debug(
+                "Fetched %d of %d symbol(s) in %.3fs",
+                len(fetched),
+                len(symbols),
+                duration,
+                requested=len(symbols),
+                fetched=len(fetched),
+                duration=round(duration, 4),
+                outcome="fetched" if len(fetched) == len(symbols) else "partial",
+            )
 
-            stock.sync_targets(targets.get(stock.symbol, []))
+        for stock, is_new in fetched:
+            if is_new or changed_symbols is None or stock.symbol in self._pending_target_changes:
+                stock.sync_targets(targets.get(stock.symbol, []))
+                self._pending_target_changes.discard(stock.symbol)
             synced.append(stock)
 
         return synced
 
+    def _fetch(self, symbols: list[str]) -> list[tuple[Stock, bool]]:
+        # Pairs each fetched stock with whether it is new to the repository.
+        if isinstance(self._provider, QuoteProvider):
+            return self._fetch_quotes(symbols)
+        fetched = []
+        for fresh_stock in self._provider.get_stocks(symbols):
+            existing = self._stock_repository.get(fresh_stock.symbol)
+            if existing is None:
+                fetched.append((fresh_stock, True))
+            else:
+                existing.update(fresh_stock)
+                fetched.append((existing, False))
+        return fetched
+
+    def _fetch_quotes(self, symbols: list[str]) -> list[tuple[Stock, bool]]:
+        # Quotes for held stocks only carry the fields that changed and are applied in place.
+        held = {}
+        for symbol in {symbol.upper() for symbol in symbols}:
+            stock = self._stock_repository.get(symbol)
+            if stock is not None:
+                held[symbol] = stock
+        fetched = []
+        for quote in self._provider.get_quotes(symbols, set(held)):
+            existing = held.get(quote.symbol)
+            if existing is None:
+                fetched.append((Stock.from_quote(quote), True))
+            else:
+                existing.apply(quote)
+                fetched.append((existing, False))
+        return fetched
+
+    def forget(self, symbols: set[str]) -> None:
+        self._pending_target_changes.difference_update(symbols)
+        self._stock_repository.delete_batch(sorted(symbols))
+
     def persist(self, stocks: list[Stock]) -> None:
         self._stock_repository.save_batch(stocks)
+        if self._tick_recorder is not None:
+            self._tick_recorder.record(stocks, self._clock())
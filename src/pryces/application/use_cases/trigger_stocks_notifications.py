@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from decimal import Decimal
 
+from pryces.domain.rules import RuleBook
+
 from ..dtos import TargetPriceDTO
 from ..services import NotificationService, StockSynchronizer
 
@@ -9,6 +11,11 @@ from ..services import NotificationService, StockSynchronizer
 class TriggerStocksNotificationsRequest:
     symbols: list[str]
     targets: dict[str, list[Decimal]] = field(default_factory=dict)
+    # None re-syncs the targets of every symbol; a set limits re-syncing to those symbols.
+    changed_symbols: set[str] | None = None
+    removed_symbols: set[str] = field(default_factory=set)
+    # Names of the notification rules to evaluate; None evaluates every built-in rule.
+    rules: tuple[str, ...] | None = None
 
 
 class TriggerStocksNotifications:
@@ -19,13 +26,23 @@ class TriggerStocksNotifications:
     ) -> None:
         self._stock_synchronizer = stock_synchronizer
         self._notification_service = notification_service
+        # Rule books memoize their evaluation plans, so one is kept per rule selection.
+        self._rule_books: dict[tuple[str, ...] | None, RuleBook] = {}
 
     def handle(self, request: TriggerStocksNotificationsRequest) -> list[TargetPriceDTO]:
-        stocks = self._stock_synchronizer.fetch_and_sync(request.symbols, request.targets)
+        if request.removed_symbols:
+            self._stock_synchronizer.forget(request.removed_symbols)
+        stocks = self._stock_synchronizer.fetch_and_sync(
+            request.symbols, request.targets, request.changed_symbols
+        )
+
+        rules = self._rule_books.get(request.rules)
+        if rules is None:
+            rules = self._rule_books[request.rules] = RuleBook.select(request.rules)
 
         fulfilled: list[TargetPriceDTO] = []
         for stock in stocks:
-            fulfilled_targets = self._notification_service.send_stock_notifications(stock)
+            fulfilled_targets = self._notification_service.send_stock_notifications(stock, rules)
             for target_value in fulfilled_targets:
                 fulfilled.append(TargetPriceDTO(symbol=stock.symbol, target=target_value))
 
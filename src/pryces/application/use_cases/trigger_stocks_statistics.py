@@ -20,8 +20,9 @@ class TriggerStocksStatistics:
         self._formatter = formatter
         self._sender = sender
 
-    def handle(self, request: TriggerStocksStatisticsRequest) -> bool:
+    def handle(self, request: TriggerStocksStatisticsRequest) -> list[str]:
+        # Returns the symbols statistics were found and sent for.
         statistics = self._provider.get_stock_statistics(request.symbols)
         for stats in statistics:
             self._sender.send_message(stats.format(self._formatter))
-        return bool(statistics)
+        return [stats.symbol for stats in statistics]
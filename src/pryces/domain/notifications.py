@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from decimal import Decimal
-from enum import Enum
+from enum import Enum, IntEnum
 
 from pryces.domain.utils import calculate_percentage_change
 
@@ -30,6 +30,28 @@ class NotificationType(Enum):
     TARGET_PRICE_REACHED = "TARGET_PRICE_REACHED"
 
 
+class NotificationPriority(IntEnum):
+    CRITICAL = 0
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+
+_NOTIFICATION_PRIORITIES: dict[NotificationType, NotificationPriority] = {
+    NotificationType.TARGET_PRICE_REACHED: NotificationPriority.CRITICAL,
+    NotificationType.SMA50_CROSSED: NotificationPriority.CRITICAL,
+    NotificationType.SMA200_CROSSED: NotificationPriority.CRITICAL,
+    NotificationType.CLOSE_TO_SMA50: NotificationPriority.HIGH,
+    NotificationType.CLOSE_TO_SMA200: NotificationPriority.HIGH,
+    NotificationType.NEW_52_WEEK_HIGH: NotificationPriority.HIGH,
+    NotificationType.NEW_52_WEEK_LOW: NotificationPriority.HIGH,
+    NotificationType.SESSION_GAINS_ERASED: NotificationPriority.HIGH,
+    NotificationType.SESSION_LOSSES_ERASED: NotificationPriority.HIGH,
+    NotificationType.REGULAR_MARKET_OPEN: NotificationPriority.LOW,
+    NotificationType.REGULAR_MARKET_CLOSED: NotificationPriority.LOW,
+}
+
+
 class Notification:
     __slots__ = ("_type", "_message")
     _CREATION_KEY = object()
@@ -48,6 +70,10 @@ class Notification:
     def message(self) -> str:
         return self._message
 
+    @property
+    def priority(self) -> NotificationPriority:
+        return _NOTIFICATION_PRIORITIES.get(self._type, NotificationPriority.NORMAL)
+
     @staticmethod
     def create_fifty_day_average_crossed(average_price: Decimal) -> "Notification":
         return Notification(
@@ -182,6 +208,16 @@ class Notification:
             Notification._CREATION_KEY, NotificationType.TARGET_PRICE_REACHED, message
         )
 
+    @staticmethod
+    def restore(notification_type: NotificationType, message: str) -> "Notification":
+        return Notification(Notification._CREATION_KEY, notification_type, message)
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationMessage:
+    text: str
+    priority: NotificationPriority
+
 
 @dataclass(frozen=True, slots=True)
 class StockContext:
@@ -192,7 +228,9 @@ class StockContext:
 
 class NotificationFormatter(ABC):
     @abstractmethod
-    def format(self, notifications: list[Notification], context: StockContext) -> list[str]:
+    def format(
+        self, notifications: list[Notification], context: StockContext
+    ) -> list[NotificationMessage]:
         pass
 
 
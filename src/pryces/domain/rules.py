@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import Decimal
+
+from pryces.domain.notifications import Notification, NotificationType
+from pryces.domain.stocks import (
+    CLOSE_TO_SMA_THRESHOLD,
+    DECREASE_LEVEL_TYPES,
+    INCREASE_LEVEL_TYPES,
+    InstrumentType,
+    Stock,
+)
+from pryces.domain.utils import calculate_percentage_change
+
+_History = frozenset[NotificationType]
+
+
+class NotificationRule(ABC):
+    __slots__ = ()
+    name: str
+
+    @abstractmethod
+    def can_fire(self, history: _History) -> bool:
+        # False when, given the types already sent this session, evaluating the rule
+        # could only produce a candidate that deduplication would drop.
+        pass
+
+    @abstractmethod
+    def evaluate(self, stock: Stock, change: Decimal | None) -> Notification | None:
+        # change is the percentage change from the previous close, computed once per cycle.
+        pass
+
+
+@dataclass(frozen=True, slots=True)
+class RegularMarketOpenRule(NotificationRule):
+    name: str = "market_open"
+
+    def can_fire(self, history: _History) -> bool:
+        return NotificationType.REGULAR_MARKET_OPEN not in history
+
+    def evaluate(self, stock: Stock, change: Decimal | None) -> Notification | None:
+        if stock.kind == InstrumentType.CRYPTO:
+            return None
+        return Notification.create_regular_market_open(
+            stock.symbol,
+            stock.open_price if stock.open_price is not None else stock.current_price,
+            stock.previous_close_price,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PercentageLevelRule(NotificationRule):
+    name: str
+    levels: frozenset[NotificationType]
+
+    def can_fire(self, history: _History) -> bool:
+        return not self.levels <= history
+
+    def evaluate(self, stock: Stock, change: Decimal | None) -> Notification | None:
+        if change is None:
+            return None
+        level = stock.resolve_percentage_level(change)
+        if level not in self.levels:
+            return None
+        return Notification.create_percentage_change(
+            level, stock.symbol, stock.current_price, change
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SmaCrossedRule(NotificationRule):
+    name: str
+    type: NotificationType
+    # Name of the Stock attribute holding the average.
+    average: str
+    notify: Callable[[Decimal], Notification]
+
+    def can_fire(self, history: _History) -> bool:
+        return self.type not in history
+
+    def evaluate(self, stock: Stock, change: Decimal | None) -> Notification | None:
+        sma = getattr(stock, self.average)
+        previous_close = stock.previous_close_price
+        if previous_close is None or sma is None:
+            return None
+        price = stock.current_price
+        if previous_close < sma <= price or previous_close > sma >= price:
+            return self.notify(sma)
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class CloseToSmaRule(NotificationRule):
+    name: str
+    type: NotificationType
+    average: str
+    # Once the average has been crossed, being close to it is no longer news.
+    crossed: NotificationType
+    notify: Callable[[Decimal, Decimal], Notification]
+    threshold: Decimal = CLOSE_TO_SMA_THRESHOLD
+
+    def can_fire(self, history: _History) -> bool:
+        return self.type not in history and self.crossed not in history
+
+    def evaluate(self, stock: Stock, change: Decimal | None) -> Notification | None:
+        sma = getattr(stock, self.average)
+        previous_close = stock.previous_close_price
+        if sma is None or previous_close is None:
+            return None
+        price = stock.current_price
+        distance = calculate_percentage_change(sma, price)
+        if (previous_close < sma and price < sma and distance <= self.threshold) or (
+            previous_close > sma and price > sma and distance >= -self.threshold
+        ):
+            return self.notify(price, sma)
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class New52WeekExtremeRule(NotificationRule):
+    name: str
+    type: NotificationType
+    # Compared against the previous cycle's snapshot, before the provider moves the extreme.
+    extreme: str
+    above: bool
+    notify: Callable[[], Notification]
+
+    def can_fire(self, history: _History) -> bool:
+        return self.type not in history
+
+    def evaluate(self, stock: Stock, change: Decimal | None) -> Notification | None:
+        if stock.snapshot is None or stock.previous_close_price is None:
+            return None
+        extreme = getattr(stock.snapshot, self.extreme)
+        if extreme is None:
+            return None
+        price = stock.current_price
+        if price > extreme if self.above else price < extreme:
+            return self.notify()
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class SessionErasedRule(NotificationRule):
+    name: str
+    type: NotificationType
+    # The levels whose move is erased; the rule only fires after one of them was sent.
+    levels: frozenset[NotificationType]
+    rising: bool
+    notify: Callable[[], Notification]
+
+    def can_fire(self, history: _History) -> bool:
+        return self.type not in history and not self.levels.isdisjoint(history)
+
+    def evaluate(self, stock: Stock, change: Decimal | None) -> Notification | None:
+        if change is None or not (change > 0 if self.rising else change < 0):
+            return None
+        return self.notify()
+
+
+# Candidates are emitted in this order, which deduplication relies on: the market-open
+# message precedes the percentage level it absorbs, and crossings precede proximity.
+BUILT_IN_RULES: tuple[NotificationRule, ...] = (
+    RegularMarketOpenRule(),
+    PercentageLevelRule("percentage_increase", INCREASE_LEVEL_TYPES),
+    PercentageLevelRule("percentage_decrease", DECREASE_LEVEL_TYPES),
+    SmaCrossedRule(
+        "sma50_crossed",
+        NotificationType.SMA50_CROSSED,
+        "fifty_day_average",
+        Notification.create_fifty_day_average_crossed,
+    ),
+    CloseToSmaRule(
+        "close_to_sma50",
+        NotificationType.CLOSE_TO_SMA50,
+        "fifty_day_average",
+        NotificationType.SMA50_CROSSED,
+        Notification.create_close_to_fifty_day_average,
+    ),
+    SmaCrossedRule(
+        "sma200_crossed",
+        NotificationType.SMA200_CROSSED,
+        "two_hundred_day_average",
+        Notification.create_two_hundred_day_average_crossed,
+    ),
+    CloseToSmaRule(
+        "close_to_sma200",
+        NotificationType.CLOSE_TO_SMA200,
+        "two_hundred_day_average",
+        NotificationType.SMA200_CROSSED,
+        Notification.create_close_to_two_hundred_day_average,
+    ),
+    New52WeekExtremeRule(
+        "new_52_week_high",
+        NotificationType.NEW_52_WEEK_HIGH,
+        "fifty_two_week_high",
+        True,
+        Notification.create_new_52_week_high,
+    ),
+    New52WeekExtremeRule(
+        "new_52_week_low",
+        NotificationType.NEW_52_WEEK_LOW,
+        "fifty_two_week_low",
+        False,
+        Notification.create_new_52_week_low,
+    ),
+    SessionErasedRule(
+        "session_gains_erased",
+        NotificationType.SESSION_GAINS_ERASED,
+        INCREASE_LEVEL_TYPES,
+        False,
+        Notification.create_session_gains_erased,
+    ),
+    SessionErasedRule(
+        "session_losses_erased",
+        NotificationType.SESSION_LOSSES_ERASED,
+        DECREASE_LEVEL_TYPES,
+        True,
+        Notification.create_session_losses_erased,
+    ),
+)
+
+RULE_NAMES = tuple(rule.name for rule in BUILT_IN_RULES)
+
+
+class RuleBook:
+    # Plans depend only on the types already sent, so they are compiled once per distinct
+    # history and shared by every stock that reaches it.
+    def __init__(self, rules: tuple[NotificationRule, ...] = BUILT_IN_RULES) -> None:
+        self._rules = rules
+        self._plans: dict[_History, tuple[NotificationRule, ...]] = {}
+
+    @property
+    def rules(self) -> tuple[NotificationRule, ...]:
+        return self._rules
+
+    @staticmethod
+    def select(names: tuple[str, ...] | None) -> RuleBook:
+        if names is None:
+            return DEFAULT_RULES
+        unknown = sorted(set(names) - set(RULE_NAMES))
+        if unknown:
+            raise ValueError(f"unknown notification rules: {', '.join(unknown)}")
+        return RuleBook(tuple(rule for rule in BUILT_IN_RULES if rule.name in names))
+
+    def plan(self, history: _History) -> tuple[NotificationRule, ...]:
+        plan = self._plans.get(history)
+        if plan is None:
+            plan = tuple(rule for rule in self._rules if rule.can_fire(history))
+            self._plans[history] = plan
+        return plan
+
+
+DEFAULT_RULES = RuleBook()
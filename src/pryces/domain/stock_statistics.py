@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from datetime import date, timedelta
 from decimal import Decimal
 from enum import Enum
 
@@ -16,6 +17,20 @@ class StatisticsPeriod(str, Enum):
     ONE_YEAR = "1Y"
     YEAR_TO_DATE = "YTD"
 
+    def reference_date(self, last_trading_date: date) -> date:
+        # The change over the period is measured against the last close on or before this date.
+        if self is StatisticsPeriod.YEAR_TO_DATE:
+            return date(last_trading_date.year - 1, 12, 31)
+        return last_trading_date - _PERIOD_LENGTHS[self]
+
+
+_PERIOD_LENGTHS = {
+    StatisticsPeriod.ONE_DAY: timedelta(days=1),
+    StatisticsPeriod.ONE_WEEK: timedelta(weeks=1),
+    StatisticsPeriod.THREE_MONTHS: timedelta(days=90),
+    StatisticsPeriod.ONE_YEAR: timedelta(days=365),
+}
+
 
 @dataclass(frozen=True, slots=True)
 class HistoricalClose:
@@ -4,23 +4,25 @@ from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from pryces.domain.notifications import (
     Notification,
     NotificationFormatter,
+    NotificationMessage,
     NotificationType,
     StockContext,
 )
 from pryces.domain.utils import calculate_percentage_change
 
 if TYPE_CHECKING:
+    from pryces.domain.rules import RuleBook
     from pryces.domain.target_prices import TargetPrice
 
 
 @dataclass(frozen=True, slots=True)
 class GenerateNotificationsResult:
-    messages: list[str]
+    messages: list[NotificationMessage]
     fulfilled_targets: list[Decimal]
 
 
@@ -39,6 +41,42 @@ class StockSnapshot:
     price_delay_in_minutes: int | None
 
 
+@dataclass(frozen=True, slots=True)
+class StockState:
+    # Everything a Stock carries between cycles, so it can be checkpointed and restored.
+    symbol: str
+    current_price: Decimal
+    name: str | None
+    currency: "Currency | None"
+    previous_close_price: Decimal | None
+    open_price: Decimal | None
+    day_high: Decimal | None
+    day_low: Decimal | None
+    fifty_day_average: Decimal | None
+    two_hundred_day_average: Decimal | None
+    fifty_two_week_high: Decimal | None
+    fifty_two_week_low: Decimal | None
+    market_cap: Decimal | None
+    market_state: "MarketState | None"
+    price_delay_in_minutes: int | None
+    kind: "InstrumentType | None"
+    snapshot: StockSnapshot | None
+    transition_time: datetime | None
+    notifications: tuple[Notification, ...]
+    # (target, entry price) pairs.
+    targets: tuple[tuple[Decimal, Decimal], ...]
+    sent_notifications: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class QuoteDelta:
+    symbol: str
+    # Stock constructor arguments that changed since the previous quote of the symbol. A
+    # full quote carries every argument and can build a Stock on its own.
+    changes: dict[str, Any]
+    full: bool = False
+
+
 class MarketState(str, Enum):
     OPEN = "OPEN"
     PRE = "PRE"
@@ -89,23 +127,30 @@ _DECREASE_LEVELS = (
     NotificationType.LEVEL_5_DECREASE,
 )
 
+INCREASE_LEVEL_TYPES = frozenset(_INCREASE_LEVELS)
+DECREASE_LEVEL_TYPES = frozenset(_DECREASE_LEVELS)
+
 _ThresholdTuple = tuple[tuple[Decimal, NotificationType], ...]
 
+CLOSE_TO_SMA_THRESHOLD = Decimal("2.5")
 
-def _build_thresholds(start: Decimal, step: Decimal) -> tuple[_ThresholdTuple, _ThresholdTuple]:
+
+def build_percentage_thresholds(
+    start: Decimal, step: Decimal
+) -> tuple[_ThresholdTuple, _ThresholdTuple]:
     last = len(_INCREASE_LEVELS) - 1
     inc = tuple((start + step * (last - i), level) for i, level in enumerate(_INCREASE_LEVELS))
     dec = tuple((-(start + step * (last - i)), level) for i, level in enumerate(_DECREASE_LEVELS))
     return inc, dec
 
 
-_LEVEL_1_INCREASE_THRESHOLDS, _LEVEL_1_DECREASE_THRESHOLDS = _build_thresholds(
+_LEVEL_1_INCREASE_THRESHOLDS, _LEVEL_1_DECREASE_THRESHOLDS = build_percentage_thresholds(
     Decimal("1"), Decimal("0.875")
 )
-_LEVEL_2_INCREASE_THRESHOLDS, _LEVEL_2_DECREASE_THRESHOLDS = _build_thresholds(
+_LEVEL_2_INCREASE_THRESHOLDS, _LEVEL_2_DECREASE_THRESHOLDS = build_percentage_thresholds(
     Decimal("2"), Decimal("1.75")
 )
-_LEVEL_3_INCREASE_THRESHOLDS, _LEVEL_3_DECREASE_THRESHOLDS = _build_thresholds(
+_LEVEL_3_INCREASE_THRESHOLDS, _LEVEL_3_DECREASE_THRESHOLDS = build_percentage_thresholds(
     Decimal("4"), Decimal("3.5")
 )
 
@@ -133,13 +178,37 @@ class Stock:
         "_transition_time",
         "_notifications",
         "_pending_notifications",
+        "_sent_notification_count",
         "_targets",
         "_fulfilled_targets",
+        "_evaluated_with",
     )
 
-    _INCREASE_LEVEL_TYPES = frozenset(_INCREASE_LEVELS)
-    _DECREASE_LEVEL_TYPES = frozenset(_DECREASE_LEVELS)
-    _CLOSE_TO_SMA_THRESHOLD = Decimal("2.5")
+    # The constructor arguments a QuoteDelta may change, and the slots holding them.
+    _QUOTE_ATTRIBUTES: ClassVar[dict[str, str]] = {
+        name: f"_{name}"
+        for name in (
+            "current_price",
+            "name",
+            "currency",
+            "previous_close_price",
+            "open_price",
+            "day_high",
+            "day_low",
+            "fifty_day_average",
+            "two_hundred_day_average",
+            "fifty_two_week_high",
+            "fifty_two_week_low",
+            "market_cap",
+            "market_state",
+            "price_delay_in_minutes",
+            "kind",
+        )
+    }
+    _CAP_SIZE_INPUTS: ClassVar[frozenset[str]] = frozenset({"kind", "currency", "market_cap"})
+
+    _INCREASE_LEVEL_TYPES = INCREASE_LEVEL_TYPES
+    _DECREASE_LEVEL_TYPES = DECREASE_LEVEL_TYPES
 
     _INSTRUMENT_THRESHOLDS: dict[InstrumentType | None, tuple[_ThresholdTuple, _ThresholdTuple]] = {
         InstrumentType.STOCK: (_LEVEL_3_INCREASE_THRESHOLDS, _LEVEL_3_DECREASE_THRESHOLDS),
@@ -195,8 +264,14 @@ class Stock:
         self._transition_time: datetime | None = None
         self._notifications: list[Notification] = []
         self._pending_notifications: list[Notification] = []
+        # _notifications is the dedup history: it also holds levels recorded without being sent
+        # and loses levels when gains or losses are erased, so sends are counted separately.
+        self._sent_notification_count = 0
         self._targets: list[TargetPrice] = []
         self._fulfilled_targets: list[TargetPrice] = []
+        # The rule book the current quote was last fully evaluated with; None forces the next
+        # evaluation.
+        self._evaluated_with: RuleBook | None = None
 
     @property
     def symbol(self) -> str:
@@ -210,6 +285,10 @@ class Stock:
     def name(self) -> str | None:
         return self._name
 
+    @property
+    def sent_notification_count(self) -> int:
+        return self._sent_notification_count
+
     @property
     def currency(self) -> Currency | None:
         return self._currency
@@ -270,15 +349,72 @@ class Stock:
     def snapshot(self) -> StockSnapshot | None:
         return self._snapshot
 
+    def export_state(self) -> StockState:
+        # Pending notifications and fulfilled targets are drained every cycle, so they are
+        # not part of the state carried over.
+        return StockState(
+            symbol=self._symbol,
+            current_price=self._current_price,
+            name=self._name,
+            currency=self._currency,
+            previous_close_price=self._previous_close_price,
+            open_price=self._open_price,
+            day_high=self._day_high,
+            day_low=self._day_low,
+            fifty_day_average=self._fifty_day_average,
+            two_hundred_day_average=self._two_hundred_day_average,
+            fifty_two_week_high=self._fifty_two_week_high,
+            fifty_two_week_low=self._fifty_two_week_low,
+            market_cap=self._market_cap,
+            market_state=self._market_state,
+            price_delay_in_minutes=self._price_delay_in_minutes,
+            kind=self._kind,
+            snapshot=self._snapshot,
+            transition_time=self._transition_time,
+            notifications=tuple(self._notifications),
+            targets=tuple((t.target, t.entry) for t in self._targets),
+            sent_notifications=self._sent_notification_count,
+        )
+
+    @staticmethod
+    def from_state(state: StockState) -> "Stock":
+        from pryces.domain.target_prices import TargetPrice
+
+        stock = Stock(
+            symbol=state.symbol,
+            current_price=state.current_price,
+            name=state.name,
+            currency=state.currency,
+            previous_close_price=state.previous_close_price,
+            open_price=state.open_price,
+            day_high=state.day_high,
+            day_low=state.day_low,
+            fifty_day_average=state.fifty_day_average,
+            two_hundred_day_average=state.two_hundred_day_average,
+            fifty_two_week_high=state.fifty_two_week_high,
+            fifty_two_week_low=state.fifty_two_week_low,
+            market_cap=state.market_cap,
+            market_state=state.market_state,
+            price_delay_in_minutes=state.price_delay_in_minutes,
+            kind=state.kind,
+        )
+        stock._snapshot = state.snapshot
+        stock._transition_time = state.transition_time
+        stock._notifications = list(state.notifications)
+        stock._sent_notification_count = state.sent_notifications
+        stock._targets = [TargetPrice(target=t, entry_price=e) for t, e in state.targets]
+        return stock
+
     def _drain_fulfilled_targets(self) -> list[Decimal]:
         fulfilled = [t.target for t in self._fulfilled_targets]
         self._fulfilled_targets = []
         return fulfilled
 
-    def _drain_notifications(self, formatter: NotificationFormatter) -> list[str]:
+    def _drain_notifications(self, formatter: NotificationFormatter) -> list[NotificationMessage]:
         context = StockContext(self._symbol, self._current_price, self._previous_close_price)
         result = formatter.format(list(self._pending_notifications), context)
         self._notifications.extend(self._pending_notifications)
+        self._sent_notification_count += len(self._pending_notifications)
         self._pending_notifications = []
         return result
 
@@ -296,10 +432,38 @@ class Stock:
                 target = TargetPrice(target=value, entry_price=self.current_price)
                 synced.append(target)
 
+        if synced != self._targets:
+            self._evaluated_with = None
         self._targets = synced
 
+    @staticmethod
+    def from_quote(quote: QuoteDelta) -> "Stock":
+        if not quote.full:
+            raise ValueError(f"a partial quote cannot build stock {quote.symbol}")
+        return Stock(symbol=quote.symbol, **quote.changes)
+
+    def apply(self, quote: QuoteDelta) -> None:
+        # In-place counterpart of update() for providers that only send changed fields.
+        attributes = self._QUOTE_ATTRIBUTES
+        if not attributes.keys() >= quote.changes.keys():
+            unknown = ", ".join(sorted(quote.changes.keys() - attributes.keys()))
+            raise ValueError(f"unknown quote fields for stock {self._symbol}: {unknown}")
+        snapshot = self._capture_snapshot()
+        if snapshot != self._snapshot or quote.changes:
+            self._evaluated_with = None
+        self._snapshot = snapshot
+        for name, value in quote.changes.items():
+            setattr(self, attributes[name], value)
+        if not self._CAP_SIZE_INPUTS.isdisjoint(quote.changes):
+            self._cap_size = self._compute_cap_size()
+
     def update(self, source: "Stock") -> None:
-        self._snapshot = self._capture_snapshot()
+        snapshot = self._capture_snapshot()
+        # Evaluation only reads the quote and the previous cycle's snapshot. When both are the
+        # same as in the last evaluation, evaluating again cannot produce anything new.
+        if snapshot != self._snapshot or self._quote() != source._quote():
+            self._evaluated_with = None
+        self._snapshot = snapshot
         self._current_price = source._current_price
         self._name = source._name
         self._currency = source._currency
@@ -325,13 +489,19 @@ class Stock:
         )
 
     def generate_notifications(
-        self, now: datetime, formatter: NotificationFormatter
+        self, now: datetime, formatter: NotificationFormatter, rules: RuleBook | None = None
     ) -> GenerateNotificationsResult:
-        if not self._is_in_delay_window(now):
+        if rules is None:
+            from pryces.domain.rules import DEFAULT_RULES
+
+            rules = DEFAULT_RULES
+        # The delay window is checked even for unchanged quotes, so its clock keeps running.
+        if not self._is_in_delay_window(now) and self._evaluated_with is not rules:
             if self._is_market_state_open():
-                self._generate_market_open_notifications()
+                self._generate_market_open_notifications(rules)
             elif self._is_market_state_post():
                 self._generate_market_closed_notifications()
+            self._evaluated_with = rules
         messages = self._drain_notifications(formatter)
         fulfilled_targets = self._drain_fulfilled_targets()
         return GenerateNotificationsResult(messages=messages, fulfilled_targets=fulfilled_targets)
@@ -349,6 +519,25 @@ class Stock:
             return CapSize.MID
         return CapSize.SMALL
 
+    def _quote(self) -> tuple:
+        return (
+            self._current_price,
+            self._name,
+            self._currency,
+            self._previous_close_price,
+            self._open_price,
+            self._day_high,
+            self._day_low,
+            self._fifty_day_average,
+            self._two_hundred_day_average,
+            self._fifty_two_week_high,
+            self._fifty_two_week_low,
+            self._market_cap,
+            self._market_state,
+            self._price_delay_in_minutes,
+            self._kind,
+        )
+
     def _capture_snapshot(self) -> StockSnapshot:
         return StockSnapshot(
             current_price=self._current_price,
@@ -364,31 +553,6 @@ class Stock:
             price_delay_in_minutes=self._price_delay_in_minutes,
         )
 
-    def _is_close_to_sma(self, sma: Decimal | None) -> bool:
-        if sma is None or self.previous_close_price is None:
-            return False
-
-        change_percentage = calculate_percentage_change(sma, self.current_price)
-
-        return (
-            self.previous_close_price < sma
-            and self.current_price < sma
-            and change_percentage <= self._CLOSE_TO_SMA_THRESHOLD
-        ) or (
-            self.previous_close_price > sma
-            and self.current_price > sma
-            and change_percentage >= -self._CLOSE_TO_SMA_THRESHOLD
-        )
-
-    def _has_crossed_sma(self, sma: Decimal | None) -> bool:
-        if self.previous_close_price is None or sma is None:
-            return False
-
-        crossed_above = self.previous_close_price < sma and self.current_price >= sma
-        crossed_below = self.previous_close_price > sma and self.current_price <= sma
-
-        return crossed_above or crossed_below
-
     def _change_percentage_from_previous_close(self) -> Decimal | None:
         if self.previous_close_price is None:
             return None
@@ -423,7 +587,7 @@ class Stock:
             return _LEVEL_2_INCREASE_THRESHOLDS, _LEVEL_2_DECREASE_THRESHOLDS
         return self._INSTRUMENT_THRESHOLDS[self._kind]
 
-    def _resolve_percentage_level(self, change_percentage: Decimal) -> NotificationType | None:
+    def resolve_percentage_level(self, change_percentage: Decimal) -> NotificationType | None:
         inc, dec = self._get_percentage_thresholds()
         if change_percentage > 0:
             for threshold, notification_type in inc:
@@ -439,102 +603,7 @@ class Stock:
         if self._open_price is None or self._previous_close_price is None:
             return None
         change = calculate_percentage_change(self._open_price, self._previous_close_price)
-        return self._resolve_percentage_level(change)
-
-    def _generate_percentage_change_notification(
-        self, change_percentage: Decimal
-    ) -> Notification | None:
-        notification_type = self._resolve_percentage_level(change_percentage)
-        if notification_type is None:
-            return None
-        return Notification.create_percentage_change(
-            notification_type, self.symbol, self.current_price, change_percentage
-        )
-
-    def _generate_new_52_week_high_notification(self) -> Notification | None:
-        if (
-            self._snapshot is not None
-            and self._snapshot.fifty_two_week_high is not None
-            and self.previous_close_price is not None
-            and self.current_price > self._snapshot.fifty_two_week_high
-        ):
-            return Notification.create_new_52_week_high()
-        return None
-
-    def _generate_new_52_week_low_notification(self) -> Notification | None:
-        if (
-            self._snapshot is not None
-            and self._snapshot.fifty_two_week_low is not None
-            and self.previous_close_price is not None
-            and self.current_price < self._snapshot.fifty_two_week_low
-        ):
-            return Notification.create_new_52_week_low()
-        return None
-
-    def _generate_regular_market_open_notification(self) -> Notification | None:
-        if self._is_crypto():
-            return None
-        return Notification.create_regular_market_open(
-            self.symbol,
-            self.open_price if self.open_price is not None else self.current_price,
-            self.previous_close_price,
-        )
-
-    def _generate_close_to_fifty_day_average_notification(self) -> Notification | None:
-        if self._is_close_to_sma(self.fifty_day_average):
-            return Notification.create_close_to_fifty_day_average(
-                self.current_price, self.fifty_day_average
-            )
-        return None
-
-    def _generate_fifty_day_average_crossed_notification(self) -> Notification | None:
-        if self._has_crossed_sma(self.fifty_day_average):
-            return Notification.create_fifty_day_average_crossed(self.fifty_day_average)
-        return None
-
-    def _generate_close_to_two_hundred_day_average_notification(self) -> Notification | None:
-        if self._is_close_to_sma(self.two_hundred_day_average):
-            return Notification.create_close_to_two_hundred_day_average(
-                self.current_price, self.two_hundred_day_average
-            )
-        return None
-
-    def _generate_two_hundred_day_average_crossed_notification(self) -> Notification | None:
-        if self._has_crossed_sma(self.two_hundred_day_average):
-            return Notification.create_two_hundred_day_average_crossed(self.two_hundred_day_average)
-        return None
-
-    def _generate_percentage_change_from_previous_close_notification(self) -> Notification | None:
-        change_percentage = self._change_percentage_from_previous_close()
-        if change_percentage is None:
-            return None
-        return self._generate_percentage_change_notification(change_percentage)
-
-    def _has_any_increase_percentage_notification(self) -> bool:
-        return any(n.type in self._INCREASE_LEVEL_TYPES for n in self._notifications)
-
-    def _has_any_decrease_percentage_notification(self) -> bool:
-        return any(n.type in self._DECREASE_LEVEL_TYPES for n in self._notifications)
-
-    def _generate_session_gains_erased_notification(self) -> Notification | None:
-        change_percentage = self._change_percentage_from_previous_close()
-        if (
-            change_percentage is not None
-            and change_percentage < 0
-            and self._has_any_increase_percentage_notification()
-        ):
-            return Notification.create_session_gains_erased()
-        return None
-
-    def _generate_session_losses_erased_notification(self) -> Notification | None:
-        change_percentage = self._change_percentage_from_previous_close()
-        if (
-            change_percentage is not None
-            and change_percentage > 0
-            and self._has_any_decrease_percentage_notification()
-        ):
-            return Notification.create_session_losses_erased()
-        return None
+        return self.resolve_percentage_level(change)
 
     def _generate_target_price_notifications(self) -> list[Notification]:
         notifications: list[Notification] = []
@@ -550,30 +619,26 @@ class Stock:
         self._targets = remaining
         return notifications
 
-    def _collect_market_open_candidates(self) -> list[Notification]:
-        candidates = [
-            n
-            for n in (
-                self._generate_regular_market_open_notification(),
-                self._generate_percentage_change_from_previous_close_notification(),
-                self._generate_fifty_day_average_crossed_notification(),
-                self._generate_close_to_fifty_day_average_notification(),
-                self._generate_two_hundred_day_average_crossed_notification(),
-                self._generate_close_to_two_hundred_day_average_notification(),
-                self._generate_new_52_week_high_notification(),
-                self._generate_new_52_week_low_notification(),
-                self._generate_session_gains_erased_notification(),
-                self._generate_session_losses_erased_notification(),
-            )
-            if n is not None
-        ]
+    def _collect_market_open_candidates(
+        self, rules: RuleBook, history: frozenset[NotificationType]
+    ) -> list[Notification]:
+        # Rules that can no longer fire this session are left out of the plan.
+        plan = rules.plan(history)
+        change = self._change_percentage_from_previous_close() if plan else None
+        candidates = [n for rule in plan if (n := rule.evaluate(self, change)) is not None]
         candidates.extend(self._generate_target_price_notifications())
         return candidates
 
-    def _deduplicate(self, candidates: list[Notification]) -> list[Notification]:
+    def _deduplicate(
+        self,
+        candidates: list[Notification],
+        history: frozenset[NotificationType] | None = None,
+    ) -> list[Notification]:
         accepted: list[Notification] = []
         accepted_types: set[NotificationType] = set()
-        historical_types = {n.type for n in self._notifications}
+        historical_types = set(
+            history if history is not None else (n.type for n in self._notifications)
+        )
         market_open_percentage_level: NotificationType | None = None
 
         for candidate in candidates:
@@ -613,9 +678,10 @@ class Stock:
 
         return accepted
 
-    def _generate_market_open_notifications(self) -> None:
-        candidates = self._collect_market_open_candidates()
-        self._pending_notifications.extend(self._deduplicate(candidates))
+    def _generate_market_open_notifications(self, rules: RuleBook) -> None:
+        history = frozenset(n.type for n in self._notifications)
+        candidates = self._collect_market_open_candidates(rules, history)
+        self._pending_notifications.extend(self._deduplicate(candidates, history))
 
     def _generate_regular_market_closed_notification(self) -> Notification | None:
         if self._is_crypto():
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from ..domain.notifications import NotificationType
+from ..domain.stocks import CLOSE_TO_SMA_THRESHOLD, MarketState, build_percentage_thresholds
+from .history import DailyBars
+from .ticks import MARKET_STATE_CODES, TickStore
+
+_FIFTY_DAYS = 50
+_TWO_HUNDRED_DAYS = 200
+_FIFTY_TWO_WEEKS = 252
+
+
+@dataclass(frozen=True, slots=True)
+class RuleSet:
+    name: str
+    level_start: Decimal
+    level_step: Decimal
+    close_to_sma: Decimal = CLOSE_TO_SMA_THRESHOLD
+
+    @staticmethod
+    def parse(spec: str) -> RuleSet:
+        # NAME=START,STEP[,CLOSE_TO_SMA], e.g. "wide=3,2.5,2".
+        name, _, values = spec.partition("=")
+        parts = [Decimal(part) for part in values.split(",")] if values else []
+        if not name or len(parts) not in (2, 3):
+            raise ValueError(f"invalid rule set '{spec}', expected NAME=START,STEP[,CLOSE_TO_SMA]")
+        return RuleSet(name, *parts)
+
+
+# The percentage levels Stock applies per instrument kind, with the current SMA proximity.
+DEFAULT_RULE_SETS = (
+    RuleSet("level-1", Decimal("1"), Decimal("0.875")),
+    RuleSet("level-2", Decimal("2"), Decimal("1.75")),
+    RuleSet("level-3", Decimal("4"), Decimal("3.5")),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PriceHistory:
+    # (symbols, days) matrices plus a (symbols, days, steps) matrix of the prices each
+    # session is evaluated at, in order; NaN marks missing values and unused steps.
+    symbols: list[str]
+    days: np.ndarray
+    previous_close: np.ndarray
+    open: np.ndarray
+    fifty_day_average: np.ndarray
+    two_hundred_day_average: np.ndarray
+    fifty_two_week_high: np.ndarray
+    fifty_two_week_low: np.ndarray
+    paths: np.ndarray
+
+    @staticmethod
+    def from_daily(bars: DailyBars) -> PriceHistory:
+        shape = bars.close.shape
+        previous_close, fifty, two_hundred, high, low = (np.full(shape, np.nan) for _ in range(5))
+        for row in range(shape[0]):
+            # Indicators only look at earlier sessions of the same symbol, skipping gaps.
+            traded = np.flatnonzero(~np.isnan(bars.close[row]))
+            closes = pd.Series(bars.close[row, traded])
+            previous_close[row, traded] = closes.shift(1).to_numpy()
+            fifty[row, traded] = closes.rolling(_FIFTY_DAYS).mean().shift(1).to_numpy()
+            two_hundred[row, traded] = closes.rolling(_TWO_HUNDRED_DAYS).mean().shift(1).to_numpy()
+            high[row, traded] = (
+                pd.Series(bars.high[row, traded]).rolling(_FIFTY_TWO_WEEKS).max().shift(1)
+            ).to_numpy()
+            low[row, traded] = (
+                pd.Series(bars.low[row, traded]).rolling(_FIFTY_TWO_WEEKS).min().shift(1)
+            ).to_numpy()
+        # Intraday order is unknown; assume the extreme nearer the open came first.
+        rising = bars.close >= bars.open
+        first = np.where(rising, bars.low, bars.high)
+        second = np.where(rising, bars.high, bars.low)
+        paths = np.stack([bars.open, first, second, bars.close], axis=2)
+        return PriceHistory(
+            symbols=list(bars.symbols),
+            days=bars.days,
+            previous_close=previous_close,
+            open=bars.open.copy(),
+            fifty_day_average=fifty,
+            two_hundred_day_average=two_hundred,
+            fifty_two_week_high=high,
+            fifty_two_week_low=low,
+            paths=paths,
+        )
+
+    def since(self, first_day: np.datetime64) -> PriceHistory:
+        keep = self.days >= first_day
+        return replace(
+            self,
+            days=self.days[keep],
+            previous_close=self.previous_close[:, keep],
+            open=self.open[:, keep],
+            fifty_day_average=self.fifty_day_average[:, keep],
+            two_hundred_day_average=self.two_hundred_day_average[:, keep],
+            fifty_two_week_high=self.fifty_two_week_high[:, keep],
+            fifty_two_week_low=self.fifty_two_week_low[:, keep],
+            paths=self.paths[:, keep],
+        )
+
+    def with_intraday_paths(self, store: TickStore) -> PriceHistory:
+        # Sessions are evaluated at every recorded open-market tick; days without ticks
+        # are dropped from the evaluation.
+        open_code = MARKET_STATE_CODES[MarketState.OPEN]
+        stored_days = set(store.days())
+        series: dict[tuple[int, int], np.ndarray] = {}
+        for column, day in enumerate(self.days.astype(object)):
+            if day not in stored_days:
+                continue
+            for symbol, ticks in store.read_day(day, self.symbols).items():
+                prices = ticks.prices[ticks.market_states == open_code]
+                if len(prices):
+                    series[(self.symbols.index(symbol), column)] = prices
+        steps = max((len(prices) for prices in series.values()), default=0)
+        paths = np.full(self.previous_close.shape + (steps,), np.nan)
+        for (row, column), prices in series.items():
+            paths[row, column, : len(prices)] = prices
+        return replace(self, paths=paths)
+
+
+@dataclass(frozen=True, slots=True)
+class BacktestReport:
+    rule_set: RuleSet
+    sessions: int
+    counts: dict[NotificationType, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+_LEVEL_TYPES = (
+    NotificationType.LEVEL_1_INCREASE,
+    NotificationType.LEVEL_2_INCREASE,
+    NotificationType.LEVEL_3_INCREASE,
+    NotificationType.LEVEL_4_INCREASE,
+    NotificationType.LEVEL_5_INCREASE,
+    NotificationType.LEVEL_1_DECREASE,
+    NotificationType.LEVEL_2_DECREASE,
+    NotificationType.LEVEL_3_DECREASE,
+    NotificationType.LEVEL_4_DECREASE,
+    NotificationType.LEVEL_5_DECREASE,
+)
+_INCREASE = slice(0, 5)
+_DECREASE = slice(5, 10)
+
+
+def _levels(change: np.ndarray, increase: np.ndarray, decrease: np.ndarray) -> np.ndarray:
+    # Index into _LEVEL_TYPES, -1 for none. Thresholds are ordered like Stock's, largest
+    # move first, and the first threshold reached wins.
+    with np.errstate(invalid="ignore"):
+        up = (change[..., None] >= increase).sum(axis=-1)
+        down = (change[..., None] <= decrease).sum(axis=-1)
+    return np.where(up > 0, 5 - up, np.where(down > 0, 10 - down, -1))
+
+
+class NotificationBacktester:
+    """Counts the notifications Stock.generate_notifications would send, for whole
+    (symbols x days) matrices at once.
+
+    Each session starts with an empty notification history, as a monitor does every day.
+    The per-session state machine (deduplication, the silent market-open level, SMA
+    suppression, erased-gains resets) advances one evaluation step at a time across all
+    sessions. Crypto handling, the price delay window and target prices are not modelled.
+    """
+
+    def run(self, history: PriceHistory, rule_sets: list[RuleSet]) -> list[BacktestReport]:
+        return [self.evaluate(history, rule_set) for rule_set in rule_sets]
+
+    def evaluate(self, history: PriceHistory, rule_set: RuleSet) -> BacktestReport:
+        inc, dec = build_percentage_thresholds(rule_set.level_start, rule_set.level_step)
+        increase = np.array([float(threshold) for threshold, _ in inc])
+        decrease = np.array([float(threshold) for threshold, _ in dec])
+        close_to_sma = float(rule_set.close_to_sma)
+
+        previous_close = history.previous_close
+        paths = history.paths
+        with np.errstate(invalid="ignore"):
+            sessions = (previous_close > 0) & np.any(~np.isnan(paths), axis=2)
+            open_change = (history.open - previous_close) / previous_close * 100
+        open_level = np.where(sessions, _levels(open_change, increase, decrease), -1)
+
+        shape = previous_close.shape
+        opened = np.zeros(shape, dtype=bool)
+        levels_sent = np.zeros(shape + (len(_LEVEL_TYPES),), dtype=bool)
+        sent = {
+            notification_type: np.zeros(shape, dtype=bool)
+            for notification_type in (
+                NotificationType.SMA50_CROSSED,
+                NotificationType.CLOSE_TO_SMA50,
+                NotificationType.SMA200_CROSSED,
+                NotificationType.CLOSE_TO_SMA200,
+                NotificationType.NEW_52_WEEK_HIGH,
+                NotificationType.NEW_52_WEEK_LOW,
+                NotificationType.SESSION_GAINS_ERASED,
+                NotificationType.SESSION_LOSSES_ERASED,
+            )
+        }
+        counts = {notification_type: 0 for notification_type in NotificationType}
+        counts[NotificationType.REGULAR_MARKET_OPEN] = int(sessions.sum())
+        counts[NotificationType.REGULAR_MARKET_CLOSED] = int(sessions.sum())
+
+        for step in range(paths.shape[2]):
+            price = paths[:, :, step]
+            with np.errstate(invalid="ignore"):
+                valid = sessions & ~np.isnan(price)
+                change = (price - previous_close) / previous_close * 100
+            # Candidates are generated against the history from before this evaluation.
+            any_increase = levels_sent[:, :, _INCREASE].any(axis=2)
+            any_decrease = levels_sent[:, :, _DECREASE].any(axis=2)
+            market_open = valid & ~opened
+
+            level = np.where(valid, _levels(change, increase, decrease), -1)
+            rows, columns = np.nonzero(level >= 0)
+            candidate = np.zeros(shape, dtype=bool)
+            candidate[rows, columns] = ~levels_sent[rows, columns, level[rows, columns]]
+            # The level the session opened at is recorded with the market-open message
+            # instead of being sent on its own.
+            accepted = candidate & ~(market_open & (level == open_level))
+            for index, count in enumerate(np.bincount(level[accepted], minlength=10)):
+                counts[_LEVEL_TYPES[index]] += int(count)
+            rows, columns = np.nonzero(candidate)
+            levels_sent[rows, columns, level[rows, columns]] = True
+
+            for average, crossed_type, close_type in (
+                (
+                    history.fifty_day_average,
+                    NotificationType.SMA50_CROSSED,
+                    NotificationType.CLOSE_TO_SMA50,
+                ),
+                (
+                    history.two_hundred_day_average,
+                    NotificationType.SMA200_CROSSED,
+                    NotificationType.CLOSE_TO_SMA200,
+                ),
+            ):
+                with np.errstate(invalid="ignore"):
+                    below, above = previous_close < average, previous_close > average
+                    distance = (average - price) / price * 100
+                    crossed = valid & (below & (price >= average) | above & (price <= average))
+                    close = valid & (
+                        below & (price < average) & (distance <= close_to_sma)
+                        | above & (price > average) & (distance >= -close_to_sma)
+                    )
+                crossed &= ~sent[crossed_type]
+                sent[crossed_type] |= crossed
+                close &= ~sent[close_type] & ~sent[crossed_type]
+                sent[close_type] |= close
+                counts[crossed_type] += int(crossed.sum())
+                counts[close_type] += int(close.sum())
+
+            # 52-week extremes compare against the previous evaluation's snapshot.
+            with np.errstate(invalid="ignore"):
+                seen = valid & opened
+                new_high = seen & (price > history.fifty_two_week_high)
+                new_low = seen & (price < history.fifty_two_week_low)
+                gains_erased = valid & (change < 0) & any_increase
+                losses_erased = valid & (change > 0) & any_decrease
+            for notification_type, fired in (
+                (NotificationType.NEW_52_WEEK_HIGH, new_high),
+                (NotificationType.NEW_52_WEEK_LOW, new_low),
+                (NotificationType.SESSION_GAINS_ERASED, gains_erased),
+                (NotificationType.SESSION_LOSSES_ERASED, losses_erased),
+            ):
+                fired &= ~sent[notification_type]
+                sent[notification_type] |= fired
+                counts[notification_type] += int(fired.sum())
+            levels_sent[gains_erased, _INCREASE] = False
+            levels_sent[losses_erased, _DECREASE] = False
+
+            opened |= valid
+
+        return BacktestReport(
+            rule_set=rule_set,
+            sessions=int(sessions.sum()),
+            counts={t: count for t, count in counts.items() if count},
+        )
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import os
+import stat
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field, replace
 from decimal import Decimal
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - advisory locking is POSIX-only
+    fcntl = None
+
+from ..domain.rules import RULE_NAMES
 from .exceptions import ConfigLoadingFailed
 
 CONFIGS_DIR = Path(__file__).resolve().parents[3] / "configs"
@@ -20,28 +32,140 @@ class SymbolConfig:
 class MonitorStocksConfig:
     interval: int
     symbols: list[SymbolConfig]
+    # Names of the notification rules to evaluate; None evaluates every built-in rule.
+    rules: tuple[str, ...] | None = None
 
     def __post_init__(self) -> None:
         if not isinstance(self.interval, int) or self.interval <= 0:
             raise ValueError("interval must be a positive integer")
         if not isinstance(self.symbols, list) or not self.symbols:
             raise ValueError("symbols must be a non-empty list")
+        if self.rules is not None:
+            unknown = sorted(set(self.rules) - set(RULE_NAMES))
+            if unknown:
+                raise ValueError(f"unknown notification rules: {', '.join(unknown)}")
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigDiff:
+    added_symbols: frozenset[str] = frozenset()
+    removed_symbols: frozenset[str] = frozenset()
+    added_targets: dict[str, list[Decimal]] = field(default_factory=dict)
+    removed_targets: dict[str, list[Decimal]] = field(default_factory=dict)
+
+    @staticmethod
+    def between(old: MonitorStocksConfig, new: MonitorStocksConfig) -> ConfigDiff:
+        old_prices = {s.symbol: s.prices for s in old.symbols}
+        new_prices = {s.symbol: s.prices for s in new.symbols}
+        added_targets = {
+            symbol: added
+            for symbol, prices in new_prices.items()
+            if (added := [p for p in prices if p not in old_prices.get(symbol, [])])
+        }
+        removed_targets = {
+            symbol: removed
+            for symbol, prices in old_prices.items()
+            if (removed := [p for p in prices if p not in new_prices.get(symbol, [])])
+        }
+        return ConfigDiff(
+            added_symbols=frozenset(new_prices.keys() - old_prices.keys()),
+            removed_symbols=frozenset(old_prices.keys() - new_prices.keys()),
+            added_targets=added_targets,
+            removed_targets=removed_targets,
+        )
+
+    @property
+    def changed_symbols(self) -> set[str]:
+        # Tracked symbols whose targets must be re-synced.
+        changed = set(self.added_symbols) | self.added_targets.keys() | self.removed_targets.keys()
+        return changed - self.removed_symbols
+
+    def is_empty(self) -> bool:
+        return not (
+            self.added_symbols or self.removed_symbols or self.added_targets or self.removed_targets
+        )
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _write_atomically(path: Path, text: str) -> None:
+    # Readers see either the old or the new file, never a partially written one.
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        try:
+            os.chmod(temp_name, stat.S_IMODE(path.stat().st_mode))
+        except FileNotFoundError:
+            os.chmod(temp_name, 0o644)
+        os.replace(temp_name, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(temp_name)
+        raise
+
+
+def _lock_path(path: Path) -> Path:
+    # The lock lives in a sidecar file because os.replace swaps the config's inode.
+    return path.with_name(f".{path.name}.lock")
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
 
 
 class ConfigManager:
     def __init__(self, path: Path) -> None:
         self._path = path
+        self._pending: MonitorStocksConfig | None = None
+
+    def signature(self) -> tuple[int, int] | None:
+        # Cheap change check: (mtime_ns, size) of the file, None when it cannot be stat'ed.
+        return _file_signature(self._path)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        # Mutations inside the block share one locked read and result in at most one rewrite.
+        if self._pending is not None:
+            yield
+            return
+        with _file_lock(_lock_path(self._path)):
+            original = self.read_monitor_stocks_config()
+            self._pending = original
+            try:
+                yield
+                if self._pending != original:
+                    self._write(self._pending)
+            finally:
+                self._pending = None
 
     def write_monitor_stocks_config(self, config: MonitorStocksConfig) -> None:
-        data = {
-            "interval": config.interval,
-            "symbols": [
-                {"symbol": s.symbol, "prices": [float(p) for p in s.prices]} for s in config.symbols
-            ],
-        }
-        self._path.write_text(json.dumps(data, indent=2))
+        if self._pending is not None:
+            self._pending = config
+            return
+        with _file_lock(_lock_path(self._path)):
+            self._write(config)
 
     def read_monitor_stocks_config(self) -> MonitorStocksConfig:
+        if self._pending is not None:
+            return self._pending
         try:
             data = json.loads(self._path.read_text())
             symbols = [
@@ -51,9 +175,11 @@ class ConfigManager:
                 )
                 for s in data["symbols"]
             ]
+            rules = data.get("rules")
             return MonitorStocksConfig(
                 interval=data["interval"],
                 symbols=symbols,
+                rules=tuple(rules) if rules is not None else None,
             )
         except FileNotFoundError as e:
             raise ConfigLoadingFailed(f"config file not found: {self._path}") from e
@@ -63,33 +189,83 @@ class ConfigManager:
             raise ConfigLoadingFailed(f"unexpected error loading config: {e}") from e
 
     def replace_symbol_prices(self, symbol: str, prices: list[Decimal]) -> None:
-        config = self.read_monitor_stocks_config()
-        updated = [
-            SymbolConfig(symbol=sc.symbol, prices=prices) if sc.symbol == symbol else sc
-            for sc in config.symbols
-        ]
-        self.write_monitor_stocks_config(
-            MonitorStocksConfig(interval=config.interval, symbols=updated)
-        )
+        with self.batch():
+            self._update(
+                lambda sc: (
+                    SymbolConfig(symbol=sc.symbol, prices=prices) if sc.symbol == symbol else sc
+                )
+            )
+
+    def add_target(self, symbol: str, price: Decimal) -> bool:
+        with self.batch():
+            return self._update(
+                lambda sc: (
+                    SymbolConfig(symbol=sc.symbol, prices=sc.prices + [price])
+                    if sc.symbol == symbol and price not in sc.prices
+                    else sc
+                )
+            )
+
+    def remove_target(self, symbol: str, price: Decimal) -> bool:
+        return self.remove_targets({(symbol, price)})
+
+    def remove_targets(self, targets: set[tuple[str, Decimal]]) -> bool:
+        with self.batch():
+            return self._update(
+                lambda sc: SymbolConfig(
+                    symbol=sc.symbol,
+                    prices=[p for p in sc.prices if (sc.symbol, p) not in targets],
+                )
+            )
 
     def add_symbol(self, symbol: str) -> None:
-        config = self.read_monitor_stocks_config()
-        updated = config.symbols + [SymbolConfig(symbol=symbol, prices=[])]
-        self.write_monitor_stocks_config(
-            MonitorStocksConfig(interval=config.interval, symbols=updated)
-        )
+        with self.batch():
+            config = self.read_monitor_stocks_config()
+            self.write_monitor_stocks_config(
+                replace(config, symbols=config.symbols + [SymbolConfig(symbol=symbol, prices=[])])
+            )
 
     def remove_symbol(self, symbol: str) -> None:
+        with self.batch():
+            config = self.read_monitor_stocks_config()
+            self.write_monitor_stocks_config(
+                replace(config, symbols=[sc for sc in config.symbols if sc.symbol != symbol])
+            )
+
+    def _update(self, update: Callable[[SymbolConfig], SymbolConfig]) -> bool:
         config = self.read_monitor_stocks_config()
-        updated = [sc for sc in config.symbols if sc.symbol != symbol]
-        self.write_monitor_stocks_config(
-            MonitorStocksConfig(interval=config.interval, symbols=updated)
-        )
+        updated = [update(sc) for sc in config.symbols]
+        if updated == config.symbols:
+            return False
+        self.write_monitor_stocks_config(replace(config, symbols=updated))
+        return True
+
+    def _write(self, config: MonitorStocksConfig) -> None:
+        data = {
+            "interval": config.interval,
+            "symbols": [
+                {"symbol": s.symbol, "prices": [float(p) for p in s.prices]} for s in config.symbols
+            ],
+        }
+        if config.rules is not None:
+            data["rules"] = list(config.rules)
+        _write_atomically(self._path, json.dumps(data, indent=2))
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedConfig:
+    signature: tuple[int, int]
+    config: MonitorStocksConfig | None
 
 
 class ConfigStore:
+    # Parsed configs are cached per file and only re-read when their mtime or size changes;
+    # the symbol index is rebuilt only when at least one file changed.
     def __init__(self, configs_dir: Path) -> None:
         self._configs_dir = configs_dir
+        self._lock = threading.Lock()
+        self._cache: dict[Path, _CachedConfig] = {}
+        self._symbol_index: dict[str, tuple[Path, SymbolConfig]] = {}
 
     def list_paths(self) -> list[Path]:
         if not self._configs_dir.exists():
@@ -99,47 +275,74 @@ class ConfigStore:
     def list_names(self) -> list[str]:
         return [path.stem for path in self.list_paths()]
 
+    def open(self, path: Path) -> ConfigManager:
+        return ConfigManager(path)
+
     def find_by_name(self, name: str) -> tuple[Path, MonitorStocksConfig] | None:
-        if not self._configs_dir.exists():
-            return None
         path = self._configs_dir / f"{name}.json"
-        try:
-            return path, ConfigManager(path).read_monitor_stocks_config()
-        except ConfigLoadingFailed:
+        with self._lock:
+            self._refresh()
+            cached = self._cache.get(path)
+        if cached is None or cached.config is None:
             return None
+        return path, cached.config
 
     def find_for_symbol(self, symbol: str) -> tuple[Path, MonitorStocksConfig] | None:
-        for path in self.list_paths():
-            try:
-                config = ConfigManager(path).read_monitor_stocks_config()
-                if any(s.symbol == symbol.upper() for s in config.symbols):
-                    return path, config
-            except ConfigLoadingFailed:
-                continue
-        return None
+        with self._lock:
+            self._refresh()
+            entry = self._symbol_index.get(symbol.upper())
+            if entry is None:
+                return None
+            path = entry[0]
+            return path, self._cache[path].config
 
     def list_tracked_symbols(self) -> list[str]:
-        symbols: set[str] = set()
-        for path in self.list_paths():
-            try:
-                config = ConfigManager(path).read_monitor_stocks_config()
-                for sc in config.symbols:
-                    symbols.add(sc.symbol)
-            except ConfigLoadingFailed:
-                continue
-        return sorted(symbols)
+        with self._lock:
+            self._refresh()
+            return sorted(self._symbol_index)
 
     def list_tracked_symbols_with_targets(self) -> list[tuple[str, list[Decimal]]]:
-        symbols: dict[str, list[Decimal]] = {}
-        for path in self.list_paths():
-            try:
-                config = ConfigManager(path).read_monitor_stocks_config()
-                for sc in config.symbols:
-                    if sc.symbol not in symbols:
-                        symbols[sc.symbol] = sc.prices
-            except ConfigLoadingFailed:
+        with self._lock:
+            self._refresh()
+            return [
+                (symbol, list(self._symbol_index[symbol][1].prices))
+                for symbol in sorted(self._symbol_index)
+            ]
+
+    def _refresh(self) -> None:
+        paths = self.list_paths()
+        changed = len(paths) != len(self._cache)
+        cache: dict[Path, _CachedConfig] = {}
+        for path in paths:
+            signature = _file_signature(path)
+            if signature is None:
+                changed = True
+                continue
+            cached = self._cache.get(path)
+            if cached is None or cached.signature != signature:
+                cached = _CachedConfig(signature=signature, config=self._load(path))
+                changed = True
+            cache[path] = cached
+        self._cache = cache
+        if changed:
+            self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        # Paths are sorted, so the alphabetically first config wins for duplicated symbols.
+        index: dict[str, tuple[Path, SymbolConfig]] = {}
+        for path, cached in self._cache.items():
+            if cached.config is None:
                 continue
-        return [(s, symbols[s]) for s in sorted(symbols)]
+            for sc in cached.config.symbols:
+                index.setdefault(sc.symbol, (path, sc))
+        self._symbol_index = index
+
+    @staticmethod
+    def _load(path: Path) -> MonitorStocksConfig | None:
+        try:
+            return ConfigManager(path).read_monitor_stocks_config()
+        except ConfigLoadingFailed:
+            return None
 
     def validate_name(self, name: str) -> str | None:
         if not name or not name.strip():
@@ -159,3 +362,4 @@ class ConfigStore:
 
     def delete_by_path(self, path: Path) -> None:
         path.unlink()
+        _lock_path(path).unlink(missing_ok=True)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import socket
+import socketserver
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from ..application.interfaces import LoggerFactory
+
+# A command returns the JSON object sent back to the client.
+ControlHandler = Callable[[], dict]
+
+
+class ControlSocketServer:
+    # Serves a process's control commands on a Unix socket, one request per connection: the
+    # client sends {"command": name} as a JSON line and reads back one JSON line. Handlers run
+    # on the server's threads, so they must only read snapshots or raise flags.
+    def __init__(
+        self,
+        path: Path,
+        handlers: dict[str, ControlHandler],
+        logger_factory: LoggerFactory,
+    ) -> None:
+        self._path = path
+        self._handlers = handlers
+        self._logger = logger_factory.get_logger(__name__)
+        # A socket left behind by a killed process would make bind fail.
+        path.unlink(missing_ok=True)
+        self._server = socketserver.ThreadingUnixStreamServer(str(path), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.1},
+            name="control-socket",
+            daemon=True,
+        )
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._path.unlink(missing_ok=True)
+
+    def _handle(self, line: bytes) -> dict:
+        try:
+            request = json.loads(line)
+            command = request["command"]
+            handler = self._handlers[command]
+        except (ValueError, TypeError, KeyError):
+            return {"ok": False, "error": f"unknown request: {line[:100]!r}"}
+        try:
+            return {"ok": True, **handler()}
+        except Exception as e:
+            self._logger.error(f"Control command {command} failed: {e}")
+            return {"ok": False, "error": str(e)}
+
+    def _make_handler(self) -> type[socketserver.StreamRequestHandler]:
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            timeout = 5.0
+
+            def handle(self) -> None:
+                try:
+                    line = self.rfile.readline()
+                except OSError:
+                    return
+                response = server._handle(line)
+                self.wfile.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+
+        return Handler
+
+
+def send_control_command(path: Path, command: str, timeout: float = 5.0) -> dict:
+    # Raises OSError when nothing listens on the socket and ValueError on a garbled reply.
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        connection.connect(str(path))
+        connection.sendall(json.dumps({"command": command}).encode("utf-8") + b"\n")
+        with connection.makefile("rb") as reply:
+            response = json.loads(reply.readline())
+    if not isinstance(response, dict):
+        raise ValueError(f"unexpected control reply: {response!r}")
+    return response
@@ -5,3 +5,7 @@ class ConfigurationError(Exception):
 
 class ConfigLoadingFailed(Exception):
     pass
+
+
+class RecordingLoadingFailed(Exception):
+    pass
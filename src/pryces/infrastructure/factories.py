@@ -1,5 +1,12 @@
+from __future__ import annotations
+
 import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
+from .configs import CONFIGS_DIR, ConfigManager, ConfigStore
 from .exceptions import ConfigurationError
 from .logging import (
     BOT_ENTRY_POINT,
@@ -8,13 +15,41 @@ from .logging import (
     REPORT_ENTRY_POINT,
     LoggingSettings,
 )
-from .providers import YahooFinanceSettings
-from .senders import TelegramSettings
+from .monitor_registry import DEFAULT_RUNTIME_DIRECTORY, MonitorRegistry
+from .queues import OverflowPolicy
+from .senders import TELEGRAM_API_BASE_URL, FireAndForgetSettings, TelegramSettings
+from .sqlite_configs import (
+    SqliteConfigDatabase,
+    SqliteConfigManager,
+    SqliteConfigStore,
+    is_database_locator,
+)
+
+if TYPE_CHECKING:
+    # providers pulls in pandas and yfinance, and receivers an HTTP server; entry points that
+    # never use them skip loading them.
+    from .providers import YahooFinanceSettings
+    from .receivers import WebhookSettings
+
+# Telegram's own limits for a webhook secret_token.
+_SECRET_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,256}")
+
+
+def _json_log_format() -> bool:
+    log_format = os.environ.get("LOG_FORMAT", "text").strip().lower()
+    if log_format not in ("text", "json"):
+        raise ConfigurationError(
+            f"Invalid value for LOG_FORMAT: '{os.environ.get('LOG_FORMAT')}'"
+            f" — expected 'text' or 'json'"
+        )
+    return log_format == "json"
 
 
 class SettingsFactory:
     @staticmethod
     def create_yahoo_finance_settings(extra_delay_in_minutes: int = 0) -> YahooFinanceSettings:
+        from .providers import YahooFinanceSettings
+
         try:
             return YahooFinanceSettings(
                 max_workers=int(os.environ["MAX_FETCH_WORKERS"]),
@@ -35,6 +70,7 @@ class SettingsFactory:
             verbose=verbose,
             debug=debug,
             logs_directory=os.environ.get("LOGS_DIRECTORY"),
+            json_format=_json_log_format(),
         )
 
     @staticmethod
@@ -46,6 +82,7 @@ class SettingsFactory:
             verbose=verbose,
             debug=debug,
             logs_directory=os.environ.get("LOGS_DIRECTORY"),
+            json_format=_json_log_format(),
         )
 
     @staticmethod
@@ -55,6 +92,7 @@ class SettingsFactory:
             verbose=verbose,
             debug=debug,
             logs_directory=os.environ.get("LOGS_DIRECTORY"),
+            json_format=_json_log_format(),
         )
 
     @staticmethod
@@ -66,6 +104,7 @@ class SettingsFactory:
             verbose=verbose,
             debug=debug,
             logs_directory=os.environ.get("LOGS_DIRECTORY"),
+            json_format=_json_log_format(),
         )
 
     @staticmethod
@@ -74,6 +113,90 @@ class SettingsFactory:
             return TelegramSettings(
                 bot_token=os.environ["TELEGRAM_BOT_TOKEN"],
                 group_id=os.environ["TELEGRAM_GROUP_ID"],
+                api_base_url=os.environ.get("TELEGRAM_API_BASE_URL", TELEGRAM_API_BASE_URL).rstrip(
+                    "/"
+                ),
             )
         except KeyError as e:
             raise ConfigurationError(f"Missing required environment variable: {e}") from e
+
+    @staticmethod
+    def create_webhook_settings(host: str, port: int) -> WebhookSettings:
+        from .receivers import WebhookSettings
+
+        secret_token = os.environ.get("TELEGRAM_WEBHOOK_SECRET") or None
+        if secret_token is not None and not _SECRET_TOKEN_PATTERN.fullmatch(secret_token):
+            raise ConfigurationError(
+                "Invalid value for TELEGRAM_WEBHOOK_SECRET"
+                " — expected 1 to 256 letters, digits, '_' or '-'"
+            )
+        public_url = os.environ.get("TELEGRAM_WEBHOOK_URL") or None
+        if public_url is None:
+            return WebhookSettings(host=host, port=port, secret_token=secret_token)
+        # The server answers on the public URL's path, so a proxy can forward it unchanged.
+        return WebhookSettings(
+            host=host,
+            port=port,
+            public_url=public_url,
+            secret_token=secret_token,
+            path=urlparse(public_url).path or "/",
+        )
+
+    @staticmethod
+    def create_fire_and_forget_settings() -> FireAndForgetSettings:
+        defaults = FireAndForgetSettings()
+        raw_policy = os.environ.get("SEND_QUEUE_POLICY", defaults.overflow_policy.value)
+        try:
+            overflow_policy = OverflowPolicy(raw_policy.upper())
+        except ValueError as e:
+            raise ConfigurationError(
+                f"Invalid value for SEND_QUEUE_POLICY: '{raw_policy}'"
+                f" — expected one of {', '.join(p.value for p in OverflowPolicy)}"
+            ) from e
+        return FireAndForgetSettings(
+            workers=SettingsFactory._read_positive_int("MAX_SEND_WORKERS", defaults.workers),
+            starvation_limit=defaults.starvation_limit,
+            max_queue_size=SettingsFactory._read_positive_int(
+                "SEND_QUEUE_SIZE", defaults.max_queue_size
+            ),
+            overflow_policy=overflow_policy,
+        )
+
+    @staticmethod
+    def _read_positive_int(name: str, default: int) -> int:
+        raw_value = os.environ.get(name)
+        if raw_value is None:
+            return default
+        try:
+            value = int(raw_value)
+        except ValueError as e:
+            raise ConfigurationError(
+                f"Invalid value for {name}: '{raw_value}' — expected an integer"
+            ) from e
+        if value <= 0:
+            raise ConfigurationError(
+                f"Invalid value for {name}: '{raw_value}' — expected a positive integer"
+            )
+        return value
+
+
+class ConfigStoreFactory:
+    @staticmethod
+    def create() -> ConfigStore:
+        database = os.environ.get("CONFIG_DATABASE")
+        if database:
+            return SqliteConfigStore(SqliteConfigDatabase(Path(database)))
+        return ConfigStore(CONFIGS_DIR)
+
+    @staticmethod
+    def open_manager(path: Path) -> ConfigManager:
+        if is_database_locator(path):
+            return SqliteConfigManager(SqliteConfigDatabase(path.parent), path.name)
+        return ConfigManager(path)
+
+
+class MonitorRegistryFactory:
+    @staticmethod
+    def create() -> MonitorRegistry:
+        runtime_directory = os.environ.get("RUNTIME_DIRECTORY") or DEFAULT_RUNTIME_DIRECTORY
+        return MonitorRegistry(Path(runtime_directory) / "monitors")
@@ -3,6 +3,7 @@ from pryces.domain.notifications import (
     STANDALONE_NOTIFICATION_TYPES,
     Notification,
     NotificationFormatter,
+    NotificationMessage,
     NotificationType,
     StockContext,
 )
@@ -11,7 +12,9 @@ from pryces.domain.utils import calculate_percentage_change
 
 
 class ConsolidatingNotificationFormatter(NotificationFormatter):
-    def format(self, notifications: list[Notification], context: StockContext) -> list[str]:
+    def format(
+        self, notifications: list[Notification], context: StockContext
+    ) -> list[NotificationMessage]:
         standalone: list[Notification] = []
         consolidatable: list[Notification] = []
 
@@ -21,16 +24,17 @@ class ConsolidatingNotificationFormatter(NotificationFormatter):
             else:
                 consolidatable.append(n)
 
-        messages: list[str] = []
+        messages: list[NotificationMessage] = []
 
         if consolidatable:
             header = self._pick_header(consolidatable, context)
             body = [n.message for n in consolidatable if n is not header]
             lines = [header.message] + body
-            messages.append("\n".join(lines))
+            priority = min(n.priority for n in consolidatable)
+            messages.append(NotificationMessage(text="\n".join(lines), priority=priority))
 
         for n in standalone:
-            messages.append(n.message)
+            messages.append(NotificationMessage(text=n.message, priority=n.priority))
 
         return messages
 
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from ..application.interfaces import LoggerFactory
+
+_PRICE_COLUMNS = ("Open", "High", "Low", "Close")
+
+
+@dataclass(frozen=True, slots=True)
+class DailyBars:
+    # Price matrices are (symbols, days); days a symbol did not trade are NaN.
+    symbols: list[str]
+    days: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+
+
+def download_daily_history(symbol: str, start: date) -> pd.DataFrame:
+    return yf.Ticker(symbol).history(start=start, interval="1d", auto_adjust=False)
+
+
+def _frame_to_arrays(frame: pd.DataFrame) -> dict[str, np.ndarray]:
+    if frame.empty:
+        return {"days": np.empty(0, dtype="datetime64[D]")} | {
+            column.lower(): np.empty(0) for column in _PRICE_COLUMNS
+        }
+    index = pd.DatetimeIndex(frame.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    arrays = {"days": index.normalize().values.astype("datetime64[D]")}
+    for column in _PRICE_COLUMNS:
+        arrays[column.lower()] = frame[column].to_numpy(dtype=np.float64)
+    return arrays
+
+
+class DailyHistoryCache:
+    # One .npz per symbol; a symbol is downloaded again at most once a day, or when the
+    # requested range starts before what is cached.
+    def __init__(
+        self,
+        cache_dir: Path,
+        logger_factory: LoggerFactory,
+        download: Callable[[str, date], pd.DataFrame] = download_daily_history,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        self._cache_dir = cache_dir
+        self._download = download
+        self._today = today
+        self._logger = logger_factory.get_logger(__name__)
+
+    def load(self, symbols: list[str], years: int) -> DailyBars:
+        today = self._today()
+        start = today - timedelta(days=round(365.25 * years))
+        per_symbol = {symbol: self._load_symbol(symbol, start, today) for symbol in symbols}
+        return self._align(per_symbol, np.datetime64(start, "D"))
+
+    def _load_symbol(self, symbol: str, start: date, today: date) -> dict[str, np.ndarray]:
+        path = self._cache_dir / f"{symbol}.npz"
+        if path.exists():
+            with np.load(path) as cached:
+                arrays = {key: cached[key] for key in cached.files}
+            fresh = date.fromisoformat(str(arrays.pop("fetched_on"))) >= today
+            if fresh and date.fromisoformat(str(arrays.pop("start"))) <= start:
+                return arrays
+        self._logger.info(f"Downloading daily history for {symbol} since {start}")
+        try:
+            arrays = _frame_to_arrays(self._download(symbol, start))
+        except Exception as e:
+            self._logger.error(f"Error downloading history for {symbol}: {e}")
+            return _frame_to_arrays(pd.DataFrame())
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        np.savez(path, fetched_on=str(today), start=str(start), **arrays)
+        return arrays
+
+    @staticmethod
+    def _align(per_symbol: dict[str, dict[str, np.ndarray]], start: np.datetime64) -> DailyBars:
+        all_days = [arrays["days"] for arrays in per_symbol.values()]
+        days = np.unique(np.concatenate(all_days)) if all_days else np.empty(0, "datetime64[D]")
+        days = days[days >= start]
+        shape = (len(per_symbol), len(days))
+        columns = {column.lower(): np.full(shape, np.nan) for column in _PRICE_COLUMNS}
+        for row, arrays in enumerate(per_symbol.values()):
+            keep = arrays["days"] >= start
+            positions = np.searchsorted(days, arrays["days"][keep])
+            for name, matrix in columns.items():
+                matrix[row, positions] = arrays[name][keep]
+        return DailyBars(symbols=list(per_symbol), days=days, **columns)
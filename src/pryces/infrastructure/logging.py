@@ -1,10 +1,15 @@
+import atexit
+import json
 import logging
+import queue
 import sys
+import threading
 from dataclasses import dataclass
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+from pryces.application.correlation import current_cycle_id
 from pryces.application.interfaces import Logger, LoggerFactory
 
 CLI_ENTRY_POINT = "cli"
@@ -21,9 +26,120 @@ class LoggingSettings:
     logs_directory: str | None = None
     max_bytes: int = 5 * 1024 * 1024
     backup_count: int = 3
-
-
-def setup_logging(settings: LoggingSettings) -> None:
+    queue_size: int = 10_000
+    json_format: bool = False
+
+
+class JsonFormatter(logging.Formatter):
+    # One JSON object per line: time, level, logger, message, the cycle id when logged inside a
+    # monitor cycle, then the record's structured fields.
+    _RESERVED = ("time", "level", "logger", "message", "cycle_id", "exception")
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, object] = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        cycle_id = getattr(record, "cycle_id", None)
+        if cycle_id is not None:
+            entry["cycle_id"] = cycle_id
+        for name, value in getattr(record, "fields", {}).items():
+            if name not in self._RESERVED:
+                entry[name] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def _add_cycle_id(record: logging.LogRecord) -> bool:
+    # Runs on the logging thread: the listener thread has no cycle context.
+    if not hasattr(record, "cycle_id"):
+        record.cycle_id = current_cycle_id()
+    return True
+
+
+class _BoundedQueueHandler(QueueHandler):
+    # Hands records over unformatted, so message interpolation also happens on the listener
+    # thread; logged arguments must therefore not be mutated afterwards. A full queue drops the
+    # record rather than blocking the caller.
+    def __init__(self, records: queue.Queue) -> None:
+        super().__init__(records)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _DrainingQueueListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Waits for room instead of failing when the queue is full at shutdown.
+        self.queue.put(self._sentinel)
+
+
+class LogPipeline:
+    # Records are queued by the logging thread and written by a background listener, so a slow
+    # disk or terminal never stalls the monitor cycle. Stopped at exit, after writing what is
+    # still queued.
+    def __init__(
+        self,
+        handlers: list[logging.Handler],
+        level: int,
+        queue_size: int,
+        root_logger: logging.Logger,
+    ) -> None:
+        self._root_logger = root_logger
+        self._handler = _BoundedQueueHandler(queue.Queue(queue_size))
+        self._handler.setLevel(level)
+        self._handler.addFilter(_add_cycle_id)
+        self._listener = _DrainingQueueListener(
+            self._handler.queue, *handlers, respect_handler_level=True
+        )
+        self._lock = threading.Lock()
+        self._stopped = False
+        root_logger.addHandler(self._handler)
+        self._listener.start()
+        atexit.register(self.stop)
+
+    @property
+    def dropped(self) -> int:
+        return self._handler.dropped
+
+    @property
+    def pending(self) -> int:
+        return self._handler.queue.qsize()
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+        self._root_logger.removeHandler(self._handler)
+        self._listener.stop()
+        if self.dropped:
+            record = logging.LogRecord(
+                __name__,
+                logging.WARNING,
+                __file__,
+                0,
+                "Log queue was full, dropped %d record(s)",
+                (self.dropped,),
+                None,
+            )
+            for handler in self._listener.handlers:
+                handler.handle(record)
+        for handler in self._listener.handlers:
+            handler.flush()
+
+
+def setup_logging(settings: LoggingSettings) -> LogPipeline | None:
     level = logging.DEBUG if settings.debug else logging.INFO
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
@@ -31,16 +147,23 @@ def setup_logging(settings: LoggingSettings) -> None:
     if settings.debug:
         logging.getLogger("pryces").setLevel(logging.DEBUG)
 
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    if settings.json_format:
+        formatter: logging.Formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handlers: list[logging.Handler] = []
 
     if settings.verbose:
         stream_handler = logging.StreamHandler(sys.stderr)
         stream_handler.setLevel(level)
         stream_handler.setFormatter(formatter)
-        root_logger.addHandler(stream_handler)
+        handlers.append(stream_handler)
 
     if settings.logs_directory and Path(settings.logs_directory).is_dir():
-        filename = datetime.now().strftime(f"pryces_{settings.entry_point}_%Y%m%d_%H%M%S.log")
+        extension = "jsonl" if settings.json_format else "log"
+        filename = datetime.now().strftime(
+            f"pryces_{settings.entry_point}_%Y%m%d_%H%M%S.{extension}"
+        )
         file_handler = RotatingFileHandler(
             Path(settings.logs_directory) / filename,
             maxBytes=settings.max_bytes,
@@ -48,27 +171,34 @@ def setup_logging(settings: LoggingSettings) -> None:
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
+    if handlers:
+        return LogPipeline(handlers, level, settings.queue_size, root_logger)
     if not root_logger.handlers:
         root_logger.addHandler(logging.NullHandler())
+    return None
+
+
+def _extra(fields: dict[str, object]) -> dict[str, object]:
+    return {"extra": {"fields": fields}} if fields else {}
 
 
 class PythonLogger(Logger):
     def __init__(self, logger: logging.Logger) -> None:
         self._logger = logger
 
-    def debug(self, message: str) -> None:
-        self._logger.debug(message)
+    def debug(self, message: str, *args: object, **fields: object) -> None:
+        self._logger.debug(message, *args, **_extra(fields))
 
-    def info(self, message: str) -> None:
-        self._logger.info(message)
+    def info(self, message: str, *args: object, **fields: object) -> None:
+        self._logger.info(message, *args, **_extra(fields))
 
-    def warning(self, message: str) -> None:
-        self._logger.warning(message)
+    def warning(self, message: str, *args: object, **fields: object) -> None:
+        self._logger.warning(message, *args, **_extra(fields))
 
-    def error(self, message: str) -> None:
-        self._logger.error(message)
+    def error(self, message: str, *args: object, **fields: object) -> None:
+        self._logger.error(message, *args, **_extra(fields))
 
 
 class PythonLoggerFactory(LoggerFactory):
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_RUNTIME_DIRECTORY = Path(__file__).resolve().parents[3] / ".run"
+_PROC = Path("/proc")
+
+
+@dataclass(frozen=True, slots=True)
+class MonitorRecord:
+    pid: int
+    config_path: str
+    started_at: datetime
+    last_cycle_at: datetime | None = None
+
+
+def control_path(directory: Path, pid: int) -> Path:
+    # The monitor's control socket, next to its registry entry.
+    return directory / f"{pid}.sock"
+
+
+def _process_start(proc: Path, pid: int) -> str | None:
+    # Field 22 of /proc/<pid>/stat, the start time in clock ticks since boot. A recycled pid
+    # has a different one. The command name in parentheses may contain spaces.
+    try:
+        stat = (proc / str(pid) / "stat").read_text()
+    except OSError:
+        return None
+    return stat.rpartition(")")[2].split()[19]
+
+
+class MonitorRegistration:
+    # One running monitor's entry: <pid>.json holds the record, <pid>.pid marks it as live.
+    def __init__(
+        self,
+        directory: Path,
+        record: MonitorRecord,
+        process_start: str | None,
+        clock: Callable[[], datetime],
+    ) -> None:
+        self._directory = directory
+        self._record = record
+        self._process_start = process_start
+        self._clock = clock
+        self._write()
+        (directory / f"{record.pid}.pid").write_text(f"{record.pid}\n")
+
+    @property
+    def record(self) -> MonitorRecord:
+        return self._record
+
+    @property
+    def control_path(self) -> Path:
+        return control_path(self._directory, self._record.pid)
+
+    def beat(self) -> None:
+        self._record = MonitorRecord(
+            self._record.pid, self._record.config_path, self._record.started_at, self._clock()
+        )
+        self._write()
+
+    def close(self) -> None:
+        for suffix in ("pid", "json"):
+            (self._directory / f"{self._record.pid}.{suffix}").unlink(missing_ok=True)
+
+    def _write(self) -> None:
+        record = self._record
+        data = {
+            "pid": record.pid,
+            "config": record.config_path,
+            "started_at": record.started_at.isoformat(),
+            "last_cycle_at": record.last_cycle_at.isoformat() if record.last_cycle_at else None,
+            "process_start": self._process_start,
+        }
+        temporary = self._directory / f".{record.pid}.json.tmp"
+        temporary.write_text(json.dumps(data))
+        os.replace(temporary, self._directory / f"{record.pid}.json")
+
+
+class MonitorRegistry:
+    # Running monitors register themselves here, so listing them reads one small file per
+    # monitor instead of scanning every process on the machine. Entries left behind by a killed
+    # monitor are detected through /proc and removed; without /proc, a signal 0 probe is used.
+    def __init__(
+        self,
+        directory: Path,
+        proc: Path = _PROC,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self._directory = directory
+        self._proc = proc
+        self._clock = clock
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def control_path(self, pid: int) -> Path:
+        return control_path(self._directory, pid)
+
+    def register(self, config_path: str, pid: int | None = None) -> MonitorRegistration:
+        pid = os.getpid() if pid is None else pid
+        self._directory.mkdir(parents=True, exist_ok=True)
+        return MonitorRegistration(
+            self._directory,
+            MonitorRecord(pid=pid, config_path=config_path, started_at=self._clock()),
+            _process_start(self._proc, pid),
+            self._clock,
+        )
+
+    def list(self) -> list[MonitorRecord]:
+        records = []
+        for pidfile in sorted(self._directory.glob("*.pid")):
+            try:
+                data = json.loads(pidfile.with_suffix(".json").read_text())
+            except FileNotFoundError:
+                # Registered between the two writes, or unregistering right now.
+                continue
+            except (OSError, ValueError):
+                data = None
+            if not isinstance(data, dict) or not self._is_alive(
+                data.get("pid"), data.get("process_start")
+            ):
+                for suffix in (".pid", ".json", ".sock"):
+                    pidfile.with_suffix(suffix).unlink(missing_ok=True)
+                continue
+            last_cycle_at = data.get("last_cycle_at")
+            records.append(
+                MonitorRecord(
+                    pid=data["pid"],
+                    config_path=data["config"],
+                    started_at=datetime.fromisoformat(data["started_at"]),
+                    last_cycle_at=datetime.fromisoformat(last_cycle_at) if last_cycle_at else None,
+                )
+            )
+        return sorted(records, key=lambda record: record.started_at)
+
+    def _is_alive(self, pid: int | None, process_start: str | None) -> bool:
+        if not isinstance(pid, int) or pid <= 0:
+            return False
+        if process_start is not None:
+            return _process_start(self._proc, pid) == process_start
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
@@ -1,17 +1,29 @@
 from __future__ import annotations
 
 import math
+import threading
+import time
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from pathlib import Path
+from typing import Any
 
 import pandas as pd
 import yfinance as yf
 
-from ..application.interfaces import LoggerFactory, StockProvider, StockStatisticsProvider
+from ..application.correlation import bind_cycle
+from ..application.interfaces import (
+    LoggerFactory,
+    QuoteProvider,
+    StockProvider,
+    StockStatisticsProvider,
+)
 from ..domain.stock_statistics import HistoricalClose, StatisticsPeriod, StockStatistics
-from ..domain.stocks import Currency, InstrumentType, MarketState, Stock
+from ..domain.stocks import Currency, InstrumentType, MarketState, QuoteDelta, Stock
+from .recordings import InfoRecorder, read_recording
 
 _CURRENCY_ALIASES: dict[str, Currency] = {
     "GBp": Currency.GBP,
@@ -35,28 +47,106 @@ class YahooFinanceSettings:
     extra_delay_in_minutes: int
 
 
+# Stock constructor arguments mapped from yfinance info keys holding prices.
+_DECIMAL_FIELDS = {
+    "previous_close_price": "previousClose",
+    "open_price": "open",
+    "day_high": "dayHigh",
+    "day_low": "dayLow",
+    "fifty_day_average": "fiftyDayAverage",
+    "two_hundred_day_average": "twoHundredDayAverage",
+    "fifty_two_week_high": "fiftyTwoWeekHigh",
+    "fifty_two_week_low": "fiftyTwoWeekLow",
+    "market_cap": "marketCap",
+}
+
+
+def _to_decimal(value) -> Decimal | None:
+    return Decimal(str(value)) if value is not None else None
+
+
+# Order of the values in a raw quote, the unconverted info values a delta is computed from.
+_RAW_FIELDS = (
+    *_DECIMAL_FIELDS,
+    "current_price",
+    "name",
+    "currency",
+    "market_state",
+    "price_delay_in_minutes",
+    "kind",
+)
+
+
 class YahooFinanceMapper:
     def __init__(self, extra_delay_in_minutes: int, logger_factory: LoggerFactory) -> None:
         self._extra_delay_in_minutes = extra_delay_in_minutes
         self._logger = logger_factory.get_logger(__name__)
+        # One converter per raw quote value, in _RAW_FIELDS order.
+        self._converters: tuple[Callable[[Any], Any], ...] = (
+            *[_to_decimal] * len(_DECIMAL_FIELDS),
+            _to_decimal,
+            lambda name: name,
+            self._map_currency,
+            self._map_market_state,
+            lambda delay: delay + self._extra_delay_in_minutes,
+            self._map_instrument_type,
+        )
 
     def map(self, symbol: str, info: dict) -> Stock | None:
+        current_price = self._current_price(symbol, info)
+        if current_price is None:
+            return None
+        return self._to_stock(symbol, info, current_price)
+
+    def map_delta(
+        self, symbol: str, info: dict, previous: tuple | None
+    ) -> tuple[QuoteDelta, tuple] | None:
+        # Compares raw info values against the previous raw quote, so unchanged fields skip
+        # conversion. Returns the delta and the raw quote to compare the next one against.
+        raw = self._raw_quote(symbol, info)
+        if raw is None:
+            return None
+        if previous is None:
+            changes = {
+                name: convert(value)
+                for name, convert, value in zip(_RAW_FIELDS, self._converters, raw)
+            }
+            return QuoteDelta(symbol.upper(), changes, full=True), raw
+        changes = {
+            name: convert(value)
+            for name, convert, value, old in zip(_RAW_FIELDS, self._converters, raw, previous)
+            if value != old
+        }
+        return QuoteDelta(symbol.upper(), changes), raw
+
+    def _current_price(self, symbol: str, info: dict) -> float | None:
         # yfinance returns a small metadata-only dict (≤3 keys) for invalid/delisted symbols
         if not info or len(info) <= 3:
             self._logger.error(f"No data available for symbol: {symbol}")
             return None
 
-        current_price = None
         for price_key in ["currentPrice", "regularMarketPrice", "previousClose"]:
             if price_key in info and info[price_key] is not None:
-                current_price = info[price_key]
-                break
+                return info[price_key]
+
+        self._logger.error(f"Unable to retrieve current price for symbol: {symbol}")
+        return None
 
+    def _raw_quote(self, symbol: str, info: dict) -> tuple | None:
+        current_price = self._current_price(symbol, info)
         if current_price is None:
-            self._logger.error(f"Unable to retrieve current price for symbol: {symbol}")
             return None
 
-        return self._to_stock(symbol, info, current_price)
+        get = info.get
+        return (
+            *map(get, _DECIMAL_FIELDS.values()),
+            current_price,
+            get("longName") or get("shortName"),
+            get("currency"),
+            get("marketState"),
+            get("exchangeDataDelayedBy") or 0,
+            get("quoteType"),
+        )
 
     def _to_stock(self, symbol: str, info: dict, current_price: float) -> Stock:
         previous_close = info.get("previousClose")
@@ -133,41 +223,163 @@ class YahooFinanceMapper:
                 return None
 
 
-class YahooFinanceProvider(StockProvider):
-    def __init__(self, settings: YahooFinanceSettings, logger_factory: LoggerFactory) -> None:
+class _QuoteCache:
+    # The last raw quote returned per symbol, which the next delta is computed against.
+    # Symbols the caller does not hold a stock for start over with a full quote.
+    def __init__(self, mapper: YahooFinanceMapper) -> None:
+        self._mapper = mapper
+        self._raw: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def quote(self, symbol: str, info: dict, known: set[str]) -> QuoteDelta | None:
+        key = symbol.upper()
+        with self._lock:
+            previous = self._raw.get(key) if key in known else None
+        mapped = self._mapper.map_delta(symbol, info, previous)
+        if mapped is None:
+            return None
+        quote, raw = mapped
+        with self._lock:
+            self._raw[key] = raw
+        return quote
+
+
+class YahooFinanceProvider(StockProvider, QuoteProvider):
+    def __init__(
+        self,
+        settings: YahooFinanceSettings,
+        logger_factory: LoggerFactory,
+        recorder: InfoRecorder | None = None,
+    ) -> None:
         self._max_workers = settings.max_workers
         self._mapper = YahooFinanceMapper(settings.extra_delay_in_minutes, logger_factory)
+        self._quotes = _QuoteCache(self._mapper)
+        self._recorder = recorder
         self._logger = logger_factory.get_logger(__name__)
 
+    def _fetch_info(self, symbol: str) -> dict:
+        started = time.perf_counter()
+        ticker_obj = yf.Ticker(symbol)
+        info = ticker_obj.info
+        if self._recorder is not None:
+            self._recorder.record(symbol, info)
+        del ticker_obj
+        duration = time.perf_counter() - started
+        self._logger.debug(
+            "Fetched stock data for %s in %.3fs",
+            symbol,
+            duration,
+            symbol=symbol,
+            duration=round(duration, 4),
+            outcome="fetched",
+        )
+        return info
+
     def _get_stock(self, symbol: str) -> Stock | None:
         try:
-            self._logger.debug(f"Fetching stock data for {symbol}")
-            ticker_obj = yf.Ticker(symbol)
-            info = ticker_obj.info
-            stock = self._mapper.map(symbol, info)
-            del info, ticker_obj
-            return stock
+            return self._mapper.map(symbol, self._fetch_info(symbol))
         except Exception as e:
-            self._logger.error(f"Error fetching data for {symbol}: {e}")
+            self._logger.error(
+                f"Error fetching data for {symbol}: {e}", symbol=symbol, outcome="error"
+            )
             return None
 
-    def get_stocks(self, symbols: list[str]) -> list[Stock]:
+    def _get_quote(self, symbol: str, known: set[str]) -> QuoteDelta | None:
+        try:
+            return self._quotes.quote(symbol, self._fetch_info(symbol), known)
+        except Exception as e:
+            self._logger.error(
+                f"Error fetching data for {symbol}: {e}", symbol=symbol, outcome="error"
+            )
+            return None
+
+    def _fetch_all(self, fetch: Callable[[str], Any], symbols: list[str]) -> list:
         if not symbols:
             return []
 
         with ThreadPoolExecutor(max_workers=min(len(symbols), self._max_workers)) as executor:
-            results = list(executor.map(self._get_stock, symbols))
+            results = list(executor.map(bind_cycle(fetch), symbols))
 
-        return [stock for stock in results if stock is not None]
+        if self._recorder is not None:
+            self._recorder.end_cycle()
 
+        return [result for result in results if result is not None]
 
-_PERIOD_DELTAS: dict[StatisticsPeriod, timedelta | None] = {
-    StatisticsPeriod.ONE_DAY: timedelta(days=1),
-    StatisticsPeriod.ONE_WEEK: timedelta(weeks=1),
-    StatisticsPeriod.THREE_MONTHS: timedelta(days=90),
-    StatisticsPeriod.ONE_YEAR: timedelta(days=365),
-    StatisticsPeriod.YEAR_TO_DATE: None,
-}
+    def get_stocks(self, symbols: list[str]) -> list[Stock]:
+        return self._fetch_all(self._get_stock, symbols)
+
+    def get_quotes(self, symbols: list[str], known: set[str]) -> list[QuoteDelta]:
+        return self._fetch_all(lambda symbol: self._get_quote(symbol, known), symbols)
+
+
+class ReplayStockProvider(StockProvider, QuoteProvider):
+    # Serves one recorded cycle per get_stocks() or get_quotes() call. speed scales the recorded
+    # gaps between cycles (2.0 replays twice as fast); 0 replays as fast as possible.
+    def __init__(
+        self,
+        path: Path,
+        logger_factory: LoggerFactory,
+        speed: float = 0.0,
+        extra_delay_in_minutes: int = 0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._cycles = read_recording(path)
+        self._speed = speed
+        self._sleep = sleep
+        self._mapper = YahooFinanceMapper(extra_delay_in_minutes, logger_factory)
+        self._quotes = _QuoteCache(self._mapper)
+        self._position = 0
+        self._logger = logger_factory.get_logger(__name__)
+
+    @property
+    def cycles(self) -> int:
+        return len(self._cycles)
+
+    @property
+    def symbols(self) -> list[str]:
+        return sorted({symbol for cycle in self._cycles for symbol in cycle.infos})
+
+    @property
+    def exhausted(self) -> bool:
+        return self._position >= len(self._cycles)
+
+    def clock(self) -> datetime:
+        # Recorded time of the cycle last served, so notification windows replay deterministically.
+        if not self._cycles:
+            return datetime.now()
+        return self._cycles[max(self._position - 1, 0)].recorded_at
+
+    def _replay(self, map_info: Callable[[str, dict], Any], symbols: list[str]) -> list:
+        if self.exhausted:
+            self._logger.debug("Recording exhausted, no stocks to replay")
+            return []
+
+        cycle = self._cycles[self._position]
+        if self._speed > 0 and self._position > 0:
+            gap = cycle.recorded_at - self._cycles[self._position - 1].recorded_at
+            self._sleep(max(gap.total_seconds(), 0) / self._speed)
+        self._position += 1
+
+        results = []
+        for symbol in symbols:
+            info = cycle.infos.get(symbol.upper())
+            if info is None:
+                self._logger.error(f"No recorded data for symbol: {symbol}")
+                continue
+            result = map_info(symbol, info)
+            if result is not None:
+                results.append(result)
+        return results
+
+    def get_stocks(self, symbols: list[str]) -> list[Stock]:
+        return self._replay(self._mapper.map, symbols)
+
+    def get_quotes(self, symbols: list[str], known: set[str]) -> list[QuoteDelta]:
+        return self._replay(lambda symbol, info: self._quotes.quote(symbol, info, known), symbols)
+
+
+# Enough daily closes for every StatisticsPeriod, the one year back included.
+STATISTICS_HISTORY_DAYS = 400
 
 
 class YahooFinanceStatisticsMapper:
@@ -203,12 +415,8 @@ class YahooFinanceStatisticsMapper:
     ) -> list[HistoricalClose]:
         closes: list[HistoricalClose] = []
 
-        for period, delta in _PERIOD_DELTAS.items():
-            if delta is not None:
-                target_date = last_trading_date - delta
-            else:
-                target_date = date(last_trading_date.year - 1, 12, 31)
-
+        for period in StatisticsPeriod:
+            target_date = period.reference_date(last_trading_date)
             subset = history[history.index.date <= target_date]
             if subset.empty:
                 continue
@@ -234,10 +442,12 @@ class YahooFinanceStatisticsProvider(StockStatisticsProvider):
 
     def _get_stock_statistics(self, symbol: str) -> StockStatistics | None:
         try:
-            self._logger.debug(f"Fetching stock statistics for {symbol}")
+            self._logger.debug("Fetching stock statistics for %s", symbol)
             ticker_obj = yf.Ticker(symbol)
             info = ticker_obj.info
-            history = ticker_obj.history(start=date.today() - timedelta(days=400))
+            history = ticker_obj.history(
+                start=date.today() - timedelta(days=STATISTICS_HISTORY_DAYS)
+            )
             stats = self._mapper.map(symbol, info, history)
             del info, history, ticker_obj
             return stats
@@ -253,3 +463,46 @@ class YahooFinanceStatisticsProvider(StockStatisticsProvider):
             results = list(executor.map(self._get_stock_statistics, symbols))
 
         return [stats for stats in results if stats is not None]
+
+
+class CachedStockStatisticsProvider(StockStatisticsProvider):
+    # Serves statistics fetched earlier the same day from memory for up to `max_age`, so
+    # repeated requests skip the download; the misses reach the wrapped provider in one call.
+    # max_age bounds how old the current price in a served result can be.
+    def __init__(
+        self,
+        provider: StockStatisticsProvider,
+        max_age: timedelta = timedelta(minutes=15),
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self._provider = provider
+        self._max_age = max_age
+        self._clock = clock
+        self._entries: dict[str, tuple[datetime, StockStatistics]] = {}
+        self._lock = threading.Lock()
+
+    def get_stock_statistics(self, symbols: list[str]) -> list[StockStatistics]:
+        now = self._clock()
+        requested = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        with self._lock:
+            found = {
+                symbol: entry[1]
+                for symbol in requested
+                if (entry := self._entries.get(symbol)) is not None and self._fresh(entry[0], now)
+            }
+        misses = [symbol for symbol in requested if symbol not in found]
+        if misses:
+            fetched = self._provider.get_stock_statistics(misses)
+            with self._lock:
+                self._entries = {
+                    symbol: entry
+                    for symbol, entry in self._entries.items()
+                    if self._fresh(entry[0], now)
+                }
+                for stats in fetched:
+                    self._entries[stats.symbol] = (now, stats)
+                    found[stats.symbol] = stats
+        return [found[symbol] for symbol in requested if symbol in found]
+
+    def _fresh(self, fetched_at: datetime, now: datetime) -> bool:
+        return fetched_at.date() == now.date() and now - fetched_at <= self._max_age
@@ -0,0 +1,164 @@
+import threading
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import Enum
+
+from ..domain.notifications import NotificationPriority
+
+
+class OverflowPolicy(str, Enum):
+    BLOCK = "BLOCK"
+    DROP_OLDEST = "DROP_OLDEST"
+    COLLAPSE = "COLLAPSE"
+
+
+@dataclass(frozen=True, slots=True)
+class QueuedMessage:
+    text: str
+    priority: NotificationPriority
+    # Unkeyed messages share the None key, so they keep their relative order too.
+    key: str | None = None
+    # The monitor cycle that queued the message, restored while a worker sends it.
+    cycle_id: str | None = field(default=None, compare=False)
+
+
+class PriorityMessageQueue:
+    def __init__(
+        self,
+        starvation_limit: int,
+        max_size: int | None = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self._starvation_limit = starvation_limit
+        self._max_size = max_size
+        self._overflow_policy = overflow_policy
+        self._lanes: dict[NotificationPriority, deque[QueuedMessage]] = {
+            priority: deque() for priority in sorted(NotificationPriority)
+        }
+        self._skips: dict[NotificationPriority, int] = {priority: 0 for priority in self._lanes}
+        self._in_flight: set[str | None] = set()
+        self._size = 0
+        self._dropped = 0
+        self._collapsed = 0
+        lock = threading.Lock()
+        self._available = threading.Condition(lock)
+        self._space = threading.Condition(lock)
+        self._closed = False
+
+    def __len__(self) -> int:
+        with self._available:
+            return self._size
+
+    @property
+    def dropped(self) -> int:
+        with self._available:
+            return self._dropped
+
+    @property
+    def collapsed(self) -> int:
+        with self._available:
+            return self._collapsed
+
+    def put(self, item: QueuedMessage) -> QueuedMessage | None:
+        # Returns the message evicted to make room (possibly the incoming one), if any.
+        with self._available:
+            if self._closed:
+                raise RuntimeError("cannot put messages on a closed queue")
+            evicted = None
+            if self._is_full():
+                if self._overflow_policy is OverflowPolicy.BLOCK:
+                    while self._is_full() and not self._closed:
+                        self._space.wait()
+                    if self._closed:
+                        raise RuntimeError("cannot put messages on a closed queue")
+                else:
+                    evicted = self._make_room(item)
+                    if evicted is item:
+                        return evicted
+            self._lanes[item.priority].append(item)
+            self._size += 1
+            self._available.notify()
+            return evicted
+
+    def get(self) -> QueuedMessage | None:
+        # Blocks until a message whose key is not in flight is available; returns None once
+        # closed and drained. Callers must hand the message back through task_done().
+        with self._available:
+            while True:
+                item = self._pop()
+                if item is not None:
+                    self._in_flight.add(item.key)
+                    self._space.notify()
+                    return item
+                if self._closed and not self._size:
+                    return None
+                self._available.wait()
+
+    def task_done(self, item: QueuedMessage) -> None:
+        with self._available:
+            self._in_flight.discard(item.key)
+            self._available.notify_all()
+
+    def close(self) -> None:
+        with self._available:
+            self._closed = True
+            self._available.notify_all()
+            self._space.notify_all()
+
+    def _is_full(self) -> bool:
+        return self._max_size is not None and self._size >= self._max_size
+
+    def _make_room(self, incoming: QueuedMessage) -> QueuedMessage:
+        if self._overflow_policy is OverflowPolicy.COLLAPSE:
+            collapsed = self._remove_first(
+                self._lanes[incoming.priority], lambda queued: queued.key == incoming.key
+            )
+            if collapsed is not None:
+                self._collapsed += 1
+                return collapsed
+        self._dropped += 1
+        # The oldest message of the least urgent non-empty lane goes first: a LOW message is
+        # dropped before any NORMAL one, and CRITICAL only when nothing else is queued.
+        least_urgent = max(priority for priority, lane in self._lanes.items() if lane)
+        if least_urgent < incoming.priority:
+            return incoming
+        return self._remove_first(self._lanes[least_urgent], lambda queued: True)
+
+    def _remove_first(
+        self, lane: deque[QueuedMessage], matches: Callable[[QueuedMessage], bool]
+    ) -> QueuedMessage | None:
+        for index, queued in enumerate(lane):
+            if matches(queued):
+                del lane[index]
+                self._size -= 1
+                return queued
+        return None
+
+    def _first_eligible(self, lane: deque[QueuedMessage]) -> int | None:
+        for index, item in enumerate(lane):
+            if item.key not in self._in_flight:
+                return index
+        return None
+
+    def _pop(self) -> QueuedMessage | None:
+        ready = {
+            priority: index
+            for priority, lane in self._lanes.items()
+            if (index := self._first_eligible(lane)) is not None
+        }
+        if not ready:
+            return None
+        # A lane passed over starvation_limit times in a row is served before more urgent ones.
+        chosen = next(
+            (p for p in ready if self._skips[p] >= self._starvation_limit), next(iter(ready))
+        )
+        for priority in ready:
+            self._skips[priority] = 0 if priority is chosen else self._skips[priority] + 1
+        lane = self._lanes[chosen]
+        item = lane[ready[chosen]]
+        del lane[ready[chosen]]
+        self._size -= 1
+        return item
@@ -1,11 +1,27 @@
+import hmac
+import http.client
 import json
+import queue
+import threading
 import urllib.error
 import urllib.request
+from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
 
 from ..application.interfaces import LoggerFactory
 from .senders import TelegramSettings
 
+_SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+# getUpdates returns at most this many updates per call.
+MAX_UPDATES_LIMIT = 100
+# Update ids a webhook receiver remembers to recognise Telegram's redeliveries.
+_SEEN_UPDATES = 1000
+# Updates are a few KiB at most; larger webhook bodies are refused unread.
+_MAX_WEBHOOK_BODY = 64 * 1024
+
 
 @dataclass(frozen=True, slots=True)
 class BotUpdate:
@@ -14,44 +30,276 @@ class BotUpdate:
     text: str
 
 
-class TelegramUpdatePoller:
-    def __init__(self, settings: TelegramSettings, logger_factory: LoggerFactory) -> None:
-        self._logger = logger_factory.get_logger(__name__)
-        self._url = f"https://api.telegram.org/bot{settings.bot_token}/getUpdates"
+@dataclass(frozen=True, slots=True)
+class WebhookSettings:
+    host: str
+    port: int
+    # Public HTTPS URL Telegram pushes to; without it the webhook must be registered elsewhere,
+    # e.g. by a reverse proxy deployment script.
+    public_url: str | None = None
+    secret_token: str | None = None
+    path: str = "/telegram"
+    max_queue_size: int = 1000
+
 
+def parse_update(item: dict) -> BotUpdate | None:
+    message = item.get("message") or {}
+    text = message.get("text")
+    chat = message.get("chat") or {}
+    chat_id = chat.get("id")
+    if text is None or chat_id is None or "update_id" not in item:
+        return None
+    return BotUpdate(update_id=item["update_id"], chat_id=str(chat_id), text=text)
+
+
+class UpdateReceiver(ABC):
+    @abstractmethod
     def get_updates(self, offset: int) -> list[BotUpdate]:
-        url = f"{self._url}?offset={offset}&timeout=30"
-        request = urllib.request.Request(url)
+        # Blocks until updates arrive or the receiver's wait elapses. offset is one past the last
+        # update handled; receivers that see updates out of order may ignore it.
+        pass
+
+    def close(self) -> None:
+        pass
 
+
+class TelegramUpdatePoller(UpdateReceiver):
+    # Long-polls getUpdates over one persistent connection, reopened only after it fails. Every
+    # update in a response is acknowledged by the next request, including the ones parse_update
+    # skips, so a batch of non-text updates is not delivered again.
+    def __init__(
+        self,
+        settings: TelegramSettings,
+        logger_factory: LoggerFactory,
+        limit: int = MAX_UPDATES_LIMIT,
+        timeout: int = 30,
+    ) -> None:
+        if not 1 <= limit <= MAX_UPDATES_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_UPDATES_LIMIT}")
+        self._logger = logger_factory.get_logger(__name__)
+        url = urlsplit(settings.api_base_url)
+        self._connection_class = (
+            http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = url.netloc
+        self._path = (
+            f"{url.path}/bot{settings.bot_token}/getUpdates?limit={limit}&timeout={timeout}"
+        )
+        self._timeout = timeout
+        self._connection: http.client.HTTPConnection | None = None
+        self._acknowledged = 0
+
+    def get_updates(self, offset: int) -> list[BotUpdate]:
+        offset = max(offset, self._acknowledged)
         try:
-            response = urllib.request.urlopen(request, timeout=35)
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode("utf-8")
-            self._logger.error(f"Telegram API HTTP {e.code}: {error_body}")
-            return []
-        except (urllib.error.URLError, OSError) as e:
+            status, body = self._get(f"{self._path}&offset={offset}")
+        except (http.client.HTTPException, OSError) as e:
+            self._disconnect()
             self._logger.error(f"Telegram API network error: {e}")
             return []
 
-        data = json.loads(response.read().decode("utf-8"))
+        if status != 200:
+            self._logger.error(f"Telegram API HTTP {status}: {body.decode('utf-8', 'replace')}")
+            return []
+
+        data = json.loads(body)
         if not data.get("ok"):
             self._logger.error(f"Telegram API returned ok=false: {data}")
             return []
 
+        result = data.get("result") or []
+        if result:
+            self._acknowledged = max(self._acknowledged, result[-1]["update_id"] + 1)
         updates = []
-        for item in data.get("result", []):
-            message = item.get("message") or {}
-            text = message.get("text")
-            chat = message.get("chat") or {}
-            chat_id = chat.get("id")
-            if text is None or chat_id is None:
-                continue
-            updates.append(
-                BotUpdate(
-                    update_id=item["update_id"],
-                    chat_id=str(chat_id),
-                    text=text,
-                )
-            )
+        for item in result:
+            update = parse_update(item)
+            if update is not None:
+                updates.append(update)
 
         return updates
+
+    def close(self) -> None:
+        self._disconnect()
+
+    def _get(self, target: str) -> tuple[int, bytes]:
+        # A kept-alive connection the server has since dropped fails on first use; that one
+        # request is retried on a fresh connection.
+        reused = self._connection is not None
+        if self._connection is None:
+            self._connection = self._connection_class(self._host, timeout=self._timeout + 5)
+        try:
+            self._connection.request("GET", target)
+            response = self._connection.getresponse()
+            return response.status, response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            self._disconnect()
+            if not reused:
+                raise
+        return self._get(target)
+
+    def _disconnect(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class TelegramWebhookReceiver(UpdateReceiver):
+    # Serves Telegram's webhook pushes on a local HTTP server. Request threads only parse and
+    # enqueue, so Telegram is acknowledged right away however long commands take; the bot drains
+    # the queue through get_updates as it would poll. A full queue answers 503, and Telegram
+    # delivers the update again later. Telegram pushes over several connections at once, so
+    # updates may arrive out of order: redeliveries are recognised by id, not by the offset.
+    _HEADERS = {"Content-Type": "application/json"}
+
+    def __init__(
+        self,
+        telegram_settings: TelegramSettings,
+        settings: WebhookSettings,
+        logger_factory: LoggerFactory,
+        wait: float = 30.0,
+    ) -> None:
+        self._api_url = f"{telegram_settings.api_base_url}/bot{telegram_settings.bot_token}"
+        self._settings = settings
+        self._wait = wait
+        self._queue: queue.Queue[BotUpdate] = queue.Queue(maxsize=settings.max_queue_size)
+        self._seen: set[int] = set()
+        self._seen_order: deque[int] = deque()
+        self._seen_lock = threading.Lock()
+        self._logger = logger_factory.get_logger(__name__)
+        self._server = ThreadingHTTPServer((settings.host, settings.port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="telegram-webhook", daemon=True
+        )
+        self._registered = False
+
+    @property
+    def address(self) -> tuple[str, int]:
+        host, port = self._server.server_address[:2]
+        return host, port
+
+    def start(self) -> None:
+        self._thread.start()
+        host, port = self.address
+        self._logger.info(f"Listening for Telegram webhooks on {host}:{port}{self._settings.path}")
+        if self._settings.public_url is not None:
+            payload = {"url": self._settings.public_url, "allowed_updates": ["message"]}
+            if self._settings.secret_token is not None:
+                payload["secret_token"] = self._settings.secret_token
+            self._registered = self._call("setWebhook", payload)
+
+    def get_updates(self, offset: int) -> list[BotUpdate]:
+        try:
+            updates = [self._queue.get(timeout=self._wait)]
+        except queue.Empty:
+            return []
+        while True:
+            try:
+                updates.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return updates
+
+    def close(self) -> None:
+        if self._registered:
+            # Leaves the bot free to switch back to getUpdates, which a webhook blocks.
+            self._call("deleteWebhook", {})
+            self._registered = False
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _authorized(self, headers) -> bool:
+        secret = self._settings.secret_token
+        if secret is not None and not hmac.compare_digest(
+            headers.get(_SECRET_HEADER, "").encode("utf-8"), secret.encode("utf-8")
+        ):
+            self._logger.warning("Rejected webhook request with a wrong secret token")
+            return False
+        return True
+
+    def _accept(self, body: bytes) -> int:
+        try:
+            item = json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return 400
+        if not isinstance(item, dict):
+            return 400
+        update = parse_update(item)
+        if update is None:
+            return 200
+        with self._seen_lock:
+            # Telegram redelivers an update whose acknowledgement it did not see.
+            if update.update_id in self._seen:
+                self._logger.debug("Dropped redelivered update %s", update.update_id)
+                return 200
+            try:
+                self._queue.put_nowait(update)
+            except queue.Full:
+                self._logger.warning(f"Webhook queue full, deferring update {update.update_id}")
+                return 503
+            self._seen.add(update.update_id)
+            self._seen_order.append(update.update_id)
+            if len(self._seen_order) > _SEEN_UPDATES:
+                self._seen.discard(self._seen_order.popleft())
+        return 200
+
+    def _call(self, method: str, payload: dict) -> bool:
+        request = urllib.request.Request(
+            f"{self._api_url}/{method}",
+            data=json.dumps(payload).encode("utf-8"),
+            headers=self._HEADERS,
+        )
+        try:
+            response = urllib.request.urlopen(request, timeout=10)
+        except urllib.error.HTTPError as e:
+            error_body = e.read().decode("utf-8")
+            self._logger.error(f"Telegram API {method} HTTP {e.code}: {error_body}")
+            return False
+        except (urllib.error.URLError, OSError) as e:
+            self._logger.error(f"Telegram API {method} network error: {e}")
+            return False
+        data = json.loads(response.read().decode("utf-8"))
+        if not data.get("ok"):
+            self._logger.error(f"Telegram API {method} returned ok=false: {data}")
+            return False
+        return True
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                # Requests are checked before the body is read, so rejecting one costs nothing.
+                if self.path.split("?", 1)[0] != receiver._settings.path:
+                    self._reject(404)
+                    return
+                if not receiver._authorized(self.headers):
+                    self._reject(403)
+                    return
+                raw_length = self.headers.get("Content-Length", "0")
+                if not raw_length.isdigit():
+                    self._reject(400)
+                    return
+                length = int(raw_length)
+                if length > _MAX_WEBHOOK_BODY:
+                    receiver._logger.warning(f"Rejected a {length} byte webhook request")
+                    self._reject(413)
+                    return
+                self._respond(receiver._accept(self.rfile.read(length)))
+
+            def _reject(self, status: int) -> None:
+                # The unread body would be parsed as the next request on a kept-alive connection.
+                self.close_connection = True
+                self._respond(status)
+
+            def _respond(self, status: int) -> None:
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format: str, *args) -> None:
+                receiver._logger.debug("Webhook %s " + format, self.address_string(), *args)
+
+        return Handler
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from .exceptions import RecordingLoadingFailed
+
+# Only the keys read by YahooFinanceMapper are kept; raw info dicts carry well over 100 keys.
+RECORDED_INFO_KEYS = (
+    "currentPrice",
+    "regularMarketPrice",
+    "previousClose",
+    "open",
+    "dayHigh",
+    "dayLow",
+    "fiftyDayAverage",
+    "twoHundredDayAverage",
+    "fiftyTwoWeekHigh",
+    "fiftyTwoWeekLow",
+    "marketCap",
+    "longName",
+    "shortName",
+    "currency",
+    "marketState",
+    "exchangeDataDelayedBy",
+    "quoteType",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedCycle:
+    recorded_at: datetime
+    infos: dict[str, dict]
+
+
+def _compact(info: dict) -> dict:
+    # Metadata-only dicts (invalid or delisted symbols) are kept whole so replays reject them too.
+    if not info or len(info) <= 3:
+        return dict(info or {})
+    return {key: info[key] for key in RECORDED_INFO_KEYS if key in info}
+
+
+class InfoRecorder:
+    # Each cycle is appended as a complete gzip member, so a monitor killed before close()
+    # leaves a file whose every cycle can still be read.
+    def __init__(self, path: Path, clock: Callable[[], datetime] = datetime.now) -> None:
+        self._path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._infos: dict[str, dict] = {}
+        self._file = None
+
+    def record(self, symbol: str, info: dict) -> None:
+        with self._lock:
+            self._infos[symbol.upper()] = _compact(info)
+
+    def end_cycle(self) -> None:
+        with self._lock:
+            if self._file is None:
+                self._file = open(self._path, "ab")
+            line = {"recorded_at": self._clock().isoformat(), "infos": self._infos}
+            data = json.dumps(line, separators=(",", ":")) + "\n"
+            self._file.write(gzip.compress(data.encode("utf-8")))
+            self._file.flush()
+            self._infos = {}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _parse_cycle(line: str) -> RecordedCycle:
+    data = json.loads(line)
+    return RecordedCycle(
+        recorded_at=datetime.fromisoformat(data["recorded_at"]), infos=data["infos"]
+    )
+
+
+def read_recording(path: Path) -> list[RecordedCycle]:
+    cycles: list[RecordedCycle] = []
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            try:
+                for line in file:
+                    cycles.append(_parse_cycle(line))
+            except EOFError:
+                # A recorder killed mid-write leaves a truncated last member; the cycles
+                # before it are complete.
+                if not cycles:
+                    raise
+    except FileNotFoundError as e:
+        raise RecordingLoadingFailed(f"recording file not found: {path}") from e
+    except (OSError, EOFError, json.JSONDecodeError, TypeError, ValueError, KeyError) as e:
+        raise RecordingLoadingFailed(f"invalid recording file: {e}") from e
+    return cycles
@@ -1,5 +1,22 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
 from ..application.interfaces import StockRepository
-from ..domain.stocks import Stock
+from ..domain.notifications import Notification, NotificationType
+from ..domain.stocks import (
+    Currency,
+    InstrumentType,
+    MarketState,
+    Stock,
+    StockSnapshot,
+    StockState,
+)
 
 
 class InMemoryStockRepository(StockRepository):
@@ -12,3 +29,175 @@ class InMemoryStockRepository(StockRepository):
 
     def get(self, symbol: str) -> Stock | None:
         return self._store.get(symbol)
+
+    def delete_batch(self, symbols: list[str]) -> None:
+        for symbol in symbols:
+            self._store.pop(symbol, None)
+
+
+_SNAPSHOT_DECIMALS = (
+    "current_price",
+    "previous_close_price",
+    "open_price",
+    "day_high",
+    "day_low",
+    "fifty_day_average",
+    "two_hundred_day_average",
+    "fifty_two_week_high",
+    "fifty_two_week_low",
+)
+_STATE_DECIMALS = _SNAPSHOT_DECIMALS + ("market_cap",)
+
+
+def _decimal(value: str | None) -> Decimal | None:
+    return Decimal(value) if value is not None else None
+
+
+def _text(value: Decimal | None) -> str | None:
+    return str(value) if value is not None else None
+
+
+def _encode_snapshot(snapshot: StockSnapshot | None) -> dict | None:
+    if snapshot is None:
+        return None
+    data = {key: _text(getattr(snapshot, key)) for key in _SNAPSHOT_DECIMALS}
+    data["market_state"] = snapshot.market_state.value if snapshot.market_state else None
+    data["price_delay_in_minutes"] = snapshot.price_delay_in_minutes
+    return data
+
+
+def _decode_snapshot(data: dict | None) -> StockSnapshot | None:
+    if data is None:
+        return None
+    market_state = data["market_state"]
+    return StockSnapshot(
+        **{key: _decimal(data[key]) for key in _SNAPSHOT_DECIMALS},
+        market_state=MarketState(market_state) if market_state else None,
+        price_delay_in_minutes=data["price_delay_in_minutes"],
+    )
+
+
+def _encode_stock_state(state: StockState) -> str:
+    data = {key: _text(getattr(state, key)) for key in _STATE_DECIMALS}
+    data.update(
+        symbol=state.symbol,
+        name=state.name,
+        currency=state.currency.value if state.currency else None,
+        market_state=state.market_state.value if state.market_state else None,
+        price_delay_in_minutes=state.price_delay_in_minutes,
+        kind=state.kind.value if state.kind else None,
+        snapshot=_encode_snapshot(state.snapshot),
+        transition_time=state.transition_time.isoformat() if state.transition_time else None,
+        notifications=[[n.type.value, n.message] for n in state.notifications],
+        targets=[[str(target), str(entry)] for target, entry in state.targets],
+        sent_notifications=state.sent_notifications,
+    )
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def _decode_stock_state(text: str) -> StockState:
+    data = json.loads(text)
+    currency, market_state, kind = data["currency"], data["market_state"], data["kind"]
+    transition_time = data["transition_time"]
+    return StockState(
+        **{key: _decimal(data[key]) for key in _STATE_DECIMALS},
+        symbol=data["symbol"],
+        name=data["name"],
+        currency=Currency(currency) if currency else None,
+        market_state=MarketState(market_state) if market_state else None,
+        price_delay_in_minutes=data["price_delay_in_minutes"],
+        kind=InstrumentType(kind) if kind else None,
+        snapshot=_decode_snapshot(data["snapshot"]),
+        transition_time=datetime.fromisoformat(transition_time) if transition_time else None,
+        notifications=tuple(
+            Notification.restore(NotificationType(type_), message)
+            for type_, message in data["notifications"]
+        ),
+        targets=tuple((Decimal(target), Decimal(entry)) for target, entry in data["targets"]),
+        # Checkpoints written before sends were counted lack the field.
+        sent_notifications=data.get("sent_notifications", 0),
+    )
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS stocks (symbol TEXT PRIMARY KEY, state TEXT NOT NULL);
+"""
+
+
+class SqliteStockRepository(StockRepository):
+    # Stocks live in memory like InMemoryStockRepository; every save_batch checkpoints the
+    # stocks whose state changed, and a restart within the same session reloads them.
+    def __init__(self, path: Path, session: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._store: dict[str, Stock] = {}
+        self._written: dict[str, str] = {}
+        self._load(session)
+
+    @property
+    def restored_symbols(self) -> list[str]:
+        return sorted(self._store)
+
+    def save_batch(self, stocks: list[Stock]) -> None:
+        changed: list[tuple[str, str]] = []
+        for stock in stocks:
+            self._store[stock.symbol] = stock
+            encoded = _encode_stock_state(stock.export_state())
+            if self._written.get(stock.symbol) != encoded:
+                changed.append((stock.symbol, encoded))
+        if not changed:
+            return
+        with self._lock:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "INSERT INTO stocks (symbol, state) VALUES (?, ?) "
+                "ON CONFLICT(symbol) DO UPDATE SET state = excluded.state",
+                changed,
+            )
+            self._connection.execute("COMMIT")
+        self._written.update(changed)
+
+    def get(self, symbol: str) -> Stock | None:
+        return self._store.get(symbol)
+
+    def delete_batch(self, symbols: list[str]) -> None:
+        for symbol in symbols:
+            self._store.pop(symbol, None)
+            self._written.pop(symbol, None)
+        with self._lock:
+            self._connection.executemany(
+                "DELETE FROM stocks WHERE symbol = ?", [(symbol,) for symbol in symbols]
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _load(self, session: str) -> None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = 'session'"
+            ).fetchone()
+            if row is None or row[0] != session:
+                # State from another session is stale: notifications would be suppressed and
+                # snapshots compared against a different trading day.
+                self._connection.execute("BEGIN")
+                self._connection.execute("DELETE FROM stocks")
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('session', ?)", (session,)
+                )
+                self._connection.execute("COMMIT")
+                return
+            rows = self._connection.execute("SELECT symbol, state FROM stocks").fetchall()
+        for symbol, encoded in rows:
+            try:
+                self._store[symbol] = Stock.from_state(_decode_stock_state(encoded))
+            except (ValueError, KeyError, TypeError, ArithmeticError):
+                # An unreadable row only costs that stock its warm start.
+                continue
+            self._written[symbol] = encoded
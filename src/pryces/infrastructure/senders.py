@@ -1,18 +1,29 @@
 import json
+import threading
 import time
 import urllib.error
 import urllib.request
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
 from dataclasses import dataclass
 
+from ..application.correlation import current_cycle_id, cycle_scope
 from ..application.exceptions import MessageSendingFailed
 from ..application.interfaces import LoggerFactory, MessageSender
+from ..domain.notifications import NotificationPriority
+from .queues import OverflowPolicy, PriorityMessageQueue, QueuedMessage
+
+TELEGRAM_API_BASE_URL = "https://api.telegram.org"
+
+
+def _elapsed(started: float) -> float:
+    return round(time.perf_counter() - started, 4)
 
 
 @dataclass(frozen=True, slots=True)
 class TelegramSettings:
     bot_token: str
     group_id: str
+    api_base_url: str = TELEGRAM_API_BASE_URL
 
 
 class TelegramMessageSender(MessageSender):
@@ -21,35 +32,65 @@ class TelegramMessageSender(MessageSender):
     def __init__(self, settings: TelegramSettings, logger_factory: LoggerFactory) -> None:
         self._settings = settings
         self._logger = logger_factory.get_logger(__name__)
-        self._url = f"https://api.telegram.org/bot{settings.bot_token}/sendMessage"
-
-    def send_message(self, message: str) -> bool:
+        self._url = f"{settings.api_base_url}/bot{settings.bot_token}/sendMessage"
+
+    def send_message(
+        self,
+        message: str,
+        priority: NotificationPriority = NotificationPriority.NORMAL,
+        key: str | None = None,
+    ) -> bool:
         payload = json.dumps({"chat_id": self._settings.group_id, "text": message}).encode("utf-8")
 
-        self._logger.debug(f"Sending message to Telegram group {self._settings.group_id}")
+        self._logger.debug("Sending message to Telegram group %s", self._settings.group_id)
 
         request = urllib.request.Request(self._url, data=payload, headers=self._HEADERS)
+        started = time.perf_counter()
 
         try:
             response = urllib.request.urlopen(request)
         except urllib.error.HTTPError as e:
             error_body = e.read().decode("utf-8")
-            self._logger.error(f"Telegram API HTTP {e.code}: {error_body}")
+            self._logger.error(
+                f"Telegram API HTTP {e.code}: {error_body}",
+                symbol=key,
+                duration=_elapsed(started),
+                outcome="http_error",
+                status=e.code,
+            )
             retryable = e.code == 429 or e.code >= 500
             raise MessageSendingFailed(f"HTTP {e.code}: {error_body}", retryable=retryable) from e
         except (urllib.error.URLError, OSError) as e:
-            self._logger.error(f"Telegram API network error: {e}")
+            self._logger.error(
+                f"Telegram API network error: {e}",
+                symbol=key,
+                duration=_elapsed(started),
+                outcome="network_error",
+            )
             raise MessageSendingFailed(f"Network error: {e}", retryable=True) from e
 
         response_data = json.loads(response.read().decode("utf-8"))
 
         if response_data.get("ok") is True:
-            self._logger.info(f"Notification sent:\n{message}")
+            self._logger.info(
+                "Notification sent:\n%s",
+                message,
+                symbol=key,
+                priority=priority.name,
+                duration=_elapsed(started),
+                outcome="sent",
+            )
             return True
 
         error_code = response_data.get("error_code", 0)
         retryable = error_code == 429 or error_code >= 500
-        self._logger.error(f"Telegram API returned ok=false: {response_data}")
+        self._logger.error(
+            f"Telegram API returned ok=false: {response_data}",
+            symbol=key,
+            duration=_elapsed(started),
+            outcome="rejected",
+            status=error_code,
+        )
         raise MessageSendingFailed(f"ok=false: {response_data}", retryable=retryable)
 
 
@@ -68,38 +109,129 @@ class RetryMessageSender(MessageSender):
         self._settings = settings
         self._logger = logger_factory.get_logger(__name__)
 
-    def send_message(self, message: str) -> bool:
+    def send_message(
+        self,
+        message: str,
+        priority: NotificationPriority = NotificationPriority.NORMAL,
+        key: str | None = None,
+    ) -> bool:
         attempt = 0
         while True:
             try:
-                return self._inner.send_message(message)
+                return self._inner.send_message(message, priority, key)
             except MessageSendingFailed as e:
                 if not e.retryable or attempt >= self._settings.max_retries:
                     raise
                 delay = self._settings.base_delay * (self._settings.backoff_factor**attempt)
                 self._logger.warning(
                     f"Send failed (attempt {attempt + 1}/{self._settings.max_retries + 1}), "
-                    f"retrying in {delay}s: {e}"
+                    f"retrying in {delay}s: {e}",
+                    symbol=key,
+                    attempt=attempt + 1,
+                    delay=delay,
+                    outcome="retry",
                 )
                 time.sleep(delay)
                 attempt += 1
 
 
+@dataclass(frozen=True, slots=True)
+class FireAndForgetSettings:
+    workers: int = 1
+    starvation_limit: int = 10
+    max_queue_size: int = 1000
+    overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    # Evictions are summed up in one warning at most this often, so an outage cannot flood logs.
+    eviction_warning_interval: float = 60.0
+
+
 class FireAndForgetMessageSender(MessageSender):
-    def __init__(self, inner: MessageSender, logger_factory: LoggerFactory) -> None:
+    def __init__(
+        self,
+        inner: MessageSender,
+        logger_factory: LoggerFactory,
+        settings: FireAndForgetSettings = FireAndForgetSettings(),
+    ) -> None:
+        if settings.workers <= 0:
+            raise ValueError("workers must be a positive integer")
         self._inner = inner
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._queue = PriorityMessageQueue(
+            starvation_limit=settings.starvation_limit,
+            max_size=settings.max_queue_size,
+            overflow_policy=settings.overflow_policy,
+        )
         self._logger = logger_factory.get_logger(__name__)
+        self._eviction_warning_interval = settings.eviction_warning_interval
+        self._evictions: Counter[NotificationPriority] = Counter()
+        self._last_eviction_warning: float | None = None
+        self._evictions_lock = threading.Lock()
+        self._workers = [
+            threading.Thread(target=self._run, name=f"message-sender-{i}", daemon=True)
+            for i in range(settings.workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def pending(self) -> int:
+        # Messages queued but not yet picked up by a worker.
+        return len(self._queue)
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            try:
+                self._send(item)
+            finally:
+                self._queue.task_done(item)
 
-    def _send(self, message: str) -> None:
-        try:
-            self._inner.send_message(message)
-        except Exception as e:
-            self._logger.error(f"Failed to send message: {e}")
+    def _send(self, item: QueuedMessage) -> None:
+        with cycle_scope(item.cycle_id):
+            try:
+                self._inner.send_message(item.text, item.priority, item.key)
+            except Exception as e:
+                self._logger.error(
+                    f"Failed to send message: {e}", symbol=item.key, outcome="failed"
+                )
 
-    def send_message(self, message: str) -> bool:
-        self._executor.submit(self._send, message)
-        return True
+    def send_message(
+        self,
+        message: str,
+        priority: NotificationPriority = NotificationPriority.NORMAL,
+        key: str | None = None,
+    ) -> bool:
+        item = QueuedMessage(text=message, priority=priority, key=key, cycle_id=current_cycle_id())
+        evicted = self._queue.put(item)
+        if evicted is None:
+            return True
+        self._report_eviction(evicted)
+        return evicted is not item
+
+    def _report_eviction(self, evicted: QueuedMessage) -> None:
+        # The first eviction is logged at once; later ones are counted and logged together once
+        # the interval has passed. Whatever is left is covered by the shutdown summary.
+        with self._evictions_lock:
+            self._evictions[evicted.priority] += 1
+            now = time.monotonic()
+            last = self._last_eviction_warning
+            if last is not None and now - last < self._eviction_warning_interval:
+                return
+            evictions, self._evictions = self._evictions, Counter()
+            self._last_eviction_warning = now
+        discarded = ", ".join(
+            f"{count} {priority.name}" for priority, count in sorted(evictions.items())
+        )
+        self._logger.warning(
+            f"Send queue full, discarded {discarded} message(s) "
+            f"(dropped: {self._queue.dropped}, collapsed: {self._queue.collapsed})",
+            outcome="discarded",
+        )
 
     def shutdown(self) -> None:
-        self._executor.shutdown(wait=True)
+        self._queue.close()
+        for worker in self._workers:
+            worker.join()
+        if self._queue.dropped or self._queue.collapsed:
+            self._logger.warning(
+                f"Send queue discarded messages during this run "
+                f"(dropped: {self._queue.dropped}, collapsed: {self._queue.collapsed})"
+            )
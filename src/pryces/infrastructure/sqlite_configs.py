@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from decimal import Decimal
+from pathlib import Path
+
+from .configs import ConfigManager, ConfigStore, MonitorStocksConfig, SymbolConfig
+from .exceptions import ConfigLoadingFailed
+
+DATABASE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS configs (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    interval INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    rules TEXT
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    config_id INTEGER NOT NULL REFERENCES configs(id) ON DELETE CASCADE,
+    symbol TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (config_id, symbol)
+);
+CREATE INDEX IF NOT EXISTS symbols_by_symbol ON symbols(symbol, config_id);
+CREATE TABLE IF NOT EXISTS targets (
+    id INTEGER PRIMARY KEY,
+    config_id INTEGER NOT NULL,
+    symbol TEXT NOT NULL,
+    price TEXT NOT NULL,
+    FOREIGN KEY (config_id, symbol) REFERENCES symbols(config_id, symbol) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS targets_by_symbol ON targets(config_id, symbol);
+CREATE TABLE IF NOT EXISTS change_sequence (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO change_sequence (id, value) VALUES (1, 0);
+"""
+
+
+def is_database_locator(path: Path) -> bool:
+    # Configs stored in a database are addressed as <database file>/<config name>.
+    return path.parent.suffix in DATABASE_SUFFIXES and not path.parent.is_dir()
+
+
+class SqliteConfigDatabase:
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._local = threading.local()
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+        # Every connection opened by any thread, so close() can release them all. A thread
+        # whose connection was closed opens a new one from the next generation.
+        self._connections: list[sqlite3.Connection] = []
+        self._generation = 0
+        self._connections_lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared across threads, so each thread gets its own;
+        # only close() touches another thread's connection.
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.generation != self._generation:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self._path, isolation_level=None, timeout=5.0, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA foreign_keys=ON")
+            with self._connections_lock:
+                self._connections.append(connection)
+                self._local.generation = self._generation
+            self._local.connection = connection
+            with self._schema_lock:
+                if not self._schema_ready:
+                    connection.executescript(_SCHEMA)
+                    _migrate(connection)
+                    self._schema_ready = True
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        # BEGIN IMMEDIATE takes the write lock up front so concurrent writers queue on
+        # busy_timeout instead of failing when a read transaction tries to upgrade.
+        connection = self.connection()
+        if connection.in_transaction:
+            yield connection
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def change_sequence(self) -> int:
+        row = self.connection().execute("SELECT value FROM change_sequence").fetchone()
+        return row[0]
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for connection in connections:
+            connection.close()
+
+
+def _migrate(connection: sqlite3.Connection) -> None:
+    # Databases created before per-config rules lack the column; NULL means every rule.
+    columns = {row[1] for row in connection.execute("PRAGMA table_info(configs)")}
+    if "rules" not in columns:
+        connection.execute("ALTER TABLE configs ADD COLUMN rules TEXT")
+
+
+def _encode_rules(rules: tuple[str, ...] | None) -> str | None:
+    return json.dumps(list(rules)) if rules is not None else None
+
+
+def _bump(connection: sqlite3.Connection, config_id: int) -> None:
+    connection.execute("UPDATE change_sequence SET value = value + 1")
+    connection.execute(
+        "UPDATE configs SET seq = (SELECT value FROM change_sequence) WHERE id = ?", (config_id,)
+    )
+
+
+def _insert_symbol(
+    connection: sqlite3.Connection, config_id: int, symbol: str, prices: list[Decimal]
+) -> None:
+    connection.execute(
+        "INSERT INTO symbols (config_id, symbol, position) "
+        "VALUES (?, ?, (SELECT COALESCE(MAX(position), -1) + 1 FROM symbols WHERE config_id = ?))",
+        (config_id, symbol, config_id),
+    )
+    connection.executemany(
+        "INSERT INTO targets (config_id, symbol, price) VALUES (?, ?, ?)",
+        [(config_id, symbol, str(price)) for price in prices],
+    )
+
+
+class SqliteConfigManager(ConfigManager):
+    def __init__(self, database: SqliteConfigDatabase, name: str) -> None:
+        super().__init__(database.path / name)
+        self._database = database
+        self._name = name
+
+    def signature(self) -> tuple[int, int] | None:
+        row = (
+            self._database.connection()
+            .execute("SELECT id, seq FROM configs WHERE name = ?", (self._name,))
+            .fetchone()
+        )
+        return (row[0], row[1]) if row is not None else None
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        with self._database.transaction():
+            yield
+
+    def write_monitor_stocks_config(self, config: MonitorStocksConfig) -> None:
+        with self._database.transaction() as connection:
+            row = connection.execute(
+                "SELECT id FROM configs WHERE name = ?", (self._name,)
+            ).fetchone()
+            if row is None:
+                config_id = connection.execute(
+                    "INSERT INTO configs (name, interval, seq, rules) VALUES (?, ?, 0, ?)",
+                    (self._name, config.interval, _encode_rules(config.rules)),
+                ).lastrowid
+            else:
+                config_id = row[0]
+                connection.execute(
+                    "UPDATE configs SET interval = ?, rules = ? WHERE id = ?",
+                    (config.interval, _encode_rules(config.rules), config_id),
+                )
+                connection.execute("DELETE FROM symbols WHERE config_id = ?", (config_id,))
+            for sc in config.symbols:
+                _insert_symbol(connection, config_id, sc.symbol, sc.prices)
+            _bump(connection, config_id)
+
+    def read_monitor_stocks_config(self) -> MonitorStocksConfig:
+        try:
+            connection = self._database.connection()
+            row = connection.execute(
+                "SELECT id, interval, rules FROM configs WHERE name = ?", (self._name,)
+            ).fetchone()
+            if row is None:
+                raise ConfigLoadingFailed(f"config not found: {self._name}")
+            config_id, interval, rules = row
+            prices: dict[str, list[Decimal]] = {
+                symbol: []
+                for (symbol,) in connection.execute(
+                    "SELECT symbol FROM symbols WHERE config_id = ? ORDER BY position",
+                    (config_id,),
+                )
+            }
+            for symbol, price in connection.execute(
+                "SELECT symbol, price FROM targets WHERE config_id = ? ORDER BY id", (config_id,)
+            ):
+                prices[symbol].append(Decimal(price))
+            return MonitorStocksConfig(
+                interval=interval,
+                symbols=[SymbolConfig(symbol=s, prices=p) for s, p in prices.items()],
+                rules=tuple(json.loads(rules)) if rules is not None else None,
+            )
+        except ConfigLoadingFailed:
+            raise
+        except (sqlite3.Error, ValueError) as e:
+            raise ConfigLoadingFailed(f"invalid config {self._name}: {e}") from e
+
+    def replace_symbol_prices(self, symbol: str, prices: list[Decimal]) -> None:
+        with self._database.transaction() as connection:
+            config_id = self._config_id(connection)
+            connection.execute(
+                "DELETE FROM targets WHERE config_id = ? AND symbol = ?", (config_id, symbol)
+            )
+            connection.executemany(
+                "INSERT INTO targets (config_id, symbol, price) "
+                "SELECT config_id, symbol, ? FROM symbols WHERE config_id = ? AND symbol = ?",
+                [(str(price), config_id, symbol) for price in prices],
+            )
+            _bump(connection, config_id)
+
+    def add_target(self, symbol: str, price: Decimal) -> bool:
+        with self._database.transaction() as connection:
+            config_id = self._config_id(connection)
+            stored = connection.execute(
+                "SELECT price FROM targets WHERE config_id = ? AND symbol = ?", (config_id, symbol)
+            ).fetchall()
+            if any(Decimal(p) == price for (p,) in stored):
+                return False
+            inserted = connection.execute(
+                "INSERT INTO targets (config_id, symbol, price) "
+                "SELECT config_id, symbol, ? FROM symbols WHERE config_id = ? AND symbol = ?",
+                (str(price), config_id, symbol),
+            ).rowcount
+            if inserted:
+                _bump(connection, config_id)
+            return inserted > 0
+
+    def remove_targets(self, targets: set[tuple[str, Decimal]]) -> bool:
+        with self._database.transaction() as connection:
+            config_id = self._config_id(connection)
+            removed = 0
+            for symbol, price in targets:
+                for target_id, stored in connection.execute(
+                    "SELECT id, price FROM targets WHERE config_id = ? AND symbol = ?",
+                    (config_id, symbol),
+                ).fetchall():
+                    if Decimal(stored) == price:
+                        connection.execute("DELETE FROM targets WHERE id = ?", (target_id,))
+                        removed += 1
+            if removed:
+                _bump(connection, config_id)
+            return removed > 0
+
+    def add_symbol(self, symbol: str) -> None:
+        with self._database.transaction() as connection:
+            config_id = self._config_id(connection)
+            _insert_symbol(connection, config_id, symbol, [])
+            _bump(connection, config_id)
+
+    def remove_symbol(self, symbol: str) -> None:
+        with self._database.transaction() as connection:
+            config_id = self._config_id(connection)
+            remaining = connection.execute(
+                "SELECT COUNT(*) FROM symbols WHERE config_id = ? AND symbol != ?",
+                (config_id, symbol),
+            ).fetchone()[0]
+            if not remaining:
+                raise ValueError("symbols must be a non-empty list")
+            connection.execute(
+                "DELETE FROM symbols WHERE config_id = ? AND symbol = ?", (config_id, symbol)
+            )
+            _bump(connection, config_id)
+
+    def _config_id(self, connection: sqlite3.Connection) -> int:
+        row = connection.execute("SELECT id FROM configs WHERE name = ?", (self._name,)).fetchone()
+        if row is None:
+            raise ConfigLoadingFailed(f"config not found: {self._name}")
+        return row[0]
+
+
+class SqliteConfigStore(ConfigStore):
+    def __init__(self, database: SqliteConfigDatabase) -> None:
+        super().__init__(database.path)
+        self._database = database
+
+    def open(self, path: Path) -> ConfigManager:
+        return SqliteConfigManager(self._database, path.name)
+
+    def list_paths(self) -> list[Path]:
+        return [self._database.path / name for name in self._names()]
+
+    def find_by_name(self, name: str) -> tuple[Path, MonitorStocksConfig] | None:
+        path = self._database.path / name
+        try:
+            return path, self.open(path).read_monitor_stocks_config()
+        except ConfigLoadingFailed:
+            return None
+
+    def find_for_symbol(self, symbol: str) -> tuple[Path, MonitorStocksConfig] | None:
+        row = (
+            self._database.connection()
+            .execute(
+                "SELECT c.name FROM symbols s JOIN configs c ON c.id = s.config_id "
+                "WHERE s.symbol = ? ORDER BY c.name LIMIT 1",
+                (symbol.upper(),),
+            )
+            .fetchone()
+        )
+        return self.find_by_name(row[0]) if row is not None else None
+
+    def list_tracked_symbols(self) -> list[str]:
+        rows = self._database.connection().execute(
+            "SELECT DISTINCT symbol FROM symbols ORDER BY symbol"
+        )
+        return [symbol for (symbol,) in rows]
+
+    def list_tracked_symbols_with_targets(self) -> list[tuple[str, list[Decimal]]]:
+        # The alphabetically first config wins for symbols tracked by several configs.
+        connection = self._database.connection()
+        owners = dict(
+            connection.execute(
+                "SELECT s.symbol, MIN(c.name) FROM symbols s JOIN configs c ON c.id = s.config_id "
+                "GROUP BY s.symbol"
+            ).fetchall()
+        )
+        prices: dict[str, list[Decimal]] = {symbol: [] for symbol in sorted(owners)}
+        for symbol, name, price in connection.execute(
+            "SELECT t.symbol, c.name, t.price FROM targets t JOIN configs c ON c.id = t.config_id "
+            "ORDER BY t.id"
+        ):
+            if owners.get(symbol) == name:
+                prices[symbol].append(Decimal(price))
+        return list(prices.items())
+
+    def validate_name(self, name: str) -> str | None:
+        if not name or not name.strip():
+            return "Name must not be empty."
+        stripped = name.strip()
+        if "/" in stripped or "." in stripped:
+            return "Name must not contain '/' or '.'."
+        if stripped in self._names():
+            return f"Config '{stripped}' already exists."
+        return None
+
+    def create(self, name: str, config: MonitorStocksConfig) -> Path:
+        path = self._database.path / name.strip()
+        self.open(path).write_monitor_stocks_config(config)
+        return path
+
+    def delete_by_path(self, path: Path) -> None:
+        with self._database.transaction() as connection:
+            connection.execute("DELETE FROM configs WHERE name = ?", (path.name,))
+            connection.execute("UPDATE change_sequence SET value = value + 1")
+
+    def import_json(self, path: Path) -> Path:
+        # Re-importing a config replaces the stored one, so imports can be repeated safely.
+        config = ConfigManager(path).read_monitor_stocks_config()
+        return self.create(path.stem, config)
+
+    def _names(self) -> list[str]:
+        rows = self._database.connection().execute("SELECT name FROM configs ORDER BY name")
+        return [name for (name,) in rows]
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import math
+import os
+import zipfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from ..application.interfaces import LoggerFactory, StockProvider, StockStatisticsProvider
+from ..domain.stock_statistics import HistoricalClose, StatisticsPeriod, StockStatistics
+from ..domain.stocks import Currency, MarketState, Stock
+from .providers import STATISTICS_HISTORY_DAYS, YahooFinanceSettings, map_currency
+
+DEFAULT_SNAPSHOT_PATH = Path(__file__).resolve().parents[3] / ".cache" / "statistics.npz"
+
+
+@dataclass(frozen=True, slots=True)
+class ClosingHistory:
+    # Daily closes in ascending order; NaN marks a close Yahoo did not report.
+    symbol: str
+    name: str | None
+    currency: Currency | None
+    days: np.ndarray
+    closes: np.ndarray
+
+    @property
+    def last_trading_date(self) -> date:
+        return self.days[-1].astype(date)
+
+    def statistics(
+        self, current_price: Decimal | None = None, trading_date: date | None = None
+    ) -> StockStatistics | None:
+        # Matches YahooFinanceStatisticsMapper on the same history. Without a live price the
+        # last close is the current price; trading_date moves the periods past the last close.
+        if current_price is None:
+            last_close = self.closes[-1]
+            if math.isnan(last_close):
+                return None
+            current_price = Decimal(str(last_close))
+        trading_date = trading_date or self.last_trading_date
+
+        closes = []
+        for period in StatisticsPeriod:
+            reference = np.datetime64(period.reference_date(trading_date), "D")
+            index = np.searchsorted(self.days, reference, side="right") - 1
+            if index < 0 or math.isnan(self.closes[index]):
+                continue
+            closes.append(
+                HistoricalClose(period=period, close_price=Decimal(str(self.closes[index])))
+            )
+        return StockStatistics(
+            symbol=self.symbol,
+            current_price=current_price,
+            historical_closes=closes,
+            name=self.name,
+            currency=self.currency,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class StatisticsSnapshot:
+    created_at: datetime
+    histories: dict[str, ClosingHistory]
+
+
+class StatisticsSnapshotStore:
+    # Every symbol's closes are concatenated into one array, split by per-symbol lengths, in a
+    # single compressed .npz. The file is replaced atomically, so readers never see it half
+    # written.
+    def __init__(self, path: Path, clock: Callable[[], datetime] = datetime.now) -> None:
+        self._path = path
+        self._clock = clock
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def write(self, histories: list[ClosingHistory]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._path.with_name(f".{self._path.name}.tmp")
+        with open(temporary, "wb") as file:
+            np.savez_compressed(
+                file,
+                created_at=np.array(self._clock().isoformat()),
+                symbols=np.array([h.symbol for h in histories], dtype=str),
+                names=np.array([h.name or "" for h in histories], dtype=str),
+                currencies=np.array(
+                    [h.currency.value if h.currency else "" for h in histories], dtype=str
+                ),
+                lengths=np.array([len(h.days) for h in histories], dtype=np.int64),
+                days=np.concatenate([h.days for h in histories] or [np.empty(0, "datetime64[D]")]),
+                closes=np.concatenate([h.closes for h in histories] or [np.empty(0)]),
+            )
+        os.replace(temporary, self._path)
+
+    def read(self) -> StatisticsSnapshot | None:
+        try:
+            with np.load(self._path) as data:
+                arrays = {key: data[key] for key in data.files}
+            created_at = datetime.fromisoformat(str(arrays["created_at"]))
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+
+        bounds = np.cumsum(arrays["lengths"])[:-1]
+        histories = {}
+        for symbol, name, currency, days, closes in zip(
+            arrays["symbols"],
+            arrays["names"],
+            arrays["currencies"],
+            np.split(arrays["days"], bounds),
+            np.split(arrays["closes"], bounds),
+        ):
+            histories[str(symbol)] = ClosingHistory(
+                symbol=str(symbol),
+                name=str(name) or None,
+                currency=map_currency(str(currency) or None),
+                days=days,
+                closes=closes,
+            )
+        return StatisticsSnapshot(created_at=created_at, histories=histories)
+
+
+def _download(symbol: str, start: date) -> tuple[dict, pd.DataFrame]:
+    ticker = yf.Ticker(symbol)
+    return ticker.info, ticker.history(start=start)
+
+
+class ClosingHistoryDownloader:
+    def __init__(
+        self,
+        settings: YahooFinanceSettings,
+        logger_factory: LoggerFactory,
+        download: Callable[[str, date], tuple[dict, pd.DataFrame]] = _download,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        self._max_workers = settings.max_workers
+        self._download = download
+        self._today = today
+        self._logger = logger_factory.get_logger(__name__)
+
+    def download(self, symbols: list[str]) -> list[ClosingHistory]:
+        if not symbols:
+            return []
+        start = self._today() - timedelta(days=STATISTICS_HISTORY_DAYS)
+        with ThreadPoolExecutor(max_workers=min(len(symbols), self._max_workers)) as executor:
+            results = list(executor.map(lambda symbol: self._get(symbol, start), symbols))
+        return [history for history in results if history is not None]
+
+    def _get(self, symbol: str, start: date) -> ClosingHistory | None:
+        try:
+            self._logger.debug("Downloading closing history for %s", symbol)
+            info, frame = self._download(symbol, start)
+        except Exception as e:
+            self._logger.error(f"Error downloading closing history for {symbol}: {e}")
+            return None
+        if frame.empty:
+            self._logger.error(f"No historical data available for symbol: {symbol}")
+            return None
+        index = pd.DatetimeIndex(frame.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        return ClosingHistory(
+            symbol=symbol.upper(),
+            name=info.get("longName") or info.get("shortName"),
+            currency=map_currency(info.get("currency")),
+            days=index.normalize().values.astype("datetime64[D]"),
+            closes=frame["Close"].to_numpy(dtype=np.float64),
+        )
+
+
+def _last_completed_session(today: date) -> date:
+    # Sessions are assumed to run every weekday. After a holiday this asks for a session that
+    # never happened, which only sends the request to the fallback provider.
+    return np.busday_offset(np.datetime64(today, "D"), -1, roll="forward").astype(date)
+
+
+class SnapshotStockStatisticsProvider(StockStatisticsProvider):
+    # Builds statistics from the precomputed snapshot, fetching only current prices when a stock
+    # provider is given. Symbols missing from the snapshot, and symbols whose history stops
+    # before the last completed session, are served by the fallback provider instead.
+    def __init__(
+        self,
+        store: StatisticsSnapshotStore,
+        fallback: StockStatisticsProvider,
+        logger_factory: LoggerFactory,
+        stock_provider: StockProvider | None = None,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self._store = store
+        self._fallback = fallback
+        self._stock_provider = stock_provider
+        self._clock = clock
+        self._snapshot: StatisticsSnapshot | None = None
+        self._loaded_mtime: float | None = None
+        self._logger = logger_factory.get_logger(__name__)
+
+    def get_stock_statistics(self, symbols: list[str]) -> list[StockStatistics]:
+        now = self._clock()
+        requested = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        histories = self._histories()
+        last_session = _last_completed_session(now.date())
+        covered = [symbol for symbol in requested if symbol in histories]
+        stale = [s for s in covered if histories[s].last_trading_date < last_session]
+        if stale:
+            self._logger.warning(
+                f"Statistics snapshot misses the {last_session} session for {', '.join(stale)}"
+            )
+            covered = [symbol for symbol in covered if symbol not in stale]
+
+        live: dict[str, Stock] = {}
+        if self._stock_provider is not None and covered:
+            live = {stock.symbol: stock for stock in self._stock_provider.get_stocks(covered)}
+
+        found: dict[str, StockStatistics] = {}
+        for symbol in covered:
+            history = histories[symbol]
+            stock = live.get(symbol)
+            if stock is None:
+                stats = history.statistics()
+            else:
+                stats = history.statistics(
+                    stock.current_price, self._trading_date(history, stock, now.date())
+                )
+            if stats is not None:
+                found[symbol] = stats
+
+        missing = [symbol for symbol in requested if symbol not in found]
+        if missing:
+            for stats in self._fallback.get_stock_statistics(missing):
+                found[stats.symbol] = stats
+        return [found[symbol] for symbol in requested if symbol in found]
+
+    def _histories(self) -> dict[str, ClosingHistory]:
+        try:
+            mtime = self._store.path.stat().st_mtime
+        except FileNotFoundError:
+            return {}
+        if mtime != self._loaded_mtime:
+            self._snapshot = self._store.read()
+            self._loaded_mtime = mtime
+        if self._snapshot is None:
+            return {}
+        return self._snapshot.histories
+
+    @staticmethod
+    def _trading_date(history: ClosingHistory, stock: Stock, today: date) -> date:
+        # A session that started after the snapshot was taken moves every period forward to
+        # today, as the live history would.
+        if history.last_trading_date < today and stock.market_state in (
+            MarketState.OPEN,
+            MarketState.POST,
+        ):
+            return today
+        return history.last_trading_date
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - advisory locking is POSIX-only
+    fcntl = None
+
+from ..application.interfaces import TickRecorder
+from ..domain.stocks import MarketState, Stock
+
+# One raw little-endian file per column, so each column can be memory-mapped on its own.
+_COLUMNS: dict[str, np.dtype] = {
+    "timestamp": np.dtype("<f8"),
+    "symbol": np.dtype("<u4"),
+    "price": np.dtype("<f8"),
+    "day_high": np.dtype("<f8"),
+    "day_low": np.dtype("<f8"),
+    "market_state": np.dtype("u1"),
+}
+_SYMBOLS_FILE = "symbols.json"
+_LOCK_FILE = ".lock"
+
+# 0 means unknown market state.
+MARKET_STATE_CODES: dict[MarketState | None, int] = {
+    None: 0,
+    **{state: code for code, state in enumerate(MarketState, start=1)},
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TickSeries:
+    # Epoch seconds; missing day high/low are NaN, market states use MARKET_STATE_CODES.
+    timestamps: np.ndarray
+    prices: np.ndarray
+    day_highs: np.ndarray
+    day_lows: np.ndarray
+    market_states: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+def _float(value) -> float:
+    return float(value) if value is not None else float("nan")
+
+
+def _read_symbols(day_dir: Path) -> list[str]:
+    try:
+        return json.loads((day_dir / _SYMBOLS_FILE).read_text())
+    except FileNotFoundError:
+        return []
+
+
+class TickWriter(TickRecorder):
+    # Rows are buffered in memory and appended to the day's column files once the buffer
+    # fills, the day rolls over or the writer is closed. Several writers may share a store:
+    # each flush holds the day's lock while it merges the symbol dictionary and appends.
+    def __init__(self, root: Path, buffer_rows: int = 4096) -> None:
+        self._root = root
+        self._buffer_rows = buffer_rows
+        self._lock = threading.Lock()
+        self._day: date | None = None
+        self._rows: list[tuple[float, str, float, float, float, int]] = []
+
+    def record(self, stocks: list[Stock], at: datetime) -> None:
+        timestamp = at.timestamp()
+        with self._lock:
+            if at.date() != self._day:
+                self._flush()
+                self._day = at.date()
+            for stock in stocks:
+                self._rows.append(
+                    (
+                        timestamp,
+                        stock.symbol,
+                        float(stock.current_price),
+                        _float(stock.day_high),
+                        _float(stock.day_low),
+                        MARKET_STATE_CODES[stock.market_state],
+                    )
+                )
+            if len(self._rows) >= self._buffer_rows:
+                self._flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        self.flush()
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        day_dir = self._root / self._day.isoformat()
+        day_dir.mkdir(parents=True, exist_ok=True)
+        with open(day_dir / _LOCK_FILE, "a") as lock:
+            # Without advisory locks a store must not be shared by several writers.
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            symbol_ids = self._merge_symbols(day_dir)
+            rows = [(row[0], symbol_ids[row[1]], *row[2:]) for row in self._rows]
+            table = np.array(rows, dtype=[(name, dtype) for name, dtype in _COLUMNS.items()])
+            complete = _complete_rows(day_dir)
+            for name, dtype in _COLUMNS.items():
+                with open(day_dir / f"{name}.bin", "ab") as file:
+                    # A flush interrupted by a crash leaves the columns at different lengths;
+                    # cutting them back to the last complete row keeps new rows aligned.
+                    file.truncate(complete * dtype.itemsize)
+                    np.ascontiguousarray(table[name]).tofile(file)
+        self._rows = []
+
+    def _merge_symbols(self, day_dir: Path) -> dict[str, int]:
+        # Ids are positions in the shared dictionary; new symbols are appended, never
+        # renumbered. Written before the rows so every stored id can be resolved.
+        symbols = _read_symbols(day_dir)
+        known = set(symbols)
+        for row in self._rows:
+            if row[1] not in known:
+                known.add(row[1])
+                symbols.append(row[1])
+        temp = day_dir / f".{_SYMBOLS_FILE}.{os.getpid()}.tmp"
+        temp.write_text(json.dumps(symbols))
+        os.replace(temp, day_dir / _SYMBOLS_FILE)
+        return {symbol: i for i, symbol in enumerate(symbols)}
+
+
+def _complete_rows(day_dir: Path) -> int:
+    sizes = []
+    for name, dtype in _COLUMNS.items():
+        path = day_dir / f"{name}.bin"
+        sizes.append(path.stat().st_size // dtype.itemsize if path.exists() else 0)
+    return min(sizes)
+
+
+class TickStore:
+    def __init__(self, root: Path) -> None:
+        self._root = root
+
+    def days(self) -> list[date]:
+        if not self._root.exists():
+            return []
+        days = []
+        for day_dir in self._root.iterdir():
+            try:
+                days.append(date.fromisoformat(day_dir.name))
+            except ValueError:
+                continue
+        return sorted(days)
+
+    def symbols(self, day: date) -> list[str]:
+        return _read_symbols(self._root / day.isoformat())
+
+    def read(self, day: date, symbol: str) -> TickSeries:
+        return self.read_day(day, [symbol]).get(symbol, self._empty())
+
+    def read_day(self, day: date, symbols: list[str] | None = None) -> dict[str, TickSeries]:
+        day_dir = self._root / day.isoformat()
+        known = _read_symbols(day_dir)
+        columns = self._map_columns(day_dir)
+        wanted = known if symbols is None else [s for s in symbols if s in known]
+        # One stable sort groups every symbol's rows while keeping them in time order.
+        order = np.argsort(columns["symbol"], kind="stable")
+        sorted_ids = columns["symbol"][order]
+        series: dict[str, TickSeries] = {}
+        for symbol in wanted:
+            symbol_id = known.index(symbol)
+            start, end = np.searchsorted(sorted_ids, [symbol_id, symbol_id + 1])
+            rows = order[start:end]
+            series[symbol] = TickSeries(
+                timestamps=columns["timestamp"][rows],
+                prices=columns["price"][rows],
+                day_highs=columns["day_high"][rows],
+                day_lows=columns["day_low"][rows],
+                market_states=columns["market_state"][rows],
+            )
+        return series
+
+    @staticmethod
+    def _map_columns(day_dir: Path) -> dict[str, np.ndarray]:
+        columns: dict[str, np.ndarray] = {}
+        for name, dtype in _COLUMNS.items():
+            path = day_dir / f"{name}.bin"
+            size = path.stat().st_size // dtype.itemsize if path.exists() else 0
+            # np.memmap rejects empty files.
+            columns[name] = (
+                np.memmap(path, dtype=dtype, mode="r", shape=(size,))
+                if size
+                else np.empty(0, dtype=dtype)
+            )
+        # A crash mid-flush can leave columns of different lengths; only complete rows count.
+        rows = min(len(column) for column in columns.values())
+        return {name: column[:rows] for name, column in columns.items()}
+
+    @staticmethod
+    def _empty() -> TickSeries:
+        return TickSeries(
+            timestamps=np.empty(0, dtype=_COLUMNS["timestamp"]),
+            prices=np.empty(0, dtype=_COLUMNS["price"]),
+            day_highs=np.empty(0, dtype=_COLUMNS["day_high"]),
+            day_lows=np.empty(0, dtype=_COLUMNS["day_low"]),
+            market_states=np.empty(0, dtype=_COLUMNS["market_state"]),
+        )
@@ -3,19 +3,23 @@ import sys
 
 from dotenv import load_dotenv
 
-from ...application.interfaces import LoggerFactory
-from ...infrastructure.configs import CONFIGS_DIR, ConfigStore
-from ...infrastructure.factories import SettingsFactory
+from ...application.interfaces import LoggerFactory, StockProvider
+from ...infrastructure.factories import ConfigStoreFactory, SettingsFactory
 from ...infrastructure.logging import PythonLoggerFactory, setup_logging
-from ...infrastructure.providers import YahooFinanceProvider
 from ...infrastructure.senders import RetryMessageSender, RetrySettings, TelegramMessageSender
-from .factories import CommandFactory
+from .factories import CommandFactory, LazyStockProvider
 from .menu import InteractiveMenu
 
 
-def _create_menu(logger_factory: LoggerFactory) -> InteractiveMenu:
+def _create_stock_provider(logger_factory: LoggerFactory) -> StockProvider:
+    from ...infrastructure.providers import YahooFinanceProvider
+
     yahoo_finance_settings = SettingsFactory.create_yahoo_finance_settings()
-    provider = YahooFinanceProvider(settings=yahoo_finance_settings, logger_factory=logger_factory)
+    return YahooFinanceProvider(settings=yahoo_finance_settings, logger_factory=logger_factory)
+
+
+def _create_menu(logger_factory: LoggerFactory) -> InteractiveMenu:
+    provider = LazyStockProvider(lambda: _create_stock_provider(logger_factory))
 
     telegram_settings = SettingsFactory.create_telegram_settings()
     message_sender = RetryMessageSender(
@@ -28,7 +32,7 @@ def _create_menu(logger_factory: LoggerFactory) -> InteractiveMenu:
         stock_provider=provider,
         message_sender=message_sender,
         logger_factory=logger_factory,
-        config_store=ConfigStore(CONFIGS_DIR),
+        config_store=ConfigStoreFactory.create(),
     )
 
     registry = factory.create_command_registry()
@@ -1,12 +1,14 @@
+from dataclasses import replace
 from pathlib import Path
 
-from pryces.infrastructure.configs import ConfigManager, ConfigStore, MonitorStocksConfig
+from pryces.infrastructure.configs import ConfigStore
 
 from .base import Command, CommandMetadata, CommandResult, InputPrompt
 from ..utils import (
     create_config_selection_validator,
     format_config_details,
     parse_symbols_with_targets,
+    reload_monitors,
     validate_positive_integer,
     validate_symbols_with_targets,
 )
@@ -46,7 +48,7 @@ class EditConfigCommand(Command):
         details_parts = []
         for i, path in enumerate(self._config_files):
             try:
-                config = ConfigManager(path).read_monitor_stocks_config()
+                config = self._config_store.open(path).read_monitor_stocks_config()
                 details_parts.append(format_config_details(config, path.name, i + 1))
             except Exception:
                 details_parts.append(f"{i + 1}. {path.name} (failed to load)")
@@ -84,7 +86,7 @@ class EditConfigCommand(Command):
         new_value = kwargs.get("new_value", "").strip()
 
         path = self._config_files[int(config_selection) - 1]
-        manager = ConfigManager(path)
+        manager = self._config_store.open(path)
 
         try:
             config = manager.read_monitor_stocks_config()
@@ -94,16 +96,19 @@ class EditConfigCommand(Command):
         if operation == "1":
             if validate_positive_integer(new_value) is not None:
                 return CommandResult("Invalid interval. Must be a positive integer.", success=False)
-            updated = MonitorStocksConfig(interval=int(new_value), symbols=config.symbols)
+            updated = replace(config, interval=int(new_value))
         else:
             if validate_symbols_with_targets(new_value) is not None:
                 return CommandResult(
                     "Invalid symbols format. Use: SYMBOL or SYMBOL:P1,P2 separated by spaces.",
                     success=False,
                 )
-            updated = MonitorStocksConfig(
-                interval=config.interval, symbols=parse_symbols_with_targets(new_value)
-            )
+            updated = replace(config, symbols=parse_symbols_with_targets(new_value))
 
         manager.write_monitor_stocks_config(updated)
+        reloaded = reload_monitors(path)
+        if reloaded:
+            return CommandResult(
+                f"Config updated: {path.name} (reloaded by {reloaded} running monitor(s))"
+            )
         return CommandResult(f"Config updated: {path.name}")
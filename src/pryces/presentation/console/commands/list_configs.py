@@ -1,4 +1,4 @@
-from pryces.infrastructure.configs import ConfigManager, ConfigStore
+from pryces.infrastructure.configs import ConfigStore
 
 from .base import Command, CommandMetadata, CommandResult, InputPrompt
 from ..utils import format_config_details
@@ -27,7 +27,7 @@ class ListConfigsCommand(Command):
         parts = []
         for i, path in enumerate(paths):
             try:
-                config = ConfigManager(path).read_monitor_stocks_config()
+                config = self._config_store.open(path).read_monitor_stocks_config()
                 parts.append(format_config_details(config, path.name, i + 1))
             except Exception as e:
                 parts.append(f"{i + 1}. {path.name}: error loading config — {e}")
@@ -1,5 +1,5 @@
 from .base import Command, CommandMetadata, CommandResult, InputPrompt
-from ..utils import format_running_monitors, get_running_monitors
+from ..utils import format_running_monitors, get_running_monitors, query_monitor
 
 
 class ListMonitorsCommand(Command):
@@ -20,4 +20,9 @@ class ListMonitorsCommand(Command):
         if not processes:
             return CommandResult(message="No monitor processes found.")
 
-        return CommandResult(message=format_running_monitors(processes))
+        statuses = {}
+        for process in processes:
+            status = query_monitor(process)
+            if status is not None:
+                statuses[process.pid] = status
+        return CommandResult(message=format_running_monitors(processes, statuses=statuses))
@@ -1,16 +1,19 @@
 import subprocess
 
+from pryces.infrastructure.monitor_registry import MonitorRecord
+
 from .base import Command, CommandMetadata, CommandResult, InputPrompt
 from ..utils import (
     create_monitor_selection_validator,
     format_running_monitors,
     get_running_monitors,
+    query_monitor,
 )
 
 
 class StopMonitorCommand(Command):
     def __init__(self) -> None:
-        self._processes: list[tuple[str, str]] = []
+        self._processes: list[MonitorRecord] = []
 
     def get_metadata(self) -> CommandMetadata:
         return CommandMetadata(
@@ -48,6 +51,14 @@ class StopMonitorCommand(Command):
         if choice == 0:
             return CommandResult(message="Cancelled.")
 
-        pid, config_path = self._processes[choice - 1]
-        subprocess.run(["kill", pid])
-        return CommandResult(message=f"Stopped monitor process PID {pid} (config: {config_path}).")
+        monitor = self._processes[choice - 1]
+        if query_monitor(monitor, "stop") is not None:
+            return CommandResult(
+                message=f"Stopping monitor process PID {monitor.pid} "
+                f"(config: {monitor.config_path}) once its queued notifications are sent."
+            )
+        # Monitors that do not answer on their control socket are killed instead.
+        subprocess.run(["kill", str(monitor.pid)])
+        return CommandResult(
+            message=f"Stopped monitor process PID {monitor.pid} (config: {monitor.config_path})."
+        )
@@ -1,4 +1,8 @@
+import threading
+from collections.abc import Callable
+
 from ...application.interfaces import LoggerFactory, MessageSender, StockProvider
+from ...domain.stocks import Stock
 from ...application.use_cases.get_stocks_prices import GetStocksPrices
 from ...application.use_cases.send_messages import SendMessages
 from ...infrastructure.configs import ConfigStore
@@ -14,6 +18,21 @@ from .commands.registry import CommandRegistry
 from .commands.stop_monitor import StopMonitorCommand
 
 
+class LazyStockProvider(StockProvider):
+    # Builds the real provider on the first fetch, so the menu does not wait for the market
+    # data libraries to load before it is shown.
+    def __init__(self, factory: Callable[[], StockProvider]) -> None:
+        self._factory = factory
+        self._provider: StockProvider | None = None
+        self._lock = threading.Lock()
+
+    def get_stocks(self, symbols: list[str]) -> list[Stock]:
+        with self._lock:
+            if self._provider is None:
+                self._provider = self._factory()
+        return self._provider.get_stocks(symbols)
+
+
 class CommandFactory:
     def __init__(
         self,
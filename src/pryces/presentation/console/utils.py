@@ -1,42 +1,81 @@
 from __future__ import annotations
 
-import subprocess
 from collections.abc import Callable
+from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 
 from pryces.application.dtos import StockDTO
 from pryces.infrastructure.configs import MonitorStocksConfig, SymbolConfig
+from pryces.infrastructure.control_sockets import send_control_command
+from pryces.infrastructure.factories import MonitorRegistryFactory
+from pryces.infrastructure.monitor_registry import MonitorRecord
 
-_MONITOR_MODULE = "pryces.presentation.scripts.monitor_stocks"
 
+def get_running_monitors() -> list[MonitorRecord]:
+    return MonitorRegistryFactory.create().list()
 
-def get_running_monitors() -> list[tuple[str, str]]:
-    result = subprocess.run(["ps", "-eo", "pid=,cmd="], capture_output=True, text=True)
-    lines = result.stdout.splitlines()
 
-    processes = []
-    for line in lines:
-        if _MONITOR_MODULE not in line or "/bin/sh" in line:
-            continue
-        pid, cmd = line.strip().split(None, 1)
-        try:
-            cmd_parts = cmd.split()
-            module_index = cmd_parts.index("-m") + 2
-            config_path = cmd_parts[module_index] if module_index < len(cmd_parts) else "unknown"
-        except ValueError:
-            config_path = "unknown"
-        processes.append((pid, config_path))
+def query_monitor(monitor: MonitorRecord, command: str = "status") -> dict | None:
+    # The monitor's reply on its control socket; None when it does not answer in time.
+    path = MonitorRegistryFactory.create().control_path(monitor.pid)
+    try:
+        reply = send_control_command(path, command, timeout=2.0)
+    except (OSError, ValueError):
+        return None
+    return reply if reply.get("ok") else None
+
 
-    return processes
+def reload_monitors(config_path: Path) -> int:
+    # Asks every monitor running this config to re-read it now; returns how many did.
+    target = config_path.resolve()
+    return sum(
+        query_monitor(monitor, "reload") is not None
+        for monitor in get_running_monitors()
+        if Path(monitor.config_path).resolve() == target
+    )
 
 
-def format_running_monitors(processes: list[tuple[str, str]]) -> str:
-    header = f"Found {len(processes)} monitor process(es):"
-    entries = [
-        f"  {i + 1}. PID {pid} — config: {config_path}"
-        for i, (pid, config_path) in enumerate(processes)
+def _format_age(seconds: float) -> str:
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m"
+    return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+
+
+def _format_status(status: dict) -> list[str]:
+    lines = [
+        f"     {status['cycles']} cycle(s), last took {status['last_cycle_seconds'] or 0:.2f}s"
+        f" — {status['queue_depth']} message(s) queued"
     ]
+    symbols = [
+        f"{symbol} {values['price']} ({values['notifications']} sent)"
+        for symbol, values in status["symbols"].items()
+    ]
+    if symbols:
+        lines.append(f"     {' | '.join(symbols)}")
+    return lines
+
+
+def format_running_monitors(
+    monitors: list[MonitorRecord],
+    now: datetime | None = None,
+    statuses: dict[int, dict] | None = None,
+) -> str:
+    now = now or datetime.now()
+    statuses = statuses or {}
+    header = f"Found {len(monitors)} monitor process(es):"
+    entries = []
+    for i, monitor in enumerate(monitors):
+        if monitor.last_cycle_at is None:
+            health = f"started {_format_age((now - monitor.started_at).total_seconds())} ago"
+        else:
+            health = f"last cycle {_format_age((now - monitor.last_cycle_at).total_seconds())} ago"
+        entries.append(f"  {i + 1}. PID {monitor.pid} — config: {monitor.config_path} — {health}")
+        if monitor.pid in statuses:
+            entries.extend(_format_status(statuses[monitor.pid]))
     return "\n".join([header] + entries)
 
 
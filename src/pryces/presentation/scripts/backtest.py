@@ -0,0 +1,120 @@
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+from dotenv import load_dotenv
+
+from ...domain.notifications import NotificationType
+from ...infrastructure.backtest import (
+    DEFAULT_RULE_SETS,
+    BacktestReport,
+    NotificationBacktester,
+    PriceHistory,
+    RuleSet,
+)
+from ...infrastructure.factories import ConfigStoreFactory
+from ...infrastructure.history import DailyHistoryCache
+from ...infrastructure.logging import PythonLoggerFactory
+from ...infrastructure.ticks import TickStore
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[4] / ".cache" / "history"
+# Indicators need a year of sessions before the first evaluated day.
+_WARM_UP_YEARS = 1
+
+
+def format_reports(reports: list[BacktestReport]) -> str:
+    label_width = max(len(t.value) for t in NotificationType)
+    widths = [max(len(report.rule_set.name), 8) for report in reports]
+
+    def row(label: str, values: list[str]) -> str:
+        cells = [f"{value:>{width}}" for value, width in zip(values, widths)]
+        return "  ".join([f"{label:<{label_width}}"] + cells)
+
+    lines = [row("notification", [report.rule_set.name for report in reports])]
+    for notification_type in NotificationType:
+        counts = [report.counts.get(notification_type, 0) for report in reports]
+        if any(counts):
+            lines.append(row(notification_type.value, [str(count) for count in counts]))
+    lines.append(row("total", [str(report.total) for report in reports]))
+    lines.append(
+        row(
+            "per session",
+            [
+                f"{report.total / report.sessions if report.sessions else 0:.2f}"
+                for report in reports
+            ],
+        )
+    )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Count the notifications each rule set would have sent over past sessions",
+    )
+    parser.add_argument(
+        "symbols",
+        nargs="*",
+        help="Symbols to backtest (default: every symbol tracked by a config)",
+    )
+    parser.add_argument("--years", type=int, default=5, help="Years of history (default: 5)")
+    parser.add_argument(
+        "--rule-set",
+        dest="rule_sets",
+        type=RuleSet.parse,
+        action="append",
+        metavar="NAME=START,STEP[,CLOSE_TO_SMA]",
+        help="Percentage level start and step, and SMA proximity in %% (repeatable; "
+        "default: the level-1, level-2 and level-3 thresholds in use)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Daily history cache directory (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--ticks",
+        type=Path,
+        default=None,
+        help="Evaluate the recorded intraday ticks in this tick store instead of daily bars",
+    )
+    args = parser.parse_args()
+
+    load_dotenv()
+    logger_factory = PythonLoggerFactory()
+    symbols = args.symbols or ConfigStoreFactory.create().list_tracked_symbols()
+    if not symbols:
+        print("Error: no symbols given and no config tracks any")
+        return 1
+
+    try:
+        cache = DailyHistoryCache(args.cache_dir, logger_factory)
+        bars = cache.load(sorted({s.upper() for s in symbols}), args.years + _WARM_UP_YEARS)
+        first_day = date.today() - timedelta(days=round(365.25 * args.years))
+        history = PriceHistory.from_daily(bars).since(np.datetime64(first_day, "D"))
+        if args.ticks is not None:
+            history = history.with_intraday_paths(TickStore(args.ticks))
+
+        start = time.perf_counter()
+        reports = NotificationBacktester().run(history, args.rule_sets or list(DEFAULT_RULE_SETS))
+        elapsed = time.perf_counter() - start
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        print(f"Backtest error: {e}")
+        return 1
+
+    print(
+        f"{len(history.symbols)} symbol(s), {len(history.days)} day(s), "
+        f"{reports[0].sessions} session(s) evaluated in {elapsed:.2f}s"
+    )
+    print(format_reports(reports))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
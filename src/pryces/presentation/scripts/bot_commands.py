@@ -11,6 +11,7 @@ from ...infrastructure.configs import ConfigManager, MonitorStocksConfig, Symbol
 _MAX_MESSAGE_LENGTH = 256
 _MAX_INTEGER_DIGITS = 7
 _MAX_DECIMAL_DIGITS = 8
+_MAX_STATS_SYMBOLS = 10
 
 
 def _validate_price(raw: str) -> Decimal | str:
@@ -54,6 +55,15 @@ class BotCommand(ABC):
     def arg_count(self) -> int:
         pass
 
+    @property
+    def max_arg_count(self) -> int:
+        return self.arg_count
+
+    @property
+    def ordered(self) -> bool:
+        # Unordered commands may run alongside, and reply before, commands sent earlier.
+        return True
+
     @abstractmethod
     def execute(self, args: list[str]) -> str:
         pass
@@ -64,7 +74,8 @@ _FindConfigByNameFn = Callable[[str], tuple[Path, MonitorStocksConfig] | None]
 _GetAllSymbolsFn = Callable[[], list[str]]
 _GetAllSymbolsWithTargetsFn = Callable[[], list[tuple[str, list[Decimal]]]]
 _GetConfigNamesFn = Callable[[], list[str]]
-_GetStockStatisticsFn = Callable[[str], bool]
+_GetStockStatisticsFn = Callable[[list[str]], list[str]]
+_OpenConfigFn = Callable[[Path], ConfigManager]
 
 
 def _find_symbol_config(
@@ -116,8 +127,11 @@ class TargetsCommand(BotCommand):
 
 
 class TargetAddCommand(BotCommand):
-    def __init__(self, find_config: _FindConfigFn) -> None:
+    def __init__(
+        self, find_config: _FindConfigFn, open_config: _OpenConfigFn = ConfigManager
+    ) -> None:
         self._find_config = find_config
+        self._open_config = open_config
 
     @property
     def name(self) -> str:
@@ -149,15 +163,18 @@ class TargetAddCommand(BotCommand):
             path, _, sc = config_result
             if price in sc.prices:
                 return f"ℹ️ {symbol} already has target {price}"
-            ConfigManager(path).replace_symbol_prices(symbol, sc.prices + [price])
+            self._open_config(path).add_target(symbol, price)
             return f"✅ Added target {price} to {symbol}"
         except Exception as e:
             return f"❌ Error: {e}"
 
 
 class TargetRemoveCommand(BotCommand):
-    def __init__(self, find_config: _FindConfigFn) -> None:
+    def __init__(
+        self, find_config: _FindConfigFn, open_config: _OpenConfigFn = ConfigManager
+    ) -> None:
         self._find_config = find_config
+        self._open_config = open_config
 
     @property
     def name(self) -> str:
@@ -189,15 +206,18 @@ class TargetRemoveCommand(BotCommand):
             path, _, sc = config_result
             if price not in sc.prices:
                 return f"ℹ️ {symbol} does not have target {price}"
-            ConfigManager(path).replace_symbol_prices(symbol, [p for p in sc.prices if p != price])
+            self._open_config(path).remove_target(symbol, price)
             return f"✅ Removed target {price} from {symbol}"
         except Exception as e:
             return f"❌ Error: {e}"
 
 
 class SymbolAddCommand(BotCommand):
-    def __init__(self, find_config_by_name: _FindConfigByNameFn) -> None:
+    def __init__(
+        self, find_config_by_name: _FindConfigByNameFn, open_config: _OpenConfigFn = ConfigManager
+    ) -> None:
         self._find_config_by_name = find_config_by_name
+        self._open_config = open_config
 
     @property
     def name(self) -> str:
@@ -225,15 +245,18 @@ class SymbolAddCommand(BotCommand):
             path, config = result
             if any(sc.symbol == symbol for sc in config.symbols):
                 return f"ℹ️ {symbol} is already in {config_name}"
-            ConfigManager(path).add_symbol(symbol)
+            self._open_config(path).add_symbol(symbol)
             return f"✅ Added {symbol} to {config_name}"
         except Exception as e:
             return f"❌ Error: {e}"
 
 
 class SymbolRemoveCommand(BotCommand):
-    def __init__(self, find_config: _FindConfigFn) -> None:
+    def __init__(
+        self, find_config: _FindConfigFn, open_config: _OpenConfigFn = ConfigManager
+    ) -> None:
         self._find_config = find_config
+        self._open_config = open_config
 
     @property
     def name(self) -> str:
@@ -260,7 +283,7 @@ class SymbolRemoveCommand(BotCommand):
             path, config = result
             if len(config.symbols) == 1:
                 return "⚠️ Cannot remove the last symbol from a config"
-            ConfigManager(path).remove_symbol(symbol)
+            self._open_config(path).remove_symbol(symbol)
             return f"✅ Removed {symbol} from config"
         except Exception as e:
             return f"❌ Error: {e}"
@@ -310,23 +333,33 @@ class StatsCommand(BotCommand):
 
     @property
     def usage(self) -> str:
-        return "/stats <symbol>"
+        return "/stats <symbol> [<symbol> ...]"
 
     @property
     def description(self) -> str:
-        return "Show price statistics for a symbol"
+        return f"Show price statistics for up to {_MAX_STATS_SYMBOLS} symbols"
 
     @property
     def arg_count(self) -> int:
         return 1
 
+    @property
+    def max_arg_count(self) -> int:
+        return _MAX_STATS_SYMBOLS
+
+    @property
+    def ordered(self) -> bool:
+        # Only reads remote data, so a slow fetch need not hold back config commands.
+        return False
+
     def execute(self, args: list[str]) -> str:
-        symbol = args[0].upper()
+        symbols = list(dict.fromkeys(arg.upper() for arg in args))
         try:
-            found = self._get_stock_statistics(symbol)
-            return "" if found else f"❌ No data found for {symbol}"
+            found = {symbol.upper() for symbol in self._get_stock_statistics(symbols)}
         except Exception as e:
             return f"❌ Error: {e}"
+        missing = [symbol for symbol in symbols if symbol not in found]
+        return f"❌ No data found for {', '.join(missing)}" if missing else ""
 
 
 class ConfigsCommand(BotCommand):
@@ -387,6 +420,11 @@ class BotCommandDispatcher:
         self._commands = {cmd.name: cmd for cmd in commands}
         self._logger = logger_factory.get_logger(__name__)
 
+    def is_ordered(self, text: str) -> bool:
+        tokens = text.strip().split()
+        cmd = self._commands.get(tokens[0].lower()) if tokens else None
+        return cmd is None or cmd.ordered
+
     def dispatch(self, text: str) -> str:
         if len(text) > _MAX_MESSAGE_LENGTH:
             return ""
@@ -397,7 +435,7 @@ class BotCommandDispatcher:
         cmd = self._commands.get(name)
         if cmd is None:
             return "❓ Unknown command, use /help"
-        if len(args) != cmd.arg_count:
+        if not cmd.arg_count <= len(args) <= cmd.max_arg_count:
             return f"❓ Usage: {cmd.usage}"
         self._logger.info(f"Executing {name} with args {args}")
         return cmd.execute(args)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 from ...application.dtos import TargetPriceDTO
 from ...application.interfaces import LoggerFactory
-from ...infrastructure.configs import ConfigManager, MonitorStocksConfig, SymbolConfig
+from ...infrastructure.configs import ConfigDiff, ConfigManager, MonitorStocksConfig, SymbolConfig
 
 
 class ConfigRefresher:
@@ -14,21 +16,32 @@ class ConfigRefresher:
     ) -> None:
         self._config_manager = config_manager
         self._config = config
+        # Unknown until the first refresh, which therefore always re-reads the file once.
+        self._signature: tuple[int, int] | None = None
         self._logger = logger_factory.get_logger(__name__)
 
     @property
     def config(self) -> MonitorStocksConfig:
         return self._config
 
-    def refresh(self) -> None:
+    def refresh(self, force: bool = False) -> ConfigDiff:
+        # force re-reads the config even when its signature is unchanged.
         try:
+            signature = self._config_manager.signature()
+            if not force and signature is not None and signature == self._signature:
+                return ConfigDiff()
             new_config = self._config_manager.read_monitor_stocks_config()
-            if new_config != self._config:
-                self._config = new_config
-                self._logger.info("Config refreshed.")
-                self.log_config()
+            self._signature = signature
+            if new_config == self._config:
+                return ConfigDiff()
+            diff = ConfigDiff.between(self._config, new_config)
+            self._config = new_config
+            self._logger.info("Config refreshed.")
+            self.log_config()
+            return diff
         except Exception as e:
             self._logger.warning(f"Config refresh failed: {e}")
+            return ConfigDiff()
 
     def remove_fulfilled_targets(self, fulfilled: list[TargetPriceDTO]) -> None:
         if not fulfilled:
@@ -49,12 +62,10 @@ class ConfigRefresher:
         if updated_symbols == self._config.symbols:
             return
 
-        new_config = MonitorStocksConfig(
-            interval=self._config.interval,
-            symbols=updated_symbols,
-        )
-        self._config = new_config
-        self._config_manager.write_monitor_stocks_config(new_config)
+        # Only the fulfilled targets are removed from storage, so changes made meanwhile by
+        # other writers survive; the next refresh picks them up as a diff.
+        self._config_manager.remove_targets(fulfilled_pairs)
+        self._config = replace(self._config, symbols=updated_symbols)
         self._logger.info("Removing fulfilled targets from config.")
         self.log_config()
 
@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from ...infrastructure.configs import CONFIGS_DIR, ConfigStore
+from ...infrastructure.exceptions import ConfigLoadingFailed
+from ...infrastructure.sqlite_configs import SqliteConfigDatabase, SqliteConfigStore
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Import JSON monitor configs into the SQLite config database",
+    )
+    parser.add_argument(
+        "configs",
+        type=Path,
+        nargs="*",
+        help="JSON config files to import (default: every config in the configs directory)",
+    )
+    parser.add_argument(
+        "--database",
+        type=Path,
+        default=None,
+        help="Database file (default: CONFIG_DATABASE environment variable)",
+    )
+    args = parser.parse_args()
+
+    load_dotenv()
+    database = args.database or Path(os.environ.get("CONFIG_DATABASE", ""))
+    if not database.name:
+        print("Error: pass --database or set CONFIG_DATABASE")
+        return 1
+
+    store = SqliteConfigStore(SqliteConfigDatabase(database))
+    paths = args.configs or ConfigStore(CONFIGS_DIR).list_paths()
+    failed = 0
+    for path in paths:
+        try:
+            locator = store.import_json(path)
+            print(f"Imported {path} as {locator}")
+        except ConfigLoadingFailed as e:
+            failed += 1
+            print(f"Skipped {path}: {e}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from ...application.interfaces import StockRepository
+from ...infrastructure.control_sockets import ControlHandler
+
+
+@dataclass(frozen=True, slots=True)
+class SymbolStatus:
+    price: Decimal
+    notifications: int
+
+
+@dataclass(frozen=True, slots=True)
+class CycleStatus:
+    cycles: int = 0
+    last_cycle_seconds: float | None = None
+    symbols: dict[str, SymbolStatus] = field(default_factory=dict)
+
+
+class MonitorControl:
+    # Shared by the monitor loop and the control socket's threads. The loop publishes an
+    # immutable status after every cycle and waits here between cycles; commands only read
+    # that status or raise a flag and wake the loop, so they never touch the loop's state.
+    def __init__(
+        self,
+        stock_repository: StockRepository,
+        queue_depth: Callable[[], int] = lambda: 0,
+    ) -> None:
+        self._stock_repository = stock_repository
+        self._queue_depth = queue_depth
+        self._status = CycleStatus()
+        self._wake = threading.Event()
+        self._reload = threading.Event()
+        self._stop = threading.Event()
+
+    @property
+    def stop_requested(self) -> bool:
+        return self._stop.is_set()
+
+    def handlers(self) -> dict[str, ControlHandler]:
+        return {
+            "status": self.status,
+            "reload": self.request_reload,
+            "cycle": self.request_cycle,
+            "stop": self.request_stop,
+        }
+
+    def record_cycle(self, symbols: list[str], seconds: float) -> None:
+        statuses = {}
+        for symbol in symbols:
+            stock = self._stock_repository.get(symbol)
+            if stock is not None:
+                statuses[symbol] = SymbolStatus(stock.current_price, stock.sent_notification_count)
+        self._status = CycleStatus(self._status.cycles + 1, seconds, statuses)
+
+    def status(self) -> dict:
+        status = self._status
+        return {
+            "cycles": status.cycles,
+            "last_cycle_seconds": status.last_cycle_seconds,
+            "queue_depth": self._queue_depth(),
+            "symbols": {
+                symbol: {"price": str(s.price), "notifications": s.notifications}
+                for symbol, s in status.symbols.items()
+            },
+        }
+
+    def request_cycle(self) -> dict:
+        self._wake.set()
+        return {}
+
+    def request_reload(self) -> dict:
+        self._reload.set()
+        self._wake.set()
+        return {}
+
+    def request_stop(self) -> dict:
+        self._stop.set()
+        self._wake.set()
+        return {}
+
+    def take_reload(self) -> bool:
+        if not self._reload.is_set():
+            return False
+        self._reload.clear()
+        return True
+
+    def wait(self, timeout: float) -> bool:
+        # Sleeps until the next cycle is due or a command wakes the loop; False once a stop
+        # was requested. A command arriving mid-cycle makes the next wait return at once.
+        if not self._stop.is_set():
+            self._wake.wait(timeout)
+        self._wake.clear()
+        return not self._stop.is_set()
@@ -1,10 +1,14 @@
 import argparse
+import signal
 import sys
 import time
+from datetime import date
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+from ...application.correlation import cycle_scope, new_cycle_id
+from ...application.dtos import TargetPriceDTO
 from ...application.interfaces import LoggerFactory
 from ...infrastructure.formatters import ConsolidatingNotificationFormatter
 from ...application.services import NotificationService, StockSynchronizer
@@ -12,9 +16,17 @@ from ...application.use_cases.trigger_stocks_notifications import (
     TriggerStocksNotifications,
     TriggerStocksNotificationsRequest,
 )
-from ...infrastructure.factories import SettingsFactory
+from ...infrastructure.factories import (
+    ConfigStoreFactory,
+    MonitorRegistryFactory,
+    SettingsFactory,
+)
+from ...infrastructure.control_sockets import ControlSocketServer
+from ...infrastructure.monitor_registry import MonitorRegistration
 from ...infrastructure.providers import YahooFinanceProvider
-from ...infrastructure.repositories import InMemoryStockRepository
+from ...infrastructure.recordings import InfoRecorder
+from ...infrastructure.repositories import InMemoryStockRepository, SqliteStockRepository
+from ...infrastructure.ticks import TickWriter
 from ...infrastructure.senders import (
     FireAndForgetMessageSender,
     RetryMessageSender,
@@ -22,9 +34,9 @@ from ...infrastructure.senders import (
     TelegramMessageSender,
 )
 from pryces.infrastructure.logging import PythonLoggerFactory, setup_logging
-from ...infrastructure.configs import ConfigManager
 from ...infrastructure.exceptions import ConfigLoadingFailed
 from .config_refresher import ConfigRefresher
+from .monitor_control import MonitorControl
 
 
 class MonitorStocksScript:
@@ -34,42 +46,125 @@ class MonitorStocksScript:
         config_refresher: ConfigRefresher,
         duration: int,
         logger_factory: LoggerFactory,
+        registration: MonitorRegistration | None = None,
+        control: MonitorControl | None = None,
     ) -> None:
         self._trigger_notifications = trigger_notifications
         self._config_refresher = config_refresher
         self._duration_seconds = duration * 60
+        self._registration = registration
+        self._control = control
         self._logger = logger_factory.get_logger(__name__)
 
     def run(self) -> None:
         self._logger.info("Monitoring started.")
         self._config_refresher.log_config()
         start = time.monotonic()
+        cycle = 0
 
         while True:
-            self._config_refresher.refresh()
-            config = self._config_refresher.config
-            request = TriggerStocksNotificationsRequest(
-                symbols=[s.symbol for s in config.symbols],
-                targets={s.symbol: s.prices for s in config.symbols},
-            )
-            try:
-                fulfilled = self._trigger_notifications.handle(request)
-                self._config_refresher.remove_fulfilled_targets(fulfilled)
-            except Exception as e:
-                self._logger.warning(f"Exception caught: {e}")
+            cycle += 1
+            # Every record logged during the cycle, on any thread, carries its id.
+            with cycle_scope(new_cycle_id()):
+                self._run_cycle(cycle)
 
             if time.monotonic() - start >= self._duration_seconds:
                 break
 
-            time.sleep(self._config_refresher.config.interval)
+            if self._control is None:
+                time.sleep(self._config_refresher.config.interval)
+            elif not self._control.wait(self._config_refresher.config.interval):
+                self._logger.info("Stop requested through the control socket.")
+                break
 
         self._logger.info("Monitoring finished.")
 
+    def _run_cycle(self, cycle: int) -> None:
+        # A reload command re-reads the config even if its signature looks unchanged.
+        reload = self._control is not None and self._control.take_reload()
+        cycle_started = time.perf_counter()
+        diff = self._config_refresher.refresh(force=reload)
+        config = self._config_refresher.config
+        request = TriggerStocksNotificationsRequest(
+            symbols=[s.symbol for s in config.symbols],
+            targets={s.symbol: s.prices for s in config.symbols},
+            # Stocks restored from a checkpoint may predate config edits made while the
+            # monitor was down, so the first cycle re-syncs every target.
+            changed_symbols=None if cycle == 1 else diff.changed_symbols,
+            removed_symbols=set(diff.removed_symbols),
+            rules=config.rules,
+        )
+        fulfilled: list[TargetPriceDTO] = []
+        outcome = "ok"
+        try:
+            fulfilled = self._trigger_notifications.handle(request)
+            self._config_refresher.remove_fulfilled_targets(fulfilled)
+        except Exception as e:
+            outcome = "error"
+            self._logger.warning(f"Exception caught: {e}", outcome=outcome)
+        seconds = time.perf_counter() - cycle_started
+        self._logger.info(
+            "Cycle %d finished in %.2fs",
+            cycle,
+            seconds,
+            cycle=cycle,
+            symbols=len(request.symbols),
+            fulfilled=len(fulfilled),
+            duration=round(seconds, 4),
+            outcome=outcome,
+        )
+        if self._registration is not None:
+            try:
+                self._registration.beat()
+            except OSError as e:
+                # A full disk or a removed registry directory only hides the monitor from list.
+                self._logger.warning(f"Failed to update the monitor registry: {e}")
+        if self._control is not None:
+            self._control.record_cycle(request.symbols, seconds)
+
 
 class _ScriptContext:
-    def __init__(self, script: MonitorStocksScript, message_sender: FireAndForgetMessageSender):
+    def __init__(
+        self,
+        script: MonitorStocksScript,
+        message_sender: FireAndForgetMessageSender,
+        recorder: InfoRecorder | None = None,
+        stock_repository: SqliteStockRepository | None = None,
+        tick_writer: TickWriter | None = None,
+        registration: MonitorRegistration | None = None,
+        control_server: ControlSocketServer | None = None,
+    ):
         self.script = script
         self.message_sender = message_sender
+        self.recorder = recorder
+        self.stock_repository = stock_repository
+        self.tick_writer = tick_writer
+        self.registration = registration
+        self.control_server = control_server
+
+    def close(self) -> None:
+        if self.control_server is not None:
+            self.control_server.close()
+        if self.registration is not None:
+            self.registration.close()
+        # Sends whatever is still queued before returning.
+        self.message_sender.shutdown()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.stock_repository is not None:
+            self.stock_repository.close()
+        if self.tick_writer is not None:
+            self.tick_writer.close()
+
+
+class _Terminated(BaseException):
+    # Raised in the main thread on SIGTERM so the run unwinds through _ScriptContext.close().
+    # It derives from BaseException so the cycle's own error handling cannot swallow it.
+    pass
+
+
+def _raise_terminated(signum, frame) -> None:
+    raise _Terminated()
 
 
 def _create_script(
@@ -77,11 +172,17 @@ def _create_script(
     duration: int,
     logger_factory: LoggerFactory,
     extra_delay_in_minutes: int = 0,
+    record_path: Path | None = None,
+    state_path: Path | None = None,
+    ticks_dir: Path | None = None,
 ) -> _ScriptContext:
     yahoo_finance_settings = SettingsFactory.create_yahoo_finance_settings(
         extra_delay_in_minutes=extra_delay_in_minutes
     )
-    provider = YahooFinanceProvider(settings=yahoo_finance_settings, logger_factory=logger_factory)
+    recorder = InfoRecorder(record_path) if record_path is not None else None
+    provider = YahooFinanceProvider(
+        settings=yahoo_finance_settings, logger_factory=logger_factory, recorder=recorder
+    )
     telegram_settings = SettingsFactory.create_telegram_settings()
     telegram_sender = TelegramMessageSender(
         settings=telegram_settings, logger_factory=logger_factory
@@ -91,25 +192,69 @@ def _create_script(
         settings=RetrySettings(max_retries=3, base_delay=1.0, backoff_factor=2.0),
         logger_factory=logger_factory,
     )
-    message_sender = FireAndForgetMessageSender(inner=retry_sender, logger_factory=logger_factory)
+    message_sender = FireAndForgetMessageSender(
+        inner=retry_sender,
+        logger_factory=logger_factory,
+        settings=SettingsFactory.create_fire_and_forget_settings(),
+    )
     formatter = ConsolidatingNotificationFormatter()
-    notification_service = NotificationService(message_sender, formatter)
-    stock_repository = InMemoryStockRepository()
-    stock_synchronizer = StockSynchronizer(provider=provider, stock_repository=stock_repository)
+    notification_service = NotificationService(
+        message_sender, formatter, logger_factory=logger_factory
+    )
+    persistent_repository = None
+    if state_path is not None:
+        # One session per config and day: a restart the same day resumes where it stopped.
+        session = f"{path.resolve()}@{date.today().isoformat()}"
+        persistent_repository = SqliteStockRepository(state_path, session)
+        restored = persistent_repository.restored_symbols
+        if restored:
+            logger_factory.get_logger(__name__).info(
+                f"Restored state of {len(restored)} stock(s) from {state_path}."
+            )
+    stock_repository = persistent_repository or InMemoryStockRepository()
+    tick_writer = TickWriter(ticks_dir) if ticks_dir is not None else None
+    stock_synchronizer = StockSynchronizer(
+        provider=provider,
+        stock_repository=stock_repository,
+        tick_recorder=tick_writer,
+        logger_factory=logger_factory,
+    )
     trigger_notifications = TriggerStocksNotifications(
         stock_synchronizer=stock_synchronizer,
         notification_service=notification_service,
     )
-    config_manager = ConfigManager(path)
+    config_manager = ConfigStoreFactory.open_manager(path)
     config = config_manager.read_monitor_stocks_config()
     config_refresher = ConfigRefresher(config_manager, config, logger_factory)
+    # Clients compare resolved paths, so a relative path must not depend on this process's cwd.
+    registration = MonitorRegistryFactory.create().register(str(path.resolve()))
+    control = MonitorControl(stock_repository, queue_depth=lambda: message_sender.pending)
+    try:
+        control_server = ControlSocketServer(
+            registration.control_path, control.handlers(), logger_factory
+        )
+        control_server.start()
+    except OSError as e:
+        # Socket paths are limited to about 100 bytes; the monitor still runs without one.
+        control_server = None
+        logger_factory.get_logger(__name__).warning(f"Control socket unavailable: {e}")
     script = MonitorStocksScript(
         trigger_notifications=trigger_notifications,
         config_refresher=config_refresher,
         duration=duration,
         logger_factory=logger_factory,
+        registration=registration,
+        control=control,
+    )
+    return _ScriptContext(
+        script=script,
+        message_sender=message_sender,
+        recorder=recorder,
+        stock_repository=persistent_repository,
+        tick_writer=tick_writer,
+        registration=registration,
+        control_server=control_server,
     )
-    return _ScriptContext(script=script, message_sender=message_sender)
 
 
 def main() -> int:
@@ -131,6 +276,24 @@ def main() -> int:
         default=0,
         help="Extra delay in minutes added to the yfinance price delay (default: 0)",
     )
+    parser.add_argument(
+        "--record",
+        type=Path,
+        default=None,
+        help="Record the raw quotes of every cycle to this file for offline replays",
+    )
+    parser.add_argument(
+        "--state",
+        type=Path,
+        default=None,
+        help="Checkpoint stock state to this file so a restart the same day resumes warm",
+    )
+    parser.add_argument(
+        "--ticks",
+        type=Path,
+        default=None,
+        help="Append every fetched quote to a day-partitioned tick store in this directory",
+    )
     args = parser.parse_args()
 
     load_dotenv()
@@ -138,6 +301,7 @@ def main() -> int:
         SettingsFactory.create_monitor_logging_settings(verbose=args.verbose, debug=args.debug)
     )
     logger_factory = PythonLoggerFactory()
+    signal.signal(signal.SIGTERM, _raise_terminated)
 
     try:
         context = _create_script(
@@ -145,13 +309,18 @@ def main() -> int:
             duration=args.duration,
             logger_factory=logger_factory,
             extra_delay_in_minutes=args.extra_delay,
+            record_path=args.record,
+            state_path=args.state,
+            ticks_dir=args.ticks,
         )
         try:
             context.script.run()
         finally:
-            context.message_sender.shutdown()
+            context.close()
     except KeyboardInterrupt:
         logger_factory.get_logger(__name__).info("Monitor stopped by user.")
+    except _Terminated:
+        logger_factory.get_logger(__name__).info("Monitor terminated.")
     except ConfigLoadingFailed as e:
         print(f"Error: {e}")
         return 1
@@ -1,6 +1,7 @@
 import argparse
 import sys
 from collections.abc import Callable
+from pathlib import Path
 
 from dotenv import load_dotenv
 
@@ -9,12 +10,16 @@ from ...application.use_cases.trigger_stocks_statistics import (
     TriggerStocksStatistics,
     TriggerStocksStatisticsRequest,
 )
-from ...infrastructure.configs import CONFIGS_DIR, ConfigStore
 from ...infrastructure.formatters import RegularStockStatisticsFormatter
-from ...infrastructure.factories import SettingsFactory
+from ...infrastructure.factories import ConfigStoreFactory, SettingsFactory
 from ...infrastructure.logging import PythonLoggerFactory, setup_logging
-from ...infrastructure.providers import YahooFinanceStatisticsProvider
+from ...infrastructure.providers import YahooFinanceProvider, YahooFinanceStatisticsProvider
 from ...infrastructure.senders import TelegramMessageSender
+from ...infrastructure.statistics_snapshots import (
+    DEFAULT_SNAPSHOT_PATH,
+    SnapshotStockStatisticsProvider,
+    StatisticsSnapshotStore,
+)
 
 
 class ReportStocksStatisticsScript:
@@ -39,10 +44,17 @@ class ReportStocksStatisticsScript:
         self._logger.info(f"Report triggered for {len(symbols)} symbol(s).")
 
 
-def _create_script(logger_factory: LoggerFactory) -> ReportStocksStatisticsScript:
+def _create_script(
+    logger_factory: LoggerFactory, snapshot_path: Path
+) -> ReportStocksStatisticsScript:
     yahoo_settings = SettingsFactory.create_yahoo_finance_settings()
-    statistics_provider = YahooFinanceStatisticsProvider(
-        settings=yahoo_settings, logger_factory=logger_factory
+    statistics_provider = SnapshotStockStatisticsProvider(
+        StatisticsSnapshotStore(snapshot_path),
+        fallback=YahooFinanceStatisticsProvider(
+            settings=yahoo_settings, logger_factory=logger_factory
+        ),
+        logger_factory=logger_factory,
+        stock_provider=YahooFinanceProvider(settings=yahoo_settings, logger_factory=logger_factory),
     )
     telegram_settings = SettingsFactory.create_telegram_settings()
     message_sender = TelegramMessageSender(
@@ -51,7 +63,7 @@ def _create_script(logger_factory: LoggerFactory) -> ReportStocksStatisticsScrip
     trigger_stocks_statistics = TriggerStocksStatistics(
         statistics_provider, RegularStockStatisticsFormatter(), message_sender
     )
-    config_store = ConfigStore(CONFIGS_DIR)
+    config_store = ConfigStoreFactory.create()
 
     return ReportStocksStatisticsScript(
         trigger_stocks_statistics=trigger_stocks_statistics,
@@ -64,6 +76,12 @@ def main() -> int:
     parser = argparse.ArgumentParser(
         description="Report price statistics for all tracked symbols via Telegram",
     )
+    parser.add_argument(
+        "--snapshot",
+        type=Path,
+        default=DEFAULT_SNAPSHOT_PATH,
+        help=f"Statistics snapshot to read (default: {DEFAULT_SNAPSHOT_PATH})",
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging to stderr")
     args = parser.parse_args()
@@ -75,7 +93,7 @@ def main() -> int:
     logger_factory = PythonLoggerFactory()
 
     try:
-        script = _create_script(logger_factory)
+        script = _create_script(logger_factory, args.snapshot)
         script.run()
     except KeyboardInterrupt:
         logger_factory.get_logger(__name__).info("Report stopped by user.")
@@ -0,0 +1,93 @@
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from ...application.interfaces import LoggerFactory
+from ...infrastructure.factories import ConfigStoreFactory, SettingsFactory
+from ...infrastructure.logging import PythonLoggerFactory, setup_logging
+from ...infrastructure.statistics_snapshots import (
+    DEFAULT_SNAPSHOT_PATH,
+    ClosingHistoryDownloader,
+    StatisticsSnapshotStore,
+)
+
+
+class SnapshotStatisticsScript:
+    def __init__(
+        self,
+        downloader: ClosingHistoryDownloader,
+        store: StatisticsSnapshotStore,
+        list_tracked_symbols: Callable[[], list[str]],
+        logger_factory: LoggerFactory,
+    ) -> None:
+        self._downloader = downloader
+        self._store = store
+        self._list_tracked_symbols = list_tracked_symbols
+        self._logger = logger_factory.get_logger(__name__)
+
+    def run(self) -> None:
+        symbols = sorted({symbol.upper() for symbol in self._list_tracked_symbols()})
+        if not symbols:
+            self._logger.info("No symbols tracked, nothing to snapshot.")
+            return
+
+        start = time.perf_counter()
+        histories = self._downloader.download(symbols)
+        if not histories:
+            # Keep the previous snapshot rather than replace it with an empty one.
+            self._logger.error("No closing history downloaded, snapshot left unchanged.")
+            return
+        self._store.write(histories)
+        self._logger.info(
+            f"Snapshot of {len(histories)}/{len(symbols)} symbol(s) written to "
+            f"{self._store.path} in {time.perf_counter() - start:.1f}s."
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Precompute the price statistics snapshot of every tracked symbol",
+    )
+    parser.add_argument(
+        "--snapshot",
+        type=Path,
+        default=DEFAULT_SNAPSHOT_PATH,
+        help=f"Snapshot file to write (default: {DEFAULT_SNAPSHOT_PATH})",
+    )
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose logging to stderr")
+    args = parser.parse_args()
+
+    load_dotenv()
+    setup_logging(
+        SettingsFactory.create_report_logging_settings(verbose=args.verbose, debug=args.debug)
+    )
+    logger_factory = PythonLoggerFactory()
+
+    try:
+        script = SnapshotStatisticsScript(
+            downloader=ClosingHistoryDownloader(
+                SettingsFactory.create_yahoo_finance_settings(), logger_factory
+            ),
+            store=StatisticsSnapshotStore(args.snapshot),
+            list_tracked_symbols=ConfigStoreFactory.create().list_tracked_symbols,
+            logger_factory=logger_factory,
+        )
+        script.run()
+    except KeyboardInterrupt:
+        logger_factory.get_logger(__name__).info("Snapshot stopped by user.")
+    except Exception as e:
+        message = f"Snapshot error: {e}"
+        print(message)
+        logger_factory.get_logger(__name__).error(message)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
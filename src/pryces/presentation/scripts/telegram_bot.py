@@ -1,20 +1,30 @@
 import argparse
 import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
 
 from dotenv import load_dotenv
 
-from ...application.interfaces import LoggerFactory
+from ...application.interfaces import LoggerFactory, StockStatisticsProvider
 from ...infrastructure.formatters import RegularStockStatisticsFormatter
 from ...application.use_cases.trigger_stocks_statistics import (
     TriggerStocksStatistics,
     TriggerStocksStatisticsRequest,
 )
 from ...application.use_cases.send_messages import SendMessages, SendMessagesRequest
-from ...infrastructure.factories import SettingsFactory
+from ...infrastructure.factories import ConfigStoreFactory, SettingsFactory
 from ...infrastructure.logging import PythonLoggerFactory, setup_logging
-from ...infrastructure.providers import YahooFinanceStatisticsProvider
-from ...infrastructure.receivers import TelegramUpdatePoller
-from ...infrastructure.senders import TelegramMessageSender
+from ...infrastructure.receivers import (
+    MAX_UPDATES_LIMIT,
+    BotUpdate,
+    TelegramUpdatePoller,
+    TelegramWebhookReceiver,
+    UpdateReceiver,
+)
+from ...infrastructure.senders import TelegramMessageSender, TelegramSettings
 from .bot_commands import (
     BotCommand,
     BotCommandDispatcher,
@@ -28,21 +38,162 @@ from .bot_commands import (
     TargetRemoveCommand,
     TargetsCommand,
 )
-from ...infrastructure.configs import CONFIGS_DIR, ConfigStore
+
+_COMMAND_WORKERS = 4
+_COMMAND_TIMEOUT = 30.0
+
+
+@dataclass(slots=True)
+class _Run:
+    update: BotUpdate
+    lane: str | None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    finished: bool = False
+    overdue: bool = False
+
+
+class CommandRunner:
+    # Runs commands on a worker pool so polling never waits for them. A chat's commands run one
+    # at a time in the order they were received, except unordered ones, which start right away.
+    # Threads cannot be cancelled, so a command still running after `timeout` seconds keeps its
+    # worker. An ordered command keeps its chat blocked too: the chat is told it is still
+    # running and gets the real reply once it finishes. An unordered command only reads, so it
+    # is answered with a timeout and its late result is dropped. At most `max_overdue` commands
+    # may be overdue at once; past that, new unordered commands are turned away so that hung
+    # reads cannot take every worker.
+    def __init__(
+        self,
+        dispatcher: BotCommandDispatcher,
+        send_messages: SendMessages,
+        logger_factory: LoggerFactory,
+        workers: int = _COMMAND_WORKERS,
+        timeout: float = _COMMAND_TIMEOUT,
+        max_overdue: int | None = None,
+    ) -> None:
+        self._dispatcher = dispatcher
+        self._send_messages = send_messages
+        self._timeout = timeout
+        self._max_overdue = workers - 1 if max_overdue is None else max_overdue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bot-command")
+        self._lanes: dict[str, deque[BotUpdate]] = {}
+        self._pending = 0
+        self._overdue = 0
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._logger = logger_factory.get_logger(__name__)
+
+    def submit(self, update: BotUpdate) -> None:
+        with self._lock:
+            ordered = self._dispatcher.is_ordered(update.text)
+            busy = not ordered and self._overdue >= self._max_overdue
+            if not busy:
+                self._pending += 1
+            if ordered:
+                queue = self._lanes.setdefault(update.chat_id, deque())
+                queue.append(update)
+                if len(queue) > 1:
+                    return
+        if busy:
+            command = update.text.split()[0]
+            self._logger.warning(f"{command} turned away, too many commands are overdue")
+            self._reply(f"⏳ Too many commands still running, {command} was not run")
+            return
+        self._start(update, update.chat_id if ordered else None)
+
+    def close(self) -> None:
+        # Commands already received are answered before the workers stop; overdue unordered
+        # commands are not waited for.
+        with self._idle:
+            self._idle.wait_for(lambda: self._pending == 0)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _start(self, update: BotUpdate, lane: str | None) -> None:
+        run = _Run(update, lane)
+        timer = threading.Timer(self._timeout, self._time_out, (run,))
+        timer.daemon = True
+        future = self._executor.submit(self._dispatcher.dispatch, update.text)
+
+        def completed(done: Future) -> None:
+            timer.cancel()
+            self._finish(run, done)
+
+        future.add_done_callback(completed)
+        timer.start()
+
+    def _time_out(self, run: _Run) -> None:
+        command = run.update.text.split()[0]
+        with run.lock:
+            if run.finished:
+                return
+            run.overdue = True
+            with self._lock:
+                self._overdue += 1
+            self._logger.warning(f"{command} still running after {self._timeout:g}s")
+            if run.lane is None:
+                self._reply(f"⏱ {command} timed out, try again later")
+            else:
+                # Retrying a write that may still land would apply it twice.
+                self._reply(f"⏳ {command} is still running, its reply will follow")
+        if run.lane is None:
+            self._done()
+
+    def _finish(self, run: _Run, done: Future) -> None:
+        with run.lock:
+            run.finished = True
+            try:
+                reply = done.result()
+            except Exception as e:
+                self._logger.error(f"Command failed: {e}")
+                reply = f"❌ Error: {e}"
+            if run.overdue:
+                with self._lock:
+                    self._overdue -= 1
+                if run.lane is None:
+                    self._logger.info(f"Dropped the late reply to {run.update.text.split()[0]}")
+                    return
+            self._reply(reply)
+        if run.lane is not None:
+            self._advance(run.lane)
+        self._done()
+
+    def _reply(self, reply: str) -> None:
+        if not reply:
+            return
+        try:
+            self._send_messages.handle(SendMessagesRequest(messages=[reply]))
+        except Exception as e:
+            self._logger.error(f"Failed to send reply: {e}")
+
+    def _done(self) -> None:
+        with self._idle:
+            self._pending -= 1
+            self._idle.notify_all()
+
+    def _advance(self, lane: str) -> None:
+        with self._lock:
+            queue = self._lanes[lane]
+            queue.popleft()
+            if not queue:
+                del self._lanes[lane]
+                return
+            update = queue[0]
+        self._start(update, lane)
 
 
 class TelegramBotScript:
     def __init__(
         self,
-        poller: TelegramUpdatePoller,
+        receiver: UpdateReceiver,
         send_messages: SendMessages,
         dispatcher: BotCommandDispatcher,
         group_id: str,
         logger_factory: LoggerFactory,
+        command_timeout: float = _COMMAND_TIMEOUT,
     ) -> None:
-        self._poller = poller
-        self._send_messages = send_messages
-        self._dispatcher = dispatcher
+        self._receiver = receiver
+        self._runner = CommandRunner(
+            dispatcher, send_messages, logger_factory, timeout=command_timeout
+        )
         self._group_id = group_id
         self._logger = logger_factory.get_logger(__name__)
 
@@ -50,46 +201,115 @@ class TelegramBotScript:
         self._logger.info("Telegram bot started.")
         offset = 0
 
-        while True:
-            updates = self._poller.get_updates(offset)
-            for update in updates:
-                if update.chat_id == self._group_id:
-                    reply = self._dispatcher.dispatch(update.text)
-                    if reply:
-                        try:
-                            self._send_messages.handle(SendMessagesRequest(messages=[reply]))
-                        except Exception as e:
-                            self._logger.error(f"Failed to send reply: {e}")
-                offset = update.update_id + 1
+        try:
+            while True:
+                updates = self._receiver.get_updates(offset)
+                for update in updates:
+                    if update.chat_id == self._group_id:
+                        self._runner.submit(update)
+                if updates:
+                    offset = updates[-1].update_id + 1
+        finally:
+            self._receiver.close()
+            self._runner.close()
+
+
+def _create_receiver(
+    telegram_settings: TelegramSettings,
+    webhook: tuple[str, int] | None,
+    poll_limit: int,
+    logger_factory: LoggerFactory,
+) -> UpdateReceiver:
+    if webhook is None:
+        return TelegramUpdatePoller(
+            settings=telegram_settings, logger_factory=logger_factory, limit=poll_limit
+        )
+    receiver = TelegramWebhookReceiver(
+        telegram_settings, SettingsFactory.create_webhook_settings(*webhook), logger_factory
+    )
+    receiver.start()
+    return receiver
+
+
+def _parse_listen_address(value: str) -> tuple[str, int]:
+    host, separator, port = value.rpartition(":")
+    if not separator or not port.isdigit() or not 0 < int(port) < 65536:
+        raise argparse.ArgumentTypeError(f"expected HOST:PORT, got '{value}'")
+    return host or "0.0.0.0", int(port)
+
+
+def _parse_poll_limit(value: str) -> int:
+    if not value.isdigit() or not 1 <= int(value) <= MAX_UPDATES_LIMIT:
+        raise argparse.ArgumentTypeError(f"expected 1 to {MAX_UPDATES_LIMIT}, got '{value}'")
+    return int(value)
+
+
+def _create_statistics_provider(
+    logger_factory: LoggerFactory, snapshot_path: Path | None
+) -> StockStatisticsProvider:
+    from ...infrastructure.providers import (
+        CachedStockStatisticsProvider,
+        YahooFinanceProvider,
+        YahooFinanceStatisticsProvider,
+    )
+    from ...infrastructure.statistics_snapshots import (
+        DEFAULT_SNAPSHOT_PATH,
+        SnapshotStockStatisticsProvider,
+        StatisticsSnapshotStore,
+    )
+
+    yahoo_settings = SettingsFactory.create_yahoo_finance_settings()
+    return CachedStockStatisticsProvider(
+        SnapshotStockStatisticsProvider(
+            StatisticsSnapshotStore(snapshot_path or DEFAULT_SNAPSHOT_PATH),
+            fallback=YahooFinanceStatisticsProvider(
+                settings=yahoo_settings, logger_factory=logger_factory
+            ),
+            logger_factory=logger_factory,
+            stock_provider=YahooFinanceProvider(
+                settings=yahoo_settings, logger_factory=logger_factory
+            ),
+        )
+    )
 
 
-def _create_script(logger_factory: LoggerFactory) -> TelegramBotScript:
+def _create_script(
+    logger_factory: LoggerFactory,
+    command_timeout: float,
+    snapshot_path: Path | None,
+    webhook: tuple[str, int] | None = None,
+    poll_limit: int = MAX_UPDATES_LIMIT,
+) -> TelegramBotScript:
     telegram_settings = SettingsFactory.create_telegram_settings()
-    poller = TelegramUpdatePoller(settings=telegram_settings, logger_factory=logger_factory)
     telegram_message_sender = TelegramMessageSender(
         settings=telegram_settings, logger_factory=logger_factory
     )
     send_messages = SendMessages(telegram_message_sender)
 
-    yahoo_settings = SettingsFactory.create_yahoo_finance_settings()
-    statistics_provider = YahooFinanceStatisticsProvider(
-        settings=yahoo_settings, logger_factory=logger_factory
-    )
-    trigger_stocks_statistics = TriggerStocksStatistics(
-        statistics_provider, RegularStockStatisticsFormatter(), telegram_message_sender
-    )
+    # The statistics stack loads pandas and yfinance, so it is built on the first /stats
+    # instead of delaying startup.
+    statistics_lock = threading.Lock()
+    trigger_stocks_statistics: TriggerStocksStatistics | None = None
 
-    def trigger_stock_statistics(symbol: str) -> bool:
-        return trigger_stocks_statistics.handle(TriggerStocksStatisticsRequest(symbols=[symbol]))
+    def trigger_stock_statistics(symbols: list[str]) -> list[str]:
+        nonlocal trigger_stocks_statistics
+        with statistics_lock:
+            if trigger_stocks_statistics is None:
+                trigger_stocks_statistics = TriggerStocksStatistics(
+                    _create_statistics_provider(logger_factory, snapshot_path),
+                    RegularStockStatisticsFormatter(),
+                    telegram_message_sender,
+                )
+        return trigger_stocks_statistics.handle(TriggerStocksStatisticsRequest(symbols=symbols))
 
-    config_store = ConfigStore(CONFIGS_DIR)
+    config_store = ConfigStoreFactory.create()
     targets_cmd = TargetsCommand(config_store.find_for_symbol)
-    target_add_cmd = TargetAddCommand(config_store.find_for_symbol)
-    target_remove_cmd = TargetRemoveCommand(config_store.find_for_symbol)
+    target_add_cmd = TargetAddCommand(config_store.find_for_symbol, config_store.open)
+    target_remove_cmd = TargetRemoveCommand(config_store.find_for_symbol, config_store.open)
     symbols_cmd = SymbolsCommand(config_store.list_tracked_symbols_with_targets)
     configs_cmd = ConfigsCommand(config_store.list_names)
-    symbol_add_cmd = SymbolAddCommand(config_store.find_by_name)
-    symbol_remove_cmd = SymbolRemoveCommand(config_store.find_for_symbol)
+    symbol_add_cmd = SymbolAddCommand(config_store.find_by_name, config_store.open)
+    symbol_remove_cmd = SymbolRemoveCommand(config_store.find_for_symbol, config_store.open)
     stats_cmd = StatsCommand(trigger_stock_statistics)
     commands: list[BotCommand] = [
         configs_cmd,
@@ -106,11 +326,12 @@ def _create_script(logger_factory: LoggerFactory) -> TelegramBotScript:
 
     dispatcher = BotCommandDispatcher(all_commands, logger_factory)
     script = TelegramBotScript(
-        poller=poller,
+        receiver=_create_receiver(telegram_settings, webhook, poll_limit, logger_factory),
         send_messages=send_messages,
         dispatcher=dispatcher,
         group_id=telegram_settings.group_id,
         logger_factory=logger_factory,
+        command_timeout=command_timeout,
     )
     return script
 
@@ -121,6 +342,30 @@ def main() -> int:
     )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging to stderr")
+    parser.add_argument(
+        "--command-timeout",
+        type=float,
+        default=_COMMAND_TIMEOUT,
+        help=f"Seconds before a command is answered with a timeout (default: {_COMMAND_TIMEOUT:g})",
+    )
+    parser.add_argument(
+        "--snapshot",
+        type=Path,
+        default=None,
+        help="Statistics snapshot to read (default: the snapshot_statistics output)",
+    )
+    parser.add_argument(
+        "--webhook",
+        type=_parse_listen_address,
+        metavar="HOST:PORT",
+        help="Receive updates through a webhook server on this address instead of long polling",
+    )
+    parser.add_argument(
+        "--poll-limit",
+        type=_parse_poll_limit,
+        default=MAX_UPDATES_LIMIT,
+        help=f"Maximum updates fetched per long poll (default: {MAX_UPDATES_LIMIT})",
+    )
     args = parser.parse_args()
 
     load_dotenv()
@@ -130,7 +375,13 @@ def main() -> int:
     logger_factory = PythonLoggerFactory()
 
     try:
-        script = _create_script(logger_factory)
+        script = _create_script(
+            logger_factory,
+            args.command_timeout,
+            args.snapshot,
+            args.webhook,
+            poll_limit=args.poll_limit,
+        )
         script.run()
     except KeyboardInterrupt:
         logger_factory.get_logger(__name__).info("Bot stopped by user.")
@@ -0,0 +1,3 @@
+from .telegram_server import FakeTelegramServer, FakeTelegramSettings, ReceivedMessage
+
+__all__ = ["FakeTelegramServer", "FakeTelegramSettings", "ReceivedMessage"]
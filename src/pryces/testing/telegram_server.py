@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+@dataclass(frozen=True, slots=True)
+class FakeTelegramSettings:
+    latency: float = 0.0
+    # Every Nth sendMessage call fails with the given fault; 0 disables it.
+    rate_limit_every: int = 0
+    retry_after: int = 1
+    server_error_every: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class ReceivedMessage:
+    chat_id: str
+    text: str
+    received_at: float
+
+
+class FakeTelegramServer:
+    """Local stand-in for the Telegram Bot API (sendMessage, getUpdates long polling and webhook
+    pushes once setWebhook registered a URL)."""
+
+    def __init__(self, settings: FakeTelegramSettings = FakeTelegramSettings()) -> None:
+        self._settings = settings
+        self._lock = threading.Condition()
+        self._messages: list[ReceivedMessage] = []
+        self._updates: list[dict] = []
+        self._next_update_id = 1
+        self._send_calls = 0
+        self._webhook: dict | None = None
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def messages(self) -> list[ReceivedMessage]:
+        with self._lock:
+            return list(self._messages)
+
+    @property
+    def send_calls(self) -> int:
+        with self._lock:
+            return self._send_calls
+
+    def start(self) -> FakeTelegramServer:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        with self._lock:
+            self._lock.notify_all()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> FakeTelegramServer:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @property
+    def webhook(self) -> dict | None:
+        with self._lock:
+            return self._webhook
+
+    def push_update(self, chat_id: str | int, text: str) -> int:
+        # With a webhook registered the update is posted to it and the webhook's HTTP status is
+        # returned; otherwise it waits for getUpdates and its update_id is returned.
+        with self._lock:
+            update_id = self._next_update_id
+            self._next_update_id += 1
+            update = {"update_id": update_id, "message": {"chat": {"id": chat_id}, "text": text}}
+            webhook = self._webhook
+            if webhook is None:
+                self._updates.append(update)
+                self._lock.notify_all()
+                return update_id
+        return self.post_update(webhook, update)
+
+    @staticmethod
+    def post_update(webhook: dict, update: dict) -> int:
+        headers = {"Content-Type": "application/json"}
+        if webhook.get("secret_token"):
+            headers["X-Telegram-Bot-Api-Secret-Token"] = webhook["secret_token"]
+        request = urllib.request.Request(
+            webhook["url"], data=json.dumps(update).encode("utf-8"), headers=headers
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+    def wait_for_messages(self, count: int, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            while len(self._messages) < count:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._lock.wait(remaining)
+            return True
+
+    def _handle_send_message(self, payload: dict) -> tuple[int, dict]:
+        with self._lock:
+            self._send_calls += 1
+            call = self._send_calls
+        if self._settings.rate_limit_every and call % self._settings.rate_limit_every == 0:
+            retry_after = self._settings.retry_after
+            return 429, {
+                "ok": False,
+                "error_code": 429,
+                "description": f"Too Many Requests: retry after {retry_after}",
+                "parameters": {"retry_after": retry_after},
+            }
+        if self._settings.server_error_every and call % self._settings.server_error_every == 0:
+            return 502, {"ok": False, "error_code": 502, "description": "Bad Gateway"}
+        with self._lock:
+            self._messages.append(
+                ReceivedMessage(
+                    chat_id=str(payload.get("chat_id")),
+                    text=payload.get("text", ""),
+                    received_at=time.monotonic(),
+                )
+            )
+            message_id = len(self._messages)
+            self._lock.notify_all()
+        return 200, {"ok": True, "result": {"message_id": message_id}}
+
+    def _handle_set_webhook(self, payload: dict) -> tuple[int, dict]:
+        with self._lock:
+            self._webhook = payload if payload.get("url") else None
+        return 200, {"ok": True, "result": True}
+
+    def _handle_get_updates(self, query: dict[str, list[str]]) -> tuple[int, dict]:
+        if self.webhook is not None:
+            return 409, {
+                "ok": False,
+                "error_code": 409,
+                "description": "Conflict: can't use getUpdates method while webhook is active",
+            }
+        offset = int(query.get("offset", ["0"])[0])
+        timeout = float(query.get("timeout", ["0"])[0])
+        limit = int(query.get("limit", ["100"])[0])
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            self._updates = [u for u in self._updates if u["update_id"] >= offset]
+            while not self._updates:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._lock.wait(remaining)
+            return 200, {"ok": True, "result": self._updates[:limit]}
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; on a kept-alive connection Nagle's
+            # algorithm would hold the body back until the client's delayed ACK.
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                self._dispatch(body=None)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", "0"))
+                self._dispatch(body=self.rfile.read(length))
+
+            def _dispatch(self, body: bytes | None) -> None:
+                if server._settings.latency:
+                    time.sleep(server._settings.latency)
+                url = urlparse(self.path)
+                method = url.path.rsplit("/", 1)[-1]
+                if method == "sendMessage":
+                    status, data = server._handle_send_message(json.loads(body or b"{}"))
+                elif method == "setWebhook":
+                    status, data = server._handle_set_webhook(json.loads(body or b"{}"))
+                elif method == "deleteWebhook":
+                    status, data = server._handle_set_webhook({})
+                elif method == "getUpdates":
+                    status, data = server._handle_get_updates(parse_qs(url.query))
+                else:
+                    status, data = 404, {"ok": False, "error_code": 404, "description": "Not Found"}
+                encoded = json.dumps(data).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
@@ -0,0 +1,36 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from pryces.application.correlation import (
+    bind_cycle,
+    current_cycle_id,
+    cycle_scope,
+    new_cycle_id,
+)
+
+
+class TestCycleScope:
+    def test_sets_the_cycle_id_only_inside_the_scope(self):
+        with cycle_scope("abc"):
+            assert current_cycle_id() == "abc"
+
+        assert current_cycle_id() is None
+
+    def test_nested_scopes_restore_the_outer_cycle(self):
+        with cycle_scope("outer"):
+            with cycle_scope("inner"):
+                assert current_cycle_id() == "inner"
+            assert current_cycle_id() == "outer"
+
+    def test_new_cycle_ids_are_unique(self):
+        assert len({new_cycle_id() for _ in range(100)}) == 100
+
+
+class TestBindCycle:
+    def test_carries_the_cycle_into_pool_threads(self):
+        with cycle_scope("abc"):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                unbound = list(executor.map(lambda _: current_cycle_id(), range(4)))
+                bound = list(executor.map(bind_cycle(lambda _: current_cycle_id()), range(4)))
+
+        assert unbound == [None] * 4
+        assert bound == ["abc"] * 4
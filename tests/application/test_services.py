@@ -1,13 +1,14 @@
 from datetime import datetime
 from decimal import Decimal
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
-from pryces.application.interfaces import StockProvider
+from pryces.application.interfaces import QuoteProvider, StockProvider, TickRecorder
 from pryces.application.services import NotificationService, StockSynchronizer
+from pryces.domain.notifications import NotificationPriority
 from pryces.infrastructure.formatters import ConsolidatingNotificationFormatter
-from pryces.domain.stocks import MarketState, Stock
+from pryces.domain.stocks import MarketState, QuoteDelta, Stock
 from pryces.infrastructure.repositories import InMemoryStockRepository
 from tests.fixtures.factories import (
     create_stock,
@@ -50,6 +51,18 @@ class TestNotificationService:
 
         assert self.mock_sender.send_message.call_count == 2
 
+    def test_logs_the_outcome_of_every_notification(self):
+        logger_factory = Mock()
+        self.mock_sender.send_message.return_value = False
+        service = NotificationService(
+            self.mock_sender, self.formatter, self.clock, logger_factory=logger_factory
+        )
+
+        service.send_stock_notifications(create_stock_crossing_fifty_day("AAPL"))
+
+        fields = logger_factory.get_logger.return_value.debug.call_args.kwargs
+        assert fields == {"symbol": "AAPL", "priority": "CRITICAL", "outcome": "dropped"}
+
     def test_handles_stock_with_no_crossing_notifications(self):
         stock = create_stock_no_crossing("AAPL")
 
@@ -124,6 +137,15 @@ class TestNotificationService:
         self.mock_sender.send_message.assert_called()
         assert fulfilled == [Decimal("200.00")]
 
+    def test_sends_messages_with_their_priority_keyed_by_symbol(self):
+        stock = create_stock_crossing_fifty_day("AAPL")
+
+        self.service.send_stock_notifications(stock)
+
+        _, priority, key = self.mock_sender.send_message.call_args[0]
+        assert priority == NotificationPriority.CRITICAL
+        assert key == "AAPL"
+
     def test_returns_fulfilled_targets_even_when_sender_returns_false(self):
         self.mock_sender.send_message.return_value = False
         stock = Stock(
@@ -176,6 +198,21 @@ class TestStockSynchronizer:
             stock_repository=self.stock_repository,
         )
 
+    def test_fetch_and_sync_logs_how_many_symbols_were_fetched(self):
+        logger_factory = Mock()
+        synchronizer = StockSynchronizer(
+            self.mock_provider, self.stock_repository, logger_factory=logger_factory
+        )
+        self.mock_provider.get_stocks.return_value = [create_stock("AAPL")]
+
+        synchronizer.fetch_and_sync(["AAPL", "MSFT"], {})
+
+        fields = logger_factory.get_logger.return_value.debug.call_args.kwargs
+        assert fields["requested"] == 2
+        assert fields["fetched"] == 1
+        assert fields["outcome"] == "partial"
+        assert fields["duration"] >= 0
+
     def test_fetch_and_sync_returns_fresh_stock_when_no_existing(self):
         stock = create_stock("AAPL")
         self.mock_provider.get_stocks.return_value = [stock]
@@ -245,9 +282,121 @@ class TestStockSynchronizer:
 
         assert result == []
 
+    def test_fetch_and_sync_skips_target_sync_for_unchanged_symbols(self):
+        self.stock_repository.save_batch([create_stock("AAPL")])
+        self.mock_provider.get_stocks.return_value = [create_stock("AAPL")]
+
+        with patch.object(Stock, "sync_targets", autospec=True) as sync_targets:
+            self.synchronizer.fetch_and_sync(["AAPL"], {"AAPL": [Decimal("300.00")]}, set())
+
+        sync_targets.assert_not_called()
+
+    def test_fetch_and_sync_resyncs_changed_symbols(self):
+        existing = create_stock("AAPL")
+        self.stock_repository.save_batch([existing])
+        self.mock_provider.get_stocks.return_value = [create_stock("AAPL")]
+
+        with patch.object(Stock, "sync_targets", autospec=True) as sync_targets:
+            self.synchronizer.fetch_and_sync(["AAPL"], {"AAPL": [Decimal("300.00")]}, {"AAPL"})
+
+        sync_targets.assert_called_once_with(existing, [Decimal("300.00")])
+
+    def test_fetch_and_sync_always_syncs_new_stocks(self):
+        stock = create_stock("AAPL")
+        self.mock_provider.get_stocks.return_value = [stock]
+
+        with patch.object(Stock, "sync_targets", autospec=True) as sync_targets:
+            self.synchronizer.fetch_and_sync(["AAPL"], {"AAPL": [Decimal("300.00")]}, set())
+
+        sync_targets.assert_called_once_with(stock, [Decimal("300.00")])
+
+    def test_fetch_and_sync_keeps_change_pending_until_stock_is_fetched(self):
+        existing = create_stock("AAPL")
+        self.stock_repository.save_batch([existing])
+        self.mock_provider.get_stocks.return_value = []
+        self.synchronizer.fetch_and_sync(["AAPL"], {"AAPL": [Decimal("300.00")]}, {"AAPL"})
+        self.mock_provider.get_stocks.return_value = [create_stock("AAPL")]
+
+        with patch.object(Stock, "sync_targets", autospec=True) as sync_targets:
+            self.synchronizer.fetch_and_sync(["AAPL"], {"AAPL": [Decimal("300.00")]}, set())
+
+        sync_targets.assert_called_once_with(existing, [Decimal("300.00")])
+
+    def test_forget_removes_stocks_from_repository(self):
+        self.stock_repository.save_batch([create_stock("AAPL"), create_stock("MSFT")])
+
+        self.synchronizer.forget({"AAPL"})
+
+        assert self.stock_repository.get("AAPL") is None
+        assert self.stock_repository.get("MSFT") is not None
+
     def test_persist_saves_stocks_to_repository(self):
         stock = create_stock("AAPL")
 
         self.synchronizer.persist([stock])
 
         assert self.stock_repository.get("AAPL") is stock
+
+    def test_persist_records_ticks_when_recorder_given(self):
+        recorder = Mock(spec=TickRecorder)
+        now = datetime(2024, 1, 2, 10, 0)
+        synchronizer = StockSynchronizer(
+            provider=self.mock_provider,
+            stock_repository=self.stock_repository,
+            tick_recorder=recorder,
+            clock=lambda: now,
+        )
+        stock = create_stock("AAPL")
+
+        synchronizer.persist([stock])
+
+        recorder.record.assert_called_once_with([stock], now)
+
+
+class TestStockSynchronizerWithQuotes:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.mock_provider = Mock(spec=QuoteProvider)
+        self.stock_repository = InMemoryStockRepository()
+        self.synchronizer = StockSynchronizer(
+            provider=self.mock_provider,
+            stock_repository=self.stock_repository,
+        )
+
+    def test_builds_new_stocks_from_full_quotes(self):
+        self.mock_provider.get_quotes.return_value = [
+            QuoteDelta("AAPL", {"current_price": Decimal("150.00")}, full=True)
+        ]
+
+        [stock] = self.synchronizer.fetch_and_sync(["aapl"], {})
+
+        self.mock_provider.get_quotes.assert_called_once_with(["aapl"], set())
+        assert stock.symbol == "AAPL"
+        assert stock.current_price == Decimal("150.00")
+
+    def test_applies_quotes_to_held_stocks(self):
+        existing = create_stock("AAPL")
+        self.stock_repository.save_batch([existing])
+        self.mock_provider.get_quotes.return_value = [
+            QuoteDelta("AAPL", {"current_price": Decimal("210.00")})
+        ]
+
+        result = self.synchronizer.fetch_and_sync(["AAPL", "MSFT"], {})
+
+        self.mock_provider.get_quotes.assert_called_once_with(["AAPL", "MSFT"], {"AAPL"})
+        assert result == [existing]
+        assert existing.current_price == Decimal("210.00")
+        assert existing.snapshot is not None
+
+    def test_syncs_targets_of_new_stocks(self):
+        self.mock_provider.get_quotes.return_value = [
+            QuoteDelta("AAPL", {"current_price": Decimal("150.00")}, full=True)
+        ]
+
+        with patch.object(Stock, "sync_targets", autospec=True) as sync_targets:
+            [stock] = self.synchronizer.fetch_and_sync(
+                ["AAPL"], {"AAPL": [Decimal("300.00")]}, set()
+            )
+
+        sync_targets.assert_called_once_with(stock, [Decimal("300.00")])
@@ -222,3 +222,23 @@ class TestTriggerStocksNotifications:
         assert self.mock_sender.send_message.call_count == 1
         sent_message = self.mock_sender.send_message.call_args[0][0]
         assert sent_message == "📉 AAPL dropped to 100.00 (-9.09%)\n💀 Hit a new 52-week low"
+
+    def test_handle_forgets_removed_symbols(self):
+        self._prime_stock_in_repo("MSFT")
+        self.mock_provider.get_stocks.return_value = []
+        request = TriggerStocksNotificationsRequest(symbols=[], removed_symbols={"MSFT"})
+
+        self.use_case.handle(request)
+
+        assert self.stock_repository.get("MSFT") is None
+
+    def test_handle_evaluates_only_the_requested_rules(self):
+        self._prime_stock_in_repo("MSFT")
+        self.mock_provider.get_stocks.return_value = [create_stock_crossing_both_averages("MSFT")]
+        request = TriggerStocksNotificationsRequest(symbols=["MSFT"], rules=("sma200_crossed",))
+
+        self.use_case.handle(request)
+
+        sent_message = self.mock_sender.send_message.call_args[0][0]
+        assert "SMA200" in sent_message
+        assert "SMA50" not in sent_message
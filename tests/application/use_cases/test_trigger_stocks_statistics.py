@@ -93,7 +93,7 @@ class TestTriggerStocksStatistics:
         self.mock_formatter.format.assert_any_call(stats[0])
         self.mock_formatter.format.assert_any_call(stats[1])
 
-    def test_handle_returns_false_when_no_statistics(self):
+    def test_handle_returns_no_symbols_when_no_statistics(self):
         self.mock_provider.get_stock_statistics.return_value = []
         request = TriggerStocksStatisticsRequest(symbols=["SXRS"])
         use_case = TriggerStocksStatistics(
@@ -104,11 +104,11 @@ class TestTriggerStocksStatistics:
 
         result = use_case.handle(request)
 
-        assert result is False
+        assert result == []
 
-    def test_handle_returns_true_when_statistics_found(self):
+    def test_handle_returns_the_symbols_statistics_were_found_for(self):
         self.mock_provider.get_stock_statistics.return_value = [_make_stats("AAPL")]
-        request = TriggerStocksStatisticsRequest(symbols=["AAPL"])
+        request = TriggerStocksStatisticsRequest(symbols=["AAPL", "BADSYM"])
         use_case = TriggerStocksStatistics(
             provider=self.mock_provider,
             formatter=self.mock_formatter,
@@ -117,4 +117,4 @@ class TestTriggerStocksStatistics:
 
         result = use_case.handle(request)
 
-        assert result is True
+        assert result == ["AAPL"]
@@ -2,7 +2,7 @@ from decimal import Decimal
 
 import pytest
 
-from pryces.domain.notifications import Notification, NotificationType
+from pryces.domain.notifications import Notification, NotificationPriority, NotificationType
 
 
 def test_cannot_create_notification_directly():
@@ -264,6 +264,40 @@ def test_create_session_losses_erased_sets_message():
     assert notification.message == "🟢 Erased session losses"
 
 
+def test_target_price_reached_has_critical_priority():
+    notification = Notification.create_target_price_reached("AAPL", Decimal("200.00"))
+
+    assert notification.priority == NotificationPriority.CRITICAL
+
+
+def test_sma_crossed_has_critical_priority():
+    notification = Notification.create_fifty_day_average_crossed(Decimal("100"))
+
+    assert notification.priority == NotificationPriority.CRITICAL
+
+
+def test_new_52_week_high_has_high_priority():
+    notification = Notification.create_new_52_week_high()
+
+    assert notification.priority == NotificationPriority.HIGH
+
+
+def test_percentage_change_has_normal_priority():
+    notification = Notification.create_percentage_change(
+        NotificationType.LEVEL_2_INCREASE, "AAPL", Decimal("150.00"), Decimal("3.75")
+    )
+
+    assert notification.priority == NotificationPriority.NORMAL
+
+
+def test_market_open_and_closed_have_low_priority():
+    market_open = Notification.create_regular_market_open("AAPL", Decimal("150.00"), None)
+    market_closed = Notification.create_regular_market_closed("AAPL", Decimal("150.00"), None)
+
+    assert market_open.priority == NotificationPriority.LOW
+    assert market_closed.priority == NotificationPriority.LOW
+
+
 def test_notification_type_enum_has_expected_values():
     assert NotificationType.SMA50_CROSSED.value == "SMA50_CROSSED"
     assert NotificationType.SMA200_CROSSED.value == "SMA200_CROSSED"
@@ -0,0 +1,122 @@
+from decimal import Decimal
+
+import pytest
+
+from pryces.domain.notifications import NotificationType
+from pryces.domain.rules import BUILT_IN_RULES, DEFAULT_RULES, RULE_NAMES, RuleBook
+from pryces.domain.stocks import INCREASE_LEVEL_TYPES
+from pryces.infrastructure.formatters import ConsolidatingNotificationFormatter
+from tests.fixtures.factories import _DEFAULT_NOW, generate_and_drain, make_stock
+
+_formatter = ConsolidatingNotificationFormatter()
+
+
+def _names(plan) -> list[str]:
+    return [rule.name for rule in plan]
+
+
+def _generate_and_drain_with(stock, rules: RuleBook) -> list[str]:
+    return [m.text for m in stock.generate_notifications(_DEFAULT_NOW, _formatter, rules).messages]
+
+
+class TestRuleBookPlan:
+    def test_fresh_session_plans_every_rule_except_erased_sessions(self):
+        assert _names(DEFAULT_RULES.plan(frozenset())) == [
+            name for name in RULE_NAMES if not name.startswith("session_")
+        ]
+
+    def test_drops_rules_whose_notification_was_already_sent(self):
+        history = frozenset(
+            {NotificationType.REGULAR_MARKET_OPEN, NotificationType.NEW_52_WEEK_HIGH}
+        )
+
+        names = _names(DEFAULT_RULES.plan(history))
+
+        assert "market_open" not in names
+        assert "new_52_week_high" not in names
+        assert "new_52_week_low" in names
+
+    def test_drops_close_to_sma_once_the_average_was_crossed(self):
+        names = _names(DEFAULT_RULES.plan(frozenset({NotificationType.SMA50_CROSSED})))
+
+        assert "close_to_sma50" not in names
+        assert "close_to_sma200" in names
+
+    def test_plans_erased_gains_only_after_an_increase_level(self):
+        history = frozenset({NotificationType.LEVEL_2_INCREASE})
+
+        names = _names(DEFAULT_RULES.plan(history))
+
+        assert "session_gains_erased" in names
+        assert "session_losses_erased" not in names
+
+    def test_drops_percentage_rule_once_every_level_was_sent(self):
+        names = _names(DEFAULT_RULES.plan(INCREASE_LEVEL_TYPES))
+
+        assert "percentage_increase" not in names
+        assert "percentage_decrease" in names
+
+    def test_late_session_plan_is_empty(self):
+        assert DEFAULT_RULES.plan(frozenset(NotificationType)) == ()
+
+    def test_plans_are_compiled_once_per_history(self):
+        rules = RuleBook()
+        history = frozenset({NotificationType.SMA50_CROSSED})
+
+        assert rules.plan(history) is rules.plan(frozenset(history))
+
+
+class TestRuleBookSelect:
+    def test_none_selects_default_rules(self):
+        assert RuleBook.select(None) is DEFAULT_RULES
+
+    def test_keeps_built_in_order(self):
+        rules = RuleBook.select(("new_52_week_low", "market_open", "sma50_crossed"))
+
+        assert _names(rules.rules) == ["market_open", "sma50_crossed", "new_52_week_low"]
+
+    def test_rejects_unknown_names(self):
+        with pytest.raises(ValueError, match="bogus"):
+            RuleBook.select(("market_open", "bogus"))
+
+    def test_built_in_rule_names_are_unique(self):
+        assert len(set(RULE_NAMES)) == len(BUILT_IN_RULES)
+
+
+class TestStockWithRuleBook:
+    def test_only_selected_rules_are_evaluated(self):
+        stock = make_stock(
+            current_price="150.00",
+            previous_close_price="140.00",
+            fifty_day_average="145.00",
+            two_hundred_day_average="148.00",
+        )
+
+        messages = _generate_and_drain_with(stock, RuleBook.select(("sma200_crossed",)))
+
+        assert len(messages) == 1
+        assert "Crossed SMA200" in messages[0]
+        assert "SMA50" not in messages[0]
+
+    def test_default_rules_match_explicit_default_rule_book(self):
+        def stock():
+            return make_stock(
+                current_price="150.00",
+                previous_close_price="140.00",
+                open_price="141.00",
+                fifty_day_average="145.00",
+                two_hundred_day_average="151.00",
+            )
+
+        assert generate_and_drain(stock()) == _generate_and_drain_with(stock(), RuleBook())
+
+    def test_stock_stays_silent_while_nothing_new_can_fire(self):
+        stock = make_stock(
+            current_price="150.00",
+            previous_close_price="140.00",
+            fifty_day_average="145.00",
+        )
+        generate_and_drain(stock)
+        stock.update(make_stock(current_price=Decimal("150.10"), previous_close_price="140.00"))
+
+        assert generate_and_drain(stock) == []
@@ -911,7 +911,7 @@ class TestSessionGainsLossesErased:
             market_state=MarketState.OPEN,
         )
         stock.update(source)
-        messages = stock.generate_notifications(_DEFAULT_NOW, _formatter).messages
+        messages = generate_and_drain(stock)
         assert any("Erased session gains" in m for m in messages)
         # Cycle 4: recovers to +5% → should fire again
         source = Stock(
@@ -921,7 +921,7 @@ class TestSessionGainsLossesErased:
             market_state=MarketState.OPEN,
         )
         stock.update(source)
-        messages = stock.generate_notifications(_DEFAULT_NOW, _formatter).messages
+        messages = generate_and_drain(stock)
 
         assert any("+5.00%" in m for m in messages)
 
@@ -951,7 +951,7 @@ class TestSessionGainsLossesErased:
             market_state=MarketState.OPEN,
         )
         stock.update(source)
-        messages = stock.generate_notifications(_DEFAULT_NOW, _formatter).messages
+        messages = generate_and_drain(stock)
         assert any("Erased session losses" in m for m in messages)
         # Cycle 4: drops to -5% → should fire again
         source = Stock(
@@ -961,7 +961,7 @@ class TestSessionGainsLossesErased:
             market_state=MarketState.OPEN,
         )
         stock.update(source)
-        messages = stock.generate_notifications(_DEFAULT_NOW, _formatter).messages
+        messages = generate_and_drain(stock)
 
         assert any("-5.00%" in m for m in messages)
 
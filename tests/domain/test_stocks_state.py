@@ -0,0 +1,85 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from pryces.domain.stocks import InstrumentType, MarketState, Stock
+from pryces.infrastructure.formatters import ConsolidatingNotificationFormatter
+from tests.fixtures.factories import (
+    _DEFAULT_NOW,
+    create_stock,
+    generate_and_drain,
+    make_stock,
+    open_stock_after_burn,
+)
+
+_formatter = ConsolidatingNotificationFormatter()
+
+
+class TestStockState:
+    def test_restored_stock_keeps_fields_snapshot_and_history(self):
+        stock = open_stock_after_burn(current_price="150.00", previous_close_price="140.00")
+        stock.update(make_stock(current_price="151.00", previous_close_price="140.00"))
+
+        restored = Stock.from_state(stock.export_state())
+
+        assert restored.export_state() == stock.export_state()
+        assert restored.snapshot == stock.snapshot
+        assert restored.current_price == Decimal("151.00")
+
+    def test_restored_stock_does_not_repeat_sent_notifications(self):
+        stock = open_stock_after_burn(current_price="150.00", previous_close_price="140.00")
+
+        restored = Stock.from_state(stock.export_state())
+
+        assert generate_and_drain(restored) == []
+
+    def test_restored_targets_keep_their_entry_price(self):
+        stock = make_stock(current_price="100.00", previous_close_price="99.00")
+        stock.sync_targets([Decimal("110.00")])
+        stock.update(make_stock(current_price="120.00", previous_close_price="99.00"))
+
+        restored = Stock.from_state(stock.export_state())
+        restored.sync_targets([Decimal("110.00")])
+
+        assert restored.export_state().targets == ((Decimal("110.00"), Decimal("100.00")),)
+        result = restored.generate_notifications(_DEFAULT_NOW, _formatter)
+        assert result.fulfilled_targets == [Decimal("110.00")]
+
+    def test_restored_stock_keeps_delay_window(self):
+        stock = create_stock(
+            kind=InstrumentType.STOCK, market_state=MarketState.PRE, price_delay_in_minutes=15
+        )
+        opened = create_stock(
+            kind=InstrumentType.STOCK, market_state=MarketState.OPEN, price_delay_in_minutes=15
+        )
+        stock.update(opened)
+        generate_and_drain(stock)
+
+        restored = Stock.from_state(stock.export_state())
+        restored.update(opened)
+
+        assert restored.export_state().transition_time == _DEFAULT_NOW
+        assert generate_and_drain(restored, _DEFAULT_NOW + timedelta(minutes=5)) == []
+        assert generate_and_drain(restored, _DEFAULT_NOW + timedelta(minutes=20)) != []
+
+
+class TestSentNotificationCount:
+    def test_does_not_count_levels_recorded_without_being_sent(self):
+        stock = make_stock(
+            current_price="106.00", previous_close_price="100.00", open_price="106.00"
+        )
+
+        messages = generate_and_drain(stock)
+
+        assert len(messages) == 1
+        assert stock.sent_notification_count == 1
+
+    def test_keeps_counting_after_session_gains_are_erased_and_across_a_restore(self):
+        stock = make_stock(current_price="106.00", previous_close_price="100.00")
+        generate_and_drain(stock)
+        sent = stock.sent_notification_count
+        stock.update(make_stock(current_price="99.00", previous_close_price="100.00"))
+        generate_and_drain(stock)
+
+        restored = Stock.from_state(stock.export_state())
+
+        assert restored.sent_notification_count == stock.sent_notification_count > sent
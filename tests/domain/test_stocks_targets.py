@@ -30,7 +30,7 @@ class TestTargetPriceNotifications:
         source = make_stock(current_price="150.00", previous_close_price="148.00")
         stock.update(source)
         result = stock.generate_notifications(_DEFAULT_NOW, _formatter)
-        assert not any("hit target" in m for m in result.messages)
+        assert not any("hit target" in m.text for m in result.messages)
         assert result.fulfilled_targets == []
 
     def test_generate_notifications_target_notification_message_contains_symbol_and_target(self):
@@ -51,7 +51,7 @@ class TestTargetPriceNotifications:
         )
         stock.update(source)
         result = stock.generate_notifications(_DEFAULT_NOW, _formatter)
-        assert not any("hit target" in m for m in result.messages)
+        assert not any("hit target" in m.text for m in result.messages)
         assert result.fulfilled_targets == []
 
     def test_generate_notifications_removes_multiple_triggered_targets(self):
@@ -60,7 +60,7 @@ class TestTargetPriceNotifications:
         source = make_stock(current_price="300.00", previous_close_price="295.00")
         stock.update(source)
         result = stock.generate_notifications(_DEFAULT_NOW, _formatter)
-        target_messages = [m for m in result.messages if "hit target" in m]
+        target_messages = [m for m in result.messages if "hit target" in m.text]
         assert len(target_messages) == 2
         assert set(result.fulfilled_targets) == {Decimal("200.00"), Decimal("250.00")}
 
@@ -70,13 +70,13 @@ class TestTargetPriceNotifications:
         source1 = make_stock(current_price="200.00", previous_close_price="195.00")
         stock.update(source1)
         result1 = stock.generate_notifications(_DEFAULT_NOW, _formatter)
-        assert any("hit target" in m for m in result1.messages)
+        assert any("hit target" in m.text for m in result1.messages)
 
         stock.sync_targets([Decimal("250.00")])
         source2 = make_stock(current_price="250.00", previous_close_price="195.00")
         stock.update(source2)
         result2 = stock.generate_notifications(_DEFAULT_NOW, _formatter)
-        assert any("hit target" in m for m in result2.messages)
+        assert any("hit target" in m.text for m in result2.messages)
 
 
 class TestSyncTargets:
@@ -92,7 +92,7 @@ class TestSyncTargets:
         source_hit = make_stock(current_price="200.00", previous_close_price="195.00")
         stock.update(source_hit)
         result = stock.generate_notifications(_DEFAULT_NOW, _formatter)
-        assert any("hit target" in m for m in result.messages)
+        assert any("hit target" in m.text for m in result.messages)
 
     def test_sync_targets_removes_missing_targets(self):
         stock = make_stock(current_price="150.00")
@@ -0,0 +1,205 @@
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from pryces.domain.rules import BUILT_IN_RULES, NotificationRule, RuleBook
+import pytest
+
+from pryces.domain.stocks import InstrumentType, MarketState, QuoteDelta, Stock
+from pryces.infrastructure.formatters import ConsolidatingNotificationFormatter
+from tests.fixtures.factories import _DEFAULT_NOW, make_stock
+
+_formatter = ConsolidatingNotificationFormatter()
+
+
+@dataclass(frozen=True, slots=True)
+class _CountingRule(NotificationRule):
+    name: str = "counting"
+    calls: list = field(default_factory=list)
+
+    def can_fire(self, history) -> bool:
+        return True
+
+    def evaluate(self, stock, change):
+        self.calls.append(stock.current_price)
+        return None
+
+
+def _drain(stock, rules=None, now: datetime = _DEFAULT_NOW) -> list[str]:
+    return [m.text for m in stock.generate_notifications(now, _formatter, rules).messages]
+
+
+def _quote(**overrides):
+    values = dict(
+        current_price="150.00",
+        previous_close_price="148.00",
+        open_price="149.00",
+        fifty_day_average="140.00",
+        market_state=MarketState.OPEN,
+    )
+    values.update(overrides)
+    return make_stock(**values)
+
+
+def _quoted(stock) -> tuple:
+    return stock.current_price, stock.fifty_two_week_high, stock.market_state, stock.snapshot
+
+
+class TestUnchangedQuotes:
+    def test_unchanged_quote_is_not_evaluated_again(self):
+        rule = _CountingRule()
+        rules = RuleBook((rule,))
+        stock = _quote()
+        stock.update(_quote())
+        _drain(stock, rules)
+
+        stock.update(_quote())
+        _drain(stock, rules)
+
+        assert len(rule.calls) == 1
+
+    def test_changed_price_is_evaluated(self):
+        rule = _CountingRule()
+        rules = RuleBook((rule,))
+        stock = _quote()
+        _drain(stock, rules)
+
+        stock.update(_quote(current_price="151.00"))
+        _drain(stock, rules)
+
+        assert rule.calls == [Decimal("150.00"), Decimal("151.00")]
+
+    def test_first_unchanged_quote_is_evaluated_against_the_new_snapshot(self):
+        # The 52-week high dropped between polls; the unchanged quote that follows is the
+        # first one compared against the lower high.
+        stock = _quote(current_price="105.00", fifty_two_week_high="110.00")
+        _drain(stock)
+        stock.update(_quote(current_price="105.00", fifty_two_week_high="100.00"))
+        assert not any("52-week high" in m for m in _drain(stock))
+
+        stock.update(_quote(current_price="105.00", fifty_two_week_high="100.00"))
+
+        assert any("52-week high" in m for m in _drain(stock))
+
+    def test_new_target_is_evaluated_on_unchanged_quote(self):
+        stock = _quote()
+        stock.update(_quote())
+        _drain(stock)
+        stock.update(_quote())
+        stock.sync_targets([Decimal("150.00")])
+
+        result = stock.generate_notifications(_DEFAULT_NOW, _formatter)
+
+        assert result.fulfilled_targets == [Decimal("150.00")]
+
+    def test_different_rule_book_is_evaluated(self):
+        stock = _quote(current_price="155.00")
+        stock.update(_quote(current_price="155.00"))
+        _drain(stock, RuleBook.select(("market_open",)))
+        stock.update(_quote(current_price="155.00"))
+
+        messages = _drain(stock, RuleBook.select(("market_open", "percentage_increase")))
+
+        assert any("rose to" in m for m in messages)
+
+    def test_unchanged_quote_is_evaluated_once_the_delay_window_ends(self):
+        start = datetime(2024, 1, 1, 9, 0, 0)
+        stock = _quote(market_state=MarketState.PRE, price_delay_in_minutes=15)
+        stock.update(_quote(current_price="160.00", price_delay_in_minutes=15))
+        assert _drain(stock, now=start) == []
+
+        stock.update(_quote(current_price="160.00", price_delay_in_minutes=15))
+        assert _drain(stock, now=start + timedelta(minutes=5)) == []
+
+        stock.update(_quote(current_price="160.00", price_delay_in_minutes=15))
+        messages = _drain(stock, now=start + timedelta(minutes=15))
+
+        assert any("opened at" in m for m in messages)
+
+    def test_skipping_matches_full_evaluation_on_random_sessions(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            kind = rng.choice([InstrumentType.STOCK, InstrumentType.ETF, None])
+            skipping = _quote(market_state=MarketState.PRE, kind=kind)
+            reference = _quote(market_state=MarketState.PRE, kind=kind)
+            price = Decimal("150.00")
+            high = Decimal("160.00")
+            now = _DEFAULT_NOW
+            for cycle in range(60):
+                if rng.random() < 0.5:
+                    price += Decimal(rng.randint(-300, 300)) / 100
+                if rng.random() < 0.05:
+                    high -= Decimal("5")
+                state = MarketState.OPEN if cycle < 50 else MarketState.POST
+                targets = [Decimal("155.00")] if cycle == 20 else None
+                for stock in (skipping, reference):
+                    stock.update(
+                        _quote(
+                            current_price=price,
+                            fifty_two_week_high=high,
+                            two_hundred_day_average="152.00",
+                            market_state=state,
+                            kind=kind,
+                        )
+                    )
+                    if targets is not None:
+                        stock.sync_targets(targets)
+                now += timedelta(seconds=15)
+
+                # A new rule book per cycle is never considered evaluated already.
+                assert _drain(skipping, now=now) == _drain(reference, RuleBook(BUILT_IN_RULES), now)
+
+
+class TestQuoteDeltas:
+    def test_partial_quote_cannot_build_a_stock(self):
+        with pytest.raises(ValueError, match="AAPL"):
+            Stock.from_quote(QuoteDelta("AAPL", {"current_price": Decimal("150.00")}))
+
+    def test_apply_changes_only_the_given_fields(self):
+        stock = _quote()
+
+        stock.apply(QuoteDelta("AAPL", {"current_price": Decimal("152.00")}))
+
+        assert stock.current_price == Decimal("152.00")
+        assert stock.open_price == Decimal("149.00")
+        assert stock.snapshot.current_price == Decimal("150.00")
+
+    def test_apply_rejects_unknown_fields(self):
+        with pytest.raises(ValueError, match="_targets"):
+            _quote().apply(QuoteDelta("AAPL", {"_targets": []}))
+
+    def test_empty_quote_is_not_evaluated_again(self):
+        rule = _CountingRule()
+        rules = RuleBook((rule,))
+        stock = _quote()
+        stock.apply(QuoteDelta("AAPL", {}))
+        _drain(stock, rules)
+
+        stock.apply(QuoteDelta("AAPL", {}))
+        _drain(stock, rules)
+        stock.apply(QuoteDelta("AAPL", {"current_price": Decimal("151.00")}))
+        _drain(stock, rules)
+
+        assert rule.calls == [Decimal("150.00"), Decimal("151.00")]
+
+    def test_applying_deltas_matches_updating_with_full_stocks(self):
+        rng = random.Random(11)
+        applied = _quote(market_state=MarketState.PRE)
+        updated = _quote(market_state=MarketState.PRE)
+        previous = {}
+        now = _DEFAULT_NOW
+        for cycle in range(80):
+            values = dict(
+                current_price=Decimal("150.00") + Decimal(rng.randint(-600, 600)) / 100,
+                fifty_two_week_high=Decimal(rng.choice(["155.00", "160.00"])),
+                market_state=MarketState.OPEN if cycle < 70 else MarketState.POST,
+            )
+            changes = {name: value for name, value in values.items() if previous.get(name) != value}
+            previous = values
+            applied.apply(QuoteDelta("AAPL", changes))
+            updated.update(_quote(**values))
+            now += timedelta(seconds=15)
+
+            assert _quoted(applied) == _quoted(updated)
+            assert _drain(applied, now=now) == _drain(updated, now=now)
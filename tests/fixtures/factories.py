@@ -124,7 +124,7 @@ def open_stock_after_burn(**kwargs) -> Stock:
 
 
 def generate_and_drain(stock: Stock, now: datetime = _DEFAULT_NOW) -> list[str]:
-    return stock.generate_notifications(now, _formatter).messages
+    return [m.text for m in stock.generate_notifications(now, _formatter).messages]
 
 
 def make_stock_with_percentage_history(
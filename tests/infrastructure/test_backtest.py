@@ -0,0 +1,210 @@
+from collections import Counter
+from dataclasses import replace
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from pryces.domain.notifications import NotificationFormatter, NotificationType
+from pryces.domain.stocks import MarketState, Stock
+from pryces.infrastructure.backtest import (
+    DEFAULT_RULE_SETS,
+    NotificationBacktester,
+    PriceHistory,
+    RuleSet,
+)
+from pryces.infrastructure.history import DailyBars
+from pryces.infrastructure.ticks import TickStore, TickWriter
+from tests.fixtures.factories import create_stock
+
+_NOW = datetime(2024, 1, 2, 12, 0)
+
+
+class _CountingFormatter(NotificationFormatter):
+    def __init__(self) -> None:
+        self.counts: Counter[NotificationType] = Counter()
+
+    def format(self, notifications, context):
+        self.counts.update(n.type for n in notifications)
+        return []
+
+
+def _decimal(value: float) -> Decimal | None:
+    return None if np.isnan(value) else Decimal(str(value))
+
+
+def _count_with_stocks(history: PriceHistory) -> dict[NotificationType, int]:
+    # Reference: every session through a fresh Stock, one evaluation per path step.
+    formatter = _CountingFormatter()
+    for row, symbol in enumerate(history.symbols):
+        for column in range(len(history.days)):
+            previous_close = history.previous_close[row, column]
+            steps = [p for p in history.paths[row, column] if not np.isnan(p)]
+            if np.isnan(previous_close) or not steps:
+                continue
+
+            def make(price: float, state: MarketState = MarketState.OPEN) -> Stock:
+                return Stock(
+                    symbol=symbol,
+                    current_price=_decimal(price),
+                    previous_close_price=_decimal(previous_close),
+                    open_price=_decimal(history.open[row, column]),
+                    fifty_day_average=_decimal(history.fifty_day_average[row, column]),
+                    two_hundred_day_average=_decimal(history.two_hundred_day_average[row, column]),
+                    fifty_two_week_high=_decimal(history.fifty_two_week_high[row, column]),
+                    fifty_two_week_low=_decimal(history.fifty_two_week_low[row, column]),
+                    market_state=state,
+                )
+
+            stock = make(steps[0])
+            stock.generate_notifications(_NOW, formatter)
+            for price in steps[1:]:
+                stock.update(make(price))
+                stock.generate_notifications(_NOW, formatter)
+            stock.update(make(steps[-1], MarketState.POST))
+            stock.generate_notifications(_NOW, formatter)
+    return dict(formatter.counts)
+
+
+def _random_bars(symbols: int, days: int, seed: int) -> DailyBars:
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0, 0.02, size=(symbols, days))
+    close = np.round(100 * np.exp(np.cumsum(returns, axis=1)), 2)
+    open_ = np.round(close * (1 + rng.normal(0, 0.01, size=close.shape)), 2)
+    spread = np.abs(rng.normal(0, 0.015, size=close.shape))
+    high = np.round(np.maximum(open_, close) * (1 + spread), 2)
+    low = np.round(np.minimum(open_, close) * (1 - spread), 2)
+    if days > 100:
+        close[0, 100] = open_[0, 100] = high[0, 100] = low[0, 100] = np.nan
+    return DailyBars(
+        symbols=[f"SYM{i}" for i in range(symbols)],
+        days=np.arange(np.datetime64("2023-01-02"), np.datetime64("2023-01-02") + days),
+        open=open_,
+        high=high,
+        low=low,
+        close=close,
+    )
+
+
+class TestRuleSet:
+    def test_parse_with_default_close_to_sma(self):
+        rule_set = RuleSet.parse("wide=3,2.5")
+
+        assert rule_set == RuleSet("wide", Decimal("3"), Decimal("2.5"))
+
+    def test_parse_with_close_to_sma(self):
+        assert RuleSet.parse("tight=1,1,1.5").close_to_sma == Decimal("1.5")
+
+    @pytest.mark.parametrize("spec", ["wide", "wide=3", "=3,2", "wide=1,2,3,4"])
+    def test_parse_rejects_invalid_specs(self, spec):
+        with pytest.raises(ValueError, match="invalid rule set"):
+            RuleSet.parse(spec)
+
+
+class TestPriceHistoryFromDaily:
+    def test_indicators_only_use_earlier_sessions(self):
+        bars = _random_bars(symbols=2, days=260, seed=1)
+
+        history = PriceHistory.from_daily(bars)
+
+        close = bars.close[1]
+        assert np.isnan(history.previous_close[1, 0])
+        assert history.previous_close[1, 5] == close[4]
+        assert np.isnan(history.fifty_day_average[1, 49])
+        assert history.fifty_day_average[1, 50] == pytest.approx(close[:50].mean())
+        assert np.isnan(history.fifty_two_week_low[1, 251])
+        assert history.fifty_two_week_high[1, 259] == bars.high[1, 7:259].max()
+
+    def test_indicators_skip_days_the_symbol_did_not_trade(self):
+        history = PriceHistory.from_daily(_random_bars(symbols=1, days=120, seed=2))
+
+        assert history.previous_close[0, 101] == history.paths[0, 99, 3]
+
+    def test_paths_visit_the_nearer_extreme_first(self):
+        bars = DailyBars(
+            symbols=["AAPL"],
+            days=np.array(["2024-01-02", "2024-01-03"], dtype="datetime64[D]"),
+            open=np.array([[100.0, 100.0]]),
+            high=np.array([[110.0, 105.0]]),
+            low=np.array([[95.0, 90.0]]),
+            close=np.array([[108.0, 92.0]]),
+        )
+
+        paths = PriceHistory.from_daily(bars).paths
+
+        assert paths[0, 0].tolist() == [100.0, 95.0, 110.0, 108.0]
+        assert paths[0, 1].tolist() == [100.0, 105.0, 90.0, 92.0]
+
+    def test_since_drops_earlier_days(self):
+        history = PriceHistory.from_daily(_random_bars(symbols=2, days=30, seed=3))
+
+        recent = history.since(np.datetime64("2023-01-22"))
+
+        assert len(recent.days) == 10
+        assert recent.paths.shape == (2, 10, 4)
+
+
+class TestNotificationBacktester:
+    def test_matches_stock_notifications_on_daily_history(self):
+        # Stocks without an instrument kind use the level-2 thresholds.
+        history = PriceHistory.from_daily(_random_bars(symbols=6, days=330, seed=7)).since(
+            np.datetime64("2023-09-20")
+        )
+
+        report = NotificationBacktester().evaluate(history, DEFAULT_RULE_SETS[1])
+
+        assert report.counts == _count_with_stocks(history)
+        assert report.sessions == 6 * len(history.days)
+        assert len(report.counts) >= 12
+
+    def test_matches_stock_notifications_on_intraday_paths(self):
+        history = PriceHistory.from_daily(_random_bars(symbols=4, days=300, seed=11)).since(
+            np.datetime64("2023-10-01")
+        )
+        rng = np.random.default_rng(5)
+        walk = np.cumprod(1 + rng.normal(0, 0.006, size=history.paths.shape[:2] + (30,)), axis=2)
+        paths = np.round(history.open[:, :, None] * walk, 2)
+        paths[:, ::3, 20:] = np.nan
+        history = replace(history, paths=paths)
+
+        report = NotificationBacktester().evaluate(history, DEFAULT_RULE_SETS[1])
+
+        assert report.counts == _count_with_stocks(history)
+
+    def test_wider_thresholds_produce_fewer_level_notifications(self):
+        history = PriceHistory.from_daily(_random_bars(symbols=10, days=300, seed=4))
+        tight, wide = NotificationBacktester().run(
+            history, [RuleSet.parse("tight=1,0.5"), RuleSet.parse("wide=5,5")]
+        )
+
+        assert tight.total > wide.total
+        assert tight.sessions == wide.sessions
+
+    def test_empty_history_reports_nothing(self):
+        history = PriceHistory.from_daily(_random_bars(symbols=1, days=1, seed=0))
+
+        report = NotificationBacktester().evaluate(history, DEFAULT_RULE_SETS[0])
+
+        assert report.sessions == 0
+        assert report.total == 0
+
+
+class TestPriceHistoryWithIntradayPaths:
+    def test_evaluates_open_market_ticks_of_stored_days(self, tmp_path):
+        writer = TickWriter(tmp_path)
+        writer.record([create_stock("AAPL", Decimal("101"))], datetime(2023, 1, 3, 15, 30))
+        writer.record(
+            [create_stock("AAPL", Decimal("102"), market_state=MarketState.POST)],
+            datetime(2023, 1, 3, 22, 30),
+        )
+        writer.record([create_stock("AAPL", Decimal("103"))], datetime(2023, 1, 3, 16, 30))
+        writer.close()
+        history = PriceHistory.from_daily(_random_bars(symbols=1, days=5, seed=0))
+        history = replace(history, symbols=["AAPL"])
+
+        intraday = history.with_intraday_paths(TickStore(tmp_path))
+
+        assert intraday.paths.shape == (1, 5, 2)
+        assert intraday.paths[0, 1].tolist() == [101.0, 103.0]
+        assert np.isnan(intraday.paths[0, 0]).all()
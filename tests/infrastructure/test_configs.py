@@ -1,9 +1,14 @@
 import json
+import os
+import threading
+from dataclasses import replace
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 
 from pryces.infrastructure.configs import (
+    ConfigDiff,
     ConfigManager,
     ConfigStore,
     MonitorStocksConfig,
@@ -157,6 +162,29 @@ class TestConfigManager:
         assert restored.symbols[0].symbol == "HUMA"
         assert restored.symbols[0].prices == [Decimal("1"), Decimal("0.92")]
 
+    def test_rules_round_trip_and_are_omitted_when_unset(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        manager = ConfigManager(config_file)
+        config = MonitorStocksConfig(
+            interval=60,
+            symbols=[SymbolConfig(symbol="HUMA", prices=[])],
+            rules=("market_open", "sma50_crossed"),
+        )
+
+        manager.write_monitor_stocks_config(config)
+        assert manager.read_monitor_stocks_config() == config
+
+        manager.write_monitor_stocks_config(replace(config, rules=None))
+        assert "rules" not in json.loads(config_file.read_text())
+        assert manager.read_monitor_stocks_config().rules is None
+
+    def test_raises_config_loading_failed_on_unknown_rule(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps(make_config_data(rules=["market_open", "bogus"])))
+
+        with pytest.raises(ConfigLoadingFailed, match="bogus"):
+            ConfigManager(config_file).read_monitor_stocks_config()
+
 
 class TestConfigManagerMutators:
 
@@ -235,6 +263,212 @@ class TestConfigManagerMutators:
         restored = ConfigManager(path).read_monitor_stocks_config()
         assert restored.symbols == [SymbolConfig("MSFT", [Decimal("300")])]
 
+    def test_remove_targets_drops_only_given_pairs(self, tmp_path):
+        path = tmp_path / "c.json"
+        self._write(
+            path,
+            MonitorStocksConfig(
+                interval=30,
+                symbols=[
+                    SymbolConfig("AAPL", [Decimal("150"), Decimal("200")]),
+                    SymbolConfig("MSFT", [Decimal("150")]),
+                ],
+            ),
+        )
+
+        removed = ConfigManager(path).remove_targets({("AAPL", Decimal("150"))})
+
+        restored = ConfigManager(path).read_monitor_stocks_config()
+        assert removed is True
+        assert restored.symbols == [
+            SymbolConfig("AAPL", [Decimal("200")]),
+            SymbolConfig("MSFT", [Decimal("150")]),
+        ]
+
+    def test_remove_targets_does_not_write_when_nothing_matches(self, tmp_path):
+        path = tmp_path / "c.json"
+        self._write(path, MonitorStocksConfig(interval=30, symbols=[SymbolConfig("AAPL", [])]))
+        before = ConfigManager(path).signature()
+
+        assert ConfigManager(path).remove_targets({("AAPL", Decimal("150"))}) is False
+        assert ConfigManager(path).signature() == before
+
+    def test_add_target_appends_price_once(self, tmp_path):
+        path = tmp_path / "c.json"
+        self._write(path, MonitorStocksConfig(interval=30, symbols=[SymbolConfig("AAPL", [])]))
+        manager = ConfigManager(path)
+
+        assert manager.add_target("AAPL", Decimal("150")) is True
+        assert manager.add_target("AAPL", Decimal("150")) is False
+        assert manager.read_monitor_stocks_config().symbols == [
+            SymbolConfig("AAPL", [Decimal("150")])
+        ]
+
+    def test_mutators_keep_rules(self, tmp_path):
+        path = tmp_path / "c.json"
+        self._write(
+            path,
+            MonitorStocksConfig(
+                interval=30, symbols=[SymbolConfig("AAPL", [])], rules=("market_open",)
+            ),
+        )
+        manager = ConfigManager(path)
+
+        manager.add_target("AAPL", Decimal("150"))
+        manager.add_symbol("MSFT")
+        manager.remove_symbol("AAPL")
+
+        assert manager.read_monitor_stocks_config().rules == ("market_open",)
+
+    def test_remove_target_drops_single_price(self, tmp_path):
+        path = tmp_path / "c.json"
+        self._write(
+            path,
+            MonitorStocksConfig(
+                interval=30, symbols=[SymbolConfig("AAPL", [Decimal("150"), Decimal("200")])]
+            ),
+        )
+
+        assert ConfigManager(path).remove_target("AAPL", Decimal("150")) is True
+        assert ConfigManager(path).read_monitor_stocks_config().symbols == [
+            SymbolConfig("AAPL", [Decimal("200")])
+        ]
+
+
+class TestConfigManagerWrites:
+
+    def _config(self) -> MonitorStocksConfig:
+        return MonitorStocksConfig(
+            interval=30,
+            symbols=[
+                SymbolConfig("AAPL", [Decimal("150"), Decimal("200")]),
+                SymbolConfig("MSFT", [Decimal("300")]),
+            ],
+        )
+
+    def test_write_leaves_no_temporary_files(self, tmp_path):
+        path = tmp_path / "c.json"
+
+        ConfigManager(path).write_monitor_stocks_config(self._config())
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".c.json.lock", "c.json"]
+
+    def test_write_replaces_file_atomically(self, tmp_path):
+        path = tmp_path / "c.json"
+        ConfigManager(path).write_monitor_stocks_config(self._config())
+
+        with patch("pryces.infrastructure.configs.os.replace", wraps=os.replace) as replace:
+            ConfigManager(path).remove_symbol("MSFT")
+
+        replace.assert_called_once()
+        assert replace.call_args.args[1] == path
+
+    def test_failed_write_keeps_previous_file_and_cleans_up(self, tmp_path):
+        path = tmp_path / "c.json"
+        ConfigManager(path).write_monitor_stocks_config(self._config())
+        before = path.read_text()
+
+        with patch("pryces.infrastructure.configs.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                ConfigManager(path).remove_symbol("MSFT")
+
+        assert path.read_text() == before
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_write_keeps_file_permissions(self, tmp_path):
+        path = tmp_path / "c.json"
+        ConfigManager(path).write_monitor_stocks_config(self._config())
+        path.chmod(0o600)
+
+        ConfigManager(path).remove_symbol("MSFT")
+
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_batch_results_in_single_rewrite(self, tmp_path):
+        path = tmp_path / "c.json"
+        ConfigManager(path).write_monitor_stocks_config(self._config())
+        manager = ConfigManager(path)
+
+        with patch("pryces.infrastructure.configs._write_atomically") as write:
+            with manager.batch():
+                manager.remove_target("AAPL", Decimal("150"))
+                manager.add_target("MSFT", Decimal("310"))
+                manager.add_symbol("GOOGL")
+
+        write.assert_called_once()
+
+    def test_batch_applies_all_mutations(self, tmp_path):
+        path = tmp_path / "c.json"
+        ConfigManager(path).write_monitor_stocks_config(self._config())
+        manager = ConfigManager(path)
+
+        with manager.batch():
+            manager.remove_target("AAPL", Decimal("150"))
+            manager.add_target("MSFT", Decimal("310"))
+            manager.add_symbol("GOOGL")
+
+        assert ConfigManager(path).read_monitor_stocks_config().symbols == [
+            SymbolConfig("AAPL", [Decimal("200")]),
+            SymbolConfig("MSFT", [Decimal("300"), Decimal("310")]),
+            SymbolConfig("GOOGL", []),
+        ]
+
+    def test_batch_reads_see_pending_changes(self, tmp_path):
+        path = tmp_path / "c.json"
+        ConfigManager(path).write_monitor_stocks_config(self._config())
+        manager = ConfigManager(path)
+
+        with manager.batch():
+            manager.remove_symbol("MSFT")
+            pending = manager.read_monitor_stocks_config()
+            stored = ConfigManager(path).read_monitor_stocks_config()
+
+        assert [s.symbol for s in pending.symbols] == ["AAPL"]
+        assert [s.symbol for s in stored.symbols] == ["AAPL", "MSFT"]
+
+    def test_batch_without_changes_does_not_write(self, tmp_path):
+        path = tmp_path / "c.json"
+        ConfigManager(path).write_monitor_stocks_config(self._config())
+        manager = ConfigManager(path)
+
+        with patch("pryces.infrastructure.configs._write_atomically") as write:
+            with manager.batch():
+                manager.remove_target("AAPL", Decimal("999"))
+
+        write.assert_not_called()
+
+    def test_batch_discards_changes_on_error(self, tmp_path):
+        path = tmp_path / "c.json"
+        ConfigManager(path).write_monitor_stocks_config(self._config())
+        manager = ConfigManager(path)
+
+        with pytest.raises(RuntimeError):
+            with manager.batch():
+                manager.remove_symbol("MSFT")
+                raise RuntimeError("boom")
+
+        stored = ConfigManager(path).read_monitor_stocks_config()
+        assert [s.symbol for s in stored.symbols] == ["AAPL", "MSFT"]
+
+    def test_concurrent_writers_do_not_lose_updates(self, tmp_path):
+        path = tmp_path / "c.json"
+        ConfigManager(path).write_monitor_stocks_config(
+            MonitorStocksConfig(interval=30, symbols=[SymbolConfig("AAPL", [])])
+        )
+
+        def add_targets(offset: int) -> None:
+            for i in range(20):
+                ConfigManager(path).add_target("AAPL", Decimal(offset + i))
+
+        threads = [threading.Thread(target=add_targets, args=(n * 100,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        prices = ConfigManager(path).read_monitor_stocks_config().symbols[0].prices
+        assert len(prices) == 80
+
 
 class TestConfigStoreListPaths:
 
@@ -539,3 +773,146 @@ class TestConfigStoreDeleteByPath:
         store.delete_by_path(path)
 
         assert not path.exists()
+
+    def test_removes_lock_file(self, tmp_path):
+        path = tmp_path / "portfolio.json"
+        ConfigManager(path).write_monitor_stocks_config(
+            MonitorStocksConfig(interval=30, symbols=[SymbolConfig("AAPL", [])])
+        )
+
+        ConfigStore(tmp_path).delete_by_path(path)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestConfigStoreCache:
+
+    def _write(self, path, symbols: list[dict]) -> None:
+        path.write_text(json.dumps({"interval": 30, "symbols": symbols}))
+
+    def test_unchanged_files_are_not_reparsed(self, tmp_path):
+        self._write(tmp_path / "a.json", [{"symbol": "AAPL", "prices": []}])
+        self._write(tmp_path / "b.json", [{"symbol": "MSFT", "prices": []}])
+        store = ConfigStore(tmp_path)
+        original = ConfigManager.read_monitor_stocks_config
+
+        with patch.object(
+            ConfigManager, "read_monitor_stocks_config", autospec=True, side_effect=original
+        ) as read:
+            store.list_tracked_symbols()
+            store.find_for_symbol("AAPL")
+            store.list_tracked_symbols_with_targets()
+
+        assert read.call_count == 2
+
+    def test_only_changed_file_is_reparsed(self, tmp_path):
+        self._write(tmp_path / "a.json", [{"symbol": "AAPL", "prices": []}])
+        self._write(tmp_path / "b.json", [{"symbol": "MSFT", "prices": []}])
+        store = ConfigStore(tmp_path)
+        store.list_tracked_symbols()
+        original = ConfigManager.read_monitor_stocks_config
+
+        self._write(tmp_path / "b.json", [{"symbol": "TSLA", "prices": [100]}])
+        with patch.object(
+            ConfigManager, "read_monitor_stocks_config", autospec=True, side_effect=original
+        ) as read:
+            symbols = store.list_tracked_symbols()
+
+        assert symbols == ["AAPL", "TSLA"]
+        assert read.call_count == 1
+
+    def test_detects_same_size_rewrite_through_mtime(self, tmp_path):
+        path = tmp_path / "a.json"
+        self._write(path, [{"symbol": "AAPL", "prices": []}])
+        store = ConfigStore(tmp_path)
+        store.list_tracked_symbols()
+        mtime_ns = path.stat().st_mtime_ns
+
+        self._write(path, [{"symbol": "MSFT", "prices": []}])
+        os.utime(path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+        assert store.find_for_symbol("AAPL") is None
+        assert store.find_for_symbol("MSFT")[0] == path
+
+    def test_forgets_deleted_files(self, tmp_path):
+        self._write(tmp_path / "a.json", [{"symbol": "AAPL", "prices": []}])
+        self._write(tmp_path / "b.json", [{"symbol": "MSFT", "prices": []}])
+        store = ConfigStore(tmp_path)
+        store.list_tracked_symbols()
+
+        (tmp_path / "b.json").unlink()
+
+        assert store.list_tracked_symbols() == ["AAPL"]
+        assert store.find_for_symbol("MSFT") is None
+
+    def test_picks_up_new_files(self, tmp_path):
+        self._write(tmp_path / "a.json", [{"symbol": "AAPL", "prices": []}])
+        store = ConfigStore(tmp_path)
+        store.list_tracked_symbols()
+
+        store.create("b", MonitorStocksConfig(interval=30, symbols=[SymbolConfig("MSFT", [])]))
+
+        assert store.list_tracked_symbols() == ["AAPL", "MSFT"]
+
+    def test_returned_targets_do_not_alias_the_cache(self, tmp_path):
+        self._write(tmp_path / "a.json", [{"symbol": "AAPL", "prices": [100]}])
+        store = ConfigStore(tmp_path)
+
+        store.list_tracked_symbols_with_targets()[0][1].append(Decimal("1"))
+
+        assert store.list_tracked_symbols_with_targets() == [("AAPL", [Decimal("100")])]
+
+
+class TestConfigManagerSignature:
+
+    def test_returns_none_when_file_missing(self, tmp_path):
+        assert ConfigManager(tmp_path / "missing.json").signature() is None
+
+    def test_changes_when_file_is_rewritten(self, tmp_path):
+        path = tmp_path / "portfolio.json"
+        path.write_text(json.dumps(make_config_data()))
+        manager = ConfigManager(path)
+        before = manager.signature()
+
+        path.write_text(json.dumps(make_config_data(interval=300)))
+
+        assert manager.signature() != before
+
+
+class TestConfigDiff:
+
+    def _config(self, **symbols) -> MonitorStocksConfig:
+        return MonitorStocksConfig(
+            interval=30,
+            symbols=[
+                SymbolConfig(s, [Decimal(p) for p in prices]) for s, prices in symbols.items()
+            ],
+        )
+
+    def test_identical_configs_produce_empty_diff(self):
+        config = self._config(AAPL=["150"])
+
+        diff = ConfigDiff.between(config, config)
+
+        assert diff.is_empty()
+        assert diff.changed_symbols == set()
+
+    def test_detects_added_and_removed_symbols(self):
+        diff = ConfigDiff.between(self._config(AAPL=[]), self._config(MSFT=[]))
+
+        assert diff.added_symbols == {"MSFT"}
+        assert diff.removed_symbols == {"AAPL"}
+
+    def test_detects_added_and_removed_targets(self):
+        diff = ConfigDiff.between(
+            self._config(AAPL=["150", "200"]), self._config(AAPL=["200", "250"])
+        )
+
+        assert diff.added_targets == {"AAPL": [Decimal("250")]}
+        assert diff.removed_targets == {"AAPL": [Decimal("150")]}
+        assert diff.changed_symbols == {"AAPL"}
+
+    def test_removed_symbols_are_not_reported_as_changed(self):
+        diff = ConfigDiff.between(self._config(AAPL=["150"]), self._config(MSFT=[]))
+
+        assert diff.changed_symbols == {"MSFT"}
@@ -0,0 +1,60 @@
+from unittest.mock import Mock
+
+import pytest
+
+from pryces.infrastructure.control_sockets import ControlSocketServer, send_control_command
+
+
+class TestControlSocketServer:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.path = tmp_path / "123.sock"
+        self.calls = []
+        self.server = ControlSocketServer(
+            self.path,
+            {
+                "status": lambda: {"cycles": 3},
+                "stop": lambda: self.calls.append("stop") or {},
+                "fail": Mock(side_effect=RuntimeError("boom")),
+            },
+            Mock(),
+        )
+        self.server.start()
+        yield
+        self.server.close()
+
+    def test_returns_the_handler_reply(self):
+        assert send_control_command(self.path, "status") == {"ok": True, "cycles": 3}
+
+    def test_runs_command_handlers(self):
+        assert send_control_command(self.path, "stop") == {"ok": True}
+        assert self.calls == ["stop"]
+
+    def test_unknown_command_is_rejected(self):
+        reply = send_control_command(self.path, "dance")
+
+        assert reply["ok"] is False
+        assert "dance" in reply["error"]
+
+    def test_failing_handler_reports_its_error(self):
+        assert send_control_command(self.path, "fail") == {"ok": False, "error": "boom"}
+
+    def test_close_removes_the_socket(self):
+        self.server.close()
+
+        assert not self.path.exists()
+        with pytest.raises(OSError):
+            send_control_command(self.path, "status")
+        self.server = Mock()
+
+    def test_replaces_a_stale_socket_file(self, tmp_path):
+        stale = tmp_path / "stale.sock"
+        stale.touch()
+
+        server = ControlSocketServer(stale, {"status": lambda: {}}, Mock())
+        server.start()
+        try:
+            assert send_control_command(stale, "status") == {"ok": True}
+        finally:
+            server.close()
@@ -1,7 +1,14 @@
 import pytest
 
 from pryces.infrastructure.exceptions import ConfigurationError
-from pryces.infrastructure.factories import SettingsFactory
+from pryces.infrastructure.configs import ConfigManager, ConfigStore
+from pryces.infrastructure.factories import (
+    ConfigStoreFactory,
+    MonitorRegistryFactory,
+    SettingsFactory,
+)
+from pryces.infrastructure.queues import OverflowPolicy
+from pryces.infrastructure.sqlite_configs import SqliteConfigManager, SqliteConfigStore
 
 
 class TestCreateYahooFinanceSettings:
@@ -61,3 +68,137 @@ class TestCreateTelegramSettings:
         monkeypatch.delenv("TELEGRAM_GROUP_ID", raising=False)
         with pytest.raises(ConfigurationError):
             SettingsFactory.create_telegram_settings()
+
+    def test_api_base_url_defaults_to_telegram(self, monkeypatch):
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token123")
+        monkeypatch.setenv("TELEGRAM_GROUP_ID", "group456")
+        monkeypatch.delenv("TELEGRAM_API_BASE_URL", raising=False)
+        settings = SettingsFactory.create_telegram_settings()
+        assert settings.api_base_url == "https://api.telegram.org"
+
+    def test_reads_api_base_url_from_env(self, monkeypatch):
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token123")
+        monkeypatch.setenv("TELEGRAM_GROUP_ID", "group456")
+        monkeypatch.setenv("TELEGRAM_API_BASE_URL", "http://127.0.0.1:8081/")
+        settings = SettingsFactory.create_telegram_settings()
+        assert settings.api_base_url == "http://127.0.0.1:8081"
+
+
+class TestCreateWebhookSettings:
+    def test_without_public_url_listens_on_the_default_path(self, monkeypatch):
+        monkeypatch.delenv("TELEGRAM_WEBHOOK_URL", raising=False)
+        monkeypatch.delenv("TELEGRAM_WEBHOOK_SECRET", raising=False)
+        settings = SettingsFactory.create_webhook_settings("127.0.0.1", 8443)
+        assert (settings.host, settings.port) == ("127.0.0.1", 8443)
+        assert (settings.public_url, settings.secret_token, settings.path) == (
+            None,
+            None,
+            "/telegram",
+        )
+
+    def test_listens_on_the_public_url_path(self, monkeypatch):
+        monkeypatch.setenv("TELEGRAM_WEBHOOK_URL", "https://bot.example.com/hooks/pryces")
+        monkeypatch.setenv("TELEGRAM_WEBHOOK_SECRET", "s3cret_token-1")
+        settings = SettingsFactory.create_webhook_settings("0.0.0.0", 8443)
+        assert settings.public_url == "https://bot.example.com/hooks/pryces"
+        assert settings.path == "/hooks/pryces"
+        assert settings.secret_token == "s3cret_token-1"
+
+    def test_invalid_secret_raises_configuration_error(self, monkeypatch):
+        monkeypatch.setenv("TELEGRAM_WEBHOOK_SECRET", "not allowed!")
+        with pytest.raises(ConfigurationError, match="TELEGRAM_WEBHOOK_SECRET"):
+            SettingsFactory.create_webhook_settings("0.0.0.0", 8443)
+
+
+class TestCreateFireAndForgetSettings:
+    def test_defaults_to_a_single_worker(self, monkeypatch):
+        monkeypatch.delenv("MAX_SEND_WORKERS", raising=False)
+        settings = SettingsFactory.create_fire_and_forget_settings()
+        assert settings.workers == 1
+
+    def test_reads_workers_from_env(self, monkeypatch):
+        monkeypatch.setenv("MAX_SEND_WORKERS", "4")
+        settings = SettingsFactory.create_fire_and_forget_settings()
+        assert settings.workers == 4
+
+    def test_non_integer_env_var_raises_configuration_error(self, monkeypatch):
+        monkeypatch.setenv("MAX_SEND_WORKERS", "many")
+        with pytest.raises(ConfigurationError):
+            SettingsFactory.create_fire_and_forget_settings()
+
+    def test_zero_workers_raises_configuration_error(self, monkeypatch):
+        monkeypatch.setenv("MAX_SEND_WORKERS", "0")
+        with pytest.raises(ConfigurationError):
+            SettingsFactory.create_fire_and_forget_settings()
+
+    def test_defaults_to_bounded_queue_dropping_oldest(self, monkeypatch):
+        monkeypatch.delenv("SEND_QUEUE_SIZE", raising=False)
+        monkeypatch.delenv("SEND_QUEUE_POLICY", raising=False)
+        settings = SettingsFactory.create_fire_and_forget_settings()
+        assert settings.max_queue_size == 1000
+        assert settings.overflow_policy == OverflowPolicy.DROP_OLDEST
+
+    def test_reads_queue_size_and_policy_from_env(self, monkeypatch):
+        monkeypatch.setenv("SEND_QUEUE_SIZE", "50")
+        monkeypatch.setenv("SEND_QUEUE_POLICY", "collapse")
+        settings = SettingsFactory.create_fire_and_forget_settings()
+        assert settings.max_queue_size == 50
+        assert settings.overflow_policy == OverflowPolicy.COLLAPSE
+
+    def test_unknown_policy_raises_configuration_error(self, monkeypatch):
+        monkeypatch.setenv("SEND_QUEUE_POLICY", "ignore")
+        with pytest.raises(ConfigurationError):
+            SettingsFactory.create_fire_and_forget_settings()
+
+
+class TestCreateLoggingSettings:
+    def test_text_format_by_default(self, monkeypatch):
+        monkeypatch.delenv("LOG_FORMAT", raising=False)
+        assert SettingsFactory.create_monitor_logging_settings().json_format is False
+
+    def test_json_format(self, monkeypatch):
+        monkeypatch.setenv("LOG_FORMAT", "JSON")
+        assert SettingsFactory.create_bot_logging_settings().json_format is True
+
+    def test_unknown_format_raises_configuration_error(self, monkeypatch):
+        monkeypatch.setenv("LOG_FORMAT", "xml")
+        with pytest.raises(ConfigurationError, match="LOG_FORMAT"):
+            SettingsFactory.create_cli_logging_settings()
+
+
+class TestConfigStoreFactory:
+    def test_defaults_to_json_config_store(self, monkeypatch):
+        monkeypatch.delenv("CONFIG_DATABASE", raising=False)
+        store = ConfigStoreFactory.create()
+        assert type(store) is ConfigStore
+
+    def test_uses_sqlite_store_when_database_is_configured(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("CONFIG_DATABASE", str(tmp_path / "pryces.db"))
+        store = ConfigStoreFactory.create()
+        assert isinstance(store, SqliteConfigStore)
+
+    def test_opens_json_manager_for_json_path(self, tmp_path):
+        manager = ConfigStoreFactory.open_manager(tmp_path / "portfolio.json")
+        assert type(manager) is ConfigManager
+
+    def test_opens_sqlite_manager_for_database_locator(self, tmp_path):
+        manager = ConfigStoreFactory.open_manager(tmp_path / "pryces.db" / "portfolio")
+        assert isinstance(manager, SqliteConfigManager)
+
+
+class TestMonitorRegistryFactory:
+    def test_default_directory_does_not_depend_on_the_working_directory(
+        self, monkeypatch, tmp_path
+    ):
+        monkeypatch.delenv("RUNTIME_DIRECTORY", raising=False)
+        monkeypatch.chdir(tmp_path)
+
+        directory = MonitorRegistryFactory.create().directory
+
+        assert directory.is_absolute()
+        assert tmp_path not in directory.parents
+
+    def test_reads_directory_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("RUNTIME_DIRECTORY", str(tmp_path))
+
+        assert MonitorRegistryFactory.create().directory == tmp_path / "monitors"
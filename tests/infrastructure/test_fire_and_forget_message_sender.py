@@ -1,16 +1,33 @@
 import logging
+import threading
+import time
 from unittest.mock import MagicMock, Mock
 
+import pytest
+
+from pryces.application.correlation import current_cycle_id, cycle_scope
 from pryces.application.exceptions import MessageSendingFailed
+from pryces.domain.notifications import NotificationPriority
 from pryces.infrastructure.logging import PythonLoggerFactory
-from pryces.infrastructure.senders import FireAndForgetMessageSender
+from pryces.infrastructure.queues import OverflowPolicy
+from pryces.infrastructure.senders import FireAndForgetMessageSender, FireAndForgetSettings
 
 
 class TestFireAndForgetMessageSender:
-    def _create_sender(self, inner: MagicMock, logger_factory=None) -> FireAndForgetMessageSender:
-        sender = FireAndForgetMessageSender(inner=inner, logger_factory=logger_factory or Mock())
+    def _create_sender(
+        self, inner: MagicMock, logger_factory=None, workers: int = 1
+    ) -> FireAndForgetMessageSender:
+        sender = FireAndForgetMessageSender(
+            inner=inner,
+            logger_factory=logger_factory or Mock(),
+            settings=FireAndForgetSettings(workers=workers),
+        )
         return sender
 
+    def test_rejects_non_positive_worker_count(self):
+        with pytest.raises(ValueError):
+            FireAndForgetMessageSender(MagicMock(), Mock(), FireAndForgetSettings(workers=0))
+
     def test_send_message_returns_true(self):
         inner = MagicMock()
         sender = self._create_sender(inner)
@@ -27,7 +44,7 @@ class TestFireAndForgetMessageSender:
         sender.send_message("hello")
         sender.shutdown()
 
-        inner.send_message.assert_called_once_with("hello")
+        inner.send_message.assert_called_once_with("hello", NotificationPriority.NORMAL, None)
 
     def test_multiple_messages_are_all_delivered(self):
         inner = MagicMock()
@@ -39,9 +56,39 @@ class TestFireAndForgetMessageSender:
         sender.shutdown()
 
         assert inner.send_message.call_count == 3
-        inner.send_message.assert_any_call("first")
-        inner.send_message.assert_any_call("second")
-        inner.send_message.assert_any_call("third")
+        inner.send_message.assert_any_call("first", NotificationPriority.NORMAL, None)
+        inner.send_message.assert_any_call("second", NotificationPriority.NORMAL, None)
+        inner.send_message.assert_any_call("third", NotificationPriority.NORMAL, None)
+
+    def test_message_is_sent_within_the_cycle_that_queued_it(self):
+        cycles = []
+        inner = MagicMock()
+        inner.send_message.side_effect = lambda *args: cycles.append(current_cycle_id())
+        sender = self._create_sender(inner)
+
+        with cycle_scope("abc"):
+            sender.send_message("first")
+        sender.send_message("second")
+        sender.shutdown()
+
+        assert cycles == ["abc", None]
+
+    def test_pending_counts_messages_not_yet_picked_up(self):
+        release = threading.Event()
+        inner = MagicMock()
+        inner.send_message.side_effect = lambda *args: release.wait(5)
+        sender = self._create_sender(inner)
+
+        for text in ("first", "second", "third"):
+            sender.send_message(text, key=text)
+        while inner.send_message.call_count == 0:
+            time.sleep(0.01)
+        pending = sender.pending
+        release.set()
+        sender.shutdown()
+
+        assert pending == 2
+        assert sender.pending == 0
 
     def test_inner_exception_is_caught_and_logged(self, caplog):
         inner = MagicMock()
@@ -72,7 +119,7 @@ class TestFireAndForgetMessageSender:
         sender.send_message("hello")
         sender.shutdown()
 
-        inner.send_message.assert_called_once_with("hello")
+        inner.send_message.assert_called_once_with("hello", NotificationPriority.NORMAL, None)
 
     def test_shutdown_does_not_propagate_exception_raised_by_inner(self, caplog):
         inner = MagicMock()
@@ -85,3 +132,155 @@ class TestFireAndForgetMessageSender:
         sender.shutdown()
 
         assert "Failed to send message" in caplog.text
+
+    def test_priority_is_passed_to_inner(self):
+        inner = MagicMock()
+        sender = self._create_sender(inner)
+
+        sender.send_message("hello", NotificationPriority.CRITICAL)
+        sender.shutdown()
+
+        inner.send_message.assert_called_once_with("hello", NotificationPriority.CRITICAL, None)
+
+    def test_critical_message_overtakes_queued_low_priority_messages(self):
+        release = threading.Event()
+        started = threading.Event()
+        delivered: list[str] = []
+
+        def send(message, priority, key):
+            if message == "blocker":
+                started.set()
+                release.wait(timeout=1)
+            delivered.append(message)
+
+        inner = MagicMock()
+        inner.send_message.side_effect = send
+        sender = self._create_sender(inner)
+
+        sender.send_message("blocker", NotificationPriority.LOW)
+        started.wait(timeout=1)
+        for i in range(3):
+            sender.send_message(f"open-{i}", NotificationPriority.LOW)
+        sender.send_message("target", NotificationPriority.CRITICAL)
+        release.set()
+        sender.shutdown()
+
+        assert delivered == ["blocker", "target", "open-0", "open-1", "open-2"]
+
+    def test_key_is_passed_to_inner(self):
+        inner = MagicMock()
+        sender = self._create_sender(inner)
+
+        sender.send_message("hello", NotificationPriority.NORMAL, "AAPL")
+        sender.shutdown()
+
+        inner.send_message.assert_called_once_with("hello", NotificationPriority.NORMAL, "AAPL")
+
+    def test_different_keys_are_sent_concurrently(self):
+        barrier = threading.Barrier(2, timeout=1)
+        inner = MagicMock()
+        inner.send_message.side_effect = lambda message, priority, key: barrier.wait()
+        sender = self._create_sender(inner, workers=2)
+
+        sender.send_message("aapl", NotificationPriority.NORMAL, "AAPL")
+        sender.send_message("msft", NotificationPriority.NORMAL, "MSFT")
+        sender.shutdown()
+
+        assert not barrier.broken
+        assert inner.send_message.call_count == 2
+
+    def test_same_key_is_never_sent_concurrently_and_keeps_order(self):
+        lock = threading.Lock()
+        in_flight: dict[str, int] = {}
+        overlaps: list[str] = []
+        delivered: list[str] = []
+
+        def send(message, priority, key):
+            with lock:
+                in_flight[key] = in_flight.get(key, 0) + 1
+                if in_flight[key] > 1:
+                    overlaps.append(message)
+            time.sleep(0.001)
+            with lock:
+                in_flight[key] -= 1
+                delivered.append(message)
+
+        inner = MagicMock()
+        inner.send_message.side_effect = send
+        sender = self._create_sender(inner, workers=4)
+
+        for i in range(20):
+            for key in ("AAPL", "MSFT"):
+                sender.send_message(f"{key}-{i}", NotificationPriority.NORMAL, key)
+        sender.shutdown()
+
+        assert overlaps == []
+        assert [m for m in delivered if m.startswith("AAPL")] == [f"AAPL-{i}" for i in range(20)]
+        assert [m for m in delivered if m.startswith("MSFT")] == [f"MSFT-{i}" for i in range(20)]
+
+    def test_returns_false_and_logs_counters_when_message_is_dropped(self, caplog):
+        release = threading.Event()
+        started = threading.Event()
+
+        def send(message, priority, key):
+            started.set()
+            release.wait(timeout=1)
+
+        inner = MagicMock()
+        inner.send_message.side_effect = send
+        sender = FireAndForgetMessageSender(
+            inner=inner,
+            logger_factory=PythonLoggerFactory(),
+            settings=FireAndForgetSettings(
+                max_queue_size=1, overflow_policy=OverflowPolicy.DROP_OLDEST
+            ),
+        )
+
+        sender.send_message("in-flight", NotificationPriority.CRITICAL)
+        started.wait(timeout=1)
+        sender.send_message("queued", NotificationPriority.CRITICAL)
+        with caplog.at_level(logging.WARNING, logger="pryces.infrastructure.senders"):
+            result = sender.send_message("overflow", NotificationPriority.LOW)
+        release.set()
+        sender.shutdown()
+
+        assert result is False
+        assert "dropped: 1, collapsed: 0" in caplog.text
+        assert inner.send_message.call_count == 2
+
+    def test_sums_up_evictions_in_one_warning_per_interval(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def send(message, priority, key):
+            started.set()
+            release.wait(timeout=1)
+
+        inner = MagicMock()
+        inner.send_message.side_effect = send
+        logger_factory = Mock()
+        logger = logger_factory.get_logger.return_value
+        sender = FireAndForgetMessageSender(
+            inner=inner,
+            logger_factory=logger_factory,
+            settings=FireAndForgetSettings(
+                max_queue_size=1,
+                overflow_policy=OverflowPolicy.DROP_OLDEST,
+                eviction_warning_interval=3600,
+            ),
+        )
+
+        sender.send_message("in-flight", NotificationPriority.CRITICAL)
+        started.wait(timeout=1)
+        sender.send_message("queued", NotificationPriority.CRITICAL)
+        for i in range(5):
+            sender.send_message(f"overflow-{i}", NotificationPriority.LOW)
+        release.set()
+        sender.shutdown()
+
+        warnings = [c.args[0] for c in logger.warning.call_args_list]
+        assert (
+            warnings[0] == "Send queue full, discarded 1 LOW message(s) (dropped: 1, collapsed: 0)"
+        )
+        assert len(warnings) == 2
+        assert "dropped: 5" in warnings[1]
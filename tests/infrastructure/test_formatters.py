@@ -5,6 +5,7 @@ import pytest
 from pryces.domain.notifications import (
     Notification,
     NotificationFormatter,
+    NotificationPriority,
     NotificationType,
     StockContext,
 )
@@ -51,8 +52,8 @@ class TestConsolidatingNotificationFormatter:
         result = self.formatter.format([header, milestone], self.context)
 
         assert len(result) == 1
-        assert header.message in result[0]
-        assert milestone.message in result[0]
+        assert header.message in result[0].text
+        assert milestone.message in result[0].text
 
     def test_multiple_milestones_consolidated_into_single_message(self):
         header = Notification.create_percentage_change(
@@ -64,8 +65,8 @@ class TestConsolidatingNotificationFormatter:
         result = self.formatter.format([header, sma50, high], self.context)
 
         assert len(result) == 1
-        assert sma50.message in result[0]
-        assert high.message in result[0]
+        assert sma50.message in result[0].text
+        assert high.message in result[0].text
 
     def test_header_only_emitted_individually_when_no_milestones(self):
         header = Notification.create_percentage_change(
@@ -74,7 +75,7 @@ class TestConsolidatingNotificationFormatter:
 
         result = self.formatter.format([header], self.context)
 
-        assert result == [header.message]
+        assert [m.text for m in result] == [header.message]
 
     def test_market_open_emitted_individually_when_no_milestones(self):
         market_open = Notification.create_regular_market_open(
@@ -83,7 +84,7 @@ class TestConsolidatingNotificationFormatter:
 
         result = self.formatter.format([market_open], self.context)
 
-        assert result == [market_open.message]
+        assert [m.text for m in result] == [market_open.message]
 
     def test_market_open_as_header_when_milestones_present(self):
         market_open = Notification.create_regular_market_open(
@@ -94,8 +95,8 @@ class TestConsolidatingNotificationFormatter:
         result = self.formatter.format([market_open, milestone], self.context)
 
         assert len(result) == 1
-        assert market_open.message in result[0]
-        assert milestone.message in result[0]
+        assert market_open.message in result[0].text
+        assert milestone.message in result[0].text
 
     def test_market_open_takes_header_priority_over_percentage(self):
         market_open = Notification.create_regular_market_open(
@@ -109,7 +110,7 @@ class TestConsolidatingNotificationFormatter:
         result = self.formatter.format([market_open, percentage, milestone], self.context)
 
         assert len(result) == 1
-        lines = result[0].split("\n")
+        lines = result[0].text.split("\n")
         assert market_open.message == lines[0]
         assert percentage.message in lines
         assert milestone.message in lines
@@ -125,7 +126,7 @@ class TestConsolidatingNotificationFormatter:
         result = self.formatter.format([market_open, percentage], self.context)
 
         assert len(result) == 1
-        lines = result[0].split("\n")
+        lines = result[0].text.split("\n")
         assert market_open.message == lines[0]
         assert percentage.message == lines[1]
 
@@ -139,8 +140,8 @@ class TestConsolidatingNotificationFormatter:
         result = self.formatter.format([header, milestone, target], self.context)
 
         assert len(result) == 2
-        assert milestone.message in result[0]
-        assert result[1] == target.message
+        assert milestone.message in result[0].text
+        assert result[1].text == target.message
 
     def test_percentage_suppressed_when_milestones_exist(self):
         header = Notification.create_percentage_change(
@@ -151,8 +152,8 @@ class TestConsolidatingNotificationFormatter:
         result = self.formatter.format([header, milestone], self.context)
 
         assert len(result) == 1
-        assert header.message in result[0]
-        assert milestone.message in result[0]
+        assert header.message in result[0].text
+        assert milestone.message in result[0].text
 
     def test_fallback_header_from_context_when_no_header_only(self):
         milestone = Notification.create_fifty_day_average_crossed(Decimal("145.00"))
@@ -160,9 +161,9 @@ class TestConsolidatingNotificationFormatter:
         result = self.formatter.format([milestone], self.context)
 
         assert len(result) == 1
-        assert "AAPL" in result[0]
-        assert "150.00" in result[0]
-        assert milestone.message in result[0]
+        assert "AAPL" in result[0].text
+        assert "150.00" in result[0].text
+        assert milestone.message in result[0].text
 
     def test_fallback_header_plain_when_no_previous_close(self):
         context = StockContext(
@@ -175,8 +176,8 @@ class TestConsolidatingNotificationFormatter:
         result = self.formatter.format([milestone], context)
 
         assert len(result) == 1
-        assert "AAPL at 150.00" in result[0]
-        assert milestone.message in result[0]
+        assert "AAPL at 150.00" in result[0].text
+        assert milestone.message in result[0].text
 
     def test_empty_notifications_returns_empty(self):
         result = self.formatter.format([], self.context)
@@ -192,8 +193,42 @@ class TestConsolidatingNotificationFormatter:
         result = self.formatter.format([milestone, header], self.context)
 
         assert len(result) == 1
-        assert header.message in result[0]
-        assert milestone.message in result[0]
+        assert header.message in result[0].text
+        assert milestone.message in result[0].text
+
+    def test_consolidated_message_takes_most_urgent_priority(self):
+        market_open = Notification.create_regular_market_open(
+            "AAPL", Decimal("150.00"), Decimal("148.50")
+        )
+        milestone = Notification.create_fifty_day_average_crossed(Decimal("145.00"))
+
+        result = self.formatter.format([market_open, milestone], self.context)
+
+        assert result[0].priority == NotificationPriority.CRITICAL
+
+    def test_fallback_header_does_not_affect_priority(self):
+        milestone = Notification.create_new_52_week_high()
+
+        result = self.formatter.format([milestone], self.context)
+
+        assert result[0].priority == NotificationPriority.HIGH
+
+    def test_standalone_messages_keep_their_own_priority(self):
+        market_open = Notification.create_regular_market_open(
+            "AAPL", Decimal("150.00"), Decimal("148.50")
+        )
+        target = Notification.create_target_price_reached("AAPL", Decimal("150.00"))
+        closed = Notification.create_regular_market_closed(
+            "AAPL", Decimal("150.00"), Decimal("148.50")
+        )
+
+        result = self.formatter.format([market_open, target, closed], self.context)
+
+        assert [m.priority for m in result] == [
+            NotificationPriority.LOW,
+            NotificationPriority.CRITICAL,
+            NotificationPriority.LOW,
+        ]
 
 
 class TestRegularStockStatisticsFormatter:
@@ -0,0 +1,88 @@
+from datetime import date
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+
+from pryces.infrastructure.history import DailyHistoryCache
+
+
+def _frame(days: list[str], closes: list[float]) -> pd.DataFrame:
+    index = pd.DatetimeIndex(days).tz_localize("America/New_York")
+    return pd.DataFrame(
+        {
+            "Open": closes,
+            "High": [c + 1 for c in closes],
+            "Low": [c - 1 for c in closes],
+            "Close": closes,
+            "Volume": [100] * len(closes),
+        },
+        index=index,
+    )
+
+
+_HISTORIES = {
+    "AAPL": _frame(["2024-01-02", "2024-01-03", "2024-01-04"], [10.0, 11.0, 12.0]),
+    "SAP.DE": _frame(["2024-01-02", "2024-01-04", "2024-01-05"], [20.0, 21.0, 22.0]),
+}
+
+
+class TestDailyHistoryCache:
+    def _cache(self, tmp_path, today=date(2024, 1, 6), download=None) -> DailyHistoryCache:
+        return DailyHistoryCache(
+            tmp_path,
+            logger_factory=Mock(),
+            download=download or Mock(side_effect=lambda symbol, start: _HISTORIES[symbol]),
+            today=lambda: today,
+        )
+
+    def test_aligns_symbols_on_the_union_of_trading_days(self, tmp_path):
+        bars = self._cache(tmp_path).load(["AAPL", "SAP.DE"], years=1)
+
+        assert bars.symbols == ["AAPL", "SAP.DE"]
+        assert bars.days.astype(str).tolist() == [
+            "2024-01-02",
+            "2024-01-03",
+            "2024-01-04",
+            "2024-01-05",
+        ]
+        np.testing.assert_array_equal(bars.close[0], [10.0, 11.0, 12.0, np.nan])
+        np.testing.assert_array_equal(bars.close[1], [20.0, np.nan, 21.0, 22.0])
+        np.testing.assert_array_equal(bars.high[1], [21.0, np.nan, 22.0, 23.0])
+
+    def test_reuses_cached_history_on_the_same_day(self, tmp_path):
+        download = Mock(side_effect=lambda symbol, start: _HISTORIES[symbol])
+        self._cache(tmp_path, download=download).load(["AAPL"], years=1)
+
+        bars = self._cache(tmp_path, download=download).load(["AAPL"], years=1)
+
+        download.assert_called_once()
+        assert bars.close[0].tolist() == [10.0, 11.0, 12.0]
+
+    def test_downloads_again_on_a_later_day(self, tmp_path):
+        download = Mock(side_effect=lambda symbol, start: _HISTORIES[symbol])
+        self._cache(tmp_path, download=download).load(["AAPL"], years=1)
+
+        self._cache(tmp_path, today=date(2024, 1, 7), download=download).load(["AAPL"], years=1)
+
+        assert download.call_count == 2
+
+    def test_downloads_again_when_more_years_are_requested(self, tmp_path):
+        download = Mock(side_effect=lambda symbol, start: _HISTORIES[symbol])
+        self._cache(tmp_path, download=download).load(["AAPL"], years=1)
+
+        self._cache(tmp_path, download=download).load(["AAPL"], years=3)
+
+        assert download.call_count == 2
+        assert download.call_args.args[1] < date(2021, 1, 7)
+
+    def test_failed_download_leaves_symbol_empty(self, tmp_path):
+        def download(symbol, start):
+            if symbol == "SAP.DE":
+                raise ConnectionError("offline")
+            return _HISTORIES[symbol]
+
+        bars = self._cache(tmp_path, download=download).load(["AAPL", "SAP.DE"], years=1)
+
+        assert np.isnan(bars.close[1]).all()
+        assert not (tmp_path / "SAP.DE.npz").exists()
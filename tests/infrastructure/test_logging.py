@@ -1,9 +1,63 @@
+import json
 import logging
+import sys
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pryces.infrastructure.logging import PythonLogger, PythonLoggerFactory
+from pryces.application.correlation import cycle_scope
+from pryces.infrastructure.logging import (
+    JsonFormatter,
+    LoggingSettings,
+    LogPipeline,
+    PythonLogger,
+    PythonLoggerFactory,
+    setup_logging,
+)
+
+
+class _Counted:
+    def __init__(self) -> None:
+        self.formatted = 0
+
+    def __str__(self) -> str:
+        self.formatted += 1
+        return "counted"
+
+
+class _BlockingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.received = threading.Event()
+        self.unblock = threading.Event()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.received.set()
+        self.unblock.wait(5)
+        self.messages.append(record.getMessage())
+
+
+class _CollectingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lines: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.format(record))
+
+
+@pytest.fixture
+def root_logger():
+    root = logging.getLogger()
+    pryces = logging.getLogger("pryces")
+    saved = (root.handlers[:], root.level, pryces.level)
+    root.setLevel(logging.INFO)
+    yield root
+    root.handlers[:] = saved[0]
+    root.setLevel(saved[1])
+    pryces.setLevel(saved[2])
 
 
 class TestPythonLogger:
@@ -33,6 +87,164 @@ class TestPythonLogger:
 
         self.inner.error.assert_called_once_with("error msg")
 
+    def test_arguments_are_passed_through_for_lazy_formatting(self):
+        self.logger.info("Fetching %s", "AAPL")
+
+        self.inner.info.assert_called_once_with("Fetching %s", "AAPL")
+
+    def test_fields_are_passed_as_extra(self):
+        self.logger.info("Fetched %s", "AAPL", symbol="AAPL", duration=0.25)
+
+        self.inner.info.assert_called_once_with(
+            "Fetched %s", "AAPL", extra={"fields": {"symbol": "AAPL", "duration": 0.25}}
+        )
+
+    def test_disabled_level_never_formats_its_arguments(self):
+        argument = _Counted()
+        logger = PythonLogger(logging.getLogger("pryces.tests.lazy"))
+        logging.getLogger("pryces.tests.lazy").setLevel(logging.INFO)
+
+        logger.debug("Fetching %s", argument)
+
+        assert argument.formatted == 0
+
+
+class TestSetupLogging:
+
+    def test_json_format_writes_json_lines(self, tmp_path, root_logger):
+        pipeline = setup_logging(
+            LoggingSettings(entry_point="monitor", logs_directory=str(tmp_path), json_format=True)
+        )
+
+        PythonLoggerFactory().get_logger("pryces.tests").info("Cycle finished", outcome="ok")
+        pipeline.stop()
+
+        [log_file] = tmp_path.glob("pryces_monitor_*.jsonl")
+        [entry] = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert (entry["message"], entry["outcome"]) == ("Cycle finished", "ok")
+
+    def test_writes_records_to_the_log_file_through_the_queue(self, tmp_path, root_logger):
+        pipeline = setup_logging(
+            LoggingSettings(entry_point="monitor", debug=True, logs_directory=str(tmp_path))
+        )
+        logger = PythonLoggerFactory().get_logger("pryces.tests")
+
+        logger.debug("Fetching %s", "AAPL")
+        logger.info("Notification sent:\n%s", "AAPL rose")
+        pipeline.stop()
+
+        [log_file] = tmp_path.glob("pryces_monitor_*.log")
+        content = log_file.read_text()
+        assert "DEBUG - Fetching AAPL" in content
+        assert "INFO - Notification sent:\nAAPL rose" in content
+
+    def test_without_handlers_installs_no_pipeline(self, root_logger):
+        root_logger.handlers[:] = []
+
+        assert setup_logging(LoggingSettings(entry_point="cli")) is None
+        assert [type(h) for h in root_logger.handlers] == [logging.NullHandler]
+
+
+class TestJsonFormatter:
+    def _record(self, **attributes) -> logging.LogRecord:
+        record = logging.LogRecord(
+            "pryces.tests", logging.INFO, __file__, 1, "Sent %s", ("AAPL",), None
+        )
+        record.__dict__.update(attributes)
+        return record
+
+    def test_formats_the_message_cycle_and_fields_as_one_json_line(self):
+        record = self._record(cycle_id="abc", fields={"symbol": "AAPL", "duration": 0.25})
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "pryces.tests"
+        assert entry["message"] == "Sent AAPL"
+        assert entry["cycle_id"] == "abc"
+        assert entry["symbol"] == "AAPL"
+        assert entry["duration"] == 0.25
+        assert "time" in entry
+
+    def test_fields_cannot_overwrite_the_standard_keys(self):
+        record = self._record(fields={"message": "spoofed", "outcome": "sent"})
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        assert entry["message"] == "Sent AAPL"
+        assert entry["outcome"] == "sent"
+        assert "cycle_id" not in entry
+
+    def test_includes_the_exception(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = self._record(exc_info=sys.exc_info())
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        assert "ValueError: boom" in entry["exception"]
+
+
+class TestLogPipeline:
+
+    def test_records_carry_the_cycle_they_were_logged_in(self, root_logger):
+        handler = _CollectingHandler()
+        handler.setFormatter(JsonFormatter())
+        pipeline = LogPipeline([handler], logging.INFO, 100, root_logger)
+        logger = PythonLoggerFactory().get_logger("pryces.tests")
+
+        with cycle_scope("abc"):
+            logger.info("Fetched %s", "AAPL", symbol="AAPL")
+        logger.info("Outside")
+        pipeline.stop()
+
+        lines = [json.loads(line) for line in handler.lines]
+        assert [(line.get("cycle_id"), line["message"]) for line in lines] == [
+            ("abc", "Fetched AAPL"),
+            (None, "Outside"),
+        ]
+        assert lines[0]["symbol"] == "AAPL"
+
+    def test_stop_writes_what_is_still_queued(self, root_logger):
+        handler = _BlockingHandler()
+        handler.unblock.set()
+        pipeline = LogPipeline([handler], logging.INFO, 100, root_logger)
+
+        for i in range(20):
+            logging.getLogger("pryces.tests").info("record %d", i)
+        pipeline.stop()
+
+        assert handler.messages == [f"record {i}" for i in range(20)]
+
+    def test_full_queue_drops_records_instead_of_blocking(self, root_logger):
+        handler = _BlockingHandler()
+        pipeline = LogPipeline([handler], logging.INFO, 1, root_logger)
+        logger = logging.getLogger("pryces.tests")
+
+        logger.info("first")
+        assert handler.received.wait(5)
+        for i in range(4):
+            logger.info("record %d", i)
+        handler.unblock.set()
+        pipeline.stop()
+
+        assert pipeline.dropped == 3
+        assert handler.messages == [
+            "first",
+            "record 0",
+            "Log queue was full, dropped 3 record(s)",
+        ]
+
+    def test_stop_detaches_from_the_root_logger(self, root_logger):
+        pipeline = LogPipeline([logging.NullHandler()], logging.INFO, 10, root_logger)
+        attached = len(root_logger.handlers)
+
+        pipeline.stop()
+        pipeline.stop()
+
+        assert len(root_logger.handlers) == attached - 1
+
 
 class TestPythonLoggerFactory:
     def test_get_logger_returns_python_logger_instance(self):
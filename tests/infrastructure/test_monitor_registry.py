@@ -0,0 +1,101 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from pryces.infrastructure.monitor_registry import MonitorRecord, MonitorRegistry
+
+_NOW = datetime(2024, 6, 14, 9, 30)
+
+
+def _stat(pid: int, start: int) -> str:
+    fields = ["S"] + ["0"] * 18 + [str(start)] + ["0"] * 10
+    return f"{pid} (python3 -m pryces) {' '.join(fields)}\n"
+
+
+class TestMonitorRegistry:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.now = _NOW
+        self.proc = tmp_path / "proc"
+        self.directory = tmp_path / "run" / "monitors"
+        self.registry = MonitorRegistry(self.directory, proc=self.proc, clock=lambda: self.now)
+
+    def _start_process(self, pid: int, start: int = 1000) -> None:
+        (self.proc / str(pid)).mkdir(parents=True, exist_ok=True)
+        (self.proc / str(pid) / "stat").write_text(_stat(pid, start))
+
+    def test_lists_registered_monitors_in_start_order(self):
+        self._start_process(200)
+        self._start_process(100)
+        self.registry.register("configs/b.json", pid=200)
+        self.now += timedelta(minutes=1)
+        self.registry.register("configs/a.json", pid=100)
+
+        assert self.registry.list() == [
+            MonitorRecord(200, "configs/b.json", _NOW),
+            MonitorRecord(100, "configs/a.json", _NOW + timedelta(minutes=1)),
+        ]
+
+    def test_beat_records_the_last_cycle(self):
+        self._start_process(100)
+        registration = self.registry.register("configs/a.json", pid=100)
+        self.now += timedelta(seconds=30)
+
+        registration.beat()
+
+        [record] = self.registry.list()
+        assert record.last_cycle_at == _NOW + timedelta(seconds=30)
+        assert registration.record == record
+
+    def test_close_unregisters(self):
+        self._start_process(100)
+        registration = self.registry.register("configs/a.json", pid=100)
+
+        registration.close()
+
+        assert self.registry.list() == []
+        assert list(self.directory.iterdir()) == []
+
+    def test_removes_entries_of_dead_processes(self):
+        self._start_process(100)
+        self.registry.register("configs/a.json", pid=100)
+        (self.proc / "100" / "stat").unlink()
+
+        assert self.registry.list() == []
+        assert list(self.directory.iterdir()) == []
+
+    def test_removes_the_control_socket_left_by_a_killed_monitor(self):
+        self._start_process(100)
+        registration = self.registry.register("configs/a.json", pid=100)
+        registration.control_path.touch()
+        (self.proc / "100" / "stat").unlink()
+
+        assert registration.control_path == self.registry.control_path(100)
+        assert self.registry.list() == []
+        assert list(self.directory.iterdir()) == []
+
+    def test_recycled_pid_is_not_mistaken_for_the_monitor(self):
+        self._start_process(100, start=1000)
+        self.registry.register("configs/a.json", pid=100)
+        self._start_process(100, start=5000)
+
+        assert self.registry.list() == []
+
+    def test_corrupt_entry_is_removed(self):
+        self.directory.mkdir(parents=True)
+        (self.directory / "100.pid").write_text("100\n")
+        (self.directory / "100.json").write_text("{not json")
+
+        assert self.registry.list() == []
+        assert list(self.directory.iterdir()) == []
+
+    def test_without_proc_probes_the_process(self, tmp_path):
+        registry = MonitorRegistry(self.directory, proc=tmp_path / "missing")
+        registry.register("configs/a.json")
+
+        assert [record.pid for record in registry.list()] == [os.getpid()]
+
+    def test_missing_directory_lists_nothing(self):
+        assert self.registry.list() == []
@@ -1,13 +1,18 @@
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import Mock, patch
 
 import pandas as pd
 import pytest
 
-from pryces.domain.stock_statistics import StatisticsPeriod
-from pryces.domain.stocks import Currency, InstrumentType, MarketState
-from pryces.infrastructure.providers import YahooFinanceMapper, map_currency
+from pryces.application.interfaces import StockStatisticsProvider
+from pryces.domain.stock_statistics import StatisticsPeriod, StockStatistics
+from pryces.domain.stocks import Currency, InstrumentType, MarketState, Stock
+from pryces.infrastructure.providers import (
+    CachedStockStatisticsProvider,
+    YahooFinanceMapper,
+    map_currency,
+)
 
 
 def _build_full_info(**overrides) -> dict:
@@ -229,6 +234,48 @@ class TestYahooFinanceMapper:
         assert stock.currency == expected_currency
 
 
+class TestYahooFinanceMapperDelta:
+    def test_first_quote_is_full(self, mapper):
+        quote, _ = mapper.map_delta("aapl", _build_full_info(), None)
+
+        assert quote.full
+        assert quote.symbol == "AAPL"
+        assert quote.changes["current_price"] == Decimal("150.25")
+        assert quote.changes["kind"] == InstrumentType.STOCK
+
+    def test_full_quote_builds_the_same_stock_as_map(self, mapper):
+        quote, _ = mapper.map_delta("AAPL", _build_full_info(), None)
+
+        stock = Stock.from_quote(quote)
+
+        assert stock.export_state() == mapper.map("AAPL", _build_full_info()).export_state()
+
+    def test_later_quote_carries_only_changed_fields(self, mapper):
+        _, raw = mapper.map_delta("AAPL", _build_full_info(), None)
+
+        quote, _ = mapper.map_delta(
+            "AAPL", _build_full_info(currentPrice=151.0, marketState="POST"), raw
+        )
+
+        assert not quote.full
+        assert quote.changes == {
+            "current_price": Decimal("151.0"),
+            "market_state": MarketState.POST,
+        }
+
+    def test_unchanged_quote_has_no_changes(self, mapper):
+        _, raw = mapper.map_delta("AAPL", _build_full_info(), None)
+
+        quote, _ = mapper.map_delta("AAPL", _build_full_info(), raw)
+
+        assert quote.changes == {}
+
+    def test_returns_none_for_unusable_info(self, mapper):
+        _, raw = mapper.map_delta("AAPL", _build_full_info(), None)
+
+        assert mapper.map_delta("AAPL", {}, raw) is None
+
+
 class TestMapCurrency:
     @pytest.mark.parametrize(
         "raw, expected",
@@ -439,3 +486,60 @@ class TestYahooFinanceStatisticsMapper:
         )
         assert one_day is not None
         assert one_day.close_price == Decimal("148.0")
+
+
+def _stats(symbol: str) -> StockStatistics:
+    return StockStatistics(symbol=symbol, current_price=Decimal("100"), historical_closes=[])
+
+
+class TestCachedStockStatisticsProvider:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.now = datetime(2024, 1, 2, 10, 0)
+        self.inner = Mock(spec=StockStatisticsProvider)
+        self.inner.get_stock_statistics.side_effect = lambda symbols: [
+            _stats(symbol) for symbol in symbols if symbol != "XYZ"
+        ]
+        self.provider = CachedStockStatisticsProvider(
+            self.inner, max_age=timedelta(minutes=15), clock=lambda: self.now
+        )
+
+    def test_repeated_request_is_served_from_memory(self):
+        first = self.provider.get_stock_statistics(["AAPL"])
+
+        second = self.provider.get_stock_statistics(["aapl"])
+
+        assert second == first
+        self.inner.get_stock_statistics.assert_called_once_with(["AAPL"])
+
+    def test_fetches_only_the_misses_in_one_call(self):
+        self.provider.get_stock_statistics(["AAPL"])
+
+        result = self.provider.get_stock_statistics(["MSFT", "AAPL", "GOOGL"])
+
+        assert [stats.symbol for stats in result] == ["MSFT", "AAPL", "GOOGL"]
+        self.inner.get_stock_statistics.assert_called_with(["MSFT", "GOOGL"])
+
+    def test_symbols_without_data_are_fetched_again(self):
+        self.provider.get_stock_statistics(["XYZ"])
+
+        assert self.provider.get_stock_statistics(["XYZ"]) == []
+        assert self.inner.get_stock_statistics.call_count == 2
+
+    def test_entries_expire_after_max_age(self):
+        self.provider.get_stock_statistics(["AAPL"])
+        self.now += timedelta(minutes=16)
+
+        self.provider.get_stock_statistics(["AAPL"])
+
+        assert self.inner.get_stock_statistics.call_count == 2
+
+    def test_entries_expire_at_the_end_of_the_day(self):
+        self.now = datetime(2024, 1, 2, 23, 55)
+        self.provider.get_stock_statistics(["AAPL"])
+        self.now = datetime(2024, 1, 3, 0, 1)
+
+        self.provider.get_stock_statistics(["AAPL"])
+
+        assert self.inner.get_stock_statistics.call_count == 2
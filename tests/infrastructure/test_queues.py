@@ -0,0 +1,259 @@
+import threading
+
+import pytest
+
+from pryces.domain.notifications import NotificationPriority
+from pryces.infrastructure.queues import OverflowPolicy, PriorityMessageQueue, QueuedMessage
+
+
+def _drain(queue: PriorityMessageQueue) -> list[str]:
+    queue.close()
+    messages = []
+    while (item := queue.get()) is not None:
+        messages.append(item.text)
+        queue.task_done(item)
+    return messages
+
+
+class TestPriorityMessageQueue:
+    def test_get_returns_message_with_its_priority(self):
+        queue = PriorityMessageQueue(starvation_limit=10)
+
+        queue.put(QueuedMessage("hello", NotificationPriority.HIGH, "AAPL"))
+
+        assert queue.get() == QueuedMessage("hello", NotificationPriority.HIGH, "AAPL")
+
+    def test_more_urgent_lanes_are_served_first(self):
+        queue = PriorityMessageQueue(starvation_limit=10)
+
+        queue.put(QueuedMessage("low", NotificationPriority.LOW))
+        queue.put(QueuedMessage("normal", NotificationPriority.NORMAL))
+        queue.put(QueuedMessage("critical", NotificationPriority.CRITICAL))
+        queue.put(QueuedMessage("high", NotificationPriority.HIGH))
+
+        assert _drain(queue) == ["critical", "high", "normal", "low"]
+
+    def test_messages_within_a_lane_keep_fifo_order(self):
+        queue = PriorityMessageQueue(starvation_limit=10)
+
+        for i in range(3):
+            queue.put(QueuedMessage(f"low-{i}", NotificationPriority.LOW))
+
+        assert _drain(queue) == ["low-0", "low-1", "low-2"]
+
+    def test_starved_lane_is_served_after_limit_is_reached(self):
+        queue = PriorityMessageQueue(starvation_limit=2)
+
+        queue.put(QueuedMessage("low", NotificationPriority.LOW))
+        for i in range(4):
+            queue.put(QueuedMessage(f"critical-{i}", NotificationPriority.CRITICAL))
+
+        assert _drain(queue) == ["critical-0", "critical-1", "low", "critical-2", "critical-3"]
+
+    def test_len_counts_messages_across_lanes(self):
+        queue = PriorityMessageQueue(starvation_limit=10)
+
+        queue.put(QueuedMessage("a", NotificationPriority.LOW))
+        queue.put(QueuedMessage("b", NotificationPriority.CRITICAL))
+
+        assert len(queue) == 2
+
+    def test_get_returns_none_when_closed_and_empty(self):
+        queue = PriorityMessageQueue(starvation_limit=10)
+
+        queue.close()
+
+        assert queue.get() is None
+
+    def test_put_on_closed_queue_raises(self):
+        queue = PriorityMessageQueue(starvation_limit=10)
+        queue.close()
+
+        with pytest.raises(RuntimeError):
+            queue.put(QueuedMessage("hello", NotificationPriority.NORMAL))
+
+    def test_close_wakes_up_blocked_consumer(self):
+        queue = PriorityMessageQueue(starvation_limit=10)
+        results = []
+        consumer = threading.Thread(target=lambda: results.append(queue.get()))
+        consumer.start()
+
+        queue.close()
+        consumer.join(timeout=1)
+
+        assert not consumer.is_alive()
+        assert results == [None]
+
+    def test_message_with_in_flight_key_is_skipped(self):
+        queue = PriorityMessageQueue(starvation_limit=10)
+        queue.put(QueuedMessage("aapl-1", NotificationPriority.NORMAL, "AAPL"))
+        queue.put(QueuedMessage("aapl-2", NotificationPriority.NORMAL, "AAPL"))
+        queue.put(QueuedMessage("msft-1", NotificationPriority.NORMAL, "MSFT"))
+
+        first = queue.get()
+        second = queue.get()
+
+        assert (first.text, second.text) == ("aapl-1", "msft-1")
+
+    def test_key_becomes_eligible_again_after_task_done(self):
+        queue = PriorityMessageQueue(starvation_limit=10)
+        queue.put(QueuedMessage("aapl-1", NotificationPriority.NORMAL, "AAPL"))
+        queue.put(QueuedMessage("aapl-2", NotificationPriority.NORMAL, "AAPL"))
+
+        first = queue.get()
+        queue.task_done(first)
+
+        assert queue.get().text == "aapl-2"
+
+    def test_unkeyed_messages_are_serialized_together(self):
+        queue = PriorityMessageQueue(starvation_limit=10)
+        queue.put(QueuedMessage("first", NotificationPriority.NORMAL))
+        queue.put(QueuedMessage("second", NotificationPriority.NORMAL))
+        queue.put(QueuedMessage("keyed", NotificationPriority.NORMAL, "AAPL"))
+
+        queue.get()
+
+        assert queue.get().text == "keyed"
+
+    def test_get_waits_for_in_flight_key_to_be_released(self):
+        queue = PriorityMessageQueue(starvation_limit=10)
+        queue.put(QueuedMessage("aapl-1", NotificationPriority.NORMAL, "AAPL"))
+        queue.put(QueuedMessage("aapl-2", NotificationPriority.NORMAL, "AAPL"))
+        first = queue.get()
+        results = []
+        consumer = threading.Thread(target=lambda: results.append(queue.get()))
+        consumer.start()
+
+        consumer.join(timeout=0.1)
+        assert consumer.is_alive()
+        queue.task_done(first)
+        consumer.join(timeout=1)
+
+        assert [r.text for r in results] == ["aapl-2"]
+
+
+class TestBoundedPriorityMessageQueue:
+    def _fill(self, queue: PriorityMessageQueue, count: int, priority: NotificationPriority):
+        for i in range(count):
+            queue.put(QueuedMessage(f"{priority.name.lower()}-{i}", priority, f"K{i}"))
+
+    def test_rejects_non_positive_max_size(self):
+        with pytest.raises(ValueError):
+            PriorityMessageQueue(starvation_limit=10, max_size=0)
+
+    def test_drop_oldest_evicts_oldest_least_urgent_message(self):
+        queue = PriorityMessageQueue(
+            starvation_limit=10, max_size=3, overflow_policy=OverflowPolicy.DROP_OLDEST
+        )
+        self._fill(queue, 2, NotificationPriority.LOW)
+        queue.put(QueuedMessage("critical-0", NotificationPriority.CRITICAL))
+
+        evicted = queue.put(QueuedMessage("critical-1", NotificationPriority.CRITICAL))
+
+        assert evicted.text == "low-0"
+        assert len(queue) == 3
+        assert queue.dropped == 1
+        assert _drain(queue) == ["critical-0", "critical-1", "low-1"]
+
+    def test_drop_oldest_empties_less_urgent_lanes_before_touching_critical(self):
+        queue = PriorityMessageQueue(
+            starvation_limit=10, max_size=4, overflow_policy=OverflowPolicy.DROP_OLDEST
+        )
+        for priority in NotificationPriority:
+            queue.put(QueuedMessage(priority.name.lower(), priority))
+
+        evicted = [
+            queue.put(QueuedMessage(f"critical-{i}", NotificationPriority.CRITICAL)).text
+            for i in range(4)
+        ]
+
+        assert evicted == ["low", "normal", "high", "critical"]
+        assert _drain(queue) == ["critical-0", "critical-1", "critical-2", "critical-3"]
+
+    def test_drop_oldest_drops_incoming_when_it_is_least_urgent(self):
+        queue = PriorityMessageQueue(
+            starvation_limit=10, max_size=2, overflow_policy=OverflowPolicy.DROP_OLDEST
+        )
+        self._fill(queue, 2, NotificationPriority.CRITICAL)
+        incoming = QueuedMessage("low", NotificationPriority.LOW)
+
+        evicted = queue.put(incoming)
+
+        assert evicted is incoming
+        assert queue.dropped == 1
+        assert _drain(queue) == ["critical-0", "critical-1"]
+
+    def test_collapse_replaces_queued_message_with_same_key_and_priority(self):
+        queue = PriorityMessageQueue(
+            starvation_limit=10, max_size=2, overflow_policy=OverflowPolicy.COLLAPSE
+        )
+        queue.put(QueuedMessage("aapl-old", NotificationPriority.NORMAL, "AAPL"))
+        queue.put(QueuedMessage("msft", NotificationPriority.NORMAL, "MSFT"))
+
+        evicted = queue.put(QueuedMessage("aapl-new", NotificationPriority.NORMAL, "AAPL"))
+
+        assert evicted.text == "aapl-old"
+        assert queue.collapsed == 1
+        assert queue.dropped == 0
+        assert _drain(queue) == ["msft", "aapl-new"]
+
+    def test_collapse_falls_back_to_dropping_when_nothing_to_collapse(self):
+        queue = PriorityMessageQueue(
+            starvation_limit=10, max_size=1, overflow_policy=OverflowPolicy.COLLAPSE
+        )
+        queue.put(QueuedMessage("msft", NotificationPriority.LOW, "MSFT"))
+
+        evicted = queue.put(QueuedMessage("aapl", NotificationPriority.CRITICAL, "AAPL"))
+
+        assert evicted.text == "msft"
+        assert queue.dropped == 1
+        assert queue.collapsed == 0
+
+    def test_size_stays_bounded_under_sustained_load(self):
+        queue = PriorityMessageQueue(
+            starvation_limit=10, max_size=5, overflow_policy=OverflowPolicy.DROP_OLDEST
+        )
+
+        self._fill(queue, 500, NotificationPriority.LOW)
+
+        assert len(queue) == 5
+        assert queue.dropped == 495
+
+    def test_block_waits_until_a_consumer_makes_room(self):
+        queue = PriorityMessageQueue(
+            starvation_limit=10, max_size=1, overflow_policy=OverflowPolicy.BLOCK
+        )
+        queue.put(QueuedMessage("first", NotificationPriority.NORMAL))
+        producer = threading.Thread(
+            target=lambda: queue.put(QueuedMessage("second", NotificationPriority.NORMAL))
+        )
+        producer.start()
+
+        producer.join(timeout=0.1)
+        assert producer.is_alive()
+        queue.task_done(queue.get())
+        producer.join(timeout=1)
+
+        assert not producer.is_alive()
+        assert _drain(queue) == ["second"]
+        assert queue.dropped == 0
+
+    def test_close_releases_blocked_producer_with_error(self):
+        queue = PriorityMessageQueue(
+            starvation_limit=10, max_size=1, overflow_policy=OverflowPolicy.BLOCK
+        )
+        queue.put(QueuedMessage("first", NotificationPriority.NORMAL))
+        errors = []
+
+        def produce():
+            try:
+                queue.put(QueuedMessage("second", NotificationPriority.NORMAL))
+            except RuntimeError as e:
+                errors.append(e)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        queue.close()
+        producer.join(timeout=1)
+
+        assert len(errors) == 1
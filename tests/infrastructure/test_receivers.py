@@ -1,8 +1,17 @@
+import http.client
 import json
 import urllib.error
+import urllib.request
 from unittest.mock import Mock, patch
 
-from pryces.infrastructure.receivers import BotUpdate, TelegramUpdatePoller
+import pytest
+
+from pryces.infrastructure.receivers import (
+    BotUpdate,
+    TelegramUpdatePoller,
+    TelegramWebhookReceiver,
+    WebhookSettings,
+)
 from pryces.infrastructure.senders import TelegramSettings
 
 
@@ -11,18 +20,19 @@ def make_poller() -> TelegramUpdatePoller:
     return TelegramUpdatePoller(settings=settings, logger_factory=Mock())
 
 
-def make_response(result: list) -> Mock:
-    data = json.dumps({"ok": True, "result": result}).encode("utf-8")
-    response = Mock()
-    response.read.return_value = data
-    return response
+def make_connection(result: list | None = None, status: int = 200, body: bytes | None = None):
+    if body is None:
+        body = json.dumps({"ok": True, "result": result or []}).encode("utf-8")
+    connection = Mock()
+    connection.getresponse.return_value = Mock(status=status, read=Mock(return_value=body))
+    return connection
 
 
 class TestTelegramUpdatePoller:
 
-    @patch("pryces.infrastructure.receivers.urllib.request.urlopen")
-    def test_returns_all_updates_when_multiple_messages_present(self, mock_urlopen):
-        mock_urlopen.return_value = make_response(
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_returns_all_updates_when_multiple_messages_present(self, mock_connection):
+        mock_connection.return_value = make_connection(
             [
                 {
                     "update_id": 1,
@@ -40,9 +50,9 @@ class TestTelegramUpdatePoller:
 
         assert len(updates) == 2
 
-    @patch("pryces.infrastructure.receivers.urllib.request.urlopen")
-    def test_parses_first_update_fields_correctly(self, mock_urlopen):
-        mock_urlopen.return_value = make_response(
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_parses_first_update_fields_correctly(self, mock_connection):
+        mock_connection.return_value = make_connection(
             [
                 {
                     "update_id": 1,
@@ -60,9 +70,9 @@ class TestTelegramUpdatePoller:
 
         assert updates[0] == BotUpdate(update_id=1, chat_id="456", text="/help")
 
-    @patch("pryces.infrastructure.receivers.urllib.request.urlopen")
-    def test_parses_second_update_fields_correctly(self, mock_urlopen):
-        mock_urlopen.return_value = make_response(
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_parses_second_update_fields_correctly(self, mock_connection):
+        mock_connection.return_value = make_connection(
             [
                 {
                     "update_id": 1,
@@ -80,9 +90,9 @@ class TestTelegramUpdatePoller:
 
         assert updates[1] == BotUpdate(update_id=2, chat_id="789", text="/targets AAPL")
 
-    @patch("pryces.infrastructure.receivers.urllib.request.urlopen")
-    def test_skips_updates_without_text(self, mock_urlopen):
-        mock_urlopen.return_value = make_response(
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_skips_updates_without_text(self, mock_connection):
+        mock_connection.return_value = make_connection(
             [
                 {
                     "update_id": 1,
@@ -101,9 +111,9 @@ class TestTelegramUpdatePoller:
         assert len(updates) == 1
         assert updates[0].text == "/help"
 
-    @patch("pryces.infrastructure.receivers.urllib.request.urlopen")
-    def test_skips_updates_without_message(self, mock_urlopen):
-        mock_urlopen.return_value = make_response(
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_skips_updates_without_message(self, mock_connection):
+        mock_connection.return_value = make_connection(
             [
                 {"update_id": 1},
                 {
@@ -118,52 +128,48 @@ class TestTelegramUpdatePoller:
 
         assert len(updates) == 1
 
-    @patch("pryces.infrastructure.receivers.urllib.request.urlopen")
-    def test_returns_empty_list_on_http_error(self, mock_urlopen):
-        mock_urlopen.side_effect = urllib.error.HTTPError(
-            url="", code=500, msg="", hdrs=None, fp=Mock(read=lambda: b"error")
-        )
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_returns_empty_list_on_http_error(self, mock_connection):
+        mock_connection.return_value = make_connection(status=500, body=b"error")
         poller = make_poller()
 
         updates = poller.get_updates(0)
 
         assert updates == []
 
-    @patch("pryces.infrastructure.receivers.urllib.request.urlopen")
-    def test_returns_empty_list_on_network_error(self, mock_urlopen):
-        mock_urlopen.side_effect = urllib.error.URLError("connection refused")
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_returns_empty_list_on_network_error(self, mock_connection):
+        mock_connection.return_value.request.side_effect = ConnectionRefusedError()
         poller = make_poller()
 
         updates = poller.get_updates(0)
 
         assert updates == []
 
-    @patch("pryces.infrastructure.receivers.urllib.request.urlopen")
-    def test_returns_empty_list_when_ok_is_false(self, mock_urlopen):
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_returns_empty_list_when_ok_is_false(self, mock_connection):
         data = json.dumps({"ok": False, "description": "Unauthorized"}).encode("utf-8")
-        response = Mock()
-        response.read.return_value = data
-        mock_urlopen.return_value = response
+        mock_connection.return_value = make_connection(body=data)
         poller = make_poller()
 
         updates = poller.get_updates(0)
 
         assert updates == []
 
-    @patch("pryces.infrastructure.receivers.urllib.request.urlopen")
-    def test_passes_offset_in_url(self, mock_urlopen):
-        mock_urlopen.return_value = make_response([])
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_passes_offset_in_url(self, mock_connection):
+        mock_connection.return_value = make_connection([])
         poller = make_poller()
 
         poller.get_updates(42)
 
-        call_args = mock_urlopen.call_args
-        request = call_args[0][0]
-        assert "offset=42" in request.full_url
+        method, target = mock_connection.return_value.request.call_args[0]
+        assert method == "GET"
+        assert "offset=42" in target
 
-    @patch("pryces.infrastructure.receivers.urllib.request.urlopen")
-    def test_converts_chat_id_to_string(self, mock_urlopen):
-        mock_urlopen.return_value = make_response(
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_converts_chat_id_to_string(self, mock_connection):
+        mock_connection.return_value = make_connection(
             [
                 {
                     "update_id": 1,
@@ -176,3 +182,196 @@ class TestTelegramUpdatePoller:
         updates = poller.get_updates(0)
 
         assert updates[0].chat_id == "-1001234567890"
+
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_reuses_one_connection_across_polls(self, mock_connection):
+        mock_connection.return_value = make_connection([])
+        poller = make_poller()
+
+        poller.get_updates(0)
+        poller.get_updates(0)
+
+        mock_connection.assert_called_once()
+        assert mock_connection.return_value.request.call_count == 2
+
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_retries_once_when_a_kept_alive_connection_was_dropped(self, mock_connection):
+        dropped = make_connection([])
+        fresh = make_connection([{"update_id": 1, "message": {"chat": {"id": 456}, "text": "hi"}}])
+        mock_connection.side_effect = [dropped, fresh]
+        poller = make_poller()
+        poller.get_updates(0)
+        dropped.request.side_effect = http.client.RemoteDisconnected()
+
+        updates = poller.get_updates(0)
+
+        assert [u.text for u in updates] == ["hi"]
+        dropped.close.assert_called_once_with()
+
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_acknowledges_skipped_updates_with_the_batch(self, mock_connection):
+        mock_connection.return_value = make_connection(
+            [{"update_id": 7, "message": {"chat": {"id": 456}}}]
+        )
+        poller = make_poller()
+
+        assert poller.get_updates(0) == []
+        poller.get_updates(0)
+
+        _, target = mock_connection.return_value.request.call_args[0]
+        assert "offset=8" in target
+
+    @patch("pryces.infrastructure.receivers.http.client.HTTPSConnection")
+    def test_requests_the_configured_limit(self, mock_connection):
+        mock_connection.return_value = make_connection([])
+        poller = TelegramUpdatePoller(
+            TelegramSettings(bot_token="test-token", group_id="123"), Mock(), limit=25
+        )
+
+        poller.get_updates(0)
+
+        _, target = mock_connection.return_value.request.call_args[0]
+        assert "limit=25" in target
+
+    def test_rejects_a_limit_telegram_does_not_accept(self):
+        with pytest.raises(ValueError, match="limit"):
+            TelegramUpdatePoller(
+                TelegramSettings(bot_token="test-token", group_id="123"), Mock(), limit=101
+            )
+
+
+def post(receiver: TelegramWebhookReceiver, body, path="/telegram", secret=None) -> int:
+    host, port = receiver.address
+    headers = {"Content-Type": "application/json"}
+    if secret is not None:
+        headers["X-Telegram-Bot-Api-Secret-Token"] = secret
+    data = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+    request = urllib.request.Request(f"http://{host}:{port}{path}", data=data, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def post_raw(receiver: TelegramWebhookReceiver, headers: dict[str, str]) -> int:
+    # Sends the request line and headers only, with whatever Content-Length the test gives.
+    host, port = receiver.address
+    connection = http.client.HTTPConnection(host, port, timeout=5)
+    try:
+        connection.putrequest("POST", "/telegram", skip_accept_encoding=True)
+        for name, value in headers.items():
+            connection.putheader(name, value)
+        connection.endheaders()
+        return connection.getresponse().status
+    finally:
+        connection.close()
+
+
+def update(update_id: int, text: str = "/help", chat_id: int = 456) -> dict:
+    return {"update_id": update_id, "message": {"chat": {"id": chat_id}, "text": text}}
+
+
+class TestTelegramWebhookReceiver:
+
+    @pytest.fixture
+    def make_receiver(self):
+        receivers = []
+
+        def make(**overrides) -> TelegramWebhookReceiver:
+            settings = TelegramSettings(bot_token="test-token", group_id="123")
+            webhook = WebhookSettings(host="127.0.0.1", port=0, **overrides)
+            receiver = TelegramWebhookReceiver(settings, webhook, Mock(), wait=0.05)
+            receiver.start()
+            receivers.append(receiver)
+            return receiver
+
+        yield make
+        for receiver in receivers:
+            receiver.close()
+
+    def test_returns_posted_updates_in_order(self, make_receiver):
+        receiver = make_receiver()
+
+        assert post(receiver, update(1, "/help")) == 200
+        assert post(receiver, update(2, "/symbols", chat_id=-100)) == 200
+
+        assert receiver.get_updates(0) == [
+            BotUpdate(update_id=1, chat_id="456", text="/help"),
+            BotUpdate(update_id=2, chat_id="-100", text="/symbols"),
+        ]
+
+    def test_returns_empty_list_when_nothing_arrives(self, make_receiver):
+        assert make_receiver().get_updates(0) == []
+
+    def test_drops_redelivered_updates(self, make_receiver):
+        receiver = make_receiver()
+        post(receiver, update(1))
+        receiver.get_updates(0)
+
+        assert post(receiver, update(1)) == 200
+        assert post(receiver, update(2)) == 200
+
+        assert [u.update_id for u in receiver.get_updates(2)] == [2]
+
+    def test_keeps_a_lower_update_that_arrives_late(self, make_receiver):
+        receiver = make_receiver()
+        post(receiver, update(2))
+        receiver.get_updates(0)
+
+        post(receiver, update(1))
+
+        assert [u.update_id for u in receiver.get_updates(3)] == [1]
+
+    def test_acknowledges_updates_without_text_without_queueing_them(self, make_receiver):
+        receiver = make_receiver()
+
+        assert post(receiver, {"update_id": 1, "edited_message": {}}) == 200
+
+        assert receiver.get_updates(0) == []
+
+    def test_rejects_a_wrong_secret_token(self, make_receiver):
+        receiver = make_receiver(secret_token="right")
+
+        assert post(receiver, update(1), secret="wrong") == 403
+        assert post(receiver, update(2)) == 403
+        assert post(receiver, update(3), secret="right") == 200
+
+        assert [u.update_id for u in receiver.get_updates(0)] == [3]
+
+    def test_rejects_unknown_paths_and_malformed_bodies(self, make_receiver):
+        receiver = make_receiver()
+
+        assert post(receiver, update(1), path="/other") == 404
+        assert post(receiver, b"not json") == 400
+        assert post(receiver, [update(1)]) == 400
+
+        assert receiver.get_updates(0) == []
+
+    def test_rejects_an_invalid_content_length(self, make_receiver):
+        receiver = make_receiver()
+
+        assert post_raw(receiver, {"Content-Length": "ten"}) == 400
+        assert post_raw(receiver, {"Content-Length": "-1"}) == 400
+
+    def test_rejects_oversized_bodies_without_reading_them(self, make_receiver):
+        receiver = make_receiver()
+
+        # No body follows the header, so the reply proves the server did not wait for it.
+        assert post_raw(receiver, {"Content-Length": str(10 * 1024 * 1024)}) == 413
+
+    def test_checks_the_secret_token_before_reading_the_body(self, make_receiver):
+        receiver = make_receiver(secret_token="right")
+
+        headers = {"Content-Length": "1000", "X-Telegram-Bot-Api-Secret-Token": "wrong"}
+        assert post_raw(receiver, headers) == 403
+
+    def test_full_queue_defers_the_update_to_a_redelivery(self, make_receiver):
+        receiver = make_receiver(max_queue_size=1)
+
+        assert post(receiver, update(1)) == 200
+        assert post(receiver, update(2)) == 503
+        receiver.get_updates(0)
+
+        assert post(receiver, update(2)) == 200
+        assert [u.update_id for u in receiver.get_updates(0)] == [2]
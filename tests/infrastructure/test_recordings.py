@@ -0,0 +1,205 @@
+import gzip
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pryces.infrastructure.exceptions import RecordingLoadingFailed
+from pryces.infrastructure.providers import (
+    ReplayStockProvider,
+    YahooFinanceProvider,
+    YahooFinanceSettings,
+)
+from pryces.infrastructure.recordings import InfoRecorder, read_recording
+
+START = datetime(2026, 1, 5, 15, 30)
+
+
+def _info(price: float, **overrides) -> dict:
+    info = {
+        "currentPrice": price,
+        "previousClose": 100.0,
+        "longName": "Test Company Inc.",
+        "currency": "USD",
+        "marketState": "REGULAR",
+        "quoteType": "EQUITY",
+    }
+    info.update(overrides)
+    return info
+
+
+def _record(path, cycles: list[dict[str, dict]], gap: timedelta = timedelta(minutes=1)):
+    times = iter(START + gap * i for i in range(len(cycles)))
+    recorder = InfoRecorder(path, clock=lambda: next(times))
+    for infos in cycles:
+        for symbol, info in infos.items():
+            recorder.record(symbol, info)
+        recorder.end_cycle()
+    recorder.close()
+
+
+class TestInfoRecorder:
+    def test_records_one_entry_per_cycle(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+
+        _record(path, [{"AAPL": _info(101.0)}, {"AAPL": _info(102.0), "MSFT": _info(300.0)}])
+
+        cycles = read_recording(path)
+        assert [c.recorded_at for c in cycles] == [START, START + timedelta(minutes=1)]
+        assert list(cycles[1].infos) == ["AAPL", "MSFT"]
+
+    def test_keeps_only_keys_used_by_the_mapper(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+
+        _record(path, [{"AAPL": _info(101.0, website="https://example.com")}])
+
+        assert "website" not in read_recording(path)[0].infos["AAPL"]
+
+    def test_keeps_metadata_only_info_untouched(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+
+        _record(path, [{"GONE": {"trailingPegRatio": None}}])
+
+        assert read_recording(path)[0].infos["GONE"] == {"trailingPegRatio": None}
+
+    def test_cycles_survive_a_recorder_that_is_never_closed(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+        recorder = InfoRecorder(path)
+        for price in (101.0, 102.0, 103.0):
+            recorder.record("AAPL", _info(price))
+            recorder.end_cycle()
+
+        cycles = read_recording(path)
+
+        assert [c.infos["AAPL"]["currentPrice"] for c in cycles] == [101.0, 102.0, 103.0]
+
+    def test_keeps_complete_cycles_before_a_truncated_tail(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+        _record(path, [{"AAPL": _info(101.0)}, {"AAPL": _info(102.0)}])
+        # A process killed while writing the third cycle.
+        member = gzip.compress(b'{"recorded_at":"2026-01-05T15:32:00","infos":{}}\n')
+        with open(path, "ab") as file:
+            file.write(member[: len(member) // 2])
+
+        assert len(read_recording(path)) == 2
+
+    def test_reading_missing_file_raises(self, tmp_path):
+        with pytest.raises(RecordingLoadingFailed):
+            read_recording(tmp_path / "missing.jsonl.gz")
+
+    def test_reading_corrupted_file_raises(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+        path.write_text("not gzip")
+
+        with pytest.raises(RecordingLoadingFailed):
+            read_recording(path)
+
+    @patch("pryces.infrastructure.providers.yf.Ticker")
+    def test_yahoo_finance_provider_records_each_cycle(self, mock_ticker, tmp_path):
+        mock_ticker.return_value.info = _info(101.0)
+        path = tmp_path / "session.jsonl.gz"
+        recorder = InfoRecorder(path)
+        provider = YahooFinanceProvider(
+            YahooFinanceSettings(max_workers=2, extra_delay_in_minutes=0),
+            logger_factory=Mock(),
+            recorder=recorder,
+        )
+
+        provider.get_stocks(["AAPL", "MSFT"])
+        provider.get_stocks(["AAPL"])
+        recorder.close()
+
+        cycles = read_recording(path)
+        assert [sorted(c.infos) for c in cycles] == [["AAPL", "MSFT"], ["AAPL"]]
+
+
+class TestReplayStockProvider:
+    def test_serves_one_recorded_cycle_per_call(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+        _record(path, [{"AAPL": _info(101.0)}, {"AAPL": _info(102.0)}])
+        provider = ReplayStockProvider(path, logger_factory=Mock())
+
+        first = provider.get_stocks(["AAPL"])
+        second = provider.get_stocks(["AAPL"])
+
+        assert first[0].current_price == Decimal("101.0")
+        assert second[0].current_price == Decimal("102.0")
+        assert provider.exhausted
+
+    def test_returns_empty_list_once_exhausted(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+        _record(path, [{"AAPL": _info(101.0)}])
+        provider = ReplayStockProvider(path, logger_factory=Mock())
+        provider.get_stocks(["AAPL"])
+
+        assert provider.get_stocks(["AAPL"]) == []
+
+    def test_serves_only_requested_symbols(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+        _record(path, [{"AAPL": _info(101.0), "MSFT": _info(300.0)}])
+        provider = ReplayStockProvider(path, logger_factory=Mock())
+
+        stocks = provider.get_stocks(["msft", "TSLA"])
+
+        assert [s.symbol for s in stocks] == ["MSFT"]
+
+    def test_symbols_lists_every_recorded_symbol(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+        _record(path, [{"MSFT": _info(300.0)}, {"AAPL": _info(101.0)}])
+
+        assert ReplayStockProvider(path, logger_factory=Mock()).symbols == ["AAPL", "MSFT"]
+
+    def test_unthrottled_replay_never_sleeps(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+        _record(path, [{"AAPL": _info(101.0)}, {"AAPL": _info(102.0)}])
+        sleep = Mock()
+        provider = ReplayStockProvider(path, logger_factory=Mock(), speed=0, sleep=sleep)
+
+        provider.get_stocks(["AAPL"])
+        provider.get_stocks(["AAPL"])
+
+        sleep.assert_not_called()
+
+    def test_speed_scales_recorded_gaps(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+        _record(path, [{"AAPL": _info(101.0)}, {"AAPL": _info(102.0)}])
+        sleep = Mock()
+        provider = ReplayStockProvider(path, logger_factory=Mock(), speed=4, sleep=sleep)
+
+        provider.get_stocks(["AAPL"])
+        provider.get_stocks(["AAPL"])
+
+        sleep.assert_called_once_with(15.0)
+
+    def test_clock_follows_recorded_time(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+        _record(path, [{"AAPL": _info(101.0)}, {"AAPL": _info(102.0)}])
+        provider = ReplayStockProvider(path, logger_factory=Mock())
+
+        provider.get_stocks(["AAPL"])
+        provider.get_stocks(["AAPL"])
+
+        assert provider.clock() == START + timedelta(minutes=1)
+
+    def test_quotes_are_full_for_unknown_symbols_and_deltas_after(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+        _record(path, [{"AAPL": _info(101.0)}, {"AAPL": _info(102.0)}])
+        provider = ReplayStockProvider(path, logger_factory=Mock())
+
+        [first] = provider.get_quotes(["AAPL"], set())
+        [second] = provider.get_quotes(["AAPL"], {"AAPL"})
+
+        assert first.full
+        assert second.changes == {"current_price": Decimal("102.0")}
+
+    def test_quotes_restart_in_full_when_the_symbol_is_no_longer_known(self, tmp_path):
+        path = tmp_path / "session.jsonl.gz"
+        _record(path, [{"AAPL": _info(101.0)}, {"AAPL": _info(101.0)}])
+        provider = ReplayStockProvider(path, logger_factory=Mock())
+        provider.get_quotes(["AAPL"], set())
+
+        [quote] = provider.get_quotes(["AAPL"], set())
+
+        assert quote.full
+        assert quote.changes["current_price"] == Decimal("101.0")
@@ -1,5 +1,12 @@
-from pryces.infrastructure.repositories import InMemoryStockRepository
-from tests.fixtures.factories import create_stock
+import sqlite3
+from dataclasses import replace
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from pryces.infrastructure.repositories import InMemoryStockRepository, SqliteStockRepository
+from tests.fixtures.factories import create_stock, generate_and_drain, open_stock_after_burn
 
 
 class TestInMemoryStockRepository:
@@ -41,3 +48,112 @@ class TestInMemoryStockRepository:
         repo.save_batch([create_stock("AAPL")])
 
         assert repo.get("MSFT") is None
+
+    def test_delete_batch_removes_stocks(self):
+        repo = InMemoryStockRepository()
+        repo.save_batch([create_stock("AAPL"), create_stock("MSFT")])
+
+        repo.delete_batch(["AAPL", "TSLA"])
+
+        assert repo.get("AAPL") is None
+        assert repo.get("MSFT") is not None
+
+
+class TestSqliteStockRepository:
+    @pytest.fixture
+    def path(self, tmp_path):
+        return tmp_path / "state" / "monitor.db"
+
+    def _open(self, path, session="portfolio@2024-01-01") -> SqliteStockRepository:
+        return SqliteStockRepository(path, session)
+
+    def test_get_returns_saved_stock_instance(self, path):
+        repo = self._open(path)
+        stock = create_stock("AAPL")
+
+        repo.save_batch([stock])
+
+        assert repo.get("AAPL") is stock
+        repo.close()
+
+    def test_restart_in_same_session_restores_state(self, path):
+        repo = self._open(path)
+        stock = open_stock_after_burn(current_price="150.00", previous_close_price="140.00")
+        stock.sync_targets([Decimal("160")])
+        repo.save_batch([stock])
+        repo.close()
+
+        restored_repo = self._open(path)
+        restored = restored_repo.get("AAPL")
+
+        assert restored_repo.restored_symbols == ["AAPL"]
+        state, expected = restored.export_state(), stock.export_state()
+        assert replace(state, notifications=()) == replace(expected, notifications=())
+        assert [(n.type, n.message) for n in state.notifications] == [
+            (n.type, n.message) for n in expected.notifications
+        ]
+        assert generate_and_drain(restored) == []
+        restored_repo.close()
+
+    def test_restart_in_other_session_starts_cold(self, path):
+        repo = self._open(path)
+        repo.save_batch([create_stock("AAPL")])
+        repo.close()
+
+        next_day = self._open(path, session="portfolio@2024-01-02")
+        assert next_day.get("AAPL") is None
+        next_day.close()
+
+        same_day_again = self._open(path)
+        assert same_day_again.get("AAPL") is None
+        same_day_again.close()
+
+    def test_only_changed_stocks_are_written(self, path):
+        repo = self._open(path)
+        aapl = create_stock("AAPL")
+        msft = create_stock("MSFT")
+        repo.save_batch([aapl, msft])
+        aapl.update(create_stock("AAPL", Decimal("151.00")))
+
+        with patch.object(repo, "_connection", wraps=repo._connection) as connection:
+            repo.save_batch([aapl, msft])
+
+        rows = connection.executemany.call_args.args[1]
+        assert [symbol for symbol, _ in rows] == ["AAPL"]
+        repo.close()
+
+    def test_unchanged_batch_does_not_touch_database(self, path):
+        repo = self._open(path)
+        stock = create_stock("AAPL")
+        repo.save_batch([stock])
+
+        with patch.object(repo, "_connection", wraps=repo._connection) as connection:
+            repo.save_batch([stock])
+
+        connection.execute.assert_not_called()
+        connection.executemany.assert_not_called()
+        repo.close()
+
+    def test_delete_batch_removes_stocks_from_checkpoint(self, path):
+        repo = self._open(path)
+        repo.save_batch([create_stock("AAPL"), create_stock("MSFT")])
+
+        repo.delete_batch(["AAPL", "TSLA"])
+        repo.close()
+
+        restored = self._open(path)
+        assert restored.get("AAPL") is None
+        assert restored.get("MSFT") is not None
+        restored.close()
+
+    def test_unreadable_rows_are_skipped(self, path):
+        repo = self._open(path)
+        repo.save_batch([create_stock("AAPL"), create_stock("MSFT")])
+        repo.close()
+        with sqlite3.connect(path) as connection:
+            connection.execute("UPDATE stocks SET state = '{}' WHERE symbol = 'AAPL'")
+
+        restored = self._open(path)
+
+        assert restored.restored_symbols == ["MSFT"]
+        restored.close()
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, Mock, call, patch
 import pytest
 
 from pryces.application.exceptions import MessageSendingFailed
+from pryces.domain.notifications import NotificationPriority
 from pryces.infrastructure.logging import PythonLoggerFactory
 from pryces.infrastructure.senders import RetryMessageSender, RetrySettings
 
@@ -29,7 +30,15 @@ class TestRetryMessageSender:
         result = sender.send_message("hello")
 
         assert result is True
-        inner.send_message.assert_called_once_with("hello")
+        inner.send_message.assert_called_once_with("hello", NotificationPriority.NORMAL, None)
+
+    def test_priority_and_key_are_passed_to_inner(self):
+        sender, inner = _make_sender()
+        inner.send_message.return_value = True
+
+        sender.send_message("hello", NotificationPriority.CRITICAL, "AAPL")
+
+        inner.send_message.assert_called_once_with("hello", NotificationPriority.CRITICAL, "AAPL")
 
     def test_non_retryable_failure_raises_immediately(self):
         sender, inner = _make_sender()
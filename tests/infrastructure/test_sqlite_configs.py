@@ -0,0 +1,320 @@
+import json
+import sqlite3
+import threading
+from dataclasses import replace
+from decimal import Decimal
+
+import pytest
+
+from pryces.infrastructure.configs import MonitorStocksConfig, SymbolConfig
+from pryces.infrastructure.exceptions import ConfigLoadingFailed
+from pryces.infrastructure.sqlite_configs import (
+    SqliteConfigDatabase,
+    SqliteConfigManager,
+    SqliteConfigStore,
+    is_database_locator,
+)
+
+
+def make_config(interval: int = 30, **symbols: list[str]) -> MonitorStocksConfig:
+    if not symbols:
+        symbols = {"AAPL": ["150", "200.5"], "MSFT": []}
+    return MonitorStocksConfig(
+        interval=interval,
+        symbols=[SymbolConfig(s, [Decimal(p) for p in prices]) for s, prices in symbols.items()],
+    )
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = SqliteConfigDatabase(tmp_path / "pryces.db")
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def store(database):
+    return SqliteConfigStore(database)
+
+
+def make_manager(database, name="portfolio", config=None) -> SqliteConfigManager:
+    manager = SqliteConfigManager(database, name)
+    manager.write_monitor_stocks_config(config or make_config())
+    return manager
+
+
+class TestSqliteConfigManager:
+
+    def test_round_trips_config(self, database):
+        manager = make_manager(database)
+
+        assert manager.read_monitor_stocks_config() == make_config()
+
+    def test_write_replaces_existing_config(self, database):
+        manager = make_manager(database)
+
+        manager.write_monitor_stocks_config(make_config(interval=60, TSLA=["10"]))
+
+        assert manager.read_monitor_stocks_config() == make_config(interval=60, TSLA=["10"])
+
+    def test_round_trips_rules(self, database):
+        config = replace(make_config(), rules=("market_open", "close_to_sma200"))
+        manager = make_manager(database, config=config)
+
+        assert manager.read_monitor_stocks_config() == config
+
+        manager.write_monitor_stocks_config(make_config())
+
+        assert manager.read_monitor_stocks_config().rules is None
+
+    def test_adds_rules_column_to_existing_databases(self, tmp_path):
+        path = tmp_path / "old.db"
+        connection = sqlite3.connect(path)
+        connection.executescript(
+            "CREATE TABLE configs (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, "
+            "interval INTEGER NOT NULL, seq INTEGER NOT NULL);"
+            "INSERT INTO configs (name, interval, seq) VALUES ('portfolio', 30, 0);"
+        )
+        connection.close()
+        database = SqliteConfigDatabase(path)
+        manager = make_manager(database, config=replace(make_config(), rules=("market_open",)))
+
+        assert manager.read_monitor_stocks_config().rules == ("market_open",)
+        database.close()
+
+    def test_read_unknown_config_raises(self, database):
+        with pytest.raises(ConfigLoadingFailed):
+            SqliteConfigManager(database, "missing").read_monitor_stocks_config()
+
+    def test_signature_is_none_for_unknown_config(self, database):
+        assert SqliteConfigManager(database, "missing").signature() is None
+
+    def test_signature_changes_on_every_mutation(self, database):
+        manager = make_manager(database)
+        signatures = [manager.signature()]
+
+        manager.replace_symbol_prices("MSFT", [Decimal("300")])
+        signatures.append(manager.signature())
+        manager.add_symbol("TSLA")
+        signatures.append(manager.signature())
+        manager.remove_symbol("TSLA")
+        signatures.append(manager.signature())
+
+        assert len(set(signatures)) == 4
+
+    def test_signature_ignores_changes_to_other_configs(self, database):
+        manager = make_manager(database, "a")
+        other = make_manager(database, "b")
+        before = manager.signature()
+
+        other.add_symbol("TSLA")
+
+        assert manager.signature() == before
+
+    def test_replace_symbol_prices_only_touches_that_symbol(self, database):
+        manager = make_manager(database)
+
+        manager.replace_symbol_prices("MSFT", [Decimal("300"), Decimal("310")])
+
+        assert manager.read_monitor_stocks_config() == make_config(
+            AAPL=["150", "200.5"], MSFT=["300", "310"]
+        )
+
+    def test_remove_targets_matches_numerically_equal_prices(self, database):
+        manager = make_manager(database)
+
+        removed = manager.remove_targets({("AAPL", Decimal("150.00"))})
+
+        assert removed is True
+        assert manager.read_monitor_stocks_config() == make_config(AAPL=["200.5"], MSFT=[])
+
+    def test_remove_targets_reports_when_nothing_matched(self, database):
+        manager = make_manager(database)
+        before = manager.signature()
+
+        assert manager.remove_targets({("AAPL", Decimal("999"))}) is False
+        assert manager.signature() == before
+
+    def test_add_symbol_appends_at_the_end(self, database):
+        manager = make_manager(database)
+
+        manager.add_symbol("TSLA")
+
+        symbols = manager.read_monitor_stocks_config().symbols
+        assert [s.symbol for s in symbols] == ["AAPL", "MSFT", "TSLA"]
+
+    def test_remove_symbol_drops_its_targets(self, database):
+        manager = make_manager(database)
+
+        manager.remove_symbol("AAPL")
+        manager.add_symbol("AAPL")
+
+        assert manager.read_monitor_stocks_config() == make_config(MSFT=[], AAPL=[])
+
+    def test_add_target_inserts_single_row(self, database):
+        manager = make_manager(database, config=make_config(AAPL=["150"], MSFT=[]))
+
+        assert manager.add_target("AAPL", Decimal("200")) is True
+        assert manager.add_target("AAPL", Decimal("200.0")) is False
+        assert manager.add_target("GOOGL", Decimal("10")) is False
+        assert manager.read_monitor_stocks_config() == make_config(AAPL=["150", "200"], MSFT=[])
+
+    def test_batch_commits_once(self, database):
+        manager = make_manager(database, config=make_config(AAPL=["150"], MSFT=[]))
+        before = manager.signature()
+
+        with manager.batch():
+            manager.remove_target("AAPL", Decimal("150"))
+            manager.add_target("MSFT", Decimal("300"))
+            manager.add_symbol("GOOGL")
+
+        assert manager.read_monitor_stocks_config() == make_config(AAPL=[], MSFT=["300"], GOOGL=[])
+        assert manager.signature()[1] > before[1]
+
+    def test_batch_rolls_back_on_error(self, database):
+        manager = make_manager(database, config=make_config(AAPL=["150"], MSFT=[]))
+
+        with pytest.raises(RuntimeError):
+            with manager.batch():
+                manager.remove_symbol("MSFT")
+                raise RuntimeError("boom")
+
+        assert manager.read_monitor_stocks_config() == make_config(AAPL=["150"], MSFT=[])
+
+    def test_remove_last_symbol_raises(self, database):
+        manager = make_manager(database, config=make_config(AAPL=[]))
+
+        with pytest.raises(ValueError):
+            manager.remove_symbol("AAPL")
+
+    def test_concurrent_row_level_updates_are_not_lost(self, database):
+        manager = make_manager(database, config=make_config(AAPL=[], MSFT=[]))
+
+        def add_targets(symbol: str) -> None:
+            for i in range(20):
+                prices = manager.read_monitor_stocks_config().symbols
+                current = next(s.prices for s in prices if s.symbol == symbol)
+                manager.replace_symbol_prices(symbol, current + [Decimal(i + 1)])
+
+        threads = [threading.Thread(target=add_targets, args=(s,)) for s in ("AAPL", "MSFT")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        config = manager.read_monitor_stocks_config()
+        assert [len(s.prices) for s in config.symbols] == [20, 20]
+
+
+class TestSqliteConfigStore:
+
+    def test_list_paths_addresses_configs_inside_database(self, store, database):
+        make_manager(database, "b")
+        make_manager(database, "a")
+
+        assert store.list_paths() == [database.path / "a", database.path / "b"]
+        assert store.list_names() == ["a", "b"]
+
+    def test_find_for_symbol_returns_first_config_alphabetically(self, store, database):
+        make_manager(database, "b", make_config(AAPL=["1"]))
+        make_manager(database, "a", make_config(MSFT=[]))
+        make_manager(database, "c", make_config(AAPL=["2"]))
+
+        path, config = store.find_for_symbol("aapl")
+
+        assert path.name == "b"
+        assert config == make_config(AAPL=["1"])
+
+    def test_find_for_symbol_returns_none_when_untracked(self, store, database):
+        make_manager(database)
+
+        assert store.find_for_symbol("TSLA") is None
+
+    def test_find_by_name(self, store, database):
+        make_manager(database)
+
+        assert store.find_by_name("portfolio")[1] == make_config()
+        assert store.find_by_name("missing") is None
+
+    def test_open_returns_manager_for_path(self, store, database):
+        make_manager(database)
+        path, _ = store.find_by_name("portfolio")
+
+        store.open(path).add_symbol("TSLA")
+
+        assert store.list_tracked_symbols() == ["AAPL", "MSFT", "TSLA"]
+
+    def test_list_tracked_symbols_with_targets_first_config_wins(self, store, database):
+        make_manager(database, "a", make_config(AAPL=["100"], MSFT=[]))
+        make_manager(database, "b", make_config(AAPL=["200"], TSLA=["5", "6"]))
+
+        assert store.list_tracked_symbols_with_targets() == [
+            ("AAPL", [Decimal("100")]),
+            ("MSFT", []),
+            ("TSLA", [Decimal("5"), Decimal("6")]),
+        ]
+
+    def test_validate_name_rejects_existing_config(self, store, database):
+        make_manager(database)
+
+        assert "already exists" in store.validate_name("portfolio")
+        assert store.validate_name("other") is None
+
+    def test_create_and_delete(self, store):
+        path = store.create("portfolio", make_config())
+
+        store.delete_by_path(path)
+
+        assert store.list_paths() == []
+        assert store.list_tracked_symbols() == []
+
+    def test_import_json_can_be_repeated(self, store, tmp_path):
+        json_path = tmp_path / "portfolio.json"
+        json_path.write_text(
+            json.dumps({"interval": 30, "symbols": [{"symbol": "AAPL", "prices": [150]}]})
+        )
+
+        store.import_json(json_path)
+        path = store.import_json(json_path)
+
+        assert store.list_names() == ["portfolio"]
+        assert store.open(path).read_monitor_stocks_config() == make_config(AAPL=["150"])
+
+    def test_change_sequence_advances_with_every_write(self, store, database):
+        before = database.change_sequence()
+
+        store.create("portfolio", make_config())
+        store.open(database.path / "portfolio").add_symbol("TSLA")
+
+        assert database.change_sequence() == before + 2
+
+
+class TestSqliteConfigDatabase:
+
+    def test_close_closes_the_connections_of_every_thread(self, database):
+        opened = []
+        thread = threading.Thread(target=lambda: opened.append(database.connection()))
+        thread.start()
+        thread.join()
+        own = database.connection()
+
+        database.close()
+
+        for connection in (opened[0], own):
+            with pytest.raises(sqlite3.ProgrammingError):
+                connection.execute("SELECT 1")
+
+    def test_reopens_a_connection_after_close(self, database):
+        database.connection()
+        database.close()
+
+        assert database.change_sequence() == 0
+
+
+class TestIsDatabaseLocator:
+
+    def test_path_inside_database_file_is_a_locator(self, tmp_path):
+        assert is_database_locator(tmp_path / "pryces.db" / "portfolio")
+
+    def test_json_path_is_not_a_locator(self, tmp_path):
+        assert not is_database_locator(tmp_path / "configs" / "portfolio.json")
@@ -0,0 +1,194 @@
+import os
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pryces.application.interfaces import StockProvider, StockStatisticsProvider
+from pryces.domain.stock_statistics import StatisticsPeriod, StockStatistics
+from pryces.domain.stocks import Currency, MarketState, Stock
+from pryces.infrastructure.providers import YahooFinanceSettings
+from pryces.infrastructure.statistics_snapshots import (
+    ClosingHistory,
+    ClosingHistoryDownloader,
+    SnapshotStockStatisticsProvider,
+    StatisticsSnapshotStore,
+)
+
+_NOW = datetime(2024, 6, 14, 23, 0)
+
+
+def _frame(end: date = _NOW.date(), days_back: int = 400, tz: str | None = None) -> pd.DataFrame:
+    days = pd.date_range(end=end, periods=days_back, freq="B", tz=tz)
+    closes = [100.0 + i * 0.25 for i in range(len(days))]
+    closes[-3] = float("nan")
+    return pd.DataFrame({"Close": closes}, index=days)
+
+
+def _history(symbol: str = "AAPL", end: date = _NOW.date()) -> ClosingHistory:
+    frame = _frame(end)
+    return ClosingHistory(
+        symbol=symbol,
+        name=f"{symbol} Inc.",
+        currency=Currency.USD,
+        days=frame.index.values.astype("datetime64[D]"),
+        closes=frame["Close"].to_numpy(),
+    )
+
+
+def _closes(stats: StockStatistics) -> dict[StatisticsPeriod, Decimal]:
+    return {change.period: change.close_price for change in stats.price_changes}
+
+
+class TestClosingHistory:
+    def test_matches_the_statistics_mapper_on_the_same_history(self, statistics_mapper):
+        frame = _frame(tz="America/New_York")
+        info = {"longName": "AAPL Inc.", "currency": "USD", "quoteType": "EQUITY", "x": 1}
+        downloader = ClosingHistoryDownloader(
+            YahooFinanceSettings(max_workers=1, extra_delay_in_minutes=0),
+            Mock(),
+            download=lambda symbol, start: (info, frame),
+        )
+
+        [history] = downloader.download(["aapl"])
+        expected = statistics_mapper.map("AAPL", info, frame)
+        stats = history.statistics()
+
+        assert stats.symbol == expected.symbol == "AAPL"
+        assert stats.current_price == expected.current_price
+        assert stats.name == expected.name
+        assert stats.currency == expected.currency
+        assert _closes(stats) == _closes(expected)
+
+    def test_live_trading_date_moves_the_periods_forward(self):
+        history = _history(end=date(2024, 6, 14))
+
+        stats = history.statistics(Decimal("300"), trading_date=date(2024, 6, 17))
+
+        assert stats.current_price == Decimal("300")
+        assert _closes(stats)[StatisticsPeriod.ONE_DAY] == Decimal(str(history.closes[-1]))
+
+    def test_returns_none_when_the_last_close_is_missing(self):
+        closes = _history().closes.copy()
+        closes[-1] = np.nan
+
+        assert replace(_history(), closes=closes).statistics() is None
+
+
+class TestStatisticsSnapshotStore:
+    def test_round_trips_histories(self, tmp_path):
+        store = StatisticsSnapshotStore(tmp_path / "statistics.npz", clock=lambda: _NOW)
+        anonymous = ClosingHistory("XYZ", None, None, _history().days, _history().closes)
+
+        store.write([_history("AAPL"), anonymous])
+        snapshot = store.read()
+
+        assert snapshot.created_at == _NOW
+        assert list(snapshot.histories) == ["AAPL", "XYZ"]
+        aapl = snapshot.histories["AAPL"]
+        assert (aapl.name, aapl.currency) == ("AAPL Inc.", Currency.USD)
+        np.testing.assert_array_equal(aapl.days, _history().days)
+        np.testing.assert_array_equal(aapl.closes, _history().closes)
+        assert (snapshot.histories["XYZ"].name, snapshot.histories["XYZ"].currency) == (None, None)
+
+    def test_missing_or_corrupt_file_reads_as_none(self, tmp_path):
+        path = tmp_path / "statistics.npz"
+        assert StatisticsSnapshotStore(path).read() is None
+
+        path.write_bytes(b"not a snapshot")
+
+        assert StatisticsSnapshotStore(path).read() is None
+
+
+class TestSnapshotStockStatisticsProvider:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.now = _NOW
+        self.store = StatisticsSnapshotStore(tmp_path / "statistics.npz", clock=lambda: _NOW)
+        self.store.write([_history("AAPL"), _history("MSFT")])
+        self.fallback = Mock(spec=StockStatisticsProvider)
+        self.fallback.get_stock_statistics.side_effect = lambda symbols: [
+            StockStatistics(symbol=s, current_price=Decimal("1"), historical_closes=[])
+            for s in symbols
+        ]
+        self.stocks = Mock(spec=StockProvider)
+        self.stocks.get_stocks.return_value = []
+
+    def _provider(self, stock_provider=None) -> SnapshotStockStatisticsProvider:
+        return SnapshotStockStatisticsProvider(
+            self.store,
+            self.fallback,
+            Mock(),
+            stock_provider=stock_provider,
+            clock=lambda: self.now,
+        )
+
+    def test_serves_snapshot_symbols_without_the_fallback(self):
+        result = self._provider().get_stock_statistics(["aapl", "MSFT"])
+
+        assert [stats.symbol for stats in result] == ["AAPL", "MSFT"]
+        self.fallback.get_stock_statistics.assert_not_called()
+
+    def test_missing_symbols_go_to_the_fallback(self):
+        result = self._provider().get_stock_statistics(["AAPL", "TSLA"])
+
+        assert [stats.symbol for stats in result] == ["AAPL", "TSLA"]
+        self.fallback.get_stock_statistics.assert_called_once_with(["TSLA"])
+
+    def test_snapshot_covering_the_last_session_is_fresh_over_the_weekend(self):
+        self.now = datetime(2024, 6, 17, 9, 0)
+
+        self._provider().get_stock_statistics(["AAPL"])
+
+        self.fallback.get_stock_statistics.assert_not_called()
+
+    def test_snapshot_missing_a_session_goes_to_the_fallback(self):
+        # Monday's snapshot used on Wednesday would compute 1D against Monday's close.
+        self.store.write([_history("AAPL", end=date(2024, 6, 17)), _history("MSFT")])
+        self.now = datetime(2024, 6, 19, 11, 0)
+        self.stocks.get_stocks.return_value = [
+            Stock(symbol="AAPL", current_price=Decimal("250"), market_state=MarketState.OPEN)
+        ]
+
+        self._provider(self.stocks).get_stock_statistics(["AAPL"])
+
+        self.fallback.get_stock_statistics.assert_called_once_with(["AAPL"])
+
+    def test_refreshes_only_the_current_price(self):
+        self.stocks.get_stocks.return_value = [
+            Stock(symbol="AAPL", current_price=Decimal("250"), market_state=MarketState.CLOSED)
+        ]
+
+        [stats] = self._provider(self.stocks).get_stock_statistics(["AAPL"])
+
+        self.stocks.get_stocks.assert_called_once_with(["AAPL"])
+        assert stats.current_price == Decimal("250")
+        assert _closes(stats) == _closes(_history().statistics())
+
+    def test_session_after_the_snapshot_moves_the_periods_to_today(self):
+        self.now = datetime(2024, 6, 17, 11, 0)
+        self.stocks.get_stocks.return_value = [
+            Stock(symbol="AAPL", current_price=Decimal("250"), market_state=MarketState.OPEN)
+        ]
+
+        [stats] = self._provider(self.stocks).get_stock_statistics(["AAPL"])
+
+        assert _closes(stats)[StatisticsPeriod.ONE_DAY] == Decimal(str(_history().closes[-1]))
+
+    def test_reloads_a_rewritten_snapshot(self):
+        provider = self._provider()
+        provider.get_stock_statistics(["AAPL"])
+        self.store.write([_history("TSLA")])
+        # Ensure the rewrite is seen even on filesystems with coarse timestamps.
+        stat = self.store.path.stat()
+        os.utime(self.store.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        result = provider.get_stock_statistics(["TSLA"])
+
+        assert [stats.symbol for stats in result] == ["TSLA"]
+        self.fallback.get_stock_statistics.assert_not_called()
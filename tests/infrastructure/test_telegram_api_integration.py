@@ -0,0 +1,136 @@
+import socket
+from unittest.mock import Mock
+
+import pytest
+
+from pryces.application.exceptions import MessageSendingFailed
+from pryces.infrastructure.receivers import (
+    BotUpdate,
+    TelegramUpdatePoller,
+    TelegramWebhookReceiver,
+    WebhookSettings,
+)
+from pryces.infrastructure.senders import (
+    FireAndForgetMessageSender,
+    FireAndForgetSettings,
+    RetryMessageSender,
+    RetrySettings,
+    TelegramMessageSender,
+    TelegramSettings,
+)
+from pryces.testing import FakeTelegramServer, FakeTelegramSettings
+
+
+def make_settings(server: FakeTelegramServer) -> TelegramSettings:
+    return TelegramSettings(bot_token="test-token", group_id="123", api_base_url=server.base_url)
+
+
+class TestTelegramApiIntegration:
+    def test_sender_delivers_message_to_server(self):
+        with FakeTelegramServer() as server:
+            sender = TelegramMessageSender(make_settings(server), logger_factory=Mock())
+
+            assert sender.send_message("hello") is True
+
+            assert [(m.chat_id, m.text) for m in server.messages] == [("123", "hello")]
+
+    def test_rate_limited_response_is_retryable(self):
+        with FakeTelegramServer(FakeTelegramSettings(rate_limit_every=1)) as server:
+            sender = TelegramMessageSender(make_settings(server), logger_factory=Mock())
+
+            with pytest.raises(MessageSendingFailed) as exc_info:
+                sender.send_message("hello")
+
+            assert exc_info.value.retryable is True
+            assert "retry_after" in str(exc_info.value)
+
+    def test_retry_sender_recovers_from_server_errors(self):
+        with FakeTelegramServer(FakeTelegramSettings(server_error_every=2)) as server:
+            inner = TelegramMessageSender(make_settings(server), logger_factory=Mock())
+            sender = RetryMessageSender(
+                inner,
+                RetrySettings(max_retries=2, base_delay=0, backoff_factor=1),
+                logger_factory=Mock(),
+            )
+
+            for i in range(3):
+                sender.send_message(f"msg-{i}")
+
+            assert [m.text for m in server.messages] == ["msg-0", "msg-1", "msg-2"]
+            assert server.send_calls == 5
+
+    def test_full_chain_delivers_every_message(self):
+        with FakeTelegramServer() as server:
+            telegram = TelegramMessageSender(make_settings(server), logger_factory=Mock())
+            retry = RetryMessageSender(
+                telegram,
+                RetrySettings(max_retries=1, base_delay=0, backoff_factor=1),
+                logger_factory=Mock(),
+            )
+            sender = FireAndForgetMessageSender(
+                retry, logger_factory=Mock(), settings=FireAndForgetSettings(workers=4)
+            )
+
+            for i in range(50):
+                sender.send_message(f"msg-{i}", key=f"K{i % 5}")
+            sender.shutdown()
+
+            assert len(server.messages) == 50
+
+    def test_poller_receives_pushed_update(self):
+        with FakeTelegramServer() as server:
+            server.push_update(456, "/help")
+            poller = TelegramUpdatePoller(make_settings(server), logger_factory=Mock())
+
+            updates = poller.get_updates(0)
+
+            assert updates == [BotUpdate(update_id=1, chat_id="456", text="/help")]
+
+    def test_poller_offset_acknowledges_previous_updates(self):
+        with FakeTelegramServer() as server:
+            server.push_update(456, "/help")
+            server.push_update(456, "/stats")
+            poller = TelegramUpdatePoller(make_settings(server), logger_factory=Mock())
+
+            updates = poller.get_updates(2)
+
+            assert [u.text for u in updates] == ["/stats"]
+
+    def test_poller_drains_a_burst_in_limit_sized_batches(self):
+        with FakeTelegramServer() as server:
+            for i in range(250):
+                server.push_update(456, f"/stats SYM{i}")
+            poller = TelegramUpdatePoller(make_settings(server), logger_factory=Mock())
+
+            batches = [poller.get_updates(0) for _ in range(3)]
+            poller.close()
+
+            assert [len(batch) for batch in batches] == [100, 100, 50]
+            assert batches[-1][-1].update_id == 250
+
+    def test_webhook_receiver_registers_and_gets_pushed_updates(self):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        with FakeTelegramServer() as server:
+            receiver = TelegramWebhookReceiver(
+                make_settings(server),
+                WebhookSettings(
+                    host="127.0.0.1",
+                    port=port,
+                    public_url=f"http://127.0.0.1:{port}/telegram",
+                    secret_token="s3cret",
+                ),
+                logger_factory=Mock(),
+            )
+            receiver.start()
+            try:
+                assert server.webhook["secret_token"] == "s3cret"
+
+                assert server.push_update(456, "/help") == 200
+                updates = receiver.get_updates(0)
+            finally:
+                receiver.close()
+
+            assert updates == [BotUpdate(update_id=1, chat_id="456", text="/help")]
+            assert server.webhook is None
@@ -0,0 +1,150 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+
+from pryces.domain.stocks import MarketState
+from pryces.infrastructure.ticks import MARKET_STATE_CODES, TickStore, TickWriter
+from tests.fixtures.factories import create_stock
+
+_MORNING = datetime(2024, 1, 2, 10, 0, 0)
+_NOON = datetime(2024, 1, 2, 12, 0, 0)
+_NEXT_DAY = datetime(2024, 1, 3, 10, 0, 0)
+
+
+class TestTickWriter:
+    def test_buffers_rows_until_flushed(self, tmp_path):
+        writer = TickWriter(tmp_path)
+
+        writer.record([create_stock("AAPL")], _MORNING)
+
+        assert len(TickStore(tmp_path).read(date(2024, 1, 2), "AAPL")) == 0
+        writer.close()
+        assert len(TickStore(tmp_path).read(date(2024, 1, 2), "AAPL")) == 1
+
+    def test_flushes_when_buffer_is_full(self, tmp_path):
+        writer = TickWriter(tmp_path, buffer_rows=2)
+
+        writer.record([create_stock("AAPL"), create_stock("MSFT")], _MORNING)
+
+        assert TickStore(tmp_path).symbols(date(2024, 1, 2)) == ["AAPL", "MSFT"]
+
+    def test_partitions_ticks_by_day(self, tmp_path):
+        writer = TickWriter(tmp_path)
+
+        writer.record([create_stock("AAPL")], _MORNING)
+        writer.record([create_stock("AAPL"), create_stock("MSFT")], _NEXT_DAY)
+        writer.close()
+
+        store = TickStore(tmp_path)
+        assert store.days() == [date(2024, 1, 2), date(2024, 1, 3)]
+        assert store.symbols(date(2024, 1, 2)) == ["AAPL"]
+        assert len(store.read(date(2024, 1, 3), "MSFT")) == 1
+
+    def test_appends_to_an_existing_day(self, tmp_path):
+        first = TickWriter(tmp_path)
+        first.record([create_stock("AAPL")], _MORNING)
+        first.close()
+
+        second = TickWriter(tmp_path)
+        second.record([create_stock("MSFT"), create_stock("AAPL")], _NOON)
+        second.close()
+
+        store = TickStore(tmp_path)
+        assert store.symbols(date(2024, 1, 2)) == ["AAPL", "MSFT"]
+        assert len(store.read(date(2024, 1, 2), "AAPL")) == 2
+
+    def test_restart_after_a_crash_mid_flush_keeps_rows_aligned(self, tmp_path):
+        first = TickWriter(tmp_path)
+        first.record([create_stock("AAPL", current_price=Decimal("100"))], _MORNING)
+        first.close()
+        # A flush killed after writing the first columns of two more rows, one of them cut.
+        day_dir = tmp_path / "2024-01-02"
+        with open(day_dir / "timestamp.bin", "ab") as file:
+            np.array([_MORNING.timestamp()] * 2).tofile(file)
+        with open(day_dir / "symbol.bin", "ab") as file:
+            file.write(b"\x00\x00")
+
+        second = TickWriter(tmp_path)
+        second.record([create_stock("MSFT", current_price=Decimal("300"))], _NOON)
+        second.close()
+
+        store = TickStore(tmp_path)
+        aapl = store.read(date(2024, 1, 2), "AAPL")
+        msft = store.read(date(2024, 1, 2), "MSFT")
+        assert (aapl.timestamps.tolist(), aapl.prices.tolist()) == (
+            [_MORNING.timestamp()],
+            [100.0],
+        )
+        assert (msft.timestamps.tolist(), msft.prices.tolist()) == ([_NOON.timestamp()], [300.0])
+
+    def test_writers_sharing_a_store_agree_on_symbol_ids(self, tmp_path):
+        first = TickWriter(tmp_path)
+        second = TickWriter(tmp_path)
+
+        first.record([create_stock("AAPL", current_price=Decimal("100"))], _MORNING)
+        second.record([create_stock("MSFT", current_price=Decimal("300"))], _MORNING)
+        second.close()
+        first.record([create_stock("TSLA", current_price=Decimal("200"))], _NOON)
+        first.close()
+
+        store = TickStore(tmp_path)
+        assert store.symbols(date(2024, 1, 2)) == ["MSFT", "AAPL", "TSLA"]
+        prices = {
+            symbol: series.prices.tolist()
+            for symbol, series in store.read_day(date(2024, 1, 2)).items()
+        }
+        assert prices == {"MSFT": [300.0], "AAPL": [100.0], "TSLA": [200.0]}
+
+
+class TestTickStore:
+    def test_read_returns_columns_per_symbol_in_time_order(self, tmp_path):
+        writer = TickWriter(tmp_path)
+        writer.record(
+            [
+                create_stock("AAPL", Decimal("150.00")),
+                create_stock("MSFT", Decimal("300.00"), market_state=MarketState.PRE),
+            ],
+            _MORNING,
+        )
+        writer.record([create_stock("AAPL", Decimal("151.50"), day_high=None)], _NOON)
+        writer.close()
+
+        series = TickStore(tmp_path).read(date(2024, 1, 2), "AAPL")
+
+        assert series.timestamps.tolist() == [_MORNING.timestamp(), _NOON.timestamp()]
+        assert series.prices.tolist() == [150.0, 151.5]
+        assert series.day_highs[0] == 151.5
+        assert np.isnan(series.day_highs[1])
+        assert series.market_states.tolist() == [MARKET_STATE_CODES[MarketState.OPEN]] * 2
+
+    def test_read_day_returns_every_symbol(self, tmp_path):
+        writer = TickWriter(tmp_path)
+        writer.record([create_stock("AAPL"), create_stock("MSFT")], _MORNING)
+        writer.close()
+
+        series = TickStore(tmp_path).read_day(date(2024, 1, 2))
+
+        assert sorted(series) == ["AAPL", "MSFT"]
+        assert series["MSFT"].market_states.dtype == np.uint8
+
+    def test_read_unknown_symbol_or_day_is_empty(self, tmp_path):
+        writer = TickWriter(tmp_path)
+        writer.record([create_stock("AAPL")], _MORNING)
+        writer.close()
+        store = TickStore(tmp_path)
+
+        assert len(store.read(date(2024, 1, 2), "TSLA")) == 0
+        assert len(store.read(date(2024, 1, 9), "AAPL")) == 0
+
+    def test_ignores_partially_written_rows(self, tmp_path):
+        writer = TickWriter(tmp_path)
+        writer.record([create_stock("AAPL")], _MORNING)
+        writer.close()
+        with open(tmp_path / "2024-01-02" / "timestamp.bin", "ab") as file:
+            np.array([_NOON.timestamp()]).tofile(file)
+
+        assert len(TickStore(tmp_path).read(date(2024, 1, 2), "AAPL")) == 1
+
+    def test_days_is_empty_without_store(self, tmp_path):
+        assert TickStore(tmp_path / "missing").days() == []
@@ -1,4 +1,5 @@
 import json
+from unittest.mock import patch
 
 import pytest
 
@@ -17,7 +18,8 @@ def _write_config(path, interval, symbols):
 class TestEditConfigCommand:
 
     @pytest.fixture(autouse=True)
-    def setup(self, tmp_path):
+    def setup(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("RUNTIME_DIRECTORY", str(tmp_path / "run"))
         self.tmp_path = tmp_path
         self.command = EditConfigCommand(ConfigStore(tmp_path))
 
@@ -86,3 +88,16 @@ class TestEditConfigCommand:
         result = self.command.execute(config_selection="1", operation="2", new_value="")
 
         assert result.success is False
+
+    def test_execute_reloads_monitors_running_the_config(self):
+        path = self.tmp_path / "test.json"
+        _write_config(path, 60, ["AAPL"])
+        self.command.get_input_prompts()
+
+        with patch(
+            "pryces.presentation.console.commands.edit_config.reload_monitors", return_value=1
+        ) as mock_reload:
+            result = self.command.execute(config_selection="1", operation="1", new_value="120")
+
+        mock_reload.assert_called_once_with(path)
+        assert result.message == "Config updated: test.json (reloaded by 1 running monitor(s))"
@@ -1,13 +1,27 @@
+from datetime import datetime
 from unittest.mock import patch
 
+import pytest
+
+from pryces.infrastructure.monitor_registry import MonitorRecord
 from pryces.presentation.console.commands.base import CommandMetadata
 from pryces.presentation.console.commands.list_monitors import ListMonitorsCommand
 
 
+def _monitor(pid: int, config_path: str) -> MonitorRecord:
+    return MonitorRecord(pid, config_path, datetime.now())
+
+
 class TestListMonitorsCommand:
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self):
         self.command = ListMonitorsCommand()
+        with patch(
+            "pryces.presentation.console.commands.list_monitors.query_monitor"
+        ) as self.mock_query:
+            self.mock_query.return_value = None
+            yield
 
     def test_get_metadata_returns_correct_metadata(self):
         metadata = self.command.get_metadata()
@@ -31,7 +45,7 @@ class TestListMonitorsCommand:
 
     @patch("pryces.presentation.console.commands.list_monitors.get_running_monitors")
     def test_execute_returns_single_process(self, mock_get):
-        mock_get.return_value = [("12345", "/path/to/config.json")]
+        mock_get.return_value = [_monitor(12345, "/path/to/config.json")]
 
         result = self.command.execute()
 
@@ -41,7 +55,10 @@ class TestListMonitorsCommand:
 
     @patch("pryces.presentation.console.commands.list_monitors.get_running_monitors")
     def test_execute_returns_multiple_processes(self, mock_get):
-        mock_get.return_value = [("11111", "/config/a.json"), ("22222", "/config/b.json")]
+        mock_get.return_value = [
+            _monitor(11111, "/config/a.json"),
+            _monitor(22222, "/config/b.json"),
+        ]
 
         result = self.command.execute()
 
@@ -50,3 +67,27 @@ class TestListMonitorsCommand:
         assert "/config/a.json" in result.message
         assert "2. PID 22222" in result.message
         assert "/config/b.json" in result.message
+
+    @patch("pryces.presentation.console.commands.list_monitors.get_running_monitors")
+    def test_execute_shows_the_live_status_of_processes_that_answer(self, mock_get):
+        mock_get.return_value = [
+            _monitor(11111, "/config/a.json"),
+            _monitor(22222, "/config/b.json"),
+        ]
+        self.mock_query.side_effect = lambda monitor: (
+            {
+                "ok": True,
+                "cycles": 7,
+                "last_cycle_seconds": 1.5,
+                "queue_depth": 2,
+                "symbols": {"AAPL": {"price": "150.00", "notifications": 3}},
+            }
+            if monitor.pid == 11111
+            else None
+        )
+
+        result = self.command.execute()
+
+        assert "7 cycle(s), last took 1.50s — 2 message(s) queued" in result.message
+        assert "AAPL 150.00 (3 sent)" in result.message
+        assert result.message.count("cycle(s)") == 1
@@ -1,9 +1,15 @@
+from datetime import datetime
 from unittest.mock import patch
 
+from pryces.infrastructure.monitor_registry import MonitorRecord
 from pryces.presentation.console.commands.base import CommandMetadata
 from pryces.presentation.console.commands.stop_monitor import StopMonitorCommand
 
 
+def _monitor(pid: int, config_path: str) -> MonitorRecord:
+    return MonitorRecord(pid, config_path, datetime.now())
+
+
 class TestStopMonitorCommand:
 
     def test_get_metadata_returns_correct_metadata(self):
@@ -25,7 +31,10 @@ class TestStopMonitorCommand:
 
     @patch("pryces.presentation.console.commands.stop_monitor.get_running_monitors")
     def test_get_input_prompts_returns_prompt_with_preamble(self, mock_get):
-        mock_get.return_value = [("11111", "/config/a.json"), ("22222", "/config/b.json")]
+        mock_get.return_value = [
+            _monitor(11111, "/config/a.json"),
+            _monitor(22222, "/config/b.json"),
+        ]
         command = StopMonitorCommand()
 
         prompts = command.get_input_prompts()
@@ -43,7 +52,10 @@ class TestStopMonitorCommand:
 
     @patch("pryces.presentation.console.commands.stop_monitor.get_running_monitors")
     def test_get_input_prompts_validator_accepts_valid_range(self, mock_get):
-        mock_get.return_value = [("11111", "/config/a.json"), ("22222", "/config/b.json")]
+        mock_get.return_value = [
+            _monitor(11111, "/config/a.json"),
+            _monitor(22222, "/config/b.json"),
+        ]
         command = StopMonitorCommand()
 
         prompts = command.get_input_prompts()
@@ -67,7 +79,7 @@ class TestStopMonitorCommand:
 
     @patch("pryces.presentation.console.commands.stop_monitor.get_running_monitors")
     def test_execute_returns_cancelled_on_zero(self, mock_get):
-        mock_get.return_value = [("12345", "/config/a.json")]
+        mock_get.return_value = [_monitor(12345, "/config/a.json")]
         command = StopMonitorCommand()
         command.get_input_prompts()
 
@@ -75,10 +87,34 @@ class TestStopMonitorCommand:
 
         assert result.message == "Cancelled."
 
+    @patch("pryces.presentation.console.commands.stop_monitor.query_monitor")
+    @patch("pryces.presentation.console.commands.stop_monitor.subprocess.run")
+    @patch("pryces.presentation.console.commands.stop_monitor.get_running_monitors")
+    def test_execute_asks_selected_process_to_stop(self, mock_get, mock_run, mock_query):
+        monitors = [_monitor(11111, "/config/a.json"), _monitor(22222, "/config/b.json")]
+        mock_get.return_value = monitors
+        mock_query.return_value = {"ok": True}
+        command = StopMonitorCommand()
+        command.get_input_prompts()
+
+        result = command.execute(selection="2")
+
+        mock_query.assert_called_once_with(monitors[1], "stop")
+        mock_run.assert_not_called()
+        assert "Stopping monitor process PID 22222" in result.message
+        assert "/config/b.json" in result.message
+
+    @patch("pryces.presentation.console.commands.stop_monitor.query_monitor")
     @patch("pryces.presentation.console.commands.stop_monitor.subprocess.run")
     @patch("pryces.presentation.console.commands.stop_monitor.get_running_monitors")
-    def test_execute_kills_selected_process(self, mock_get, mock_run):
-        mock_get.return_value = [("11111", "/config/a.json"), ("22222", "/config/b.json")]
+    def test_execute_kills_selected_process_without_control_socket(
+        self, mock_get, mock_run, mock_query
+    ):
+        mock_get.return_value = [
+            _monitor(11111, "/config/a.json"),
+            _monitor(22222, "/config/b.json"),
+        ]
+        mock_query.return_value = None
         command = StopMonitorCommand()
         command.get_input_prompts()
 
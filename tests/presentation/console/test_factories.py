@@ -2,7 +2,7 @@ from unittest.mock import Mock
 
 from pryces.application.interfaces import MessageSender, StockProvider
 from pryces.infrastructure.configs import ConfigStore
-from pryces.presentation.console.factories import CommandFactory
+from pryces.presentation.console.factories import CommandFactory, LazyStockProvider
 from pryces.presentation.console.commands.get_stocks_prices import GetStocksPricesCommand
 from pryces.presentation.console.commands.monitor_stocks import MonitorStocksCommand
 from pryces.presentation.console.commands.registry import CommandRegistry
@@ -106,3 +106,19 @@ class TestCommandFactory:
         all_commands = registry.get_all_commands()
 
         assert all_commands[0].get_metadata().id == "list_configs"
+
+
+class TestLazyStockProvider:
+
+    def test_builds_the_provider_on_the_first_fetch_only(self):
+        inner = Mock(spec=StockProvider)
+        inner.get_stocks.return_value = []
+        factory = Mock(return_value=inner)
+        provider = LazyStockProvider(factory)
+        factory.assert_not_called()
+
+        provider.get_stocks(["AAPL"])
+        provider.get_stocks(["MSFT"])
+
+        factory.assert_called_once_with()
+        assert inner.get_stocks.call_count == 2
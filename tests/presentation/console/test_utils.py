@@ -1,6 +1,10 @@
+import os
+from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
+
+import pytest
 
 from pryces.presentation.console.utils import (
     create_config_selection_validator,
@@ -13,6 +17,8 @@ from pryces.presentation.console.utils import (
     get_running_monitors,
     parse_symbols_input,
     parse_symbols_with_targets,
+    query_monitor,
+    reload_monitors,
     validate_file_path,
     validate_positive_integer,
     validate_symbol,
@@ -20,88 +26,119 @@ from pryces.presentation.console.utils import (
     validate_symbols_with_targets,
 )
 from pryces.infrastructure.configs import MonitorStocksConfig, SymbolConfig
+from pryces.infrastructure.control_sockets import ControlSocketServer
+from pryces.infrastructure.factories import MonitorRegistryFactory
+from pryces.infrastructure.monitor_registry import MonitorRecord
 from pryces.domain.stocks import Currency
 from tests.fixtures.factories import create_stock_dto
 
+_STARTED = datetime(2024, 6, 14, 9, 30)
+
 
 class TestGetRunningMonitors:
 
-    @patch("pryces.presentation.console.utils.subprocess.run")
-    def test_returns_empty_list_when_no_monitor_processes(self, mock_run):
-        mock_run.return_value = Mock(stdout="    1 /sbin/init\n")
+    def test_returns_monitors_registered_in_the_runtime_directory(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("RUNTIME_DIRECTORY", str(tmp_path))
+        registration = MonitorRegistryFactory.create().register("/path/to/config.json")
 
         result = get_running_monitors()
 
-        assert result == []
+        assert [(m.pid, m.config_path) for m in result] == [(os.getpid(), "/path/to/config.json")]
+        registration.close()
 
-    @patch("pryces.presentation.console.utils.subprocess.run")
-    def test_returns_single_process(self, mock_run):
-        mock_run.return_value = Mock(
-            stdout=(
-                "12345 /usr/bin/python -m"
-                " pryces.presentation.scripts.monitor_stocks /path/to/config.json\n"
-            )
-        )
+    def test_returns_empty_list_when_nothing_is_registered(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("RUNTIME_DIRECTORY", str(tmp_path))
 
-        result = get_running_monitors()
+        assert get_running_monitors() == []
 
-        assert result == [("12345", "/path/to/config.json")]
-
-    @patch("pryces.presentation.console.utils.subprocess.run")
-    def test_returns_multiple_processes(self, mock_run):
-        mock_run.return_value = Mock(
-            stdout=(
-                "11111 /usr/bin/python -m"
-                " pryces.presentation.scripts.monitor_stocks /config/a.json\n"
-                "22222 /usr/bin/python -m"
-                " pryces.presentation.scripts.monitor_stocks /config/b.json\n"
-            )
-        )
 
-        result = get_running_monitors()
+class TestFormatRunningMonitors:
 
-        assert result == [("11111", "/config/a.json"), ("22222", "/config/b.json")]
+    def test_formats_single_process_before_its_first_cycle(self):
+        processes = [MonitorRecord(12345, "/path/to/config.json", _STARTED)]
 
-    @patch("pryces.presentation.console.utils.subprocess.run")
-    def test_shows_unknown_config_when_no_args_after_module(self, mock_run):
-        mock_run.return_value = Mock(
-            stdout=("12345 /usr/bin/python -m" " pryces.presentation.scripts.monitor_stocks\n")
-        )
+        result = format_running_monitors(processes, now=_STARTED + timedelta(seconds=5))
 
-        result = get_running_monitors()
+        assert result == (
+            "Found 1 monitor process(es):\n"
+            "  1. PID 12345 — config: /path/to/config.json — started 5s ago"
+        )
 
-        assert result == [("12345", "unknown")]
+    def test_formats_multiple_processes_with_their_last_cycle(self):
+        processes = [
+            MonitorRecord(11111, "/config/a.json", _STARTED, _STARTED + timedelta(minutes=10)),
+            MonitorRecord(22222, "/config/b.json", _STARTED, _STARTED + timedelta(minutes=55)),
+        ]
 
-    @patch("pryces.presentation.console.utils.subprocess.run")
-    def test_calls_ps(self, mock_run):
-        mock_run.return_value = Mock(stdout="")
+        result = format_running_monitors(processes, now=_STARTED + timedelta(hours=2))
 
-        get_running_monitors()
+        assert result == (
+            "Found 2 monitor process(es):\n"
+            "  1. PID 11111 — config: /config/a.json — last cycle 1h 50m ago\n"
+            "  2. PID 22222 — config: /config/b.json — last cycle 1h 5m ago"
+        )
 
-        mock_run.assert_called_once_with(["ps", "-eo", "pid=,cmd="], capture_output=True, text=True)
+    def test_formats_the_live_status_below_its_process(self):
+        processes = [MonitorRecord(12345, "/path/to/config.json", _STARTED)]
+        status = {
+            "cycles": 12,
+            "last_cycle_seconds": 0.25,
+            "queue_depth": 0,
+            "symbols": {
+                "AAPL": {"price": "150.00", "notifications": 2},
+                "MSFT": {"price": "410.10", "notifications": 0},
+            },
+        }
+
+        result = format_running_monitors(
+            processes, now=_STARTED + timedelta(seconds=5), statuses={12345: status}
+        )
 
+        assert result == (
+            "Found 1 monitor process(es):\n"
+            "  1. PID 12345 — config: /path/to/config.json — started 5s ago\n"
+            "     12 cycle(s), last took 0.25s — 0 message(s) queued\n"
+            "     AAPL 150.00 (2 sent) | MSFT 410.10 (0 sent)"
+        )
 
-class TestFormatRunningMonitors:
 
-    def test_formats_single_process(self):
-        processes = [("12345", "/path/to/config.json")]
+class TestMonitorControlCommands:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("RUNTIME_DIRECTORY", str(tmp_path / "run"))
+        self.registry = MonitorRegistryFactory.create()
+        self.registration = self.registry.register(str(tmp_path / "a.json"))
+        self.commands = []
+        self.server = ControlSocketServer(
+            self.registration.control_path,
+            {
+                "status": lambda: {"cycles": 1},
+                "reload": lambda: self.commands.append("reload") or {},
+            },
+            Mock(),
+        )
+        self.server.start()
+        yield
+        self.server.close()
+        self.registration.close()
 
-        result = format_running_monitors(processes)
+    def test_query_monitor_returns_the_reply(self):
+        assert query_monitor(self.registration.record) == {"ok": True, "cycles": 1}
 
-        assert result == (
-            "Found 1 monitor process(es):\n" "  1. PID 12345 — config: /path/to/config.json"
-        )
+    def test_query_monitor_returns_none_when_the_command_fails(self):
+        assert query_monitor(self.registration.record, "dance") is None
 
-    def test_formats_multiple_processes(self):
-        processes = [("11111", "/config/a.json"), ("22222", "/config/b.json")]
+    def test_query_monitor_returns_none_without_control_socket(self):
+        self.server.close()
+        self.server = Mock()
 
-        result = format_running_monitors(processes)
+        assert query_monitor(self.registration.record) is None
 
-        assert result == (
-            "Found 2 monitor process(es):\n"
-            "  1. PID 11111 — config: /config/a.json\n"
-            "  2. PID 22222 — config: /config/b.json"
-        )
+    def test_reload_monitors_reloads_only_monitors_of_the_config(self, tmp_path):
+        assert reload_monitors(tmp_path / "b.json") == 0
+        assert reload_monitors(tmp_path / "a.json") == 1
+        assert self.commands == ["reload"]
 
 
 class TestCreateMonitorSelectionValidator:
@@ -0,0 +1,39 @@
+from decimal import Decimal
+
+from pryces.domain.notifications import NotificationType
+from pryces.infrastructure.backtest import BacktestReport, RuleSet
+from pryces.presentation.scripts.backtest import format_reports
+
+
+class TestFormatReports:
+    def test_renders_one_column_per_rule_set_and_only_sent_types(self):
+        reports = [
+            BacktestReport(
+                RuleSet("narrow", Decimal("1"), Decimal("1")),
+                sessions=4,
+                counts={NotificationType.LEVEL_1_INCREASE: 6, NotificationType.SMA50_CROSSED: 2},
+            ),
+            BacktestReport(
+                RuleSet("wide", Decimal("3"), Decimal("2")),
+                sessions=4,
+                counts={NotificationType.SMA50_CROSSED: 2},
+            ),
+        ]
+
+        lines = format_reports(reports).splitlines()
+
+        assert lines[0].split() == ["notification", "narrow", "wide"]
+        assert sorted(line.split() for line in lines[1:3]) == sorted(
+            [
+                [NotificationType.LEVEL_1_INCREASE.value, "6", "0"],
+                [NotificationType.SMA50_CROSSED.value, "2", "2"],
+            ]
+        )
+        assert lines[3].split() == ["total", "8", "2"]
+        assert lines[4].split() == ["per", "session", "2.00", "0.50"]
+        assert len(lines) == 5
+
+    def test_reports_zero_per_session_without_sessions(self):
+        report = BacktestReport(RuleSet("empty", Decimal("1"), Decimal("1")), sessions=0)
+
+        assert format_reports([report]).splitlines()[-1].split() == ["per", "session", "0.00"]
@@ -134,6 +134,16 @@ class TestTargetAddCommand:
 
         assert "is not tracked" in result
 
+    def test_writes_through_injected_config_opener(self, tmp_path):
+        find_config = make_find_config(tmp_path)
+        open_config = Mock()
+        cmd = TargetAddCommand(find_config, open_config)
+
+        cmd.execute(["AAPL", "250"])
+
+        open_config.assert_called_once_with(tmp_path / "test.json")
+        open_config.return_value.add_target.assert_called_once_with("AAPL", Decimal("250"))
+
 
 class TestTargetRemoveCommand:
 
@@ -376,6 +386,14 @@ class TestBotCommandDispatcher:
         assert "Usage:" in result
         assert "/targets <symbol>" in result
 
+    def test_accepts_variable_arg_count_up_to_the_maximum(self):
+        stats = StatsCommand(lambda symbols: symbols)
+        dispatcher = BotCommandDispatcher([stats], logger_factory=Mock())
+
+        assert dispatcher.dispatch("/stats " + " ".join(["AAPL"] * 10)) == ""
+        assert "Usage:" in dispatcher.dispatch("/stats " + " ".join(["AAPL"] * 11))
+        assert "Usage:" in dispatcher.dispatch("/stats")
+
     def test_returns_empty_string_for_non_command_text(self):
         dispatcher = self._make_dispatcher()
 
@@ -484,28 +502,55 @@ class TestStatsCommand:
 
         def capture(s):
             received.append(s)
-            return True
+            return s
 
         cmd = StatsCommand(capture)
 
         cmd.execute(["aapl"])
 
-        assert received == ["AAPL"]
+        assert received == [["AAPL"]]
+
+    def test_passes_every_symbol_in_one_call_without_duplicates(self):
+        received = []
+
+        def capture(s):
+            received.append(s)
+            return s
+
+        cmd = StatsCommand(capture)
+
+        cmd.execute(["aapl", "MSFT", "AAPL"])
+
+        assert received == [["AAPL", "MSFT"]]
+
+    def test_lists_every_symbol_when_no_data_found(self):
+        cmd = StatsCommand(lambda _: [])
+
+        result = cmd.execute(["SXRS", "XYZ"])
+
+        assert result == "❌ No data found for SXRS, XYZ"
 
     def test_returns_empty_string_when_data_found(self):
-        cmd = StatsCommand(lambda _: True)
+        cmd = StatsCommand(lambda symbols: symbols)
 
         result = cmd.execute(["AAPL"])
 
         assert result == ""
 
     def test_returns_error_message_when_no_data_found(self):
-        cmd = StatsCommand(lambda _: False)
+        cmd = StatsCommand(lambda _: [])
 
         result = cmd.execute(["SXRS"])
 
         assert result == "❌ No data found for SXRS"
 
+    def test_lists_only_the_symbols_without_data(self):
+        cmd = StatsCommand(lambda _: ["AAPL"])
+
+        result = cmd.execute(["aapl", "BADSYM"])
+
+        assert result == "❌ No data found for BADSYM"
+
     def test_returns_error_on_exception(self):
         def raise_error(_):
             raise RuntimeError("network failure")
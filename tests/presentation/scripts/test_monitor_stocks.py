@@ -1,20 +1,29 @@
 import logging
+import os
+import signal
+import sys
 from decimal import Decimal
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
+from pryces.application.correlation import current_cycle_id
 from pryces.application.dtos import TargetPriceDTO
 from pryces.application.use_cases.trigger_stocks_notifications import TriggerStocksNotifications
 from pryces.infrastructure.logging import PythonLoggerFactory
+from pryces.infrastructure.monitor_registry import MonitorRegistration
 from pryces.infrastructure.configs import (
+    ConfigDiff,
     ConfigManager,
     MonitorStocksConfig,
     SymbolConfig,
 )
+from pryces.infrastructure.repositories import InMemoryStockRepository
 from pryces.presentation.scripts.config_refresher import ConfigRefresher
-from pryces.presentation.scripts.monitor_stocks import MonitorStocksScript
+from pryces.presentation.scripts.monitor_control import MonitorControl
+from pryces.presentation.scripts.monitor_stocks import MonitorStocksScript, main
 
+from tests.fixtures.factories import make_stock
 from tests.presentation.scripts.factories import make_config, make_symbol
 
 
@@ -30,6 +39,192 @@ def make_refresher(config=None, config_manager=None, logger_factory=None) -> Con
     )
 
 
+class TestMonitorStocksScriptRun:
+
+    def test_first_cycle_resyncs_every_target_and_later_cycles_only_changes(self):
+        trigger = Mock(spec=TriggerStocksNotifications)
+        trigger.handle.return_value = []
+        refresher = Mock(spec=ConfigRefresher)
+        refresher.config = make_config()
+        refresher.refresh.return_value = ConfigDiff(added_targets={"AAPL": [Decimal("1")]})
+        script = MonitorStocksScript(trigger, refresher, duration=1, logger_factory=Mock())
+
+        with patch("pryces.presentation.scripts.monitor_stocks.time") as time:
+            time.monotonic.side_effect = [0, 0, 120]
+            time.perf_counter.return_value = 0.0
+            script.run()
+
+        first, second = [call.args[0] for call in trigger.handle.call_args_list]
+        assert first.changed_symbols is None
+        assert second.changed_symbols == {"AAPL"}
+
+    def test_records_every_cycle_in_the_monitor_registry(self):
+        trigger = Mock(spec=TriggerStocksNotifications)
+        trigger.handle.side_effect = [[], Exception("fetch failed")]
+        refresher = Mock(spec=ConfigRefresher)
+        refresher.config = make_config()
+        refresher.refresh.return_value = ConfigDiff()
+        registration = Mock(spec=MonitorRegistration)
+        script = MonitorStocksScript(
+            trigger, refresher, duration=1, logger_factory=Mock(), registration=registration
+        )
+
+        with patch("pryces.presentation.scripts.monitor_stocks.time") as time:
+            time.monotonic.side_effect = [0, 0, 120]
+            time.perf_counter.return_value = 0.0
+            script.run()
+
+        assert registration.beat.call_count == 2
+
+    def test_keeps_running_when_the_registry_cannot_be_written(self):
+        trigger = Mock(spec=TriggerStocksNotifications)
+        trigger.handle.return_value = []
+        refresher = Mock(spec=ConfigRefresher)
+        refresher.config = make_config()
+        refresher.refresh.return_value = ConfigDiff()
+        registration = Mock(spec=MonitorRegistration)
+        registration.beat.side_effect = OSError("No space left on device")
+        script = MonitorStocksScript(
+            trigger, refresher, duration=1, logger_factory=Mock(), registration=registration
+        )
+
+        with patch("pryces.presentation.scripts.monitor_stocks.time") as time:
+            time.monotonic.side_effect = [0, 0, 120]
+            time.perf_counter.return_value = 0.0
+            script.run()
+
+        assert trigger.handle.call_count == 2
+
+    def test_logs_a_summary_of_every_cycle_under_its_own_id(self):
+        trigger = Mock(spec=TriggerStocksNotifications)
+        cycle_ids = []
+        trigger.handle.side_effect = lambda request: cycle_ids.append(current_cycle_id()) or []
+        refresher = Mock(spec=ConfigRefresher)
+        refresher.config = make_config()
+        refresher.refresh.return_value = ConfigDiff()
+        logger_factory = Mock()
+        script = MonitorStocksScript(trigger, refresher, duration=1, logger_factory=logger_factory)
+
+        with patch("pryces.presentation.scripts.monitor_stocks.time") as time:
+            time.monotonic.side_effect = [0, 0, 120]
+            time.perf_counter.side_effect = [0.0, 1.5, 10.0, 10.25]
+            script.run()
+
+        summaries = [
+            call.kwargs
+            for call in logger_factory.get_logger.return_value.info.call_args_list
+            if "cycle" in call.kwargs
+        ]
+        assert [(s["cycle"], s["duration"], s["outcome"]) for s in summaries] == [
+            (1, 1.5, "ok"),
+            (2, 0.25, "ok"),
+        ]
+        assert summaries[0]["symbols"] == len(make_config().symbols)
+        assert len(set(cycle_ids)) == 2 and None not in cycle_ids
+
+
+class TestMonitorStocksScriptControl:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.trigger = Mock(spec=TriggerStocksNotifications)
+        self.trigger.handle.return_value = []
+        self.refresher = Mock(spec=ConfigRefresher)
+        self.refresher.config = make_config(interval=3600)
+        self.refresher.refresh.return_value = ConfigDiff()
+        self.repository = InMemoryStockRepository()
+        self.control = MonitorControl(self.repository, queue_depth=lambda: 4)
+        self.script = MonitorStocksScript(
+            self.trigger, self.refresher, duration=600, logger_factory=Mock(), control=self.control
+        )
+
+    def test_stop_ends_the_run_after_the_current_cycle(self):
+        self.trigger.handle.side_effect = lambda request: self.control.request_stop() or []
+
+        self.script.run()
+
+        assert self.trigger.handle.call_count == 1
+
+    def test_cycle_and_reload_wake_the_loop_without_waiting_for_the_interval(self):
+        commands = [self.control.request_cycle, self.control.request_reload]
+
+        def handle(request):
+            if commands:
+                commands.pop(0)()
+            else:
+                self.control.request_stop()
+            return []
+
+        self.trigger.handle.side_effect = handle
+
+        self.script.run()
+
+        assert [call.kwargs["force"] for call in self.refresher.refresh.call_args_list] == [
+            False,
+            False,
+            True,
+        ]
+
+    def test_publishes_the_status_of_every_cycle(self):
+        self.repository.save_batch([make_stock(symbol="AAPL", current_price="150.00")])
+        self.trigger.handle.side_effect = lambda request: self.control.request_stop() or []
+
+        self.script.run()
+        status = self.control.status()
+
+        assert status["cycles"] == 1
+        assert status["last_cycle_seconds"] >= 0
+        assert status["queue_depth"] == 4
+        assert status["symbols"] == {"AAPL": {"price": "150.00", "notifications": 0}}
+
+
+class TestMain:
+
+    @patch("pryces.presentation.scripts.monitor_stocks.setup_logging")
+    @patch("pryces.presentation.scripts.monitor_stocks.load_dotenv")
+    @patch("pryces.presentation.scripts.monitor_stocks._create_script")
+    def test_sigterm_closes_the_script_context(self, create_script, load_dotenv, setup_logging):
+        context = create_script.return_value
+        context.script.run.side_effect = lambda: os.kill(os.getpid(), signal.SIGTERM)
+        previous = signal.getsignal(signal.SIGTERM)
+
+        try:
+            with patch.object(sys, "argv", ["monitor", "config.json", "--duration", "1"]):
+                exit_code = main()
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+
+        assert exit_code == 0
+        context.close.assert_called_once()
+
+
+class TestMonitorControl:
+
+    def test_status_before_the_first_cycle(self):
+        control = MonitorControl(InMemoryStockRepository())
+
+        assert control.status() == {
+            "cycles": 0,
+            "last_cycle_seconds": None,
+            "queue_depth": 0,
+            "symbols": {},
+        }
+
+    def test_reload_is_taken_once(self):
+        control = MonitorControl(InMemoryStockRepository())
+        control.request_reload()
+
+        assert control.take_reload() is True
+        assert control.take_reload() is False
+
+    def test_wait_returns_false_once_stopped(self):
+        control = MonitorControl(InMemoryStockRepository())
+
+        control.request_stop()
+
+        assert control.wait(3600) is False
+
+
 class TestConfigRefresherRemoveFulfilledTargets:
 
     def setup_method(self):
@@ -42,13 +237,26 @@ class TestConfigRefresherRemoveFulfilledTargets:
     def test_does_nothing_when_fulfilled_is_empty(self):
         self.refresher.remove_fulfilled_targets([])
 
-        self.mock_config_manager.write_monitor_stocks_config.assert_not_called()
+        self.mock_config_manager.remove_targets.assert_not_called()
 
     def test_does_nothing_when_no_prices_match(self):
         self.refresher.remove_fulfilled_targets(
             [TargetPriceDTO(symbol="AAPL", target=Decimal("999"))]
         )
 
+        self.mock_config_manager.remove_targets.assert_not_called()
+
+    def test_removes_only_fulfilled_targets_from_storage(self):
+        self.refresher.remove_fulfilled_targets(
+            [
+                TargetPriceDTO(symbol="AAPL", target=Decimal("150")),
+                TargetPriceDTO(symbol="GOOGL", target=Decimal("100")),
+            ]
+        )
+
+        self.mock_config_manager.remove_targets.assert_called_once_with(
+            {("AAPL", Decimal("150")), ("GOOGL", Decimal("100"))}
+        )
         self.mock_config_manager.write_monitor_stocks_config.assert_not_called()
 
     def test_removes_fulfilled_price_from_symbol(self):
@@ -56,28 +264,26 @@ class TestConfigRefresherRemoveFulfilledTargets:
             [TargetPriceDTO(symbol="AAPL", target=Decimal("150"))]
         )
 
-        expected = make_config(
+        assert self.refresher.config == make_config(
             symbols=[
                 SymbolConfig("AAPL", [Decimal("200")]),
                 SymbolConfig("GOOGL", [Decimal("100")]),
             ]
         )
-        self.mock_config_manager.write_monitor_stocks_config.assert_called_once_with(expected)
 
     def test_keeps_symbol_with_empty_prices_when_all_its_prices_are_fulfilled(self):
         self.refresher.remove_fulfilled_targets(
             [TargetPriceDTO(symbol="GOOGL", target=Decimal("100"))]
         )
 
-        expected = make_config(
+        assert self.refresher.config == make_config(
             symbols=[
                 SymbolConfig("AAPL", [Decimal("150"), Decimal("200")]),
                 SymbolConfig("GOOGL", []),
             ]
         )
-        self.mock_config_manager.write_monitor_stocks_config.assert_called_once_with(expected)
 
-    def test_writes_config_with_all_symbols_emptied_when_all_prices_fulfilled(self):
+    def test_empties_all_symbols_when_all_prices_fulfilled(self):
         self.refresher.remove_fulfilled_targets(
             [
                 TargetPriceDTO(symbol="AAPL", target=Decimal("150")),
@@ -86,25 +292,32 @@ class TestConfigRefresherRemoveFulfilledTargets:
             ]
         )
 
-        expected = make_config(
+        assert self.refresher.config == make_config(
             symbols=[
                 SymbolConfig("AAPL", []),
                 SymbolConfig("GOOGL", []),
             ]
         )
-        self.mock_config_manager.write_monitor_stocks_config.assert_called_once_with(expected)
 
-    def test_updates_config_after_write(self):
-        self.refresher.remove_fulfilled_targets(
-            [TargetPriceDTO(symbol="AAPL", target=Decimal("150"))]
-        )
+    def test_keeps_targets_added_concurrently_on_disk(self, tmp_path):
+        path = tmp_path / "portfolio.json"
+        manager = ConfigManager(path)
+        manager.write_monitor_stocks_config(make_config())
+        refresher = make_refresher(config_manager=manager)
+        refresher.refresh()
+        manager.replace_symbol_prices("GOOGL", [Decimal("100"), Decimal("120")])
 
-        assert self.refresher.config == make_config(
+        refresher.remove_fulfilled_targets([TargetPriceDTO(symbol="AAPL", target=Decimal("150"))])
+        diff = refresher.refresh()
+
+        assert manager.read_monitor_stocks_config() == make_config(
             symbols=[
                 SymbolConfig("AAPL", [Decimal("200")]),
-                SymbolConfig("GOOGL", [Decimal("100")]),
+                SymbolConfig("GOOGL", [Decimal("100"), Decimal("120")]),
             ]
         )
+        assert diff.added_targets == {"GOOGL": [Decimal("120")]}
+        assert diff.removed_targets == {}
 
 
 class TestConfigRefresherRefresh:
@@ -146,6 +359,76 @@ class TestConfigRefresherRefresh:
 
         assert refresher.config == original
 
+    def test_skips_reading_when_file_signature_unchanged(self):
+        mock_manager = Mock(spec=ConfigManager)
+        mock_manager.signature.return_value = (1, 100)
+        mock_manager.read_monitor_stocks_config.return_value = make_config()
+        refresher = make_refresher(config_manager=mock_manager)
+
+        refresher.refresh()
+        refresher.refresh()
+
+        mock_manager.read_monitor_stocks_config.assert_called_once()
+
+    def test_forced_refresh_rereads_an_unchanged_file(self):
+        mock_manager = Mock(spec=ConfigManager)
+        mock_manager.signature.return_value = (1, 100)
+        mock_manager.read_monitor_stocks_config.return_value = make_config()
+        refresher = make_refresher(config_manager=mock_manager)
+
+        refresher.refresh()
+        refresher.refresh(force=True)
+
+        assert mock_manager.read_monitor_stocks_config.call_count == 2
+
+    def test_rereads_when_file_signature_changes(self):
+        mock_manager = Mock(spec=ConfigManager)
+        mock_manager.signature.side_effect = [(1, 100), (2, 100)]
+        mock_manager.read_monitor_stocks_config.side_effect = [
+            make_config(),
+            make_config(interval=10),
+        ]
+        refresher = make_refresher(config_manager=mock_manager)
+
+        refresher.refresh()
+        refresher.refresh()
+
+        assert refresher.config == make_config(interval=10)
+
+    def test_returns_diff_of_symbols_and_targets(self):
+        mock_manager = Mock(spec=ConfigManager)
+        mock_manager.signature.return_value = (1, 100)
+        mock_manager.read_monitor_stocks_config.return_value = make_config(
+            symbols=[
+                SymbolConfig("AAPL", [Decimal("150"), Decimal("300")]),
+                SymbolConfig("MSFT", []),
+            ]
+        )
+        refresher = make_refresher(config_manager=mock_manager)
+
+        diff = refresher.refresh()
+
+        assert diff.added_symbols == {"MSFT"}
+        assert diff.removed_symbols == {"GOOGL"}
+        assert diff.added_targets == {"AAPL": [Decimal("300")]}
+        assert diff.removed_targets == {"AAPL": [Decimal("200")], "GOOGL": [Decimal("100")]}
+        assert diff.changed_symbols == {"AAPL", "MSFT"}
+
+    def test_returns_empty_diff_when_config_unchanged(self):
+        mock_manager = Mock(spec=ConfigManager)
+        mock_manager.signature.return_value = (1, 100)
+        mock_manager.read_monitor_stocks_config.return_value = make_config()
+        refresher = make_refresher(config_manager=mock_manager)
+
+        assert refresher.refresh().is_empty()
+
+    def test_returns_empty_diff_on_read_errors(self):
+        mock_manager = Mock(spec=ConfigManager)
+        mock_manager.read_monitor_stocks_config.side_effect = Exception("disk error")
+        refresher = make_refresher(config_manager=mock_manager)
+
+        assert refresher.refresh().is_empty()
+
 
 class TestConfigRefresherLogConfig:
 
@@ -0,0 +1,52 @@
+from unittest.mock import Mock
+
+import pytest
+
+from pryces.infrastructure.statistics_snapshots import (
+    ClosingHistoryDownloader,
+    StatisticsSnapshotStore,
+)
+from pryces.presentation.scripts.snapshot_statistics import SnapshotStatisticsScript
+
+
+@pytest.fixture()
+def downloader():
+    return Mock(spec=ClosingHistoryDownloader)
+
+
+@pytest.fixture()
+def store():
+    return Mock(spec=StatisticsSnapshotStore)
+
+
+def _make_script(downloader, store, list_tracked_symbols):
+    return SnapshotStatisticsScript(
+        downloader=downloader,
+        store=store,
+        list_tracked_symbols=list_tracked_symbols,
+        logger_factory=Mock(),
+    )
+
+
+class TestSnapshotStatisticsScript:
+    def test_does_nothing_when_no_symbols_tracked(self, downloader, store):
+        _make_script(downloader, store, lambda: []).run()
+
+        downloader.download.assert_not_called()
+        store.write.assert_not_called()
+
+    def test_writes_the_history_of_every_tracked_symbol_once(self, downloader, store):
+        histories = [Mock(), Mock()]
+        downloader.download.return_value = histories
+
+        _make_script(downloader, store, lambda: ["msft", "AAPL", "MSFT"]).run()
+
+        downloader.download.assert_called_once_with(["AAPL", "MSFT"])
+        store.write.assert_called_once_with(histories)
+
+    def test_keeps_the_previous_snapshot_when_nothing_was_downloaded(self, downloader, store):
+        downloader.download.return_value = []
+
+        _make_script(downloader, store, lambda: ["AAPL"]).run()
+
+        store.write.assert_not_called()
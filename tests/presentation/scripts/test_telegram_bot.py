@@ -1,9 +1,11 @@
-from unittest.mock import Mock, call
+import sys
+import threading
+from unittest.mock import Mock, call, patch
 
 from pryces.application.use_cases.send_messages import SendMessages, SendMessagesRequest
 from pryces.infrastructure.receivers import BotUpdate, TelegramUpdatePoller
 from pryces.presentation.scripts.bot_commands import BotCommandDispatcher
-from pryces.presentation.scripts.telegram_bot import TelegramBotScript
+from pryces.presentation.scripts.telegram_bot import CommandRunner, TelegramBotScript, main
 
 
 def make_script(
@@ -13,7 +15,7 @@ def make_script(
     group_id="123",
 ) -> TelegramBotScript:
     return TelegramBotScript(
-        poller=poller or Mock(spec=TelegramUpdatePoller),
+        receiver=poller or Mock(spec=TelegramUpdatePoller),
         send_messages=send_messages or Mock(spec=SendMessages),
         dispatcher=dispatcher or Mock(spec=BotCommandDispatcher),
         group_id=group_id,
@@ -115,3 +117,181 @@ class TestTelegramBotScript:
             pass
 
         assert send_messages.handle.call_count == 2
+
+    def test_closes_the_receiver_when_stopped(self):
+        poller = Mock(spec=TelegramUpdatePoller)
+        poller.get_updates.side_effect = KeyboardInterrupt
+
+        try:
+            make_script(poller=poller).run()
+        except KeyboardInterrupt:
+            pass
+
+        poller.close.assert_called_once_with()
+
+
+class _BlockingDispatcher:
+    # Commands listed in `blocked` wait for `release`; /stats is unordered like the real one.
+    def __init__(self, blocked: set[str]) -> None:
+        self.blocked = blocked
+        self.release = threading.Event()
+        self.started: list[str] = []
+
+    def is_ordered(self, text: str) -> bool:
+        return not text.startswith("/stats")
+
+    def dispatch(self, text: str) -> str:
+        self.started.append(text)
+        if text in self.blocked:
+            self.release.wait(5)
+        return f"reply to {text}"
+
+
+def _replies(send_messages) -> list[str]:
+    return [c.args[0].messages[0] for c in send_messages.handle.call_args_list]
+
+
+def _update(update_id: int, text: str) -> BotUpdate:
+    return BotUpdate(update_id=update_id, chat_id="123", text=text)
+
+
+class TestCommandRunner:
+
+    def test_slow_unordered_command_does_not_hold_back_others(self):
+        dispatcher = _BlockingDispatcher({"/stats AAPL"})
+        send_messages = Mock(spec=SendMessages)
+        replied = threading.Event()
+        send_messages.handle.side_effect = lambda request: replied.set()
+        runner = CommandRunner(dispatcher, send_messages, Mock())
+
+        runner.submit(_update(1, "/stats AAPL"))
+        runner.submit(_update(2, "/targets AAPL"))
+
+        assert replied.wait(5)
+        assert _replies(send_messages) == ["reply to /targets AAPL"]
+        dispatcher.release.set()
+        runner.close()
+        assert _replies(send_messages) == ["reply to /targets AAPL", "reply to /stats AAPL"]
+
+    def test_ordered_commands_run_one_at_a_time_in_order(self):
+        dispatcher = _BlockingDispatcher({"/target_add AAPL 200"})
+        send_messages = Mock(spec=SendMessages)
+        runner = CommandRunner(dispatcher, send_messages, Mock())
+
+        runner.submit(_update(1, "/target_add AAPL 200"))
+        runner.submit(_update(2, "/targets AAPL"))
+
+        assert dispatcher.started == ["/target_add AAPL 200"]
+        dispatcher.release.set()
+        runner.close()
+        assert _replies(send_messages) == [
+            "reply to /target_add AAPL 200",
+            "reply to /targets AAPL",
+        ]
+
+    def test_overdue_ordered_command_keeps_its_chat_blocked_until_it_finishes(self):
+        dispatcher = _BlockingDispatcher({"/symbols"})
+        send_messages = Mock(spec=SendMessages)
+        notified = threading.Event()
+        send_messages.handle.side_effect = lambda request: notified.set()
+        runner = CommandRunner(dispatcher, send_messages, Mock(), timeout=0.05)
+
+        runner.submit(_update(1, "/symbols"))
+        runner.submit(_update(2, "/configs"))
+
+        assert notified.wait(5)
+        assert dispatcher.started == ["/symbols"]
+        dispatcher.release.set()
+        runner.close()
+        assert _replies(send_messages) == [
+            "⏳ /symbols is still running, its reply will follow",
+            "reply to /symbols",
+            "reply to /configs",
+        ]
+
+    def test_overdue_unordered_command_is_answered_and_its_late_reply_dropped(self):
+        dispatcher = _BlockingDispatcher({"/stats AAPL"})
+        send_messages = Mock(spec=SendMessages)
+        logger_factory = Mock()
+        dropped = threading.Event()
+        logger_factory.get_logger.return_value.info.side_effect = lambda message: dropped.set()
+        runner = CommandRunner(dispatcher, send_messages, logger_factory, timeout=0.05)
+
+        runner.submit(_update(1, "/stats AAPL"))
+        runner.close()
+        dispatcher.release.set()
+
+        assert dropped.wait(5)
+        assert _replies(send_messages) == ["⏱ /stats timed out, try again later"]
+
+    def test_turns_away_unordered_commands_once_too_many_are_overdue(self):
+        dispatcher = _BlockingDispatcher({"/stats AAPL"})
+        send_messages = Mock(spec=SendMessages)
+        notified = threading.Event()
+        send_messages.handle.side_effect = lambda request: notified.set()
+        runner = CommandRunner(dispatcher, send_messages, Mock(), timeout=0.05, max_overdue=1)
+
+        runner.submit(_update(1, "/stats AAPL"))
+        assert notified.wait(5)
+        runner.submit(_update(2, "/stats MSFT"))
+        runner.submit(_update(3, "/configs"))
+        runner.close()
+        dispatcher.release.set()
+
+        assert dispatcher.started == ["/stats AAPL", "/configs"]
+        assert _replies(send_messages) == [
+            "⏱ /stats timed out, try again later",
+            "⏳ Too many commands still running, /stats was not run",
+            "reply to /configs",
+        ]
+
+    def test_failing_command_is_answered_with_the_error(self):
+        dispatcher = Mock(spec=BotCommandDispatcher)
+        dispatcher.dispatch.side_effect = RuntimeError("boom")
+        send_messages = Mock(spec=SendMessages)
+        runner = CommandRunner(dispatcher, send_messages, Mock())
+
+        runner.submit(_update(1, "/configs"))
+        runner.close()
+
+        assert _replies(send_messages) == ["❌ Error: boom"]
+
+    def test_polling_continues_while_a_command_runs(self):
+        dispatcher = _BlockingDispatcher({"/stats AAPL"})
+        poller = Mock(spec=TelegramUpdatePoller)
+
+        def get_updates(offset):
+            if offset == 0:
+                return [_update(1, "/stats AAPL")]
+            dispatcher.release.set()
+            raise KeyboardInterrupt
+
+        poller.get_updates.side_effect = get_updates
+        send_messages = Mock(spec=SendMessages)
+        script = make_script(poller=poller, send_messages=send_messages, dispatcher=dispatcher)
+
+        try:
+            script.run()
+        except KeyboardInterrupt:
+            pass
+
+        assert poller.get_updates.call_args_list == [call(0), call(2)]
+        assert _replies(send_messages) == ["reply to /stats AAPL"]
+
+
+class TestMain:
+
+    @patch("pryces.presentation.scripts.telegram_bot.setup_logging")
+    @patch("pryces.presentation.scripts.telegram_bot.load_dotenv")
+    @patch("pryces.presentation.scripts.telegram_bot.TelegramUpdatePoller")
+    def test_poll_limit_reaches_the_poller(
+        self, poller_class, load_dotenv, setup_logging, monkeypatch
+    ):
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "test-token")
+        monkeypatch.setenv("TELEGRAM_GROUP_ID", "123")
+        poller_class.return_value.get_updates.side_effect = KeyboardInterrupt
+
+        with patch.object(sys, "argv", ["telegram_bot", "--poll-limit", "7"]):
+            assert main() == 0
+
+        assert poller_class.call_args.kwargs["limit"] == 7
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+# Market data libraries must load on first use, never at startup.
+_HEAVY_MODULES = ("numpy", "pandas", "yfinance")
+# Wall-clock import budgets are checked by benchmarks/bench_imports.py, not here.
+
+
+def _import_times(module: str) -> dict[str, float]:
+    # Cumulative seconds per imported module, from `python -X importtime`.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        _, _, columns = line.partition("import time:")
+        parts = columns.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        times[parts[2].strip()] = int(parts[1]) / 1_000_000
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["pryces.presentation.console.cli", "pryces.presentation.scripts.telegram_bot"],
+)
+class TestImportTime:
+    def test_does_not_import_market_data_libraries(self, module):
+        imported = _import_times(module)
+
+        assert [name for name in _HEAVY_MODULES if name in imported] == []